@@ -7,22 +7,29 @@ import io
 import json
 import logging
 import os
+import queue
 import re
+import threading
 import time
 import traceback
 from collections import defaultdict
-from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
 from statistics import mean
 from statistics import median
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Type
 
 from click import style
 from nv_ingest_client.client import NvIngestClient
+from nv_ingest_client.primitives import JobSpec
 from nv_ingest_client.util.processing import handle_future_result
+from nv_ingest_client.util.util import add_tasks_to_job_spec
+from nv_ingest_client.util.util import create_job_specs_for_batch
 from nv_ingest_client.util.util import estimate_page_count
 from PIL import Image
 from pydantic import BaseModel
@@ -433,83 +440,79 @@ def save_response_data(response, output_directory, images_to_disk=False):
             f.write(json.dumps(documents, indent=2))
 
 
-def generate_job_batch_for_iteration(
-    client: Any,
-    pbar: Any,
-    files: List[str],
-    tasks: Dict,
-    processed: int,
-    batch_size: int,
-    retry_job_ids: List[str],
-    fail_on_error: bool = False,
-) -> Tuple[List[str], Dict[str, str], int]:
+class JobSpecPrefetcher:
     """
-    Generates a batch of job specifications for the current iteration of file processing.
-    This function handles retrying failed jobs and creating new jobs for unprocessed files.
-    The job specifications are then submitted for processing.
+    Builds job specifications for a list of files on a background thread, ahead of their submission.
+
+    Reading and base64-encoding each file, adding its tasks and estimating its page count happen on the prefetch
+    thread, so the submitting thread only registers and submits ready job specifications. At most `depth` prepared
+    files are held at a time.
 
     Parameters
     ----------
-    client : Any
-        The client object used to submit jobs asynchronously.
-    pbar : Any
-        The progress bar object to update the progress as jobs are processed.
     files : List[str]
-        The list of file paths to be processed.
-    tasks : Dict
-        A dictionary of tasks to be executed as part of the job specifications.
-    processed : int
-        The number of files that have been processed so far.
-    batch_size : int
-        The maximum number of jobs to process in one batch.
-    retry_job_ids : List[str]
-        A list of job IDs that need to be retried due to previous failures.
-    fail_on_error : bool, optional
-        Whether to raise an error and stop processing if job specifications are missing, by default False.
-
-    Returns
-    -------
-    Tuple[List[str], Dict[str, str], int]
-        A tuple containing:
-        - job_ids (List[str]): The list of job IDs created or retried in this iteration.
-        - job_id_map_updates (Dict[str, str]): A dictionary mapping job IDs to their corresponding file names.
-        - processed (int): The updated number of files processed.
+        The files to build job specifications for, in submission order.
+    tasks : Dict[str, Any]
+        The tasks to add to each job specification, see `add_tasks_to_job_spec`.
+    depth : int
+        The maximum number of prepared files waiting to be taken.
 
-    Raises
-    ------
-    RuntimeError
-        If `fail_on_error` is True and there are missing job specifications, a RuntimeError is raised.
+    Notes
+    -----
+    `get` returns `(file, job_spec, page_count)` tuples in file order, with `job_spec` None when the file could not be
+    read, and None once every file has been returned. Any other error raised while preparing a file, such as an invalid
+    task, is re-raised by `get`.
     """
 
-    job_indices = []
-    job_index_map_updates = {}
-    cur_job_count = 0
-
-    if retry_job_ids:
-        job_indices.extend(retry_job_ids)
-        cur_job_count = len(job_indices)
-
-    if (cur_job_count < batch_size) and (processed < len(files)):
-        new_job_count = min(batch_size - cur_job_count, len(files) - processed)
-        batch_files = files[processed : processed + new_job_count]  # noqa: E203
-
-        new_job_indices = client.create_jobs_for_batch(batch_files, tasks)
-        if len(new_job_indices) != new_job_count:
-            missing_jobs = new_job_count - len(new_job_indices)
-            error_msg = f"Missing {missing_jobs} job specs -- this is likely due to bad reads or file corruption"
-            logger.warning(error_msg)
-
-            if fail_on_error:
-                raise RuntimeError(error_msg)
-
-            pbar.update(missing_jobs)
-
-        job_index_map_updates = {job_index: file for job_index, file in zip(new_job_indices, batch_files)}
-        processed += new_job_count
-        _ = client.submit_job_async(new_job_indices, "morpheus_task_queue")
-        job_indices.extend(new_job_indices)
-
-    return job_indices, job_index_map_updates, processed
+    _DONE = object()
+
+    def __init__(self, files: List[str], tasks: Dict[str, Any], depth: int):
+        self._files = files
+        self._tasks = tasks
+        self._queue = queue.Queue(maxsize=max(1, depth))
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._prefetch, name="job-spec-prefetch", daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _prefetch(self) -> None:
+        try:
+            for file in self._files:
+                job_specs = create_job_specs_for_batch([file])
+                job_spec = job_specs[0] if job_specs else None
+                page_count = 0
+                if job_spec is not None:
+                    add_tasks_to_job_spec(job_spec, self._tasks)
+                    page_count = estimate_page_count(file)
+                if not self._put((file, job_spec, page_count)):
+                    return
+            self._put(self._DONE)
+        except Exception as err:
+            self._put(err)
+
+    def get(self) -> Optional[Tuple[str, Optional[JobSpec], int]]:
+        item = self._queue.get()
+        if item is self._DONE:
+            self._queue.put(item)  # Later calls return None as well.
+            return None
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
 
 
 def create_and_process_jobs(
@@ -525,10 +528,12 @@ def create_and_process_jobs(
     """
     Process a list of files, creating and submitting jobs for each file, then fetch and handle the results.
 
-    This function creates job specifications (JobSpecs) for a list of files, submits the jobs to the
-    client, and processes the results asynchronously. It handles job retries for timeouts, logs failures,
-    and limits the number of JobSpecs in memory to `batch_size * 2`. Progress is reported on a per-file basis,
-    including the pages processed per second.
+    Jobs are processed through a sliding window: up to `batch_size` jobs are in flight at any time, and a new file is
+    submitted as soon as any job completes, so a single slow document does not hold up the others. Upcoming files are
+    read, base64-encoded and page-counted on a background thread (see `JobSpecPrefetcher`), at most `batch_size` ahead
+    of submission. Jobs whose results are not ready within `timeout` are fetched again, failures are logged, and the
+    progress bar reports files completed, pages processed per second, and the number of jobs in flight and prepared
+    files waiting.
 
     Parameters
     ----------
@@ -547,18 +552,21 @@ def create_and_process_jobs(
         results will not be saved.
 
     batch_size : int
-        The number of jobs to process in each batch. Memory is limited to `batch_size * 2` jobs at any time.
+        The maximum number of jobs in flight, and of prepared files held ahead of submission.
 
     timeout : int, optional
-        The timeout in seconds for each job to complete before it is retried. Default is 10 seconds.
+        The timeout in seconds for each fetch of a job's result before it is fetched again. Default is 10 seconds.
 
     fail_on_error : bool, optional
         If True, the function will raise an error and stop processing when encountering an unrecoverable error.
         If False, the function logs the error and continues processing other jobs. Default is False.
 
+    save_images_separately : bool, optional
+        If True, images in the results are written to their own files instead of inline in the saved metadata.
+
     Returns
     -------
-    Tuple[int, Dict[str, List[float]], int]
+    Tuple[int, Dict[str, List[float]], int, Dict[str, str]]
         A tuple containing:
         - `total_files` (int): The total number of files processed.
         - `trace_times` (Dict[str, List[float]]): A dictionary mapping job IDs to a list of trace times for
@@ -573,7 +581,7 @@ def create_and_process_jobs(
 
     Notes
     -----
-    - The function limits the number of JobSpecs in memory to `batch_size * 2` for efficient resource management.
+    - At most `batch_size` submitted jobs and `batch_size` prepared files are held in memory at any time.
     - It manages job retries for timeouts and logs decoding or processing errors.
     - The progress bar reports progress on a per-file basis and shows the pages processed per second.
 
@@ -586,7 +594,7 @@ def create_and_process_jobs(
     >>> tasks = {"split": ..., "extract": ..., "store": ...}
     >>> output_directory = "/path/to/output"
     >>> batch_size = 5
-    >>> total_files, trace_times, total_pages_processed = create_and_process_jobs(
+    >>> total_files, trace_times, total_pages_processed, trace_ids = create_and_process_jobs(
     ...     files, client, tasks, output_directory, batch_size
     ... )
     >>> print(f"Processed {total_files} files, {total_pages_processed} pages.")
@@ -596,7 +604,7 @@ def create_and_process_jobs(
 
     See Also
     --------
-    generate_job_batch_for_iteration : Function to generate job batches for processing.
+    JobSpecPrefetcher : Prepares job specifications ahead of submission.
     handle_future_result : Function to process and handle the result of completed future jobs.
     """
 
@@ -605,63 +613,102 @@ def create_and_process_jobs(
     trace_times = defaultdict(list)
     trace_ids = defaultdict(list)
     failed_jobs = []
-    retry_job_ids = []
     job_id_map = {}
     retry_counts = defaultdict(int)
-    file_page_counts = {file: estimate_page_count(file) for file in files}
+    file_page_counts = {}
+    in_flight = {}  # Fetch future -> job ID
 
-    start_time_ns = time.time_ns()
-    with tqdm(total=total_files, desc="Processing files", unit="file") as pbar:
-        processed = 0
-        while (processed < len(files)) or retry_job_ids:
-            # Process new batch of files or retry failed job IDs
-            job_ids, job_id_map_updates, processed = generate_job_batch_for_iteration(
-                client, pbar, files, tasks, processed, batch_size, retry_job_ids, fail_on_error
-            )
-            job_id_map.update(job_id_map_updates)
-            retry_job_ids = []
-
-            futures_dict = client.fetch_job_result_async(job_ids, timeout=timeout, data_only=False)
-            for future in as_completed(futures_dict.keys()):
-                retry = False
-                job_id = futures_dict[future]
-                source_name = job_id_map[job_id]
-                try:
-                    future_response, trace_id = handle_future_result(future, futures_dict)
-                    trace_ids[source_name] = trace_id
-
-                    if output_directory:
-                        save_response_data(future_response, output_directory, images_to_disk=save_images_separately)
+    def fetch(job_id):
+        in_flight.update(client.fetch_job_result_async(job_id, timeout=timeout, data_only=False))
 
-                    total_pages_processed += file_page_counts[source_name]
-                    elapsed_time = (time.time_ns() - start_time_ns) / 1e9
-                    pages_per_sec = total_pages_processed / elapsed_time if elapsed_time > 0 else 0
-                    pbar.set_postfix(pages_per_sec=f"{pages_per_sec:.2f}")
+    def submit_next() -> bool:
+        # Submits the next prepared file; returns False once there are none left.
+        prefetched = prefetcher.get()
+        if prefetched is None:
+            return False
 
-                    process_response(future_response, trace_times)
+        source_name, job_spec, page_count = prefetched
+        if job_spec is None:
+            error_msg = f"Missing job spec for {source_name} -- this is likely due to a bad read or file corruption"
+            logger.warning(error_msg)
+            if fail_on_error:
+                raise RuntimeError(error_msg)
+            pbar.update(1)
+            return True
+
+        job_id = client.add_job(job_spec)
+        job_id_map[job_id] = source_name
+        file_page_counts[source_name] = page_count
+        try:
+            client.submit_job(job_id, "morpheus_task_queue")
+        except Exception as e:
+            logger.error(f"Error while submitting '{job_id}' - ({source_name}):\n{e}")
+            if fail_on_error:
+                raise RuntimeError(f"Failed to submit {source_name}: {e}") from e
+            failed_jobs.append(f"{job_id}::{source_name}")
+            pbar.update(1)
+            return True
+
+        fetch(job_id)
+        return True
+
+    def report_progress():
+        elapsed_time = (time.time_ns() - start_time_ns) / 1e9
+        pages_per_sec = total_pages_processed / elapsed_time if elapsed_time > 0 else 0
+        pbar.set_postfix(
+            pages_per_sec=f"{pages_per_sec:.2f}", in_flight=len(in_flight), prefetched=prefetcher.qsize(), refresh=False
+        )
 
-                except TimeoutError:
-                    source_name = job_id_map[job_id]
-                    retry_counts[source_name] += 1
-                    retry_job_ids.append(job_id)  # Add job_id back to retry list
-                    retry = True
-                except json.JSONDecodeError as e:
-                    source_name = job_id_map[job_id]
-                    logger.error(f"Decoding while processing {job_id}({source_name}) {e}")
-                    failed_jobs.append(f"{job_id}::{source_name}")
-                except RuntimeError as e:
-                    source_name = job_id_map[job_id]
-                    logger.error(f"Error while processing '{job_id}' - ({source_name}):\n{e}")
-                    failed_jobs.append(f"{job_id}::{source_name}")
-                except Exception as e:
-                    traceback.print_exc()
+    start_time_ns = time.time_ns()
+    prefetcher = JobSpecPrefetcher(files, tasks, depth=batch_size)
+    try:
+        with tqdm(total=total_files, desc="Processing files", unit="file") as pbar:
+            more_files = True
+            while more_files or in_flight:
+                # Refill the window as soon as jobs complete.
+                while more_files and len(in_flight) < batch_size:
+                    more_files = submit_next()
+                report_progress()
+
+                if not in_flight:
+                    continue
+
+                done, _ = wait(in_flight.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    retry = False
+                    job_id = in_flight.pop(future)
                     source_name = job_id_map[job_id]
-                    logger.error(f"Unhandled error while processing {job_id}({source_name}) {e}")
-                    failed_jobs.append(f"{job_id}::{source_name}")
-                finally:
-                    # Don't update progress bar if we're going to retry the job
-                    if not retry:
-                        pbar.update(1)
+                    try:
+                        future_response, trace_id = handle_future_result(future)
+                        trace_ids[source_name] = trace_id
+
+                        if output_directory:
+                            save_response_data(future_response, output_directory, images_to_disk=save_images_separately)
+
+                        total_pages_processed += file_page_counts[source_name]
+
+                        process_response(future_response, trace_times)
+
+                    except TimeoutError:
+                        retry_counts[source_name] += 1
+                        fetch(job_id)  # Still processing; fetch it again
+                        retry = True
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Decoding while processing {job_id}({source_name}) {e}")
+                        failed_jobs.append(f"{job_id}::{source_name}")
+                    except RuntimeError as e:
+                        logger.error(f"Error while processing '{job_id}' - ({source_name}):\n{e}")
+                        failed_jobs.append(f"{job_id}::{source_name}")
+                    except Exception as e:
+                        traceback.print_exc()
+                        logger.error(f"Unhandled error while processing {job_id}({source_name}) {e}")
+                        failed_jobs.append(f"{job_id}::{source_name}")
+                    finally:
+                        # Don't update progress bar if we're going to retry the job
+                        if not retry:
+                            pbar.update(1)
+    finally:
+        prefetcher.stop()
 
     return total_files, trace_times, total_pages_processed, trace_ids
 
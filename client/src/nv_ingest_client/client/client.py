@@ -29,9 +29,13 @@ from nv_ingest_client.primitives.jobs import JobState
 from nv_ingest_client.primitives.jobs import JobStateEnum
 from nv_ingest_client.primitives.tasks import Task
 from nv_ingest_client.primitives.tasks import TaskType
-from nv_ingest_client.primitives.tasks import is_valid_task_type
 from nv_ingest_client.primitives.tasks import task_factory
+from nv_ingest_client.util.blob_store import BLOB_STORE_THRESHOLD_BYTES
+from nv_ingest_client.util.blob_store import offload_job_payload
+from nv_ingest_client.util.blob_store import resolve_result_content
+from nv_ingest_client.util.embeddings import decode_embeddings
 from nv_ingest_client.util.processing import handle_future_result
+from nv_ingest_client.util.util import add_tasks_to_job_spec
 from nv_ingest_client.util.util import create_job_specs_for_batch
 
 logger = logging.getLogger(__name__)
@@ -68,6 +72,9 @@ class NvIngestClient:
         message_client_kwargs: Optional[Dict] = None,
         msg_counter_id: Optional[str] = "nv-ingest-message-id",
         worker_pool_size: int = 1,
+        blob_store_threshold_bytes: int = BLOB_STORE_THRESHOLD_BYTES,
+        blob_store: Optional[Any] = None,
+        offload_results: bool = False,
     ) -> None:
         """
         Initializes the NvIngestClient with a client allocator, REST configuration, a message counter ID,
@@ -85,6 +92,16 @@ class NvIngestClient:
             The key for tracking message counts. Defaults to "nv-ingest-message-id".
         worker_pool_size : int, optional
             The number of worker processes in the pool. Defaults to 1.
+        blob_store_threshold_bytes : int, optional
+            If positive, document content whose base64 text is longer than this is uploaded to the blob store and
+            submitted as a blob reference. The store must be shared with the service. Defaults to the
+            `BLOB_STORE_THRESHOLD_BYTES` environment variable, or 0 (content is always sent inline).
+        blob_store : FileBlobStore or MinioBlobStore, optional
+            The blob store for submitted content and for results the service returns as blob references. Defaults to
+            the store configured by the `BLOB_STORE*` environment variables.
+        offload_results : bool, optional
+            If True, jobs ask the service to return large result images as blob references, which this client reads
+            back from `blob_store`. Only set it if this client can read the service's blob store. Defaults to False.
         """
 
         self._current_message_id = 0
@@ -93,6 +110,9 @@ class NvIngestClient:
         self._message_client_hostname = message_client_hostname or "localhost"
         self._message_client_port = message_client_port or 7670
         self._message_counter_id = msg_counter_id or "nv-ingest-message-id"
+        self._blob_store_threshold_bytes = blob_store_threshold_bytes
+        self._blob_store = blob_store
+        self._offload_results = offload_results
 
         logger.debug("Instantiate NvIngestClient:\n%s", str(self))
         self._message_client = message_client_allocator(
@@ -304,24 +324,40 @@ class NvIngestClient:
             job_state = self._get_and_check_job_state(
                 job_index, required_state=[JobStateEnum.SUBMITTED, JobStateEnum.SUBMITTED_ASYNC]
             )
-            response = self._message_client.fetch_message(job_state.job_id, timeout)
-
-            if response.response_code == 0:
-                try:
-                    job_state.state = JobStateEnum.PROCESSING
+            # A result whose blob references could not be read is kept on the job state, so it can be retried.
+            response_json = job_state.response
+            if response_json is None:
+                response = self._message_client.fetch_message(job_state.job_id, timeout)
+                if response.response_code != 0:
+                    raise TimeoutError(f"Timeout: No response within {timeout} seconds for job ID {job_index}")
+
+            keep_job_state = False
+            try:
+                if response_json is None:
                     response_json = json.loads(response.response)
-                    if data_only:
-                        response_json = response_json["data"]
-
-                    return response_json, job_index, job_state.trace_id
-                except json.JSONDecodeError as err:
-                    logger.error(f"Error decoding job result for job ID {job_index}: {err}")
-                    raise ValueError(f"Error decoding job result: {err}") from err
-                finally:
-                    # Only pop once we know we've successfully decoded the response or errored out
+                    decode_embeddings(response_json.get("data"))
+                try:
+                    resolve_result_content(response_json.get("data"), self._blob_store)
+                except Exception as err:
+                    # The broker has handed the result over, so dropping it here would lose it.
+                    job_state.response = response_json
+                    keep_job_state = True
+                    raise RuntimeError(
+                        f"Error reading result blobs for job ID {job_index}, fetch it again to retry: {err}"
+                    ) from err
+
+                job_state.state = JobStateEnum.PROCESSING
+                if data_only:
+                    response_json = response_json["data"]
+
+                return response_json, job_index, job_state.trace_id
+            except json.JSONDecodeError as err:
+                logger.error(f"Error decoding job result for job ID {job_index}: {err}")
+                raise ValueError(f"Error decoding job result: {err}") from err
+            finally:
+                # Only pop once we know we've successfully decoded the response or errored out
+                if not keep_job_state:
                     _ = self._pop_job_state(job_index)
-            else:
-                raise TimeoutError(f"Timeout: No response within {timeout} seconds for job ID {job_index}")
 
         except TimeoutError:
             raise
@@ -519,7 +555,12 @@ class NvIngestClient:
         )
 
         try:
-            message = json.dumps(job_state.job_spec.to_dict())
+            job_dict = job_state.job_spec.to_dict()
+            if self._blob_store_threshold_bytes > 0:
+                offload_job_payload(job_dict, self._blob_store_threshold_bytes, self._blob_store)
+            if self._offload_results:
+                job_dict["offload_results"] = True
+            message = json.dumps(job_dict)
 
             response = self._message_client.submit_message(job_queue_id, message, for_nv_ingest=True)
             x_trace_id = response.trace_id
@@ -673,28 +714,7 @@ class NvIngestClient:
 
         job_ids = []
         for job_spec in job_specs:
-            logger.debug(f"Tasks: {tasks.keys()}")
-            for task in tasks:
-                logger.debug(f"Task: {task}")
-
-            file_type = job_spec.document_type
-
-            seen_tasks = set()  # For tracking tasks and rejecting duplicate tasks.
-
-            for task_name, task_config in tasks.items():
-                if task_name.lower().startswith("extract_"):
-                    task_file_type = task_name.split("_", 1)[1]
-                    if file_type.lower() != task_file_type.lower():
-                        continue
-                elif not is_valid_task_type(task_name.upper()):
-                    raise ValueError(f"Invalid task type: '{task_name}'")
-
-                if str(task_config) in seen_tasks:
-                    raise ValueError(f"Duplicate task detected: {task_name} with config {task_config}")
-
-                job_spec.add_task(task_config)
-
-                seen_tasks.add(str(task_config))
+            add_tasks_to_job_spec(job_spec, tasks)
 
             job_id = self.add_job(job_spec)
             job_ids.append(job_id)
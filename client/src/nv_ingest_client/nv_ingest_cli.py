@@ -6,11 +6,12 @@
 import json
 import logging
 import time
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
 from io import BytesIO
 from typing import List
 
 import click
-import pkg_resources
 from nv_ingest_client.util.zipkin import collect_traces_from_zipkin, write_results_to_output_directory
 from nv_ingest_client.cli.util.click import LogLevel
 from nv_ingest_client.cli.util.click import click_match_and_validate_files
@@ -26,17 +27,15 @@ from nv_ingest_client.message_clients.rest.rest_client import RestClient
 from nv_ingest_client.message_clients.simple.simple_client import SimpleClient
 from nv_ingest_client.util.dataset import get_dataset_files
 from nv_ingest_client.util.dataset import get_dataset_statistics
-from pkg_resources import DistributionNotFound
-from pkg_resources import VersionConflict
 
 try:
-    NV_INGEST_VERSION = pkg_resources.get_distribution("nv_ingest").version
-except (DistributionNotFound, VersionConflict):
+    NV_INGEST_VERSION = version("nv_ingest")
+except PackageNotFoundError:
     NV_INGEST_VERSION = "Unknown -- No Distribution found or Version conflict."
 
 try:
-    NV_INGEST_CLIENT_VERSION = pkg_resources.get_distribution("nv_ingest_client").version
-except (DistributionNotFound, VersionConflict):
+    NV_INGEST_CLIENT_VERSION = version("nv_ingest_client")
+except PackageNotFoundError:
     NV_INGEST_CLIENT_VERSION = "Unknown -- No Distribution found or Version conflict."
 
 logger = logging.getLogger(__name__)
@@ -48,7 +47,7 @@ logger = logging.getLogger(__name__)
     default=10,
     show_default=True,
     type=int,
-    help="Batch size (must be >= 1).",
+    help="Maximum number of jobs in flight, and of files prepared ahead of submission (must be >= 1).",
     callback=click_validate_batch_size,
 )
 @click.option(
@@ -139,6 +138,8 @@ Tasks and Options:
     Options:
       - content_type (str): Content type to deduplicate ('image').
       - filter (bool): When set to True, duplicates will be filtered, otherwise, an info message will be added.
+      - method (str): 'exact' to match identical images (default), or 'perceptual' to also match re-encoded,
+        rescaled or noisy copies.
 \b
 - embed: Computes embeddings on multimodal extractions.
     Options:
@@ -172,7 +173,7 @@ Tasks and Options:
     Options:
     - max_character_length (int): Maximum segment character count. No default.
     - sentence_window_size (int): Sentence window size. No default.
-    - split_by (str): Criteria ('page', 'size', 'word', 'sentence'). No default.
+    - split_by (str): Criteria ('page', 'size', 'word', 'sentence', 'token'). No default.
     - split_length (int): Segment length. No default.
     - split_overlap (int): Segment overlap. No default.
 \b
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 class DedupTaskSchema(BaseModel):
     content_type: str = "image"
     filter: bool = False
+    method: str = "exact"
 
     @validator("content_type")
     def content_type_must_be_valid(cls, v):
@@ -29,6 +30,13 @@ class DedupTaskSchema(BaseModel):
             raise ValueError(f"content_type must be one of {valid_criteria}")
         return v
 
+    @validator("method")
+    def method_must_be_valid(cls, v):
+        valid_methods = ["exact", "perceptual"]
+        if v not in valid_methods:
+            raise ValueError(f"method must be one of {valid_methods}")
+        return v
+
     class Config:
         extra = "forbid"
 
@@ -39,11 +47,13 @@ class DedupTask(Task):
     """
 
     _TypeContentType = Literal["image"]
+    _TypeMethod = Literal["exact", "perceptual"]
 
     def __init__(
         self,
         content_type: _TypeContentType = "image",
         filter: bool = False,
+        method: _TypeMethod = "exact",
     ) -> None:
         """
         Setup Dedup Task Config
@@ -51,6 +61,7 @@ class DedupTask(Task):
         super().__init__()
         self._content_type = content_type
         self._filter = filter
+        self._method = method
 
     def __str__(self) -> str:
         """
@@ -60,6 +71,7 @@ class DedupTask(Task):
         info += "Dedup Task:\n"
         info += f"  content_type: {self._content_type}\n"
         info += f"  filter: {self._filter}\n"
+        info += f"  method: {self._method}\n"
         return info
 
     def to_dict(self) -> Dict:
@@ -67,6 +79,9 @@ class DedupTask(Task):
         Convert to a dict for submission to redis
         """
         dedup_params = {"filter": self._filter}
+        if self._method != "exact":
+            # Omitted by default so the payload stays valid for services without near-duplicate detection.
+            dedup_params["method"] = self._method
 
         task_properties = {
             "content_type": self._content_type,
@@ -28,7 +28,7 @@ class SplitTaskSchema(BaseModel):
 
     @validator("split_by")
     def split_by_must_be_valid(cls, v):
-        valid_criteria = ["page", "size", "word", "sentence"]
+        valid_criteria = ["page", "size", "word", "sentence", "token"]
         if v not in valid_criteria:
             raise ValueError(f"split_by must be one of {valid_criteria}")
         return v
@@ -42,7 +42,7 @@ class SplitTask(Task):
     Object for document splitting task
     """
 
-    _TypeSplitBy = Literal["word", "sentence", "passage"]
+    _TypeSplitBy = Literal["word", "sentence", "passage", "token"]
 
     def __init__(
         self,
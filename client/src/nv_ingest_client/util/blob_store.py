@@ -0,0 +1,453 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+import functools
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import time
+import uuid
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+# "file" keeps blobs in BLOB_STORE_DIR, "minio" in BLOB_STORE_BUCKET of a MinIO or other S3-compatible server.
+BLOB_STORE = os.getenv("BLOB_STORE", "file").lower()
+
+# The directory blobs are stored in. It must be shared by the REST service and the pipeline.
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "/tmp/nv_ingest_blob_store")
+
+# Seconds after which blobs are deleted by the store's sweeper; 0 keeps them forever.
+BLOB_STORE_TTL = float(os.getenv("BLOB_STORE_TTL", 24 * 60 * 60))
+
+BLOB_STORE_MINIO_ENDPOINT = os.getenv("BLOB_STORE_MINIO_ENDPOINT", os.getenv("MINIO_INTERNAL_ADDRESS", "minio:9000"))
+BLOB_STORE_BUCKET = os.getenv("BLOB_STORE_BUCKET", "nv-ingest-blobs")
+
+# Job content and result images whose base64 text is longer than this are sent as blob references; 0 disables it.
+BLOB_STORE_THRESHOLD_BYTES = int(os.getenv("BLOB_STORE_THRESHOLD_BYTES", 0))
+
+# Prefix of a blob reference. ':' is not in the base64 alphabet, so references never look like inline content.
+BLOB_REFERENCE_PREFIX = "blob://"
+
+# Size of the chunks files are copied into the store in.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Document types whose job content is text rather than base64-encoded bytes.
+_TEXT_DOCUMENT_TYPES = ("text", "md", "html")
+
+
+def is_blob_reference(value: object) -> bool:
+    """
+    Returns True if a job payload or result value is a blob reference rather than inline content.
+    """
+    return isinstance(value, str) and value.startswith(BLOB_REFERENCE_PREFIX)
+
+
+def _get_digest(reference: str) -> str:
+    if not is_blob_reference(reference):
+        raise ValueError(f"Not a blob reference: '{reference[:64]}'")
+
+    digest = reference[len(BLOB_REFERENCE_PREFIX) :]
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise ValueError(f"Malformed blob reference: '{reference[:128]}'")
+
+    return digest
+
+
+def _maybe_sweep(store: Any) -> None:
+    # Writers sweep the store as they go, at most once per tenth of the TTL per process.
+    if not store._ttl:
+        return
+    now = time.monotonic()
+    if now < store._next_sweep:
+        return
+    store._next_sweep = now + store._ttl / 10
+    try:
+        removed = store.sweep()
+        if removed:
+            logger.debug(f"Removed {removed} expired blobs")
+    except Exception as e:
+        logger.warning(f"Blob store sweep failed: {e}")
+
+
+class FileBlobStore:
+    """
+    A content-addressed blob store in a local directory, standing in for an object store.
+
+    Blobs are named by the SHA-256 of their bytes, so storing the same content twice keeps one copy. Content is
+    written in chunks to a temporary file while it is hashed and then renamed into place, so large files are never
+    held in memory and readers never see a partial blob.
+
+    Blobs are deleted once they are `ttl` seconds old, counted from the last time their content was stored. Blobs are
+    shared by every job with the same content, so they are not deleted when one job has read them; instead, writers
+    sweep the store periodically.
+
+    Parameters
+    ----------
+    path : str
+        The store directory. It is created if it does not exist.
+    ttl : float, optional
+        Seconds after which blobs are deleted, or 0 to keep them.
+
+    Methods
+    -------
+    put_stream(chunks)
+        Stores content given as an iterable of byte chunks and returns its reference.
+    put(data)
+        Stores bytes and returns their reference.
+    open(reference)
+        Opens a blob for reading.
+    get(reference)
+        Returns a blob's bytes.
+    sweep()
+        Deletes expired blobs.
+    """
+
+    def __init__(self, path: str, ttl: float = 0):
+        self._path = path
+        self._ttl = ttl
+        self._next_sweep = 0.0
+        os.makedirs(path, exist_ok=True)
+
+    def _blob_path(self, reference: str) -> str:
+        digest = _get_digest(reference)
+        return os.path.join(self._path, digest[:2], digest)
+
+    def put_stream(self, chunks: Iterable[bytes]) -> str:
+        """
+        Stores content given as an iterable of byte chunks.
+
+        Parameters
+        ----------
+        chunks : Iterable[bytes]
+            The content, in order.
+
+        Returns
+        -------
+        str
+            The blob reference, "blob://<sha256 hex digest>".
+        """
+        digest = hashlib.sha256()
+        tmp_path = os.path.join(self._path, f".{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            reference = BLOB_REFERENCE_PREFIX + digest.hexdigest()
+            blob_path = self._blob_path(reference)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(tmp_path, blob_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        _maybe_sweep(self)
+
+        return reference
+
+    def put(self, data: bytes) -> str:
+        """
+        Stores bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            The content.
+
+        Returns
+        -------
+        str
+            The blob reference.
+        """
+        return self.put_stream((data,))
+
+    def open(self, reference: str) -> BinaryIO:
+        """
+        Opens a blob for reading.
+
+        Parameters
+        ----------
+        reference : str
+            The blob reference.
+
+        Returns
+        -------
+        BinaryIO
+            The open blob file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the blob is not in the store.
+        """
+        return open(self._blob_path(reference), "rb")
+
+    def get(self, reference: str) -> bytes:
+        """
+        Returns a blob's bytes. See `open`.
+        """
+        with self.open(reference) as f:
+            return f.read()
+
+    def sweep(self) -> int:
+        """
+        Deletes blobs, and temporary files left by interrupted writes, older than the store's TTL.
+
+        Returns
+        -------
+        int
+            The number of files deleted.
+        """
+        if not self._ttl:
+            return 0
+
+        cutoff = time.time() - self._ttl
+        removed = 0
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+
+        return removed
+
+
+class MinioBlobStore:
+    """
+    A content-addressed blob store in a bucket of a MinIO or other S3-compatible server, shared between hosts.
+
+    Objects are named by the SHA-256 of their bytes, as in `FileBlobStore`. Streamed content is spooled to a local
+    temporary file while it is hashed, so it is never held in memory. Objects older than `ttl` are swept as in
+    `FileBlobStore`; a bucket lifecycle rule can be used instead, with `ttl` set to 0.
+
+    Parameters
+    ----------
+    client : minio.Minio
+        The MinIO client.
+    bucket_name : str
+        The bucket. It is created if it does not exist.
+    ttl : float, optional
+        Seconds after which objects are deleted, or 0 to keep them.
+    """
+
+    def __init__(self, client: Any, bucket_name: str, ttl: float = 0):
+        self._client = client
+        self._bucket_name = bucket_name
+        self._ttl = ttl
+        self._next_sweep = 0.0
+        if not client.bucket_exists(bucket_name):
+            client.make_bucket(bucket_name)
+            logger.debug("Created bucket %s", bucket_name)
+
+    def put_stream(self, chunks: Iterable[bytes]) -> str:
+        digest = hashlib.sha256()
+        with tempfile.TemporaryFile() as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+            length = f.tell()
+            f.seek(0)
+            self._client.put_object(self._bucket_name, digest.hexdigest(), f, length=length)
+        _maybe_sweep(self)
+
+        return BLOB_REFERENCE_PREFIX + digest.hexdigest()
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        self._client.put_object(self._bucket_name, digest, io.BytesIO(data), length=len(data))
+        _maybe_sweep(self)
+
+        return BLOB_REFERENCE_PREFIX + digest
+
+    def get(self, reference: str) -> bytes:
+        from minio.error import S3Error
+
+        try:
+            response = self._client.get_object(self._bucket_name, _get_digest(reference))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                raise FileNotFoundError(f"Blob {reference} is not in bucket {self._bucket_name}") from e
+            raise
+
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def open(self, reference: str) -> BinaryIO:
+        return io.BytesIO(self.get(reference))
+
+    def sweep(self) -> int:
+        if not self._ttl:
+            return 0
+
+        cutoff = time.time() - self._ttl
+        removed = 0
+        for obj in self._client.list_objects(self._bucket_name, recursive=True):
+            if obj.last_modified is not None and obj.last_modified.timestamp() < cutoff:
+                self._client.remove_object(self._bucket_name, obj.object_name)
+                removed += 1
+
+        return removed
+
+
+@functools.lru_cache(maxsize=None)
+def get_blob_store() -> Union[FileBlobStore, MinioBlobStore]:
+    """
+    Returns the process-wide blob store configured by the `BLOB_STORE*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If `BLOB_STORE` is not "file" or "minio".
+    """
+    if BLOB_STORE == "file":
+        return FileBlobStore(BLOB_STORE_DIR, BLOB_STORE_TTL)
+
+    if BLOB_STORE == "minio":
+        from minio import Minio
+
+        client = Minio(
+            BLOB_STORE_MINIO_ENDPOINT,
+            access_key=os.getenv("MINIO_ACCESS_KEY"),
+            secret_key=os.getenv("MINIO_SECRET_KEY"),
+            secure=os.getenv("BLOB_STORE_MINIO_SECURE", "false").lower() == "true",
+        )
+        return MinioBlobStore(client, BLOB_STORE_BUCKET, BLOB_STORE_TTL)
+
+    raise ValueError(f"Unsupported BLOB_STORE '{BLOB_STORE}'; expected 'file' or 'minio'.")
+
+
+def resolve_content(content: Union[str, bytes]) -> bytes:
+    """
+    Returns the bytes of document or image content from a job, whether inline or in the blob store.
+
+    Parameters
+    ----------
+    content : str or bytes
+        Base64-encoded content, or a blob reference.
+
+    Returns
+    -------
+    bytes
+        The decoded content.
+    """
+    if is_blob_reference(content):
+        return get_blob_store().get(content)
+
+    return base64.b64decode(content)
+
+
+def offload_job_payload(job: Dict[str, Any], threshold: int, store: Optional[Any] = None) -> int:
+    """
+    Moves large base64 document content of a job into the blob store, replacing it with references.
+
+    Text documents are left inline. Extraction stages read referenced content back with `resolve_content`.
+
+    Parameters
+    ----------
+    job : dict
+        The job, as produced by `JobSpec.to_dict`. Modified in place.
+    threshold : int
+        Content whose base64 text is longer than this many bytes is moved.
+    store : FileBlobStore or MinioBlobStore, optional
+        The store to use. Defaults to `get_blob_store()`.
+
+    Returns
+    -------
+    int
+        The number of base64 bytes moved out of the job.
+    """
+    payload = job.get("job_payload", {})
+    contents = payload.get("content", [])
+    document_types = payload.get("document_type", [])
+
+    offloaded = 0
+    for i, content in enumerate(contents):
+        document_type = document_types[i] if i < len(document_types) else None
+        if document_type in _TEXT_DOCUMENT_TYPES or not isinstance(content, str) or is_blob_reference(content):
+            continue
+        if len(content) > threshold:
+            store = store or get_blob_store()
+            contents[i] = store.put(base64.b64decode(content))
+            offloaded += len(content)
+
+    return offloaded
+
+
+def offload_result_content(data: Optional[List[Dict[str, Any]]], threshold: int, store: Optional[Any] = None) -> int:
+    """
+    Moves large base64 image content of job results into the blob store, replacing it with references.
+
+    Only image and structured rows, whose `metadata.content` is a base64-encoded image, are considered.
+
+    Parameters
+    ----------
+    data : List[dict], optional
+        The result rows, each with "document_type" and "metadata". Modified in place.
+    threshold : int
+        Content whose base64 text is longer than this many bytes is moved.
+    store : FileBlobStore or MinioBlobStore, optional
+        The store to use. Defaults to `get_blob_store()`.
+
+    Returns
+    -------
+    int
+        The number of base64 bytes moved out of the results.
+    """
+    offloaded = 0
+    for row in data or []:
+        metadata = row.get("metadata") or {}
+        content = metadata.get("content")
+        if row.get("document_type") not in ("image", "structured") or not isinstance(content, str):
+            continue
+        if len(content) > threshold and not is_blob_reference(content):
+            store = store or get_blob_store()
+            metadata["content"] = store.put(base64.b64decode(content))
+            offloaded += len(content)
+
+    return offloaded
+
+
+def resolve_result_content(data: Optional[List[Dict[str, Any]]], store: Optional[Any] = None) -> int:
+    """
+    Replaces blob references in the `metadata.content` of job results with the base64-encoded blobs.
+
+    Parameters
+    ----------
+    data : List[dict], optional
+        The result rows. Modified in place.
+    store : FileBlobStore or MinioBlobStore, optional
+        The store to read from. Defaults to `get_blob_store()`, which is only created if a reference is found.
+
+    Returns
+    -------
+    int
+        The number of references resolved.
+    """
+    resolved = 0
+    for row in data or []:
+        metadata = row.get("metadata") or {}
+        if is_blob_reference(metadata.get("content")):
+            store = store or get_blob_store()
+            metadata["content"] = base64.b64encode(store.get(metadata["content"])).decode("utf-8")
+            resolved += 1
+
+    return resolved
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+
+# Marks an embedding packed by `encode_embedding`.
+EMBEDDING_ENCODING = "base64"
+
+# Packed embeddings are always little-endian, whatever the byte order of the machine that wrote them.
+EMBEDDING_DTYPES = {
+    "float32": "<f4",
+    "float16": "<f2",
+}
+
+
+def encode_embedding(embedding: Sequence[float], dtype: str = "float32") -> Dict[str, Any]:
+    """
+    Packs an embedding into base64-encoded little-endian bytes.
+
+    Parameters
+    ----------
+    embedding : Sequence[float]
+        The embedding vector.
+    dtype : str
+        "float32" or "float16".
+
+    Returns
+    -------
+    dict
+        {"encoding": "base64", "dtype": "<f4" or "<f2", "shape": [dim], "data": <base64 str>}
+
+    Raises
+    ------
+    ValueError
+        If `dtype` is not supported.
+    """
+    if dtype not in EMBEDDING_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype '{dtype}'; expected one of {sorted(EMBEDDING_DTYPES)}.")
+
+    array = np.asarray(embedding, dtype=EMBEDDING_DTYPES[dtype])
+
+    return {
+        "encoding": EMBEDDING_ENCODING,
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def is_encoded_embedding(value: Any) -> bool:
+    """
+    Returns True if `value` is an embedding packed by `encode_embedding`.
+    """
+    return isinstance(value, dict) and value.get("encoding") == EMBEDDING_ENCODING and "data" in value
+
+
+def decode_embedding(value: Any, as_numpy: bool = False) -> Any:
+    """
+    Unpacks an embedding packed by `encode_embedding`. Any other value is returned unchanged.
+
+    Parameters
+    ----------
+    value : Any
+        A packed embedding, a list of floats, or None.
+    as_numpy : bool
+        If True, packed embeddings are returned as NumPy arrays of their packed dtype instead of lists of floats.
+
+    Returns
+    -------
+    Any
+        The embedding.
+    """
+    if not is_encoded_embedding(value):
+        return value
+
+    array = np.frombuffer(base64.b64decode(value["data"]), dtype=np.dtype(value["dtype"]))
+    if "shape" in value:
+        array = array.reshape(value["shape"])
+
+    return array if as_numpy else array.tolist()
+
+
+def encode_embeddings(records: Optional[List[Dict[str, Any]]], dtype: str = "float32") -> Optional[List[Dict]]:
+    """
+    Packs `metadata.embedding` of every result record in place with `encode_embedding`.
+
+    Parameters
+    ----------
+    records : List[dict], optional
+        Result records, each with a "metadata" dictionary.
+    dtype : str
+        "float32" or "float16".
+
+    Returns
+    -------
+    List[dict], optional
+        `records`.
+    """
+    for record in records or []:
+        metadata = record.get("metadata") if isinstance(record, dict) else None
+        if not isinstance(metadata, dict):
+            continue
+
+        embedding = metadata.get("embedding")
+        if embedding is not None and not is_encoded_embedding(embedding) and len(embedding) > 0:
+            metadata["embedding"] = encode_embedding(embedding, dtype)
+
+    return records
+
+
+def decode_embeddings(records: Optional[List[Dict[str, Any]]], as_numpy: bool = False) -> Optional[List[Dict]]:
+    """
+    Unpacks `metadata.embedding` of every result record in place with `decode_embedding`.
+
+    Parameters
+    ----------
+    records : List[dict], optional
+        Result records, each with a "metadata" dictionary.
+    as_numpy : bool
+        If True, embeddings are returned as NumPy arrays instead of lists of floats.
+
+    Returns
+    -------
+    List[dict], optional
+        `records`.
+    """
+    for record in records or []:
+        metadata = record.get("metadata") if isinstance(record, dict) else None
+        if isinstance(metadata, dict) and is_encoded_embedding(metadata.get("embedding")):
+            metadata["embedding"] = decode_embedding(metadata["embedding"], as_numpy=as_numpy)
+
+    return records
@@ -13,14 +13,12 @@ from io import BytesIO
 from typing import Dict
 from typing import List
 
-import pypdfium2 as pdfium
-from docx import Document as DocxDocument
 from nv_ingest_client.primitives.jobs.job_spec import JobSpec
+from nv_ingest_client.primitives.tasks import is_valid_task_type
 from nv_ingest_client.util.file_processing.extract import DocumentTypeEnum
 from nv_ingest_client.util.file_processing.extract import detect_encoding_and_read_text_file
 from nv_ingest_client.util.file_processing.extract import extract_file_content
 from nv_ingest_client.util.file_processing.extract import get_or_infer_file_type
-from pptx import Presentation
 
 logger = logging.getLogger(__name__)
 
@@ -58,15 +56,22 @@ def estimate_page_count(file_path: str) -> int:
 
 
 def count_pages_for_documents(file_path: str, document_type: DocumentTypeEnum) -> int:
+    # Document libraries are imported on first use, so importing the client does not load them all.
     try:
         if document_type == DocumentTypeEnum.pdf:
+            import pypdfium2 as pdfium
+
             doc = pdfium.PdfDocument(file_path)
             return len(doc)
         elif document_type == DocumentTypeEnum.docx:
+            from docx import Document as DocxDocument
+
             doc = DocxDocument(file_path)
             # Approximation, as word documents do not have a direct 'page count' attribute
             return len(doc.paragraphs) // 15
         elif document_type == DocumentTypeEnum.pptx:
+            from pptx import Presentation
+
             ppt = Presentation(file_path)
             return len(ppt.slides)
     except FileNotFoundError:
@@ -377,6 +382,45 @@ def create_job_specs_for_batch(files_batch: List[str]) -> List[JobSpec]:
     return job_specs
 
 
+def add_tasks_to_job_spec(job_spec: JobSpec, tasks: Dict[str, typing.Any]) -> None:
+    """
+    Adds the tasks that apply to a job specification's document type to it.
+
+    `extract_<type>` tasks are only added to documents of that type; every other task is added to all documents.
+
+    Parameters
+    ----------
+    job_spec : JobSpec
+        The job specification to add the tasks to.
+    tasks : Dict[str, Any]
+        A dictionary of task names to task objects, such as the one built by the CLI from its `--task` options.
+
+    Raises
+    ------
+    ValueError
+        If a task name is not a valid task type, or the same task configuration is given twice.
+    """
+    logger.debug(f"Tasks: {tasks.keys()}")
+
+    file_type = job_spec.document_type
+    seen_tasks = set()  # For tracking tasks and rejecting duplicate tasks.
+
+    for task_name, task_config in tasks.items():
+        if task_name.lower().startswith("extract_"):
+            task_file_type = task_name.split("_", 1)[1]
+            if file_type.lower() != task_file_type.lower():
+                continue
+        elif not is_valid_task_type(task_name.upper()):
+            raise ValueError(f"Invalid task type: '{task_name}'")
+
+        if str(task_config) in seen_tasks:
+            raise ValueError(f"Duplicate task detected: {task_name} with config {task_config}")
+
+        job_spec.add_task(task_config)
+
+        seen_tasks.add(str(task_config))
+
+
 def filter_function_kwargs(func, **kwargs):
     """
     Filters and returns keyword arguments that match the parameters of a given function.
@@ -10,12 +10,12 @@
 
 # pylint: skip-file
 
-import base64
+import functools
 import json
 import logging
 import time
 import traceback
-from io import BytesIO
+import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Request, Response
@@ -25,8 +25,11 @@ from fastapi import HTTPException
 from fastapi import UploadFile
 from nv_ingest_client.primitives.jobs.job_spec import JobSpec
 from nv_ingest_client.primitives.tasks.extract import ExtractTask
+from nv_ingest_client.util.blob_store import DEFAULT_CHUNK_SIZE
+from nv_ingest_client.util.blob_store import get_blob_store
 from opentelemetry import trace
 from redis import RedisError
+from starlette.concurrency import run_in_threadpool
 
 from nv_ingest.schemas.message_wrapper_schema import MessageWrapper
 from nv_ingest.service.impl.ingest.redis_ingest_service import RedisIngestService
@@ -66,14 +69,16 @@ async def submit_job_curl_friendly(ingest_service: INGEST_SERVICE_T, file: Uploa
     the nv-ingest service through tools like Curl easier.
     """
     try:
-        file_stream = BytesIO(file.file.read())
-        doc_content = base64.b64encode(file_stream.read()).decode("utf-8")
+        # Copy the upload into the blob store in chunks, off the event loop, instead of holding it in memory as
+        # base64. The job carries only the blob reference, which the extraction stage resolves.
+        chunks = iter(functools.partial(file.file.read, DEFAULT_CHUNK_SIZE), b"")
+        content_reference = await run_in_threadpool(get_blob_store().put_stream, chunks)
 
         # Construct the JobSpec from the HTTP supplied form-data
         job_spec = JobSpec(
             # TOOD: Update this to look at the uploaded content-type, currently that is not working
             document_type="pdf",
-            payload=doc_content,
+            payload=content_reference,
             source_id=file.filename,
             source_name=file.filename,
             # TODO: Update this to accept user defined options
@@ -91,7 +96,9 @@ async def submit_job_curl_friendly(ingest_service: INGEST_SERVICE_T, file: Uploa
 
         job_spec.add_task(extract_task)
 
-        submitted_job_id = await ingest_service.submit_job(MessageWrapper(payload=json.dumps(job_spec.to_dict())))
+        submitted_job_id = await ingest_service.submit_job(
+            MessageWrapper(payload=json.dumps(job_spec.to_dict())), str(uuid.uuid4())
+        )
         return submitted_job_id
     except Exception as ex:
         traceback.print_exc()
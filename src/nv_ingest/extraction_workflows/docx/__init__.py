@@ -3,8 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from nv_ingest.extraction_workflows.docx.docx_helper import python_docx
-from nv_ingest.extraction_workflows.docx.docxreader import DocxReader
+from nv_ingest.util.lazy_imports import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "python_docx": ("nv_ingest.extraction_workflows.docx.docx_helper", "python_docx"),
+        "DocxReader": ("nv_ingest.extraction_workflows.docx.docxreader", "DocxReader"),
+    },
+)
 
 __all__ = [
     "python_docx",
@@ -1,3 +1,10 @@
-from .image_handlers import image_data_extractor as image
+from nv_ingest.util.lazy_imports import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "image": ("nv_ingest.extraction_workflows.image.image_handlers", "image_data_extractor"),
+    },
+)
 
 __all__ = ["image"]
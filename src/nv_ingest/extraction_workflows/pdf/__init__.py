@@ -3,12 +3,23 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from nv_ingest.extraction_workflows.pdf.adobe_helper import adobe
-from nv_ingest.extraction_workflows.pdf.doughnut_helper import doughnut
-from nv_ingest.extraction_workflows.pdf.llama_parse_helper import llama_parse
-from nv_ingest.extraction_workflows.pdf.pdfium_helper import pdfium_extractor as pdfium
-from nv_ingest.extraction_workflows.pdf.tika_helper import tika
-from nv_ingest.extraction_workflows.pdf.unstructured_io_helper import unstructured_io
+# Helpers are imported when their extraction method is first requested, so only the dependencies of the methods in
+# use are loaded.
+from nv_ingest.util.lazy_imports import lazy_module_attributes
+
+_PACKAGE = "nv_ingest.extraction_workflows.pdf"
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "adobe": (f"{_PACKAGE}.adobe_helper", "adobe"),
+        "doughnut": (f"{_PACKAGE}.doughnut_helper", "doughnut"),
+        "llama_parse": (f"{_PACKAGE}.llama_parse_helper", "llama_parse"),
+        "pdfium": (f"{_PACKAGE}.pdfium_helper", "pdfium_extractor"),
+        "tika": (f"{_PACKAGE}.tika_helper", "tika"),
+        "unstructured_io": (f"{_PACKAGE}.unstructured_io_helper", "unstructured_io"),
+    },
+)
 
 __all__ = [
     "llama_parse",
@@ -17,8 +17,17 @@
 # limitations under the License.
 
 import logging
+import multiprocessing as mp
+import os
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from math import log
+from multiprocessing import shared_memory
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -44,8 +53,10 @@ from nv_ingest.util.pdf.metadata_aggregators import extract_pdf_metadata
 from nv_ingest.util.pdf.pdfium import PDFIUM_PAGEOBJ_MAPPING
 from nv_ingest.util.pdf.pdfium import pdfium_pages_to_numpy
 from nv_ingest.util.pdf.pdfium import pdfium_try_get_bitmap_as_numpy
+from nv_ingest.util.process_local import register_exit_finalizer
 
 YOLOX_MAX_BATCH_SIZE = 8
+YOLOX_MAX_INFLIGHT_BATCHES = 2
 YOLOX_MAX_WIDTH = 1536
 YOLOX_MAX_HEIGHT = 1536
 YOLOX_NUM_CLASSES = 3
@@ -56,73 +67,200 @@ YOLOX_FINAL_SCORE = 0.48
 
 logger = logging.getLogger(__name__)
 
+_shard_executor: Optional[ProcessPoolExecutor] = None
+_shard_executor_workers = 0
+_shard_executor_lock = threading.Lock()
 
-def extract_tables_and_charts_using_image_ensemble(
-    pages: List,  # List[libpdfium.PdfPage]
-    config: PDFiumConfigSchema,
-    trace_info: Optional[List] = None,
-) -> List[Tuple[int, object]]:  # List[Tuple[int, CroppedImageWithContent]]
-    tables_and_charts = []
 
-    # Obtain yolox_version
-    # Assuming that the grpc endpoint is at index 0
-    yolox_http_endpoint = config.yolox_endpoints[1]
-    try:
-        yolox_version = get_version(yolox_http_endpoint)
-        if not yolox_version:
+def _get_yolox_batch_sizes(page_count: int, max_batch_size: int = YOLOX_MAX_BATCH_SIZE) -> List[int]:
+    """
+    Splits `page_count` pages into power-of-two batches of at most `max_batch_size` pages.
+    """
+    batch_sizes = []
+    remaining = page_count
+    while remaining > 0:
+        batch_size = min(2 ** int(log(remaining, 2)), max_batch_size)
+        batch_sizes.append(batch_size)
+        remaining -= batch_size
+
+    return batch_sizes
+
+
+class TableAndChartPipeline:
+    """
+    Detects tables and charts on PDF pages as the pages are rendered.
+
+    Pages are rendered on the calling thread, since pdfium is not thread safe. Every full batch of rendered pages is
+    handed to a small thread pool that sends it to YOLOX and crops the detected tables and charts, so rendering of
+    later pages overlaps with inference and cropping of earlier ones. At most `max_inflight_batches` rendered batches
+    are held at once; `add_page` blocks until one of them completes.
+
+    Parameters
+    ----------
+    config : PDFiumConfigSchema
+        The configuration with the YOLOX endpoints.
+    page_count : int
+        The number of pages that will be added, used to plan batch sizes.
+    trace_info : list, optional
+        Trace information for the YOLOX calls.
+    max_inflight_batches : int, optional
+        The maximum number of rendered batches waiting for, or undergoing, inference and cropping.
+    """
+
+    def __init__(
+        self,
+        config: PDFiumConfigSchema,
+        page_count: int,
+        trace_info: Optional[List] = None,
+        max_inflight_batches: int = YOLOX_MAX_INFLIGHT_BATCHES,
+    ):
+        self._trace_info = trace_info
+        self._batch_sizes = _get_yolox_batch_sizes(page_count)
+        self._batch_images = []
+        self._batch_page_indices = []
+        self._futures = []
+        self._inflight = threading.BoundedSemaphore(max_inflight_batches)
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight_batches)
+        self._yolox_client = self._create_yolox_client(config)
+
+    @staticmethod
+    def _create_yolox_client(config: PDFiumConfigSchema):
+        # Obtain yolox_version
+        # Assuming that the grpc endpoint is at index 0
+        yolox_http_endpoint = config.yolox_endpoints[1]
+        try:
+            yolox_version = get_version(yolox_http_endpoint)
+            if not yolox_version:
+                logger.warning(
+                    "Failed to obtain yolox-page-elements version from the endpoint. "
+                    "Falling back to the latest version."
+                )
+                yolox_version = None  # Default to the latest version
+        except Exception:
             logger.warning(
-                "Failed to obtain yolox-page-elements version from the endpoint. Falling back to the latest version."
+                "Failed to get yolox-page-elements version after 30 seconds. Falling back to the latest version."
             )
             yolox_version = None  # Default to the latest version
-    except Exception:
-        logger.waring("Failed to get yolox-page-elements version after 30 seconds. Falling back to the latest version.")
-        yolox_version = None  # Default to the latest version
 
-    try:
         model_interface = yolox_utils.YoloxPageElementsModelInterface(yolox_version=yolox_version)
-        yolox_client = create_inference_client(
-            config.yolox_endpoints, model_interface, config.auth_token, config.yolox_infer_protocol
+        return create_inference_client(
+            config.yolox_endpoints,
+            model_interface,
+            config.auth_token,
+            config.yolox_infer_protocol,
+            model_version=yolox_version,
         )
 
-        batches = []
-        i = 0
-        max_batch_size = YOLOX_MAX_BATCH_SIZE
-        while i < len(pages):
-            batch_size = min(2 ** int(log(len(pages) - i, 2)), max_batch_size)
-            batches.append(pages[i : i + batch_size])  # noqa: E203
-            i += batch_size
-
-        page_index = 0
-        for batch in batches:
-            original_images, _ = pdfium_pages_to_numpy(
-                batch, scale_tuple=(YOLOX_MAX_WIDTH, YOLOX_MAX_HEIGHT), trace_info=trace_info
-            )
+    def add_page(self, page, page_idx: int) -> None:
+        """
+        Renders a page and queues it for table and chart detection.
+
+        Parameters
+        ----------
+        page : libpdfium.PdfPage
+            The page to render. It is not referenced after this call returns.
+        page_idx : int
+            The page number recorded with the page's tables and charts.
+        """
+        image, _ = pdfium_pages_to_numpy(
+            [page], target_resolution=(YOLOX_MAX_WIDTH, YOLOX_MAX_HEIGHT), trace_info=self._trace_info
+        )
+        self._batch_images.extend(image)
+        self._batch_page_indices.append(page_idx)
+
+        if self._batch_sizes and len(self._batch_images) >= self._batch_sizes[0]:
+            self._batch_sizes.pop(0)
+            self._submit_batch()
+
+    def _submit_batch(self) -> None:
+        images, page_indices = self._batch_images, self._batch_page_indices
+        self._batch_images, self._batch_page_indices = [], []
+
+        self._inflight.acquire()
+        try:
+            self._raise_on_failed_batch()
+            future = self._executor.submit(self._process_batch, images, page_indices)
+        except BaseException:
+            self._inflight.release()
+            raise
+        future.add_done_callback(lambda _: self._inflight.release())
+        self._futures.append(future)
+
+    def _raise_on_failed_batch(self) -> None:
+        # Stop rendering as soon as an earlier batch has failed rather than after the last page.
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+    def _process_batch(self, images: List[np.ndarray], page_indices: List[int]) -> List[Tuple[int, object]]:
+        inference_results = self._yolox_client.infer(
+            {"images": images},
+            model_name="yolox",
+            num_classes=YOLOX_NUM_CLASSES,
+            conf_thresh=YOLOX_CONF_THRESHOLD,
+            iou_thresh=YOLOX_IOU_THRESHOLD,
+            min_score=YOLOX_MIN_SCORE,
+            final_thresh=YOLOX_FINAL_SCORE,
+            trace_info=self._trace_info,  # traceable_func arg
+            stage_name="pdf_content_extractor",  # traceable_func arg
+        )
 
-            # Prepare data
-            data = {"images": original_images}
-
-            # Perform inference using NimClient
-            inference_results = yolox_client.infer(
-                data,
-                model_name="yolox",
-                num_classes=YOLOX_NUM_CLASSES,
-                conf_thresh=YOLOX_CONF_THRESHOLD,
-                iou_thresh=YOLOX_IOU_THRESHOLD,
-                min_score=YOLOX_MIN_SCORE,
-                final_thresh=YOLOX_FINAL_SCORE,
-                trace_info=trace_info,  # traceable_func arg
-                stage_name="pdf_content_extractor",  # traceable_func arg
+        tables_and_charts = []
+        for annotation_dict, original_image, page_idx in zip(inference_results, images, page_indices):
+            extract_table_and_chart_images(
+                annotation_dict,
+                original_image,
+                page_idx,
+                tables_and_charts,
             )
 
-            # Process results
-            for annotation_dict, original_image in zip(inference_results, original_images):
-                extract_table_and_chart_images(
-                    annotation_dict,
-                    original_image,
-                    page_index,
-                    tables_and_charts,
-                )
-                page_index += 1
+        return tables_and_charts
+
+    def finish(self) -> List[Tuple[int, object]]:  # List[Tuple[int, CroppedImageWithContent]]
+        """
+        Submits any remaining pages and waits for every batch to complete.
+
+        Returns
+        -------
+        List[Tuple[int, CroppedImageWithContent]]
+            The page number and cropped image of every detected table and chart, in page order.
+        """
+        try:
+            if self._batch_images:
+                self._submit_batch()
+
+            tables_and_charts = []
+            for future in self._futures:
+                tables_and_charts.extend(future.result())
+        finally:
+            self.close()
+
+        logger.debug(f"Extracted {len(tables_and_charts)} tables and charts.")
+
+        return tables_and_charts
+
+    def close(self) -> None:
+        """
+        Cancels batches that have not started and waits for running ones to finish.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._batch_images, self._batch_page_indices = [], []
+        if self._yolox_client:
+            self._yolox_client.close()
+
+
+def extract_tables_and_charts_using_image_ensemble(
+    pages: List,  # List[libpdfium.PdfPage]
+    config: PDFiumConfigSchema,
+    trace_info: Optional[List] = None,
+) -> List[Tuple[int, object]]:  # List[Tuple[int, CroppedImageWithContent]]
+    pipeline = None
+    try:
+        pipeline = TableAndChartPipeline(config, len(pages), trace_info=trace_info)
+        for page_idx, page in enumerate(pages):
+            pipeline.add_page(page, page_idx)
+
+        return pipeline.finish()
 
     except TimeoutError:
         logger.error("Timeout error during table/chart extraction.")
@@ -134,12 +272,8 @@ def extract_tables_and_charts_using_image_ensemble(
         raise e
 
     finally:
-        if yolox_client:
-            yolox_client.close()
-
-    logger.debug(f"Extracted {len(tables_and_charts)} tables and charts.")
-
-    return tables_and_charts
+        if pipeline is not None:
+            pipeline.close()
 
 
 def process_inference_results(
@@ -271,6 +405,264 @@ def extract_table_and_chart_images(
             tables_and_charts.append((page_idx, table_data))
 
 
+def _extract_page_range(
+    doc,  # libpdfium.PdfDocument
+    page_range: range,
+    pdf_metadata,
+    extract_text: bool,
+    extract_images: bool,
+    extract_tables: bool,
+    extract_charts: bool,
+    text_depth: TextTypeEnum,
+    source_metadata: Dict[str, Any],
+    base_unified_metadata: Dict[str, Any],
+    pdfium_config,
+    trace_info=None,
+) -> Tuple[List, List[str], List[Tuple[int, object]]]:
+    """
+    Extracts text, images, tables and charts from a contiguous range of pages.
+
+    Returns
+    -------
+    Tuple[List, List[str], List[Tuple[int, CroppedImageWithContent]]]
+        The page and image rows in page order, the text still to be aggregated at the document level, and the
+        detected tables and charts with their page numbers.
+    """
+    extracted_data = []
+    accumulated_text = []
+
+    # Tables and charts are detected by YOLOX while later pages are still being extracted.
+    table_and_chart_pipeline = None
+    tables_and_charts = []
+    if extract_tables or extract_charts:
+        table_and_chart_pipeline = TableAndChartPipeline(pdfium_config, len(page_range), trace_info=trace_info)
+
+    try:
+        for page_idx in page_range:
+            page = doc.get_page(page_idx)
+            page_width, page_height = doc.get_page_size(page_idx)
+
+            # https://pypdfium2.readthedocs.io/en/stable/python_api.html#module-pypdfium2._helpers.textpage
+            if extract_text:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_bounded()
+                accumulated_text.append(page_text)
+
+                if text_depth == TextTypeEnum.PAGE and len(accumulated_text) > 0:
+                    text_extraction = construct_text_metadata(
+                        accumulated_text,
+                        pdf_metadata.keywords,
+                        page_idx,
+                        -1,
+                        -1,
+                        -1,
+                        pdf_metadata.page_count,
+                        text_depth,
+                        source_metadata,
+                        base_unified_metadata,
+                    )
+
+                    extracted_data.append(text_extraction)
+                    accumulated_text = []
+
+            # Image extraction
+            if extract_images:
+                for obj in page.get_objects():
+                    obj_type = PDFIUM_PAGEOBJ_MAPPING.get(obj.type, "UNKNOWN")
+                    if obj_type == "IMAGE":
+                        try:
+                            # Attempt to retrieve the image bitmap
+                            image_numpy: np.ndarray = pdfium_try_get_bitmap_as_numpy(obj)  # noqa
+                            image_base64: str = numpy_to_base64(image_numpy)
+                            image_bbox = obj.get_pos()
+                            image_size = obj.get_size()
+                            image_data = Base64Image(
+                                image=image_base64,
+                                bbox=image_bbox,
+                                width=image_size[0],
+                                height=image_size[1],
+                                max_width=page_width,
+                                max_height=page_height,
+                            )
+
+                            extracted_image_data = construct_image_metadata_from_pdf_image(
+                                image_data,
+                                page_idx,
+                                pdf_metadata.page_count,
+                                source_metadata,
+                                base_unified_metadata,
+                            )
+
+                            extracted_data.append(extracted_image_data)
+                        except Exception as e:
+                            logger.error(f"Unhandled error extracting image: {e}")
+                            pass  # Pdfium failed to extract the image associated with this object - corrupt or missing.
+
+            # Table and chart detection
+            if table_and_chart_pipeline is not None:
+                table_and_chart_pipeline.add_page(page, page_idx)
+
+            page.close()
+
+        if table_and_chart_pipeline is not None:
+            tables_and_charts = table_and_chart_pipeline.finish()
+
+    finally:
+        if table_and_chart_pipeline is not None:
+            table_and_chart_pipeline.close()
+
+    return extracted_data, accumulated_text, tables_and_charts
+
+
+def _get_page_shards(page_count: int, pdfium_config) -> List[range]:
+    """
+    Splits a document's pages into contiguous shards, or a single range if the document is below the shard threshold.
+    """
+    threshold = getattr(pdfium_config, "page_shard_threshold", 0)
+    workers = getattr(pdfium_config, "page_shard_workers", 1)
+    if not threshold or page_count < threshold or workers <= 1:
+        return [range(page_count)]
+
+    shard_size = -(-page_count // workers)  # ceil division
+    return [range(start, min(start + shard_size, page_count)) for start in range(0, page_count, shard_size)]
+
+
+def _get_shard_executor(max_workers: int) -> ProcessPoolExecutor:
+    global _shard_executor, _shard_executor_workers
+
+    with _shard_executor_lock:
+        if _shard_executor is None or _shard_executor_workers != max_workers:
+            if _shard_executor is not None:
+                _shard_executor.shutdown(wait=True)
+            # Pool workers may hold gRPC channels, which do not survive fork; shard processes start from a clean
+            # forkserver instead.
+            context = mp.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+            _shard_executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+            _shard_executor_workers = max_workers
+            register_exit_finalizer(_shutdown_shard_executor)
+
+        return _shard_executor
+
+
+def _shutdown_shard_executor() -> None:
+    global _shard_executor
+
+    with _shard_executor_lock:
+        executor, _shard_executor = _shard_executor, None
+
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _reset_shard_executor_after_fork() -> None:
+    # A forked child must not use, or shut down, the parent's shard processes.
+    global _shard_executor, _shard_executor_lock
+
+    _shard_executor = None
+    _shard_executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_shard_executor_after_fork)
+
+
+def _extract_page_shard(shm_name: str, size: int, source_id, page_range: range, shard_kwargs: Dict[str, Any]):
+    """
+    Runs `_extract_page_range` for one shard in a shard process, over PDF bytes held in shared memory.
+
+    Returns
+    -------
+    tuple
+        The result of `_extract_page_range` and the shard's trace information.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pdf_bytes = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+    trace_info = {}
+    doc = libpdfium.PdfDocument(pdf_bytes)
+    try:
+        pdf_metadata = extract_pdf_metadata(doc, source_id)
+        result = _extract_page_range(doc, page_range, pdf_metadata, trace_info=trace_info, **shard_kwargs)
+    finally:
+        doc.close()
+
+    return result, trace_info
+
+
+def _merge_trace_info(trace_info: Dict, shard_trace_info: Dict) -> None:
+    """
+    Copies a shard's trace entries into `trace_info`, renumbering deduplicated entries that would collide.
+    """
+    for entry_key, ts_entry in shard_trace_info.items():
+        if not entry_key.startswith("trace::entry::"):
+            continue
+
+        exit_key = "trace::exit::" + entry_key[len("trace::entry::") :]  # noqa: E203
+        ts_exit = shard_trace_info.get(exit_key)
+
+        prefix, sep, index = entry_key.rpartition("_")
+        if not (sep and index.isdigit()):
+            trace_info[entry_key] = ts_entry
+            if ts_exit is not None:
+                trace_info[exit_key] = ts_exit
+            continue
+
+        name = prefix[len("trace::entry::") :]  # noqa: E203
+        i = 0
+        while f"trace::entry::{name}_{i}" in trace_info or f"trace::exit::{name}_{i}" in trace_info:
+            i += 1
+        trace_info[f"trace::entry::{name}_{i}"] = ts_entry
+        if ts_exit is not None:
+            trace_info[f"trace::exit::{name}_{i}"] = ts_exit
+
+
+def _extract_page_shards(
+    pdf_stream, page_shards: List[range], source_id, pdfium_config, trace_info=None, **shard_kwargs
+) -> Tuple[List, List[str], List[Tuple[int, object]]]:
+    """
+    Extracts page shards in parallel shard processes and merges the results back in page order.
+
+    The PDF bytes are written to shared memory once; each shard process opens its own `PdfDocument` over them.
+    """
+    pdf_buffer = pdf_stream.getbuffer() if hasattr(pdf_stream, "getbuffer") else memoryview(pdf_stream.read())
+    size = len(pdf_buffer)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        shm.buf[:size] = pdf_buffer
+        del pdf_buffer
+
+        executor = _get_shard_executor(pdfium_config.page_shard_workers)
+        shard_kwargs["pdfium_config"] = pdfium_config
+        futures = [
+            executor.submit(_extract_page_shard, shm.name, size, source_id, page_range, shard_kwargs)
+            for page_range in page_shards
+        ]
+
+        extracted_data, accumulated_text, tables_and_charts = [], [], []
+        try:
+            for future in futures:
+                (shard_data, shard_text, shard_tables_and_charts), shard_trace_info = future.result()
+                extracted_data.extend(shard_data)
+                accumulated_text.extend(shard_text)
+                tables_and_charts.extend(shard_tables_and_charts)
+                if trace_info is not None:
+                    _merge_trace_info(trace_info, shard_trace_info)
+        finally:
+            for future in futures:
+                future.cancel()
+            # Shards still running must release the segment before it is unlinked.
+            wait(futures)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return extracted_data, accumulated_text, tables_and_charts
+
+
 # Define a helper function to use unstructured-io to extract text from a base64
 # encoded bytestream PDF
 def pdfium_extractor(
@@ -330,8 +722,6 @@ def pdfium_extractor(
     partition_id = base_source_metadata.get("partition_id", -1)
     access_level = base_source_metadata.get("access_level", AccessLevelEnum.LEVEL_1)
 
-    pages = []
-    extracted_data = []
     doc = libpdfium.PdfDocument(pdf_stream)
     pdf_metadata = extract_pdf_metadata(doc, source_id)
 
@@ -355,71 +745,28 @@ def pdfium_extractor(
     logger.debug(f"extract tables: {extract_charts}")
 
     # Pdfium does not support text extraction at the document level
-    accumulated_text = []
     text_depth = text_depth if text_depth == TextTypeEnum.PAGE else TextTypeEnum.DOCUMENT
-    for page_idx in range(pdf_metadata.page_count):
-        page = doc.get_page(page_idx)
-        page_width, page_height = doc.get_page_size(page_idx)
-
-        # https://pypdfium2.readthedocs.io/en/stable/python_api.html#module-pypdfium2._helpers.textpage
-        if extract_text:
-            textpage = page.get_textpage()
-            page_text = textpage.get_text_bounded()
-            accumulated_text.append(page_text)
-
-            if text_depth == TextTypeEnum.PAGE and len(accumulated_text) > 0:
-                text_extraction = construct_text_metadata(
-                    accumulated_text,
-                    pdf_metadata.keywords,
-                    page_idx,
-                    -1,
-                    -1,
-                    -1,
-                    pdf_metadata.page_count,
-                    text_depth,
-                    source_metadata,
-                    base_unified_metadata,
-                )
+    range_kwargs = {
+        "extract_text": extract_text,
+        "extract_images": extract_images,
+        "extract_tables": extract_tables,
+        "extract_charts": extract_charts,
+        "text_depth": text_depth,
+        "source_metadata": source_metadata,
+        "base_unified_metadata": base_unified_metadata,
+    }
 
-                extracted_data.append(text_extraction)
-                accumulated_text = []
-
-        # Image extraction
-        if extract_images:
-            for obj in page.get_objects():
-                obj_type = PDFIUM_PAGEOBJ_MAPPING.get(obj.type, "UNKNOWN")
-                if obj_type == "IMAGE":
-                    try:
-                        # Attempt to retrieve the image bitmap
-                        image_numpy: np.ndarray = pdfium_try_get_bitmap_as_numpy(obj)  # noqa
-                        image_base64: str = numpy_to_base64(image_numpy)
-                        image_bbox = obj.get_pos()
-                        image_size = obj.get_size()
-                        image_data = Base64Image(
-                            image=image_base64,
-                            bbox=image_bbox,
-                            width=image_size[0],
-                            height=image_size[1],
-                            max_width=page_width,
-                            max_height=page_height,
-                        )
-
-                        extracted_image_data = construct_image_metadata_from_pdf_image(
-                            image_data,
-                            page_idx,
-                            pdf_metadata.page_count,
-                            source_metadata,
-                            base_unified_metadata,
-                        )
-
-                        extracted_data.append(extracted_image_data)
-                    except Exception as e:
-                        logger.error(f"Unhandled error extracting image: {e}")
-                        pass  # Pdfium failed to extract the image associated with this object - corrupt or missing.
-
-        # Table and chart collection
-        if extract_tables or extract_charts:
-            pages.append(page)
+    page_shards = _get_page_shards(pdf_metadata.page_count, pdfium_config)
+    if len(page_shards) > 1:
+        logger.debug(f"Extracting {pdf_metadata.page_count} pages in {len(page_shards)} shards.")
+        doc.close()
+        extracted_data, accumulated_text, tables_and_charts = _extract_page_shards(
+            pdf_stream, page_shards, source_id, pdfium_config, trace_info=trace_info, **range_kwargs
+        )
+    else:
+        extracted_data, accumulated_text, tables_and_charts = _extract_page_range(
+            doc, page_shards[0], pdf_metadata, pdfium_config=pdfium_config, trace_info=trace_info, **range_kwargs
+        )
 
     if extract_text and text_depth == TextTypeEnum.DOCUMENT and len(accumulated_text) > 0:
         text_extraction = construct_text_metadata(
@@ -437,27 +784,22 @@ def pdfium_extractor(
 
         extracted_data.append(text_extraction)
 
-    if extract_tables or extract_charts:
-        for page_idx, table_and_charts in extract_tables_and_charts_using_image_ensemble(
-            pages,
-            pdfium_config,
-            trace_info=trace_info,
+    for page_idx, table_and_charts in tables_and_charts:
+        if (extract_tables and (table_and_charts.type_string == "table")) or (
+            extract_charts and (table_and_charts.type_string == "chart")
         ):
-            if (extract_tables and (table_and_charts.type_string == "table")) or (
-                extract_charts and (table_and_charts.type_string == "chart")
-            ):
-                if table_and_charts.type_string == "table":
-                    table_and_charts.content_format = paddle_output_format
-
-                extracted_data.append(
-                    construct_table_and_chart_metadata(
-                        table_and_charts,
-                        page_idx,
-                        pdf_metadata.page_count,
-                        source_metadata,
-                        base_unified_metadata,
-                    )
+            if table_and_charts.type_string == "table":
+                table_and_charts.content_format = paddle_output_format
+
+            extracted_data.append(
+                construct_table_and_chart_metadata(
+                    table_and_charts,
+                    page_idx,
+                    pdf_metadata.page_count,
+                    source_metadata,
+                    base_unified_metadata,
                 )
+            )
 
     logger.debug(f"Extracted {len(extracted_data)} items from PDF.")
 
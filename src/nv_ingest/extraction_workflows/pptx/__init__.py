@@ -3,7 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from nv_ingest.extraction_workflows.pptx.pptx_helper import python_pptx
+from nv_ingest.util.lazy_imports import lazy_module_attributes
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "python_pptx": ("nv_ingest.extraction_workflows.pptx.pptx_helper", "python_pptx"),
+    },
+)
 
 __all__ = [
     "python_pptx",
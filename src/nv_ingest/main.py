@@ -8,9 +8,20 @@
 # without an express license agreement from NVIDIA CORPORATION or
 # its affiliates is strictly prohibited.
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from .api.main import app as app_v1
+from .service.impl.ingest.redis_ingest_service import RedisIngestService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Mounted apps get no lifespan events of their own, so the v1 API's shared service is closed here.
+    await RedisIngestService.closeInstance()
+
 
 app = FastAPI(
     title="NV-Ingest Microservice",
@@ -23,6 +34,7 @@ app = FastAPI(
     openapi_tags=[
         {"name": "Health", "description": "Health checks"},
     ],
+    lifespan=lifespan,
 )
 
 
@@ -10,7 +10,6 @@
 Module for extracting content from docx
 """
 
-import base64
 import ctypes
 import functools
 import io
@@ -28,6 +27,7 @@ from morpheus.messages import MessageMeta
 from morpheus.utils.module_utils import ModuleLoaderFactory
 from morpheus.utils.module_utils import register_module
 from mrc.core.node import RoundRobinRouter
+from nv_ingest_client.util.blob_store import resolve_content
 
 import cudf
 
@@ -69,8 +69,8 @@ def _process_docx_bytes(df, task_props):
         task_props["params"]["row_data"] = row_data
         # Get source_id
         source_id = base64_row["source_id"] if "source_id" in base64_row.index else None
-        # Decode the base64 content
-        doc_bytes = base64.b64decode(base64_content)
+        # Decode the base64 content, or read it from the blob store if the job carries a reference
+        doc_bytes = resolve_content(base64_content)
 
         # Load the doc
         doc_stream = io.BytesIO(doc_bytes)
@@ -10,6 +10,7 @@ import traceback
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 import mrc
@@ -17,6 +18,8 @@ from morpheus.messages import ControlMessage
 from morpheus.utils.module_utils import ModuleLoaderFactory
 from morpheus.utils.module_utils import register_module
 from mrc.core import operators as ops
+from nv_ingest_client.util.blob_store import offload_result_content
+from nv_ingest_client.util.embeddings import encode_embeddings
 
 from nv_ingest.schemas.message_broker_sink_schema import MessageBrokerTaskSinkSchema
 from nv_ingest.util.message_brokers.client_base import MessageBrokerClientBase
@@ -276,7 +279,12 @@ def handle_failure(
     broker_client.submit_message(response_channel, json.dumps(fail_msg))
 
 
-def process_and_forward(message: ControlMessage, broker_client: MessageBrokerClientBase) -> ControlMessage:
+def process_and_forward(
+    message: ControlMessage,
+    broker_client: MessageBrokerClientBase,
+    embedding_dtype: Optional[str] = None,
+    blob_store_threshold_bytes: int = 0,
+) -> ControlMessage:
     """
     Processes a message by extracting data, creating a JSON payload, and attempting to push it to the message broker.
 
@@ -286,6 +294,12 @@ def process_and_forward(message: ControlMessage, broker_client: MessageBrokerCli
         The message to process.
     broker_client : MessageBrokerClientBase
         The message broker client used for pushing data.
+    embedding_dtype : str, optional
+        If set ("float32" or "float16"), embeddings are sent as base64-packed little-endian bytes of this dtype
+        instead of JSON lists of floats.
+    blob_store_threshold_bytes : int, optional
+        If positive, image content whose base64 text is longer than this is moved to the blob store and sent as a
+        blob reference. Only applies to jobs submitted with `offload_results`, whose consumer can read the store.
 
     Returns
     -------
@@ -305,6 +319,10 @@ def process_and_forward(message: ControlMessage, broker_client: MessageBrokerCli
         cm_failed = message.get_metadata("cm_failed", False)
         if not cm_failed:
             mdf, df_json = extract_data_frame(message)
+            if embedding_dtype:
+                encode_embeddings(df_json, embedding_dtype)
+            if blob_store_threshold_bytes > 0 and message.get_metadata("offload_results", False):
+                offload_result_content(df_json, blob_store_threshold_bytes)
             json_result_fragments = create_json_payload(message, df_json)
         else:
             json_result_fragments = create_json_payload(message, None)
@@ -388,7 +406,9 @@ def _message_broker_task_sink(builder: mrc.Builder) -> None:
         ControlMessage
             The processed message, after attempting to forward to the message broker.
         """
-        return process_and_forward(message, client)
+        return process_and_forward(
+            message, client, validated_config.embedding_dtype, validated_config.blob_store_threshold_bytes
+        )
 
     process_node = builder.make_node("process_and_forward", ops.map(_process_and_forward))
     process_node.launch_options.engines_per_pe = validated_config.progress_engines
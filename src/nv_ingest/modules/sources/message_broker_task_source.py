@@ -13,6 +13,7 @@ from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
 from morpheus.utils.module_utils import ModuleLoaderFactory
 from morpheus.utils.module_utils import register_module
+from nv_ingest_client.util.blob_store import offload_job_payload
 from opentelemetry.trace.span import format_trace_id
 from pydantic import BaseModel
 
@@ -71,7 +72,7 @@ def fetch_and_process_messages(client, validated_config: MessageBrokerTaskSource
                 logger.debug("Received something not a ResponseSchema")
 
             ts_fetched = datetime.now()
-            yield process_message(job, ts_fetched)
+            yield process_message(job, ts_fetched, validated_config.blob_store_threshold_bytes)
         except TimeoutError:
             continue
         except Exception as err:
@@ -82,7 +83,7 @@ def fetch_and_process_messages(client, validated_config: MessageBrokerTaskSource
             continue  # Continue fetching the next message
 
 
-def process_message(job: Dict, ts_fetched: datetime) -> ControlMessage:
+def process_message(job: Dict, ts_fetched: datetime, blob_store_threshold_bytes: int = 0) -> ControlMessage:
     """
     Process a job and return a ControlMessage.
 
@@ -92,6 +93,9 @@ def process_message(job: Dict, ts_fetched: datetime) -> ControlMessage:
         The job payload retrieved from the message broker.
     ts_fetched : datetime
         The timestamp when the message was fetched.
+    blob_store_threshold_bytes : int, optional
+        If positive, document content whose base64 text is longer than this is moved to the blob store, so only a
+        reference travels through the pipeline until an extraction stage reads it.
 
     Returns
     -------
@@ -127,9 +131,13 @@ def process_message(job: Dict, ts_fetched: datetime) -> ControlMessage:
             # ts_send is in nanoseconds
             ts_send = datetime.fromtimestamp(ts_send / 1e9)
         trace_id = tracing_options.get("trace_id", None)
+        offload_results = job.pop("offload_results", False)
 
         response_channel = f"{job_id}"
 
+        if blob_store_threshold_bytes > 0:
+            offload_job_payload(job, blob_store_threshold_bytes)
+
         df = cudf.DataFrame(job_payload)
         message_meta = MessageMeta(df=df)
 
@@ -137,6 +145,8 @@ def process_message(job: Dict, ts_fetched: datetime) -> ControlMessage:
         annotate_cm(control_message, message="Created")
         control_message.set_metadata("response_channel", response_channel)
         control_message.set_metadata("job_id", job_id)
+        if offload_results:
+            control_message.set_metadata("offload_results", True)
 
         for task in job_tasks:
             control_message.add_task(task["type"], task["task_properties"])
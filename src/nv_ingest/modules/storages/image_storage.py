@@ -26,6 +26,8 @@ from nv_ingest.schemas.image_storage_schema import ImageStorageModuleSchema
 from nv_ingest.schemas.metadata_schema import ContentTypeEnum
 from nv_ingest.util.exception_handlers.decorators import nv_ingest_node_failure_context_manager
 from nv_ingest.util.flow_control import filter_by_task
+from nv_ingest.util.image_processing.dedup_index import get_content_hash
+from nv_ingest.util.image_processing.dedup_index import get_image_dedup_index
 from nv_ingest.util.modules.config_validator import fetch_and_validate_module_config
 from nv_ingest.util.tracing import traceable
 
@@ -86,6 +88,8 @@ def upload_images(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
     else:
         logger.debug("Bucket %s already exists", bucket_name)
 
+    dedup_index = get_image_dedup_index()
+
     for idx, row in df.iterrows():
         if row["document_type"] not in content_types.keys():
             continue
@@ -120,6 +124,13 @@ def upload_images(df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
             metadata["image_metadata"][
                 "uploaded_image_url"
             ] = f"{_DEFAULT_READ_ADDRESS}/{bucket_name}/{destination_file}"
+            if dedup_index is not None:
+                # Later jobs that ingest the same image into this collection will reference this copy.
+                dedup_index.commit(
+                    metadata["source_metadata"].get("collection_id", ""),
+                    get_content_hash(metadata["content"]),
+                    metadata["image_metadata"]["uploaded_image_url"],
+                )
         elif row["document_type"] == ContentTypeEnum.STRUCTURED:
             logger.debug("Storing structured image data to Minio")
             metadata["table_metadata"][
@@ -83,15 +83,23 @@ def _metrics_aggregation(builder: mrc.Builder) -> None:
         "inflight_jobs_total": meter.create_gauge("inflight_jobs_total"),
         "completed_jobs_total": meter.create_gauge("completed_jobs_total"),
         "failed_jobs_total": meter.create_gauge("failed_jobs_total"),
-        "source_to_sink_mean": meter.create_gauge("source_to_sink_mean"),
-        "source_to_sink_median": meter.create_gauge("source_to_sink_median"),
         "outstanding_job_responses_total": meter.create_gauge("outstanding_job_responses_total"),
-        "response_wait_time_mean": meter.create_gauge("response_wait_time_mean"),
-        "response_wait_time_median": meter.create_gauge("response_wait_time_median"),
+        "embedding_cache_hits_total": meter.create_gauge("embedding_cache_hits_total"),
+        "embedding_cache_misses_total": meter.create_gauge("embedding_cache_misses_total"),
+        "embedding_cache_hit_rate": meter.create_gauge("embedding_cache_hit_rate"),
+        "embedding_cache_bytes_saved_total": meter.create_gauge("embedding_cache_bytes_saved_total"),
     }
 
     response_channels_store = {}
 
+    def update_latency_gauges(stat_name):
+        # Windowed mean and median, and p95/p99 from the cumulative quantile sketch.
+        for suffix in ("mean", "median", "p95", "p99"):
+            gauge_name = f"{stat_name}_{suffix}"
+            if gauge_name not in gauges:
+                gauges[gauge_name] = meter.create_gauge(gauge_name)
+            gauges[gauge_name].set(stats.get_job_stat(stat_name, suffix))
+
     def update_job_stats():
         submitted_jobs = stats.get_stat("submitted_jobs")
         completed_jobs = stats.get_stat("completed_jobs")
@@ -101,6 +109,14 @@ def _metrics_aggregation(builder: mrc.Builder) -> None:
         gauges["completed_jobs_total"].set(completed_jobs)
         gauges["failed_jobs_total"].set(failed_jobs)
 
+    def update_embedding_cache_stats():
+        hits = stats.get_stat("embedding_cache_hits")
+        misses = stats.get_stat("embedding_cache_misses")
+        gauges["embedding_cache_hits_total"].set(hits)
+        gauges["embedding_cache_misses_total"].set(misses)
+        gauges["embedding_cache_hit_rate"].set(hits / (hits + misses) if hits + misses else 0.0)
+        gauges["embedding_cache_bytes_saved_total"].set(stats.get_stat("embedding_cache_bytes_saved"))
+
     def update_job_latency(message):
         for key, val in message.filter_timestamp("trace::exit::").items():
             exit_key = key
@@ -115,19 +131,7 @@ def _metrics_aggregation(builder: mrc.Builder) -> None:
             latency_ms = (ts_exit - ts_entry).total_seconds() * 1e3
 
             stats.append_job_stat(sanitized_job_name, latency_ms)
-            mean = stats.get_job_stat(sanitized_job_name, "mean")
-            median = stats.get_job_stat(sanitized_job_name, "median")
-
-            mean_gauge_name = f"{sanitized_job_name}_mean"
-            median_gauge_name = f"{sanitized_job_name}_median"
-
-            if mean_gauge_name not in gauges:
-                gauges[mean_gauge_name] = meter.create_gauge(mean_gauge_name)
-            if median_gauge_name not in gauges:
-                gauges[median_gauge_name] = meter.create_gauge(median_gauge_name)
-
-            gauges[mean_gauge_name].set(mean)
-            gauges[median_gauge_name].set(median)
+            update_latency_gauges(sanitized_job_name)
 
     def update_e2e_latency(message):
         created_ts = pushed_ts = None
@@ -141,10 +145,7 @@ def _metrics_aggregation(builder: mrc.Builder) -> None:
         if created_ts and pushed_ts:
             latency_ms = (pushed_ts - created_ts).total_seconds() * 1e3
             stats.append_job_stat("source_to_sink", latency_ms)
-            mean = stats.get_job_stat("source_to_sink", "mean")
-            median = stats.get_job_stat("source_to_sink", "median")
-            gauges["source_to_sink_mean"].set(mean)
-            gauges["source_to_sink_median"].set(median)
+            update_latency_gauges("source_to_sink")
 
     def update_response_stats(message):
         response_channel = message.get_metadata("response_channel")
@@ -163,11 +164,8 @@ def _metrics_aggregation(builder: mrc.Builder) -> None:
                 to_remove.append(key)
                 wait_time_ms = (datetime.now() - pushed_ts).total_seconds() * 1e3  # best effort
                 stats.append_job_stat("response_wait_time", wait_time_ms)
-                mean = stats.get_job_stat("response_wait_time", "mean")
-                median = stats.get_job_stat("response_wait_time", "median")
 
-            gauges["response_wait_time_mean"].set(mean)
-            gauges["response_wait_time_median"].set(median)
+            update_latency_gauges("response_wait_time")
 
             for key in to_remove:
                 del response_channels_store[key]
@@ -189,6 +187,7 @@ def _metrics_aggregation(builder: mrc.Builder) -> None:
             logger.debug("Performing statistics aggregation.")
 
             update_job_stats()
+            update_embedding_cache_stats()
             update_job_latency(message)
             update_e2e_latency(message)
             update_response_stats(message)
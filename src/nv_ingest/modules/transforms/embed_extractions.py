@@ -3,11 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import asyncio
 import logging
 import traceback
-from typing import Iterable
 from typing import List
+from typing import Optional
 
 import mrc
 import pandas as pd
@@ -17,7 +16,6 @@ from morpheus.utils.control_message_utils import cm_skip_processing_if_failed
 from morpheus.utils.module_utils import ModuleLoaderFactory
 from morpheus.utils.module_utils import register_module
 from mrc.core import operators as ops
-from openai import AsyncOpenAI
 
 import cudf
 
@@ -29,7 +27,11 @@ from nv_ingest.schemas.metadata_schema import TaskTypeEnum
 from nv_ingest.util.exception_handlers.decorators import nv_ingest_node_failure_context_manager
 from nv_ingest.util.flow_control import filter_by_task
 from nv_ingest.util.modules.config_validator import fetch_and_validate_module_config
+from nv_ingest.util.nim.embedding_batcher import EmbeddingBatcher
+from nv_ingest.util.nim.inference_cache import DiskCacheTier
+from nv_ingest.util.nim.inference_cache import InferenceCache
 from nv_ingest.util.schema.schema_validator import validate_schema
+from nv_ingest.util.telemetry.global_stats import GlobalStats
 from nv_ingest.util.tracing import traceable
 
 logger = logging.getLogger(__name__)
@@ -40,228 +42,32 @@ MODULE_NAMESPACE = "nv_ingest"
 EmbedExtractionsLoaderFactory = ModuleLoaderFactory(MODULE_NAME, MODULE_NAMESPACE, EmbedExtractionsSchema)
 
 
-async def _make_async_request(
-    prompts: List[str],
-    api_key: str,
-    embedding_nim_endpoint: str,
-    embedding_model: str,
-    encoding_format: str,
-    input_type: str,
-    truncate: str,
-    filter_errors: bool,
-) -> list:
-    """
-    A function that interacts directly with the NIM embedding service to caculate embeddings for a batch of prompts.
-
-    Parameters
-    ----------
-    prompts : ControlMessage
-        List of all prompts that will be sent to the NIM embedding service.
-    api_key : str
-        The valid NGC api key to make requests to the NIM embedding service.
-    embedding_nim_endpoint : str
-        The url of the hosted embedding NIM.
-    embedding_model : str
-        Specifies the embedding model used in the embedding NIM.
-    encoding_format : str
-        The format to return the embeddings in, valid values are "float" or "base64"
-    input_type : str
-        nvidia/nv-embedqa-e5-v5 operates in `passage` or `query` mode, and thus require the `input_type` parameter.
-        `passage` is used when generating embeddings during indexing. `query` is used when generating embeddings during
-        querying. It is very important to use the correct `input_type`. Failure to do so will result in large drops in
-        retrieval accuracy.
-    truncate : str
-        Specifies how inputs longer than the maximum token length of the model are handled. Passing `START` discards
-        the start of the input. `END` discards the end of the input. In both cases, input is discarded until the
-        remaining input is exactly the maximum input token length for the model. If `NONE` is selected, when the input
-        exceeds the maximum input token length an error will be returned.
-    filter_errors : bool
-        A flag used set the filter criteria in an info message, allowing the pipeline drop embeddings with errors in a
-        future step.
-
-    Returns
-    -------
-        response : dict
-            A dictionary containing embeddings and list of info messages for errors that occured during the request to
-            the NIM.
-    """
-
-    response = {}
-
-    try:
-        async_client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=embedding_nim_endpoint,
-        )
-
-        resp = await async_client.embeddings.create(
-            input=prompts,
-            model=embedding_model,
-            encoding_format=encoding_format,
-            extra_body={"input_type": input_type, "truncate": truncate},
-        )
-
-        response["embedding"] = resp.data
-        response["info_msg"] = None
-
-    except Exception as e:
-        info_msg = {
-            "task": TaskTypeEnum.EMBED.value,
-            "status": StatusEnum.ERROR.value,
-            "message": f"Embedding error: {e}",
-            "filter": filter_errors,
-        }
-
-        validated_info_msg = validate_schema(info_msg, InfoMessageMetadataSchema).dict()
-
-        response["embedding"] = [None] * len(prompts)
-        response["info_msg"] = validated_info_msg
-
-    return response
-
-
-async def _async_request_handler(
-    prompts: List[str],
-    api_key: str,
-    embedding_nim_endpoint: str,
-    embedding_model: str,
-    encoding_format: str,
-    input_type: str,
-    truncate: str,
-    filter_errors: bool,
-) -> List[dict]:
+def _make_info_msg(error: str, filter_errors: bool) -> dict:
     """
-    A function to gather caculated embedding results from the NIM embedding service.
+    A function to build the info message attached to an extraction whose embedding could not be generated.
 
     Parameters
     ----------
-    prompts : ControlMessage
-        List of all prompts that will be sent to the NIM embedding service.
-    api_key : str
-        The valid NGC api key to make requests to the NIM embedding service.
-    embedding_nim_endpoint : str
-        The url of the hosted embedding NIM.
-    embedding_model : str
-        Specifies the embedding model used in the embedding NIM.
-    encoding_format : str
-        The format to return the embeddings in, valid values are "float" or "base64"
-    input_type : str
-        nvidia/nv-embedqa-e5-v5 operates in `passage` or `query` mode, and thus require the `input_type` parameter.
-        `passage` is used when generating embeddings during indexing. `query` is used when generating embeddings during
-        querying. It is very important to use the correct `input_type`. Failure to do so will result in large drops in
-        retrieval accuracy.
-    truncate : str
-        Specifies how inputs longer than the maximum token length of the model are handled. Passing `START` discards
-        the start of the input. `END` discards the end of the input. In both cases, input is discarded until the
-        remaining input is exactly the maximum input token length for the model. If `NONE` is selected, when the input
-        exceeds the maximum input token length an error will be returned.
+    error : str
+        A description of the error returned for the extraction's embedding request.
     filter_errors : bool
         A flag used set the filter criteria in an info message, allowing the pipeline drop embeddings with errors in a
         future step.
 
     Returns
     -------
-        res : list
-            A list of dictionaries containing embeddings and info messages describing errors that occured during each
-            request.
+    dict
+        A validated `InfoMessageMetadataSchema` dictionary.
     """
 
-    res = await asyncio.gather(
-        *(
-            (
-                _make_async_request(
-                    prompts=prompt_batch,
-                    api_key=api_key,
-                    embedding_nim_endpoint=embedding_nim_endpoint,
-                    embedding_model=embedding_model,
-                    encoding_format=encoding_format,
-                    input_type=input_type,
-                    truncate=truncate,
-                    filter_errors=filter_errors,
-                )
-            )
-            for prompt_batch in prompts
-        )
-    )
-
-    return res
-
-
-def _async_runner(
-    prompts: List[str],
-    api_key: str,
-    embedding_nim_endpoint: str,
-    embedding_model: str,
-    encoding_format: str,
-    input_type: str,
-    truncate: str,
-    event_loop: asyncio.SelectorEventLoop,
-    filter_errors: bool,
-) -> dict:
-    """
-    A function asynchronously launch all NIM embedding requests in the supplied asyncio event loop.
-
-    Parameters
-    ----------
-    prompts : ControlMessage
-        List of all prompts that will be sent to the NIM embedding service.
-    api_key : str
-        The valid NGC api key to make requests to the NIM embedding service.
-    embedding_nim_endpoint : str
-        The url of the hosted embedding NIM.
-    embedding_model : str
-        Specifies the embedding model used in the embedding NIM.
-    encoding_format : str
-        The format to return the embeddings in, valid values are "float" or "base64"
-    input_type : str
-        nvidia/nv-embedqa-e5-v5 operates in `passage` or `query` mode, and thus require the `input_type` parameter.
-        `passage` is used when generating embeddings during indexing. `query` is used when generating embeddings during
-        querying. It is very important to use the correct `input_type`. Failure to do so will result in large drops in
-        retrieval accuracy.
-    truncate : str
-        Specifies how inputs longer than the maximum token length of the model are handled. Passing `START` discards
-        the start of the input. `END` discards the end of the input. In both cases, input is discarded until the
-        remaining input is exactly the maximum input token length for the model. If `NONE` is selected, when the input
-        exceeds the maximum input token length an error will be returned.
-    event_loop : asyncio.SelectorEventLoop
-        The asyncio event loop used to manage asynchronous requests to embedding service.
-    filter_errors : bool
-        A flag used set the filter criteria in an info message, allowing the pipeline drop embeddings with errors in a
-        future step.
-
-    Returns
-    -------
-        flat_results : dict
-            A dictionary containing a list of embeddings and list of info messages for errors that occured.
-    """
-
-    results = event_loop.run_until_complete(
-        _async_request_handler(
-            prompts,
-            api_key,
-            embedding_nim_endpoint,
-            embedding_model,
-            encoding_format,
-            input_type,
-            truncate,
-            filter_errors,
-        )
-    )
+    info_msg = {
+        "task": TaskTypeEnum.EMBED.value,
+        "status": StatusEnum.ERROR.value,
+        "message": error,
+        "filter": filter_errors,
+    }
 
-    flat_results = {"embeddings": [], "info_msgs": []}
-    for batch_dict in results:
-        info_msg = batch_dict["info_msg"]
-        for embedding in batch_dict["embedding"]:
-            if not isinstance(embedding, list):
-                if embedding is not None:
-                    flat_results["embeddings"].append(embedding.embedding)
-                else:
-                    flat_results["embeddings"].append(embedding)
-            else:
-                flat_results["embeddings"].append(embedding)
-            flat_results["info_msgs"].append(info_msg)
-
-    return flat_results
+    return validate_schema(info_msg, InfoMessageMetadataSchema).dict()
 
 
 def _add_embeddings(row, embeddings, info_msgs):
@@ -297,67 +103,10 @@ def _get_table_content(row):
     return row["table_metadata"]["table_content"]
 
 
-def _batch_generator(iterable: Iterable, batch_size=10):
-    """
-    A generator to yield batches of size `batch_size` from an interable.
-
-    Parameters
-    ----------
-    iterable : Iterable
-        The iterable object to source data for each batch.
-    batch_size : int
-        Defines the size of each batch.
-
-    Yields
-    ------
-    Iterable
-        Yields an batch of data.
-
-    Notes
-    -----
-    The length of the last batch may be less than `batch_size`.
-    """
-
-    iter_len = len(iterable)
-    for idx in range(0, iter_len, batch_size):
-        yield iterable[idx : min(idx + batch_size, iter_len)]  # noqa: E203
-
-
-def _generate_batches(prompts: List[str], batch_size: int = 100):
-    """
-    A function to create a list of batches of size `batch_size` from a list of prompts.
-
-    Parameters
-    ----------
-    prompts : List[str]
-        A list of prompts that will be the source of data for each batch.
-    batch_size : int
-        Defines the size of each batch.
-
-    Yields
-    ------
-    List
-        Returns a list of batches of prompts.
-
-    Notes
-    -----
-    The length of the last batch may be less than `batch_size`.
-    """
-
-    return [x for x in _batch_generator(prompts, batch_size)]
-
-
 def _generate_embeddings(
     ctrl_msg: ControlMessage,
     content_type: ContentTypeEnum,
-    event_loop: asyncio.SelectorEventLoop,
-    batch_size: int,
-    api_key: str,
-    embedding_nim_endpoint: str,
-    embedding_model: str,
-    encoding_format: str,
-    input_type: str,
-    truncate: str,
+    batcher: EmbeddingBatcher,
     filter_errors: bool,
 ):
     """
@@ -370,28 +119,9 @@ def _generate_embeddings(
         The incoming control message which contains metadata to filter on and content used to create embeddings.
     content_type : ContentTypeEnum
         The content type will specify the filter criteria. Data that survives the filter is used to create embeddings.
-    event_loop : asyncio.SelectorEventLoop
-        The asyncio event loop used to manage asynchronous requests to embedding service.
-    batch_size : int
-        All elements to be embedded will be grouped into batches of size `batch_size`.
-    api_key : str
-        The valid NGC api key to make requests to the NIM embedding service.
-    embedding_nim_endpoint : str
-        The url of the hosted embedding NIM.
-    embedding_model : str
-        Specifies the embedding model used in the embedding NIM.
-    encoding_format : str
-        The format to return the embeddings in, valid values are "float" or "base64"
-    input_type : str
-        nvidia/nv-embedqa-e5-v5 operates in `passage` or `query` mode, and thus require the `input_type` parameter.
-        `passage` is used when generating embeddings during indexing. `query` is used when generating embeddings during
-        querying. It is very important to use the correct `input_type`. Failure to do so will result in large
-        drops in retrieval accuracy.
-    truncate : str
-        Specifies how inputs longer than the maximum token length of the model are handled. Passing `START` discards
-        the start of the input. `END` discards the end of the input. In both cases, input is discarded until the
-        remaining input is exactly the maximum input token length for the model. If `NONE` is selected, when the input
-        exceeds the maximum input token length an error will be returned.
+    batcher : EmbeddingBatcher
+        The shared batcher that sends content to the NIM embedding service, batched together with content from other
+        messages.
     filter_errors : bool
         A flag used set the filter criteria in an info message, allowing the pipeline drop embeddings with errors in a
         future step.
@@ -431,18 +161,15 @@ def _generate_embeddings(
         # get text list
         filtered_text = df_text["metadata"].apply(content_getter)
         # calculate embeddings
-        filtered_text_batches = _generate_batches(filtered_text.tolist(), batch_size)
-        text_embeddings = _async_runner(
-            filtered_text_batches,
-            api_key,
-            embedding_nim_endpoint,
-            embedding_model,
-            encoding_format,
-            input_type,
-            truncate,
-            event_loop,
-            filter_errors,
-        )
+        results = batcher.embed(filtered_text.tolist())
+        info_msgs_by_error = {}
+        for _, error in results:
+            if error is not None and error not in info_msgs_by_error:
+                info_msgs_by_error[error] = _make_info_msg(error, filter_errors)
+        text_embeddings = {
+            "embeddings": [embedding for embedding, _ in results],
+            "info_msgs": [info_msgs_by_error.get(error) for _, error in results],
+        }
         # update embeddings in metadata
         df_text[["metadata", "document_type", "_contains_embeddings"]] = df_text.apply(
             _add_embeddings, **text_embeddings, axis=1
@@ -452,6 +179,43 @@ def _generate_embeddings(
     return df_text, content_mask
 
 
+def _create_embedding_cache(validated_config: EmbedExtractionsSchema) -> Optional[InferenceCache]:
+    """
+    A function to create the embedding cache described by the module configuration.
+
+    Parameters
+    ----------
+    validated_config : EmbedExtractionsSchema
+        The module configuration.
+
+    Returns
+    -------
+    InferenceCache or None
+        An in-memory LRU, backed by a directory that persists across restarts when `cache_mode` is "disk", or None
+        when `cache_mode` is "off".
+    """
+
+    if validated_config.cache_mode == "off":
+        return None
+
+    shared_tier = None
+    if validated_config.cache_mode == "disk":
+        shared_tier = DiskCacheTier(validated_config.cache_dir, validated_config.cache_dir_max_bytes)
+
+    return InferenceCache(max_bytes=validated_config.cache_max_bytes, shared_tier=shared_tier)
+
+
+def _update_cache_stats(stats: GlobalStats, batcher: EmbeddingBatcher):
+    """
+    A function to publish the embedding cache counters to `GlobalStats`, where the telemetry stages export them.
+    """
+
+    cache_metrics = batcher.get_cache_metrics()
+    stats.set_stat("embedding_cache_hits", cache_metrics["hits"])
+    stats.set_stat("embedding_cache_misses", cache_metrics["misses"])
+    stats.set_stat("embedding_cache_bytes_saved", cache_metrics["bytes_saved"])
+
+
 def _concatenate_extractions(ctrl_msg: ControlMessage, dataframes: List[pd.DataFrame], masks: List[cudf.Series]):
     """
     A function to concatenate extractions enriched with embeddings and remaining extractions into `ControlMessage`.
@@ -506,7 +270,19 @@ def _embed_extractions(builder: mrc.Builder):
     validated_config = fetch_and_validate_module_config(builder, EmbedExtractionsSchema)
     httpx_logger = logging.getLogger("httpx")
     httpx_logger.setLevel(validated_config.httpx_log_level.value)
-    event_loop = asyncio.new_event_loop()
+    batcher = EmbeddingBatcher(
+        api_key=validated_config.api_key,
+        embedding_nim_endpoint=validated_config.embedding_nim_endpoint,
+        embedding_model=validated_config.embedding_model,
+        encoding_format=validated_config.encoding_format,
+        input_type=validated_config.input_type,
+        truncate=validated_config.truncate,
+        batch_size=validated_config.batch_size,
+        max_batch_wait=validated_config.max_batch_wait_ms / 1000,
+        max_concurrent_requests=validated_config.max_concurrent_requests,
+        cache=_create_embedding_cache(validated_config),
+    )
+    stats = GlobalStats.get_instance()
 
     @filter_by_task(["embed"])
     @traceable(MODULE_NAME)
@@ -530,14 +306,7 @@ def _embed_extractions(builder: mrc.Builder):
                 df_text, content_mask = _generate_embeddings(
                     message,
                     ContentTypeEnum.TEXT,
-                    event_loop,
-                    validated_config.batch_size,
-                    validated_config.api_key,
-                    validated_config.embedding_nim_endpoint,
-                    validated_config.embedding_model,
-                    validated_config.encoding_format,
-                    validated_config.input_type,
-                    validated_config.truncate,
+                    batcher,
                     filter_errors,
                 )
                 if df_text is not None:
@@ -548,20 +317,15 @@ def _embed_extractions(builder: mrc.Builder):
                 df_tables, table_mask = _generate_embeddings(
                     message,
                     ContentTypeEnum.STRUCTURED,
-                    event_loop,
-                    validated_config.batch_size,
-                    validated_config.api_key,
-                    validated_config.embedding_nim_endpoint,
-                    validated_config.embedding_model,
-                    validated_config.encoding_format,
-                    validated_config.input_type,
-                    validated_config.truncate,
+                    batcher,
                     filter_errors,
                 )
                 if df_tables is not None:
                     embedding_dataframes.append(df_tables)
                     content_masks.append(table_mask)
 
+            _update_cache_stats(stats, batcher)
+
             if len(content_masks) == 0:
                 return message
 
@@ -574,6 +338,8 @@ def _embed_extractions(builder: mrc.Builder):
             raise ValueError(f"Failed to generate embeddings: {e}")
 
     embedding_node = builder.make_node("embed_extractions", ops.map(embed_extractions_fn))
+    # Messages handled concurrently share embedding batches.
+    embedding_node.launch_options.engines_per_pe = validated_config.progress_engines
 
     # Register the input and output of the module
     builder.register_module_input("input", embedding_node)
@@ -3,17 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import copy
 import logging
 import traceback
-import uuid
-from typing import Any
-from typing import List
-from typing import Literal
 
 import mrc
 import pandas as pd
-from more_itertools import windowed
 from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
 from morpheus.utils.control_message_utils import cm_skip_processing_if_failed
@@ -28,103 +22,13 @@ from nv_ingest.schemas.nemo_doc_splitter_schema import DocumentSplitterSchema
 from nv_ingest.util.exception_handlers.decorators import nv_ingest_node_failure_context_manager
 from nv_ingest.util.flow_control import filter_by_task
 from nv_ingest.util.modules.config_validator import fetch_and_validate_module_config
+from nv_ingest.util.text_splitting.splitter import split_documents
+from nv_ingest.util.text_splitting.tokenizer import load_tokenizer
 from nv_ingest.util.tracing import traceable
 
 logger = logging.getLogger(__name__)
 
 
-def _build_split_documents(row, text_splits: List[str], sentence_window_size: int) -> List[dict[str, Any]]:
-    """Build documents from text splits with window text."""
-    documents: List[dict] = []
-
-    window_size = sentence_window_size
-    for i, text in enumerate(text_splits):
-        if text is None or not text.strip():
-            continue
-
-        metadata = row.metadata if hasattr(row, "metadata") and isinstance(row.metadata, dict) else {}
-        metadata = copy.deepcopy(metadata)
-        if window_size > 0:
-            window_text = "".join(
-                text_splits[max(0, i - window_size) : min(i + 1 + window_size, len(text_splits))]  # noqa: E203
-            )
-
-            metadata["window"] = window_text
-            metadata["original_text"] = text
-
-        metadata["content"] = text
-
-        documents.append({"document_type": ContentTypeEnum.TEXT.value, "metadata": metadata, "uuid": str(uuid.uuid4())})
-
-    return documents
-
-
-def _split_into_units(text: str, split_by: Literal["word", "sentence", "passage"]) -> List[str]:
-    if split_by == "passage":
-        split_at = "\n\n"
-    elif split_by == "sentence":
-        split_at = "."  # why not ?,!, etc..?
-    elif split_by == "word":
-        split_at = " "
-    else:
-        raise NotImplementedError("DocumentSplitter only supports 'passage', 'sentence'" " or 'word' split_by options.")
-    units = text.split(split_at)
-    # Add the delimiter back to all units except the last one
-    for i in range(len(units) - 1):
-        units[i] += split_at
-
-    return units
-
-
-def _concatenate_units(units: List[str], split_length: int, split_overlap: int, max_character_length: int) -> List[str]:
-    text_splits = []
-    segments = windowed(units, n=split_length, step=split_length - split_overlap)
-    for seg in segments:
-        current_units = [unit for unit in seg if unit is not None]
-        txt = "".join(current_units)
-        if max_character_length and len(txt) > max_character_length:
-            text_splits.extend(_split_long_text(txt, max_character_length))
-        elif len(txt) > 0:
-            text_splits.append(txt)
-
-    return text_splits
-
-
-def _split_long_text(text: str, max_character_length: int) -> List[str]:
-    """
-    Splits a long text into smaller segments that
-    do not exceed max_character_length.
-    """
-    split_texts = []
-    while text:
-        # Take the maximum possible substring without exceeding max_character_length
-        segment = text[:max_character_length]
-        split_texts.append(segment)
-        text = text[max_character_length:]  # noqa: E203
-
-    return split_texts
-
-
-def _process_content(row, validated_config):
-    content = row["metadata"]["content"]
-
-    if content is None:
-        raise ValueError(
-            "DocumentSplitter only works with text documents but one or more 'content' " "values are None."
-        )
-
-    units = _split_into_units(content, validated_config.split_by)
-    text_splits = _concatenate_units(
-        units,
-        validated_config.split_length,
-        validated_config.split_overlap,
-        max_character_length=validated_config.max_character_length,
-    )
-    split_docs = _build_split_documents(row, text_splits, sentence_window_size=validated_config.sentence_window_size)
-
-    return split_docs
-
-
 MODULE_NAME = "nemo_document_splitter"
 MODULE_NAMESPACE = "nv_ingest"
 
@@ -179,25 +83,21 @@ def _nemo_document_splitter(builder: mrc.Builder):
                 f"sentence_window_size: {sentence_window_size}"
             )
 
-            split_docs = []
-            for _, row in df_filtered.iterrows():
-                content = row["metadata"]["content"]
-
-                if content is None:
-                    raise ValueError(
-                        "DocumentSplitter only works with text documents but one or more " "'content' values are None."
-                    )
-
-                units = _split_into_units(content, split_by)
-                text_splits = _concatenate_units(
-                    units,
-                    split_length,
-                    split_overlap,
-                    max_character_length=max_character_length,
-                )
-                split_docs.extend(_build_split_documents(row, text_splits, sentence_window_size=sentence_window_size))
-
-            split_docs_df = pd.DataFrame(split_docs)
+            tokenizer = None
+            if split_by == "token":
+                if validated_config.tokenizer_path is None:
+                    raise ValueError("split_by 'token' requires the splitter's tokenizer_path to be configured.")
+                tokenizer = load_tokenizer(validated_config.tokenizer_path, validated_config.tokenizer_cache_max_bytes)
+
+            split_docs_df = split_documents(
+                df_filtered["metadata"],
+                split_by,
+                split_length,
+                split_overlap,
+                max_character_length,
+                sentence_window_size,
+                tokenizer=tokenizer,
+            )
 
             # Return both processed text and other document types
             split_docs_df = pd.concat([split_docs_df, df[~bool_index]], axis=0).reset_index(drop=True)
@@ -34,6 +34,9 @@ class ChartExtractorConfigSchema(BaseModel):
         A tuple containing the gRPC and HTTP services for the paddle endpoint.
         Either the gRPC or HTTP service can be empty, but not both.
 
+    max_concurrent_charts : int, default=8
+        The maximum number of charts with cached and deplot requests in flight at once, per worker process.
+
     Methods
     -------
     validate_endpoints(values)
@@ -62,6 +65,8 @@ class ChartExtractorConfigSchema(BaseModel):
     paddle_endpoints: Tuple[Optional[str], Optional[str]] = (None, None)
     paddle_infer_protocol: str = ""
 
+    max_concurrent_charts: int = 8
+
     @root_validator(pre=True)
     def validate_endpoints(cls, values):
         """
@@ -104,6 +109,12 @@ class ChartExtractorConfigSchema(BaseModel):
 
         return values
 
+    @validator("max_concurrent_charts")
+    def check_max_concurrent_charts(cls, v):
+        if v <= 0:
+            raise ValueError("max_concurrent_charts must be greater than 0.")
+        return v
+
     class Config:
         extra = "forbid"
 
@@ -4,8 +4,12 @@
 
 
 import logging
+from typing import Optional
 
 from pydantic import BaseModel
+from pydantic import conint
+from pydantic import root_validator
+from pydantic import validator
 
 from nv_ingest.util.logging.configuration import LogLevel
 
@@ -15,13 +19,33 @@ logger = logging.getLogger(__name__)
 class EmbedExtractionsSchema(BaseModel):
     api_key: str = "api_key"
     batch_size: int = 100
+    cache_dir: Optional[str] = None
+    cache_dir_max_bytes: conint(ge=1) = 4 * 1024 * 1024 * 1024
+    cache_max_bytes: conint(ge=1) = 256 * 1024 * 1024
+    cache_mode: str = "off"
     embedding_model: str = "nvidia/nv-embedqa-e5-v5"
     embedding_nim_endpoint: str = "http://embedding:8000/v1"
     encoding_format: str = "float"
     httpx_log_level: LogLevel = LogLevel.WARNING
     input_type: str = "passage"
+    max_batch_wait_ms: conint(ge=0) = 20
+    max_concurrent_requests: conint(ge=1) = 8
+    progress_engines: conint(ge=1) = 4
     raise_on_failure: bool = False
     truncate: str = "END"
 
+    @validator("cache_mode")
+    def validate_cache_mode(cls, to_validate):  # pylint: disable=no-self-argument
+        to_validate = to_validate.lower()
+        if to_validate not in ("off", "memory", "disk"):
+            raise ValueError("cache_mode must be one of 'off', 'memory' or 'disk'.")
+        return to_validate
+
+    @root_validator(skip_on_failure=True)
+    def validate_cache_dir(cls, values):  # pylint: disable=no-self-argument
+        if values.get("cache_mode") == "disk" and not values.get("cache_dir"):
+            raise ValueError("cache_dir is required when cache_mode is 'disk'.")
+        return values
+
     class Config:
         extra = "forbid"
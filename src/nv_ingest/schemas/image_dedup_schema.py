@@ -7,13 +7,18 @@ import logging
 
 from pydantic import BaseModel
 from pydantic import StrictBool
+from pydantic import conint
 
 logger = logging.getLogger(__name__)
 
+# Bits (of 64) two perceptual hashes may differ by for the images to count as near-duplicates.
+DEFAULT_PERCEPTUAL_HASH_THRESHOLD = 6
+
 
 class ImageDedupSchema(BaseModel):
     raise_on_failure: StrictBool = False
     cpu_only: StrictBool = False
+    perceptual_hash_threshold: conint(ge=0, le=64) = DEFAULT_PERCEPTUAL_HASH_THRESHOLD
 
     class Config:
         extra = "forbid"
@@ -61,7 +61,7 @@ class TracingOptionsSchema(BaseModelNoExt):
 
 
 class IngestTaskSplitSchema(BaseModelNoExt):
-    split_by: Literal["word", "sentence", "passage"]
+    split_by: Literal["word", "sentence", "passage", "token"]
     split_length: conint(gt=0)
     split_overlap: conint(ge=0)
     max_character_length: Optional[conint(gt=0)]
@@ -121,6 +121,7 @@ class IngestTaskFilterSchema(BaseModelNoExt):
 
 class IngestTaskDedupParams(BaseModelNoExt):
     filter: bool = False
+    method: Literal["exact", "perceptual"] = "exact"
 
 
 class IngestTaskDedupSchema(BaseModelNoExt):
@@ -213,6 +214,7 @@ class IngestJobSchema(BaseModelNoExt):
     job_id: Union[str, int]
     tasks: List[IngestTaskSchema]
     tracing_options: Optional[TracingOptionsSchema]
+    offload_results: bool = False
 
 
 def validate_ingest_job(job_data: Dict[str, Any]) -> IngestJobSchema:
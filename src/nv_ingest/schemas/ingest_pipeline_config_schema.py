@@ -5,6 +5,7 @@
 import logging
 
 from pydantic import BaseModel
+from pydantic import Field
 
 from nv_ingest.schemas.chart_extractor_schema import ChartExtractorSchema
 from nv_ingest.schemas.embedding_storage_schema import EmbeddingStorageModuleSchema
@@ -24,6 +25,7 @@ from nv_ingest.schemas.otel_tracer_schema import OpenTelemetryTracerSchema
 from nv_ingest.schemas.pdf_extractor_schema import PDFExtractorSchema
 from nv_ingest.schemas.pptx_extractor_schema import PPTXExctractorSchema
 from nv_ingest.schemas.table_extractor_schema import TableExtractorSchema
+from nv_ingest.schemas.worker_pool_schema import WorkerPoolsSchema
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +48,8 @@ class PipelineConfigSchema(BaseModel):
     redis_task_sink: MessageBrokerTaskSinkSchema = MessageBrokerTaskSinkSchema()
     redis_task_source: MessageBrokerTaskSourceSchema = MessageBrokerTaskSourceSchema()
     table_extractor_module: TableExtractorSchema = TableExtractorSchema()
-    vdb_task_sink: VdbTaskSinkSchema = VdbTaskSinkSchema()
+    vdb_task_sink: VdbTaskSinkSchema = Field(default_factory=VdbTaskSinkSchema)
+    worker_pools: WorkerPoolsSchema = WorkerPoolsSchema()
 
     class Config:
         extra = "forbid"
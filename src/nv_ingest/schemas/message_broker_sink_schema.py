@@ -3,8 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from typing import Optional
+
 from pydantic import BaseModel
 from pydantic import conint
+from pydantic import validator
 
 from nv_ingest.schemas.message_broker_client_schema import MessageBrokerClientSchema
 
@@ -15,3 +18,18 @@ class MessageBrokerTaskSinkSchema(BaseModel):
     raise_on_failure: bool = False
 
     progress_engines: conint(ge=1) = 6
+
+    # None sends embeddings as JSON lists of floats; "float32" or "float16" packs them as base64 little-endian bytes.
+    embedding_dtype: Optional[str] = None
+
+    # Image content whose base64 text is longer than this is sent as a blob store reference; 0 keeps it inline.
+    blob_store_threshold_bytes: conint(ge=0) = 0
+
+    @validator("embedding_dtype")
+    def validate_embedding_dtype(cls, to_validate):  # pylint: disable=no-self-argument
+        if to_validate is None:
+            return to_validate
+        to_validate = to_validate.lower()
+        if to_validate not in ("float32", "float16"):
+            raise ValueError("embedding_dtype must be 'float32' or 'float16'.")
+        return to_validate
@@ -16,3 +16,6 @@ class MessageBrokerTaskSourceSchema(BaseModel):
     raise_on_failure: bool = False
 
     progress_engines: conint(ge=1) = 6
+
+    # Job content whose base64 text is longer than this is moved to the blob store on arrival; 0 keeps it inline.
+    blob_store_threshold_bytes: conint(ge=0) = 0
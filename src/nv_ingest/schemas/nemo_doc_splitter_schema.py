@@ -12,11 +12,13 @@ from pydantic import validator
 
 
 class DocumentSplitterSchema(BaseModel):
-    split_by: Literal["word", "sentence", "passage"] = "word"
+    split_by: Literal["word", "sentence", "passage", "token"] = "word"
     split_length: conint(gt=0) = 60
     split_overlap: conint(ge=0) = 10
     max_character_length: Optional[conint(gt=0)] = 450
     sentence_window_size: Optional[conint(ge=0)] = 0
+    tokenizer_path: Optional[str] = None
+    tokenizer_cache_max_bytes: conint(ge=0) = 64 * 1024 * 1024
     raise_on_failure: bool = False
 
     @validator("sentence_window_size")
@@ -24,3 +26,9 @@ class DocumentSplitterSchema(BaseModel):
         if v is not None and v > 0 and values["split_by"] != "sentence":
             raise ValueError("When using sentence_window_size, split_by must be 'sentence'.")
         return v
+
+    @validator("tokenizer_path", always=True)
+    def check_tokenizer_path(cls, v, values, **kwargs):
+        if not v and values.get("split_by") == "token":
+            raise ValueError("When using split_by 'token', tokenizer_path must be set.")
+        return v or None
@@ -9,6 +9,7 @@ from typing import Tuple
 
 from pydantic import BaseModel
 from pydantic import root_validator
+from pydantic import validator
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,13 @@ class PDFiumConfigSchema(BaseModel):
         A tuple containing the gRPC and HTTP services for the yolox endpoint.
         Either the gRPC or HTTP service can be empty, but not both.
 
+    page_shard_threshold : int, default=0
+        Documents with at least this many pages are split into contiguous page shards that are extracted in
+        parallel. 0 disables sharding.
+
+    page_shard_workers : int, default=4
+        The number of shard processes each PDF extraction worker uses for sharded documents.
+
     Methods
     -------
     validate_endpoints(values)
@@ -47,6 +55,9 @@ class PDFiumConfigSchema(BaseModel):
     yolox_endpoints: Tuple[Optional[str], Optional[str]] = (None, None)
     yolox_infer_protocol: str = ""
 
+    page_shard_threshold: int = 0
+    page_shard_workers: int = 4
+
     @root_validator(pre=True)
     def validate_endpoints(cls, values):
         """
@@ -94,6 +105,18 @@ class PDFiumConfigSchema(BaseModel):
 
         return values
 
+    @validator("page_shard_threshold")
+    def check_page_shard_threshold(cls, v):
+        if v < 0:
+            raise ValueError("page_shard_threshold must be 0 or greater.")
+        return v
+
+    @validator("page_shard_workers")
+    def check_page_shard_workers(cls, v):
+        if v < 1:
+            raise ValueError("page_shard_workers must be 1 or greater.")
+        return v
+
     class Config:
         extra = "forbid"
 
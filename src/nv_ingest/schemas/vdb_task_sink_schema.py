@@ -6,7 +6,6 @@
 import logging
 import typing
 
-import pymilvus
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic import conint
@@ -33,6 +32,8 @@ def build_default_milvus_config(embedding_size: int = 1024) -> typing.Dict[str,
     typing.Dict[str, Any]
         A dictionary containing the configuration settings for Milvus.
     """
+    # Imported here, as pymilvus is slow to import and only needed once a sink is configured.
+    import pymilvus
 
     milvus_resource_kwargs = {
         "index_conf": {
@@ -87,7 +88,7 @@ class VdbTaskSinkSchema(BaseModel):
     service: str = "milvus"
     is_service_serialized: bool = False
     default_resource_name: str = "nv_ingest_collection"
-    resource_schemas: dict = {default_resource_name: build_default_milvus_config()}
+    resource_schemas: dict = Field(default_factory=lambda: {"nv_ingest_collection": build_default_milvus_config()})
     resource_kwargs: dict = Field(default_factory=dict)
     service_kwargs: dict = {}
     batch_size: int = 5120
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import root_validator
+from pydantic import validator
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPoolSchema(BaseModel):
+    """
+    Configuration for a single named process worker pool.
+
+    Parameters
+    ----------
+    workers : int
+        The number of worker processes in the pool.
+
+    max_queue_depth : int, default=0
+        The maximum number of tasks allowed to wait for a free worker. 0 leaves the queue unbounded.
+
+    cpu_affinity : Optional[List[int]], default=None
+        CPU ids the pool's workers are restricted to. Workers inherit the pipeline's affinity when unset.
+    """
+
+    workers: int
+    max_queue_depth: int = 0
+    cpu_affinity: Optional[List[int]] = None
+
+    @validator("workers")
+    def check_workers(cls, v):
+        if v <= 0:
+            raise ValueError("workers must be greater than 0.")
+        return v
+
+    @validator("max_queue_depth")
+    def check_max_queue_depth(cls, v):
+        if v < 0:
+            raise ValueError("max_queue_depth must be greater than or equal to 0.")
+        return v
+
+    @validator("cpu_affinity")
+    def check_cpu_affinity(cls, v):
+        if v is not None and (not v or any(cpu < 0 for cpu in v)):
+            raise ValueError("cpu_affinity must be a non-empty list of CPU ids.")
+        return v
+
+    class Config:
+        extra = "forbid"
+
+
+class WorkerPoolsSchema(BaseModel):
+    """
+    Configuration for the pipeline's named worker pools and the stages assigned to them.
+
+    Parameters
+    ----------
+    pools : Dict[str, WorkerPoolSchema], default={}
+        Pool definitions keyed by pool name.
+
+    stages : Dict[str, str], default={}
+        Pool assignments keyed by stage name, for example {"pdf_extractor": "extraction"}. Stages that are not
+        listed run in the default pool.
+    """
+
+    pools: Dict[str, WorkerPoolSchema] = {}
+    stages: Dict[str, str] = {}
+
+    @root_validator(skip_on_failure=True)
+    def check_stage_pools(cls, values):
+        pools = values.get("pools", {})
+        for stage_name, pool_name in values.get("stages", {}).items():
+            if pool_name != "default" and pool_name not in pools:
+                raise ValueError(f"Stage '{stage_name}' is assigned to undefined worker pool '{pool_name}'.")
+        return values
+
+    class Config:
+        extra = "forbid"
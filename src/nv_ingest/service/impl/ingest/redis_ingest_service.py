@@ -8,16 +8,21 @@
 # without an express license agreement from NVIDIA CORPORATION or
 # its affiliates is strictly prohibited.
 
+import asyncio
 import json
 import logging
 import os
 from json import JSONDecodeError
 from typing import Any
 
+from nv_ingest_client.util.blob_store import BLOB_STORE_THRESHOLD_BYTES
+from nv_ingest_client.util.blob_store import offload_job_payload
+from nv_ingest_client.util.blob_store import resolve_result_content
+
 from nv_ingest.schemas import validate_ingest_job
 from nv_ingest.schemas.message_wrapper_schema import MessageWrapper
 from nv_ingest.service.meta.ingest.ingest_service_meta import IngestServiceMeta
-from nv_ingest.util.message_brokers.redis.redis_client import RedisClient
+from nv_ingest.util.message_brokers.redis.async_redis_client import AsyncRedisClient
 
 logger = logging.getLogger("uvicorn")
 
@@ -25,7 +30,8 @@ logger = logging.getLogger("uvicorn")
 class RedisIngestService(IngestServiceMeta):
     """Submits Jobs to via Redis"""
 
-    _concurrency_level = os.getenv("CONCURRENCY_LEVEL", 10)
+    # The number of Redis connections shared by all requests; more concurrent fetches than this wait for a connection.
+    _concurrency_level = int(os.getenv("CONCURRENCY_LEVEL", 128))
     _client_kwargs = "{}"
     __shared_instance = None
 
@@ -42,12 +48,20 @@ class RedisIngestService(IngestServiceMeta):
 
         return RedisIngestService.__shared_instance
 
+    @staticmethod
+    async def closeInstance():
+        """Closes the shared instance's Redis connections, if it was created"""
+        if RedisIngestService.__shared_instance is not None:
+            await RedisIngestService.__shared_instance.close()
+            RedisIngestService.__shared_instance = None
+
     def __init__(self, redis_hostname: str, redis_port: int, redis_task_queue: str):
         self._redis_hostname = redis_hostname
         self._redis_port = redis_port
         self._redis_task_queue = redis_task_queue
 
-        self._ingest_client = RedisClient(
+        # Redis commands are awaited, so a fetch waiting on a job's result does not block other requests.
+        self._ingest_client = AsyncRedisClient(
             host=self._redis_hostname, port=self._redis_port, max_pool_size=self._concurrency_level
         )
 
@@ -59,7 +73,11 @@ class RedisIngestService(IngestServiceMeta):
 
             job_spec["job_id"] = trace_id
 
-            self._ingest_client.submit_message(self._redis_task_queue, json.dumps(job_spec))
+            if BLOB_STORE_THRESHOLD_BYTES > 0:
+                # Keep large documents out of Redis; the pipeline reads them from the blob store.
+                await asyncio.to_thread(offload_job_payload, job_spec, BLOB_STORE_THRESHOLD_BYTES)
+
+            await self._ingest_client.submit_message(self._redis_task_queue, json.dumps(job_spec))
 
             return trace_id
 
@@ -73,8 +91,15 @@ class RedisIngestService(IngestServiceMeta):
 
     async def fetch_job(self, job_id: str) -> Any:
         # Fetch message with a timeout
-        message = self._ingest_client.fetch_message(f"{job_id}", timeout=5)
+        message = await self._ingest_client.fetch_message(f"{job_id}", timeout=5)
         if message is None:
             raise TimeoutError()
 
+        if isinstance(message, dict):
+            # HTTP callers may not be able to read the blob store, so results offloaded by the sink are sent inline.
+            await asyncio.to_thread(resolve_result_content, message.get("data"))
+
         return message
+
+    async def close(self) -> None:
+        await self._ingest_client.close()
@@ -3,14 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import base64
 import functools
 import io
 import logging
 import traceback
+from typing import Optional
 
 import pandas as pd
 from morpheus.config import Config
+from nv_ingest_client.util.blob_store import resolve_content
 
 from nv_ingest.extraction_workflows import docx
 from nv_ingest.stages.multiprocessing_stage import MultiProcessingBaseStage
@@ -41,8 +42,8 @@ def _process_docx_bytes(df, task_props):
         task_props["params"]["row_data"] = row_data
         # Get source_id
         source_id = base64_row["source_id"] if "source_id" in base64_row.index else None
-        # Decode the base64 content
-        doc_bytes = base64.b64decode(base64_content)
+        # Decode the base64 content, or read it from the blob store if the job carries a reference
+        doc_bytes = resolve_content(base64_content)
 
         # Load the document
         doc_stream = io.BytesIO(doc_bytes)
@@ -97,6 +98,8 @@ def generate_docx_extractor_stage(
     task: str = "docx-extract",
     task_desc: str = "docx_content_extractor",
     pe_count: int = 24,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Helper function to generate a multiprocessing stage to perform document content extraction.
@@ -111,6 +114,10 @@ def generate_docx_extractor_stage(
         A descriptor to be used in latency tracing.
     pe_count : int
         Integer for how many process engines to use for document content extraction.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -119,5 +126,12 @@ def generate_docx_extractor_stage(
     """
 
     return MultiProcessingBaseStage(
-        c=c, pe_count=pe_count, task=task, task_desc=task_desc, process_fn=_process_docx_bytes, document_type="docx"
+        c=c,
+        pe_count=pe_count,
+        task=task,
+        task_desc=task_desc,
+        process_fn=_process_docx_bytes,
+        document_type="docx",
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
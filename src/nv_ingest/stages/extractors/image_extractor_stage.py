@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import base64
 import functools
 import io
 import logging
@@ -15,6 +14,7 @@ from typing import Optional
 
 import pandas as pd
 from morpheus.config import Config
+from nv_ingest_client.util.blob_store import resolve_content
 
 import nv_ingest.extraction_workflows.image as image_helpers
 from nv_ingest.schemas.image_extractor_schema import ImageExtractorSchema
@@ -78,8 +78,8 @@ def decode_and_extract(
 
         # Get source_id
         source_id = base64_row["source_id"] if "source_id" in base64_row.index else None
-        # Decode the base64 content
-        image_bytes = base64.b64decode(base64_content)
+        # Decode the base64 content, or read it from the blob store if the job carries a reference
+        image_bytes = resolve_content(base64_content)
 
         # Load the PDF
         image_stream = io.BytesIO(image_bytes)
@@ -180,6 +180,8 @@ def generate_image_extractor_stage(
     task: str = "extract",
     task_desc: str = "image_content_extractor",
     pe_count: int = 24,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Helper function to generate a multiprocessing stage to perform image content extraction.
@@ -196,6 +198,10 @@ def generate_image_extractor_stage(
         A descriptor to be used in latency tracing.
     pe_count : int
         Integer for how many process engines to use for pdf content extraction.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -212,4 +218,6 @@ def generate_image_extractor_stage(
         task_desc=task_desc,
         process_fn=_wrapped_process_fn,
         document_type="regex:^(png|svg|jpeg|jpg|tiff)$",
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
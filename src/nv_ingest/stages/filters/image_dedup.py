@@ -8,7 +8,9 @@ import logging
 from functools import partial
 from typing import Any
 from typing import Dict
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 from morpheus.config import Config
 from morpheus.messages import ControlMessage
@@ -18,12 +20,18 @@ from morpheus.utils.module_utils import ModuleLoaderFactory
 import cudf
 
 from nv_ingest.modules.filters.image_filter import add_info_message
+from nv_ingest.schemas.image_dedup_schema import DEFAULT_PERCEPTUAL_HASH_THRESHOLD
 from nv_ingest.schemas.image_dedup_schema import ImageDedupSchema
 from nv_ingest.schemas.metadata_schema import ContentTypeEnum
 from nv_ingest.schemas.metadata_schema import InfoMessageMetadataSchema
 from nv_ingest.schemas.metadata_schema import StatusEnum
 from nv_ingest.schemas.metadata_schema import TaskTypeEnum
 from nv_ingest.stages.multiprocessing_stage import MultiProcessingBaseStage
+from nv_ingest.util.image_processing.dedup_index import ImageDedupIndex
+from nv_ingest.util.image_processing.dedup_index import get_content_hash
+from nv_ingest.util.image_processing.dedup_index import get_image_dedup_index
+from nv_ingest.util.image_processing.perceptual_hash import compute_dhashes
+from nv_ingest.util.image_processing.perceptual_hash import group_near_duplicates
 from nv_ingest.util.schema.schema_validator import validate_schema
 
 logger = logging.getLogger(__name__)
@@ -67,7 +75,27 @@ def hash_content(x: Any, algorithm: str = "md5"):
     return hashlib.md5(x["content"].encode()).digest()
 
 
-def _cpu_only_apply_dedup_filter(df: pd.DataFrame, filter_flag: bool):
+def _perceptual_dedup_keys(metadata_sr: pd.Series, max_distance: int) -> pd.Series:
+    """
+    Computes dedup keys that are equal for near-duplicate images.
+
+    Images are grouped by the Hamming distance between their difference hashes (see `group_near_duplicates`), and
+    each image's key is the position of the first image of its group. Images that cannot be decoded fall back to
+    their exact content hash.
+    """
+    hashes, valid = compute_dhashes([metadata["content"] for metadata in metadata_sr])
+    groups = group_near_duplicates(hashes[valid], max_distance)
+
+    keys = [hash_content(metadata) for metadata in metadata_sr]
+    for position, group in zip(np.flatnonzero(valid).tolist(), groups.tolist()):
+        keys[position] = f"dhash:{group}"
+
+    return pd.Series(keys, index=metadata_sr.index, dtype=object)
+
+
+def _cpu_only_apply_dedup_filter(
+    df: pd.DataFrame, filter_flag: bool, method: str = "exact", max_distance: int = DEFAULT_PERCEPTUAL_HASH_THRESHOLD
+):
     """
     Applies a deduplication filter to images in the DataFrame.
 
@@ -81,6 +109,12 @@ def _cpu_only_apply_dedup_filter(df: pd.DataFrame, filter_flag: bool):
         and a `metadata` column containing content metadata.
     filter_flag : bool
         A flag indicating whether to filter out duplicates (`True`) or mark them with informational messages (`False`).
+    method : str, optional
+        "exact" to match identical image content, or "perceptual" to also match near-duplicates (re-encoded, rescaled
+        or noisy copies) whose perceptual hashes differ by at most `max_distance` bits. The first image of each group
+        is kept.
+    max_distance : int, optional
+        The largest Hamming distance between near-duplicate perceptual hashes.
 
     Returns
     -------
@@ -117,7 +151,10 @@ def _cpu_only_apply_dedup_filter(df: pd.DataFrame, filter_flag: bool):
 
     base_cols = df.columns
     df_images = df.loc[image_mask].copy()
-    content_hash_sr = df_images["metadata"].apply(hash_content, args=("md5",))
+    if method == "perceptual":
+        content_hash_sr = _perceptual_dedup_keys(df_images["metadata"], max_distance)
+    else:
+        content_hash_sr = df_images["metadata"].apply(hash_content, args=("md5",))
     df_images.loc[content_hash_sr.index, "_image_content_hash"] = content_hash_sr
     df_images_deduped = df_images.drop_duplicates(subset="_image_content_hash")
     deduped_indices = df_images_deduped.index
@@ -156,6 +193,65 @@ def _cpu_only_apply_dedup_filter(df: pd.DataFrame, filter_flag: bool):
     return df
 
 
+def _apply_dedup_index(df: pd.DataFrame, dedup_index: ImageDedupIndex) -> pd.DataFrame:
+    """
+    Replaces images that earlier jobs already ingested into the same collection with references to them.
+
+    Every image still in the DataFrame is claimed in the cross-job index under its `collection_id`. Images an earlier
+    job already stored become `INFO_MSG` rows whose content is dropped and whose `content_url` (and
+    `image_metadata.uploaded_image_url`) point at the stored copy, so captioning, storage and embedding are skipped
+    for them. Images whose first occurrence has not been stored keep their content.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame after in-job deduplication.
+    dedup_index : ImageDedupIndex
+        The cross-job index.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with cross-job duplicates replaced by references.
+    """
+    image_mask = df["document_type"] == ContentTypeEnum.IMAGE
+    if not image_mask.any():
+        return df
+
+    for idx, metadata in df.loc[image_mask, "metadata"].items():
+        source_metadata = metadata.get("source_metadata") or {}
+        reference = {
+            "source_id": source_metadata.get("source_id", ""),
+            "page_number": (metadata.get("content_metadata") or {}).get("page_number", -1),
+            "content_url": "",
+        }
+        content_hash = get_content_hash(metadata["content"])
+        existing = dedup_index.claim(source_metadata.get("collection_id", ""), content_hash, reference)
+        if existing is None or not existing.get("content_url"):
+            continue
+
+        info_msg = {
+            "task": TaskTypeEnum.FILTER.value,
+            "status": StatusEnum.SUCCESS.value,
+            "message": (
+                f"Duplicate of image {content_hash} already ingested from '{existing.get('source_id', '')}' "
+                f"page {existing.get('page_number', -1)}."
+            ),
+            "filter": True,
+        }
+        validated_info_msg = validate_schema(info_msg, InfoMessageMetadataSchema).dict()
+
+        content_url = existing["content_url"]
+        metadata = dict(metadata, content="", content_url=content_url, info_message_metadata=validated_info_msg)
+        if metadata.get("image_metadata") is not None:
+            metadata["image_metadata"] = dict(metadata["image_metadata"], uploaded_image_url=content_url)
+
+        df.at[idx, "metadata"] = metadata
+        df.at[idx, "document_type"] = ContentTypeEnum.INFO_MSG
+
+    return df
+
+
 def _apply_dedup_filter(ctrl_msg: ControlMessage, filter_flag: bool):
     """
     Applies a deduplication filter to images within a DataFrame encapsulated in a ControlMessage.
@@ -285,6 +381,8 @@ def dedup_image_stage(df: pd.DataFrame, task_props: Dict[str, Any], validated_co
     -----
     - The deduplication process operates on the rows where `document_type` is `ContentTypeEnum.IMAGE`.
     - The `filter_flag` parameter, extracted from `task_props`, determines whether duplicates are removed or marked.
+    - When the cross-job index is enabled (`IMAGE_DEDUP_INDEX`), images already ingested into the same collection by
+      earlier jobs are then replaced with references to them; see `_apply_dedup_index`.
 
     Examples
     --------
@@ -304,10 +402,17 @@ def dedup_image_stage(df: pd.DataFrame, task_props: Dict[str, Any], validated_co
     task_props.get("content_type")
     task_params = task_props.get("params", {})
     filter_flag = task_params.get("filter", True)
+    method = task_params.get("method", "exact")
+
+    logger.debug(f"De-duplicating images with filter_flag={filter_flag}, method={method}")
 
-    logger.debug(f"De-duplicating images with filter_flag={filter_flag}")
+    df_result = _cpu_only_apply_dedup_filter(
+        df, filter_flag, method=method, max_distance=validated_config.perceptual_hash_threshold
+    )
 
-    df_result = _cpu_only_apply_dedup_filter(df, filter_flag)
+    dedup_index = get_image_dedup_index()
+    if dedup_index is not None:
+        df_result = _apply_dedup_index(df_result, dedup_index)
 
     return df_result
 
@@ -318,6 +423,8 @@ def generate_dedup_stage(
     task: str = "dedup",
     task_desc: str = "dedup_images",
     pe_count: int = 8,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ) -> MultiProcessingBaseStage:
     """
     Generates a deduplication processing stage for images using multiprocessing.
@@ -337,6 +444,10 @@ def generate_dedup_stage(
         A description of the task, by default "dedup_images".
     pe_count : int, optional
         The number of processing elements (workers) to use for the task, by default 8.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -372,4 +483,6 @@ def generate_dedup_stage(
         task_desc=task_desc,
         process_fn=_wrapped_dedup_image_stage,
         filter_properties={"content_type": ContentTypeEnum.IMAGE.value},
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
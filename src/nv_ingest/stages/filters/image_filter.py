@@ -7,6 +7,7 @@ import logging
 from functools import partial
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 import mrc
 import mrc.core.operators as ops
@@ -225,6 +226,8 @@ def generate_image_filter_stage(
     task: str = "filter",
     task_desc: str = "image_filter",
     pe_count: int = 8,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Generates a caption extraction stage with the specified configuration.
@@ -241,6 +244,10 @@ def generate_image_filter_stage(
         A descriptor to be used in latency tracing, by default "caption_extraction".
     pe_count : int, optional
         Number of processing elements to use, by default 8.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -266,4 +273,6 @@ def generate_image_filter_stage(
         task_desc=task_desc,
         process_fn=_wrapped_caption_extract,
         filter_properties={"content_type": ContentTypeEnum.IMAGE.value},
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
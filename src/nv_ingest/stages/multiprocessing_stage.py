@@ -28,7 +28,17 @@ import cudf
 
 from nv_ingest.util.exception_handlers.decorators import nv_ingest_node_failure_context_manager
 from nv_ingest.util.flow_control import filter_by_task
-from nv_ingest.util.multi_processing import ProcessWorkerPoolSingleton
+from nv_ingest.util.multi_processing import ProcessWorkerPool
+from nv_ingest.util.multi_processing import WorkerPoolRegistry
+from nv_ingest.util.multi_processing.arrow_transport import PAYLOAD_TRANSPORT_ARROW
+from nv_ingest.util.multi_processing.arrow_transport import PAYLOAD_TRANSPORT_PICKLE
+from nv_ingest.util.multi_processing.arrow_transport import PAYLOAD_TRANSPORTS
+from nv_ingest.util.multi_processing.arrow_transport import ArrowIPCHandle
+from nv_ingest.util.multi_processing.arrow_transport import read_arrow_handle
+from nv_ingest.util.multi_processing.arrow_transport import release_arrow_handle
+from nv_ingest.util.multi_processing.arrow_transport import run_with_arrow_payload
+from nv_ingest.util.multi_processing.arrow_transport import write_arrow_handle
+from nv_ingest.util.multi_processing.mp_pool_singleton import SimpleFuture
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +87,9 @@ def put_in_queue(ctrl_msg, pass_thru_recv_queue):
             continue
 
 
-def process_control_message(ctrl_msg, task, task_desc, ctrl_msg_ledger, send_queue):
+def process_control_message(
+    ctrl_msg, task, task_desc, ctrl_msg_ledger, send_queue, payload_transport=PAYLOAD_TRANSPORT_PICKLE
+):
     """
     Processes the control message, extracting the dataframe and task properties,
     and puts the work package into the send queue.
@@ -94,14 +106,20 @@ def process_control_message(ctrl_msg, task, task_desc, ctrl_msg_ledger, send_que
         Ledger to keep track of control messages.
     send_queue : Queue
         Queue to send the work package to the child process.
+    payload_transport : str, optional
+        How the payload is handed to the worker pool. "pickle" sends a pandas DataFrame, "arrow" writes the payload
+        once to an Arrow IPC buffer in shared memory and sends only a handle to it.
     """
     with ctrl_msg.payload().mutable_dataframe() as mdf:
-        df = mdf.to_pandas()  # noqa
+        if payload_transport == PAYLOAD_TRANSPORT_ARROW:
+            payload = write_arrow_handle(mdf.to_arrow(preserve_index=False))
+        else:
+            payload = mdf.to_pandas()  # noqa
 
     task_props = ctrl_msg.get_tasks().get(task).pop()
     cm_id = uuid.uuid4()
     ctrl_msg_ledger[cm_id] = ctrl_msg
-    work_package = {"payload": df, "task_props": task_props, "cm_id": cm_id}
+    work_package = {"payload": payload, "task_props": task_props, "cm_id": cm_id}
     send_queue.put({"type": "on_next", "value": work_package})
 
 
@@ -122,6 +140,23 @@ class MultiProcessingBaseStage(SinglePortStage):
     process_fn : typing.Callable[[pd.DataFrame, dict], pd.DataFrame]
         The function that will be executed in each process engine. The function will
         accept a pandas DataFrame from a ControlMessage payload and a dictionary of task arguments.
+    document_type : str or list of str, optional
+        Document type(s) the stage should handle.
+    filter_properties : dict, optional
+        Additional task properties used to filter the control messages the stage handles.
+    payload_transport : str, optional
+        How payloads move between the stage and the worker pool. "pickle" (default) pickles a pandas DataFrame
+        through the queues. "arrow" serializes the payload once into an Arrow IPC buffer in shared memory and passes
+        only a handle, avoiding repeated copies of large payloads.
+    max_in_flight : int, optional
+        The maximum number of work packages the stage keeps in the worker pool at once. Defaults to `pe_count`.
+        This also bounds the control message ledger, which provides backpressure to upstream stages.
+    preserve_order : bool, optional
+        If True, results are emitted in the order their control messages arrived. Otherwise (default) results are
+        emitted as soon as they complete.
+    worker_pool : str, optional
+        Name of the worker pool, as configured in `WorkerPoolRegistry`, that runs this stage's work. Stages without
+        a pool share the default pool.
 
     Returns
     -------
@@ -136,9 +171,11 @@ class MultiProcessingBaseStage(SinglePortStage):
        This acts as a record for the incoming message.
 
     2. **Work Queue**: The core work content of the `ControlMessage` is pushed to a work queue. This queue
-       forwards the task to a global multi-process worker pool where the heavy-lifting occurs.
+       forwards the task to the stage's multi-process worker pool where the heavy-lifting occurs. Up to
+       `max_in_flight` work packages are submitted to the pool without waiting on earlier ones, and the ledger
+       admits no more than `max_in_flight` control messages at a time.
 
-    3. **Global Worker Pool**: The work is executed in parallel across multiple process engines via the worker pool.
+    3. **Worker Pool**: The work is executed in parallel across multiple process engines via the worker pool.
        Each process engine applies the `process_fn` to the task data, which includes a pandas DataFrame and
        task-specific arguments.
 
@@ -160,21 +197,34 @@ class MultiProcessingBaseStage(SinglePortStage):
         process_fn: typing.Callable[[pd.DataFrame, dict], pd.DataFrame],
         document_type: typing.Union[typing.List[str], str] = None,
         filter_properties: dict = None,
+        payload_transport: str = PAYLOAD_TRANSPORT_PICKLE,
+        max_in_flight: typing.Optional[int] = None,
+        preserve_order: bool = False,
+        worker_pool: typing.Optional[str] = None,
     ):
         super().__init__(c)
+        if payload_transport not in PAYLOAD_TRANSPORTS:
+            raise ValueError(
+                f"Unsupported payload transport '{payload_transport}', expected one of {PAYLOAD_TRANSPORTS}"
+            )
+
         self._document_type = document_type
         self._filter_properties = filter_properties if filter_properties is not None else {}
         self._task = task
         self._task_desc = task_desc
         self._pe_count = pe_count
         self._process_fn = process_fn
-        self._max_queue_size = 1
+        self._payload_transport = payload_transport
+        self._max_in_flight = max(1, max_in_flight if max_in_flight is not None else pe_count)
+        self._preserve_order = preserve_order
+        self._max_queue_size = self._max_in_flight
         self._mp_context = mp.get_context("fork")
         self._cancellation_token = self._mp_context.Value(ctypes.c_int8, False)
         self._pass_thru_recv_queue = queue.Queue(maxsize=c.edge_buffer_size)
         self._my_threads = {}
         self._ctrl_msg_ledger = {}
-        self._worker_pool = ProcessWorkerPoolSingleton()
+        self._ledger_slots = mt.BoundedSemaphore(self._max_in_flight)
+        self._worker_pool = WorkerPoolRegistry().get_pool(worker_pool)
 
         if self._document_type is not None:
             self._filter_properties["document_type"] = self._document_type
@@ -200,13 +250,60 @@ class MultiProcessingBaseStage(SinglePortStage):
     def supports_cpp_node(self) -> bool:
         return False
 
+    @staticmethod
+    def _submit_work_package(
+        work_package: dict,
+        process_fn: typing.Callable[[pd.DataFrame, dict], pd.DataFrame],
+        process_pool: ProcessWorkerPool,
+    ):
+        """
+        Submits a work package to the process pool and returns the resulting future.
+        """
+        payload = work_package["payload"]
+        task_props = work_package["task_props"]
+
+        if isinstance(payload, ArrowIPCHandle):
+            return process_pool.submit_task(run_with_arrow_payload, (process_fn, payload, task_props))
+
+        return process_pool.submit_task(process_fn, (payload, task_props))
+
+    @staticmethod
+    def _resolve_work_package(work_package: dict, future) -> dict:
+        """
+        Folds the outcome of a completed future into its work package and returns the event to emit.
+        """
+        try:
+            # This can return/raise an exception
+            result = future.result()
+            extra_results = []
+            if isinstance(result, tuple):
+                result, *extra_results = result
+
+            work_package["payload"] = result
+            if extra_results:
+                for extra_result in extra_results:
+                    if isinstance(extra_result, dict) and ("trace_info" in extra_result):
+                        work_package["trace_info"] = extra_result["trace_info"]
+
+            return {"type": "on_next", "value": work_package}
+        except Exception as e:
+            logger.error(f"child_receive_thread error: {e}")
+            if isinstance(work_package["payload"], ArrowIPCHandle):
+                release_arrow_handle(work_package["payload"])
+            work_package["error"] = True
+            work_package["error_message"] = str(e)
+
+            return {"type": "on_error", "value": work_package}
+
     @staticmethod
     def work_package_input_handler(
-        work_package_input_queue: mp.Queue,
-        work_package_response_queue: mp.Queue,
+        work_package_input_queue: queue.Queue,
+        work_package_response_queue: queue.Queue,
         cancellation_token: mp.Value,
         process_fn: typing.Callable[[pd.DataFrame, dict], pd.DataFrame],
-        process_pool: ProcessWorkerPoolSingleton,
+        process_pool: ProcessWorkerPool,
+        max_in_flight: int = 1,
+        preserve_order: bool = False,
     ):
         """
         Processes work packages received from the recv_queue, applies the process_fn to each package,
@@ -214,56 +311,82 @@ class MultiProcessingBaseStage(SinglePortStage):
 
         Parameters
         ----------
-        work_package_input_queue : multiprocessing.Queue
+        work_package_input_queue : queue.Queue
             Queue from which work packages are received.
-        work_package_response_queue : multiprocessing.Queue
+        work_package_response_queue : queue.Queue
             Queue to which processed results are sent.
         cancellation_token : multiprocessing.Value
             Shared flag to indicate when to stop processing.
-        process_pool : ProcessWorkerPoolSingleton
+        process_pool : ProcessWorkerPool
             Singleton process pool to handle the actual processing.
+        max_in_flight : int, optional
+            Maximum number of work packages submitted to the process pool at once (default 1).
+        preserve_order : bool, optional
+            Emit results in submission order rather than completion order (default False).
 
         Notes
         -----
-        The method continuously retrieves work packages from the recv_queue, submits them to the process pool,
-        and sends the results to the send_queue. It stops processing when the cancellation_token is set.
+        The method continuously retrieves work packages from the recv_queue and submits them to the process pool
+        without waiting for earlier submissions, keeping up to `max_in_flight` packages in the pool. Results are sent
+        to the send_queue as their futures complete. Once the input stream completes, outstanding work is drained
+        before the completion event is forwarded. It stops processing when the cancellation_token is set.
         """
+        completion_queue = queue.Queue()
+        in_flight = {}  # submission sequence number -> (work_package, future)
+        finished = {}  # completed events waiting for earlier submissions when preserving order
+        next_seq = 0
+        next_emit_seq = 0
+        input_completed = False
+
         while not cancellation_token.value:
+            # Collect completed work; block only when nothing else can make progress.
+            must_wait = bool(in_flight) and (input_completed or len(in_flight) >= max_in_flight)
+            while True:
+                try:
+                    seq = completion_queue.get(timeout=0.1) if must_wait else completion_queue.get_nowait()
+                except queue.Empty:
+                    break
+                must_wait = False
+
+                work_package, future = in_flight.pop(seq)
+                event = MultiProcessingBaseStage._resolve_work_package(work_package, future)
+                if not preserve_order:
+                    work_package_response_queue.put(event)
+                    continue
+
+                finished[seq] = event
+                while next_emit_seq in finished:
+                    work_package_response_queue.put(finished.pop(next_emit_seq))
+                    next_emit_seq += 1
+
+            if input_completed:
+                if not in_flight:
+                    break
+                continue
+
+            if len(in_flight) >= max_in_flight:
+                continue
+
             try:
-                # Get work from recv_queue
-                event = work_package_input_queue.get(timeout=1.0)
-                # logger.debug(f"child_receive_thread got event: {event}")
+                # Get work from recv_queue; poll quickly while results are outstanding.
+                event = work_package_input_queue.get(timeout=0.01 if in_flight else 1.0)
             except queue.Empty:
                 continue
 
             if event["type"] == "on_next":
                 work_package = event["value"]
-                df = work_package["payload"]
-                task_props = work_package["task_props"]
+                seq = next_seq
+                next_seq += 1
 
                 try:
                     # Submit to the process pool and get the future
-                    future = process_pool.submit_task(process_fn, (df, task_props))
-
-                    # This can return/raise an exception
-                    result = future.result()
-                    extra_results = []
-                    if isinstance(result, tuple):
-                        result, *extra_results = result
-
-                    work_package["payload"] = result
-                    if extra_results:
-                        for extra_result in extra_results:
-                            if isinstance(extra_result, dict) and ("trace_info" in extra_result):
-                                work_package["trace_info"] = extra_result["trace_info"]
-
-                    work_package_response_queue.put({"type": "on_next", "value": work_package})
+                    future = MultiProcessingBaseStage._submit_work_package(work_package, process_fn, process_pool)
                 except Exception as e:
-                    logger.error(f"child_receive_thread error: {e}")
-                    work_package["error"] = True
-                    work_package["error_message"] = str(e)
+                    future = SimpleFuture()
+                    future.set_exception(e)
 
-                    work_package_response_queue.put({"type": "on_error", "value": work_package})
+                in_flight[seq] = (work_package, future)
+                future.add_done_callback(lambda _, seq=seq: completion_queue.put(seq))
 
                 continue
 
@@ -274,10 +397,10 @@ class MultiProcessingBaseStage(SinglePortStage):
                 continue
 
             if event["type"] == "on_completed":
-                work_package_response_queue.put(event)
-                logger.debug("child_receive_thread sending completed")
+                input_completed = True
+                logger.debug(f"child_receive_thread draining {len(in_flight)} in-flight work packages")
 
-                break
+                continue
 
         # Send completion event
         work_package_response_queue.put({"type": "on_completed"})
@@ -287,11 +410,13 @@ class MultiProcessingBaseStage(SinglePortStage):
     def work_package_response_handler(
         mp_context,
         max_queue_size,
-        work_package_input_queue: mp.Queue,
+        work_package_input_queue: queue.Queue,
         sub: mrc.Subscriber,
         cancellation_token: mp.Value,
         process_fn: typing.Callable[[pd.DataFrame, dict], pd.DataFrame],
-        process_pool: ProcessWorkerPoolSingleton,
+        process_pool: ProcessWorkerPool,
+        max_in_flight: int = 1,
+        preserve_order: bool = False,
     ):
         """
         Manages child threads and collects results, forwarding them to the subscriber.
@@ -302,14 +427,18 @@ class MultiProcessingBaseStage(SinglePortStage):
             Context for creating multiprocessing objects.
         max_queue_size : int
             Maximum size of the queues.
-        work_package_input_queue : multiprocessing.Queue
-            Queue to send tasks to the child process.
+        work_package_input_queue : queue.Queue
+            Queue to send tasks to the child thread.
         sub : mrc.Subscriber
             Subscriber to send results to.
         cancellation_token : multiprocessing.Value
             Shared flag to indicate when to stop processing.
-        process_pool : ProcessWorkerPoolSingleton
+        process_pool : ProcessWorkerPool
             Singleton process pool to handle the actual processing.
+        max_in_flight : int, optional
+            Maximum number of work packages submitted to the process pool at once (default 1).
+        preserve_order : bool, optional
+            Emit results in submission order rather than completion order (default False).
 
         Notes
         -----
@@ -317,11 +446,20 @@ class MultiProcessingBaseStage(SinglePortStage):
         and forwards the results to the subscriber. It stops processing when the cancellation_token is set or the
         subscriber is unsubscribed.
         """
-        work_package_response_queue = mp_context.Queue(maxsize=max_queue_size)
+        # Both ends of this queue live in this process, so a thread queue avoids pickling payloads through a pipe.
+        work_package_response_queue = queue.Queue(maxsize=max_queue_size)
 
         child_thread = mt.Thread(
             target=MultiProcessingBaseStage.work_package_input_handler,
-            args=(work_package_input_queue, work_package_response_queue, cancellation_token, process_fn, process_pool),
+            args=(
+                work_package_input_queue,
+                work_package_response_queue,
+                cancellation_token,
+                process_fn,
+                process_pool,
+                max_in_flight,
+                preserve_order,
+            ),
         )
 
         child_thread.start()
@@ -354,6 +492,21 @@ class MultiProcessingBaseStage(SinglePortStage):
         sub.on_completed()
         logger.debug("parent_receive completed")
 
+    def _acquire_ledger_slot(self) -> bool:
+        """
+        Blocks until the ledger has room for another control message or the stage is cancelled.
+
+        Returns
+        -------
+        bool
+            True if a slot was acquired, False if the stage was cancelled first.
+        """
+        while not self._cancellation_token.value:
+            if self._ledger_slots.acquire(timeout=0.1):
+                return True
+
+        return False
+
     def observable_fn(self, obs: mrc.Observable, sub: mrc.Subscriber):
         """
         Sets up the observable pipeline to receive and process ControlMessage objects.
@@ -376,7 +529,7 @@ class MultiProcessingBaseStage(SinglePortStage):
         child processes and collecting results.
         """
 
-        work_package_input_queue = self._mp_context.Queue(maxsize=self._max_queue_size)
+        work_package_input_queue = queue.Queue(maxsize=self._max_queue_size)
 
         tid = str(uuid.uuid4())
         self._my_threads[tid] = mt.Thread(
@@ -389,6 +542,8 @@ class MultiProcessingBaseStage(SinglePortStage):
                 self._cancellation_token,
                 self._process_fn,
                 self._worker_pool,
+                self._max_in_flight,
+                self._preserve_order,
             ),
         )
 
@@ -431,10 +586,24 @@ class MultiProcessingBaseStage(SinglePortStage):
             # Trace the control message
             trace_message(ctrl_msg, self._task_desc)
 
+            # Wait for room in the ledger; this is what applies backpressure to upstream stages.
+            if not self._acquire_ledger_slot():
+                logger.warning(f"{self._task_desc} cancelled while waiting for a ledger slot, dropping message.")
+                return
+
             # Process and forward the control message
-            process_control_message(
-                ctrl_msg, self._task, self._task_desc, self._ctrl_msg_ledger, work_package_input_queue
-            )
+            try:
+                process_control_message(
+                    ctrl_msg,
+                    self._task,
+                    self._task_desc,
+                    self._ctrl_msg_ledger,
+                    work_package_input_queue,
+                    payload_transport=self._payload_transport,
+                )
+            except Exception:
+                self._ledger_slots.release()
+                raise
 
         def on_error(error: BaseException):
             work_package_input_queue.put({"type": "on_error", "value": error})
@@ -480,6 +649,7 @@ class MultiProcessingBaseStage(SinglePortStage):
                 The reconstructed control message with the updated payload.
             """
             ctrl_msg = self._ctrl_msg_ledger.pop(work_package["cm_id"])
+            self._ledger_slots.release()
 
             @nv_ingest_node_failure_context_manager(
                 annotation_id=self.task_desc,
@@ -488,10 +658,16 @@ class MultiProcessingBaseStage(SinglePortStage):
             def cm_func(ctrl_msg: ControlMessage, work_package: dict):
                 # This is the first location where we have access to both the control message and the work package,
                 # if we had any errors in the processing, raise them here.
+                payload = work_package["payload"]
                 if work_package.get("error", False):
+                    if isinstance(payload, ArrowIPCHandle):
+                        release_arrow_handle(payload)
                     raise RuntimeError(work_package["error_message"])
 
-                gdf = cudf.from_pandas(work_package["payload"])
+                if isinstance(payload, ArrowIPCHandle):
+                    gdf = cudf.DataFrame.from_arrow(read_arrow_handle(payload))
+                else:
+                    gdf = cudf.from_pandas(payload)
                 ctrl_msg.payload(MessageMeta(df=gdf))
 
                 do_trace_tagging = (ctrl_msg.has_metadata("config::add_trace_tagging") is True) and (
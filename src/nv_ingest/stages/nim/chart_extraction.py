@@ -4,6 +4,8 @@
 
 import functools
 import logging
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -24,41 +26,67 @@ from nv_ingest.util.nim.helpers import NimClient
 logger = logging.getLogger(f"morpheus.{__name__}")
 
 
-# Modify the _update_metadata function
-def _update_metadata(row: pd.Series, cached_client: NimClient, deplot_client: NimClient, trace_info: Dict) -> Dict:
+def _submit_chart_inference(
+    executor: ThreadPoolExecutor,
+    base64_image: str,
+    cached_client: NimClient,
+    deplot_client: NimClient,
+    trace_info: Dict,
+) -> Tuple[Future, Future]:
     """
-    Modifies the metadata of a row if the conditions for chart extraction are met.
+    Submits the cached and deplot inference calls for a chart image so that they run concurrently.
 
     Parameters
     ----------
-    row : pd.Series
-        A row from the DataFrame containing metadata for the chart extraction.
-
+    executor : ThreadPoolExecutor
+        The executor the inference calls are submitted to.
+    base64_image : str
+        The base64-encoded chart image.
     cached_client : NimClient
         The client used to call the cached inference model.
-
     deplot_client : NimClient
         The client used to call the deplot inference model.
-
     trace_info : Dict
         Trace information used for logging or debugging.
 
     Returns
     -------
-    Dict
-        The modified metadata if conditions are met, otherwise the original metadata.
+    Tuple[Future, Future]
+        Futures for the cached and deplot results.
+    """
+    # Each call gets its own data dict, since prepare_data_for_inference adds the decoded image to it.
+    cached_future = executor.submit(
+        cached_client.infer,
+        {"base64_image": base64_image},
+        model_name="cached",
+        stage_name="chart_data_extraction",  # traceable_func arg
+        trace_info=trace_info,  # traceable_func arg
+    )
+    deplot_future = executor.submit(
+        deplot_client.infer,
+        {"base64_image": base64_image},
+        model_name="deplot",
+        stage_name="chart_data_extraction",  # traceable_func arg
+        trace_info=trace_info,  # traceable_func arg
+    )
+
+    return cached_future, deplot_future
+
+
+def _get_chart_metadata(row: pd.Series) -> Tuple[Dict, Optional[Dict]]:
+    """
+    Returns a row's metadata and, if the row is a chart eligible for extraction, its chart metadata.
 
     Raises
     ------
     ValueError
-        If critical information (such as metadata) is missing from the row.
+        If the row does not contain metadata.
     """
     metadata = row.get("metadata")
     if metadata is None:
         logger.error("Row does not contain 'metadata'.")
         raise ValueError("Row does not contain 'metadata'.")
 
-    base64_image = metadata.get("content")
     content_metadata = metadata.get("content_metadata", {})
     chart_metadata = metadata.get("table_metadata")
 
@@ -68,34 +96,73 @@ def _update_metadata(row: pd.Series, cached_client: NimClient, deplot_client: Ni
         or (content_metadata.get("subtype") != "chart")
         or (chart_metadata is None)
     ):
-        return metadata
+        return metadata, None
 
-    # Modify chart metadata with the result from the inference models
-    try:
-        data = {"base64_image": base64_image}
-
-        # Perform inference using the NimClients
-        deplot_result = deplot_client.infer(
-            data,
-            model_name="deplot",
-            trace_info=trace_info,  # traceable_func arg
-            stage_name="chart_data_extraction",  # traceable_func arg
-        )
-        cached_result = cached_client.infer(
-            data,
-            model_name="cached",
-            stage_name="chart_data_extraction",  # traceable_func arg
-            trace_info=trace_info,  # traceable_func arg
-        )
+    return metadata, chart_metadata
+
+
+def _update_metadata_concurrent(
+    df: pd.DataFrame,
+    cached_client: NimClient,
+    deplot_client: NimClient,
+    max_concurrent_charts: int,
+    trace_info: Dict,
+) -> pd.Series:
+    """
+    Runs chart extraction for every chart row in a DataFrame, keeping up to `max_concurrent_charts` charts in flight.
+
+    Both model calls for a chart are issued at the same time, so each chart takes roughly as long as the slower of
+    the two models rather than their sum.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame whose "metadata" column holds the rows to process.
+    cached_client : NimClient
+        The client used to call the cached inference model.
+    deplot_client : NimClient
+        The client used to call the deplot inference model.
+    max_concurrent_charts : int
+        The maximum number of charts with inference requests in flight at once.
+    trace_info : Dict
+        Trace information used for logging or debugging.
+
+    Returns
+    -------
+    pd.Series
+        The updated "metadata" column.
 
-        chart_content = join_cached_and_deplot_output(cached_result, deplot_result)
+    Raises
+    ------
+    ValueError
+        If a row does not contain metadata.
+    """
+    charts = []
+    for _, row in df.iterrows():
+        _, chart_metadata = _get_chart_metadata(row)
+        if chart_metadata is not None:
+            charts.append((row["metadata"], chart_metadata))
+
+    if not charts:
+        return df["metadata"]
 
-        chart_metadata["table_content"] = chart_content
+    executor = ThreadPoolExecutor(max_workers=2 * min(max_concurrent_charts, len(charts)))
+    try:
+        futures = [
+            _submit_chart_inference(executor, metadata.get("content"), cached_client, deplot_client, trace_info)
+            for metadata, _ in charts
+        ]
+        for (_, chart_metadata), (cached_future, deplot_future) in zip(charts, futures):
+            chart_metadata["table_content"] = join_cached_and_deplot_output(
+                cached_future.result(), deplot_future.result()
+            )
     except Exception as e:
         logger.error(f"Unhandled error calling image inference model: {e}", exc_info=True)
         raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
-    return metadata
+    return df["metadata"]
 
 
 def _create_clients(
@@ -181,8 +248,9 @@ def _extract_chart_data(
         logger.debug("No trace_info provided. Initialized empty trace_info dictionary.")
 
     try:
-        # Apply the _update_metadata function to each row in the DataFrame
-        df["metadata"] = df.apply(_update_metadata, axis=1, args=(cached_client, deplot_client, trace_info))
+        df["metadata"] = _update_metadata_concurrent(
+            df, cached_client, deplot_client, stage_config.max_concurrent_charts, trace_info
+        )
 
         return df, {"trace_info": trace_info}
 
@@ -202,6 +270,8 @@ def generate_chart_extractor_stage(
     task: str = "chart_data_extract",
     task_desc: str = "chart_data_extraction",
     pe_count: int = 1,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Generates a multiprocessing stage to perform chart data extraction from PDF content.
@@ -227,6 +297,13 @@ def generate_chart_extractor_stage(
         The number of process engines to use for chart data extraction. This value controls
         how many worker processes will run concurrently. Default is 1.
 
+    payload_transport : str, optional
+        How payloads are passed to the worker pool. "arrow" hands workers a shared memory Arrow IPC
+        buffer instead of a pickled DataFrame. Default is "pickle".
+
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage. Default is None, the shared default pool.
+
     Returns
     -------
     MultiProcessingBaseStage
@@ -238,5 +315,11 @@ def generate_chart_extractor_stage(
     _wrapped_process_fn = functools.partial(_extract_chart_data, validated_config=validated_config)
 
     return MultiProcessingBaseStage(
-        c=c, pe_count=pe_count, task=task, task_desc=task_desc, process_fn=_wrapped_process_fn
+        c=c,
+        pe_count=pe_count,
+        task=task,
+        task_desc=task_desc,
+        process_fn=_wrapped_process_fn,
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
@@ -4,13 +4,16 @@
 
 import functools
 import logging
+from collections import defaultdict
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Tuple
 
-import pandas as pd
+import numpy as np
 
+import pandas as pd
 from morpheus.config import Config
 
 from nv_ingest.schemas.table_extractor_schema import TableExtractorSchema
@@ -97,6 +100,121 @@ def _update_metadata(row: pd.Series, paddle_client: NimClient, trace_info: Dict)
     return metadata
 
 
+def _update_metadata_batch(
+    tables: List[Tuple[Dict, str, np.ndarray]], paddle_client: NimClient, table_content_format: str, trace_info: Dict
+) -> None:
+    """
+    Runs PaddleOCR once for a batch of table images and writes each result into its table metadata.
+
+    Parameters
+    ----------
+    tables : List[Tuple[Dict, str, np.ndarray]]
+        The table_metadata dictionary, base64 image and decoded image of each table in the batch.
+
+    paddle_client : NimClient
+        The client used to call the PaddleOCR inference model.
+
+    table_content_format : str
+        The table content format requested for every table in the batch.
+
+    trace_info : Dict
+        Trace information used for logging or debugging.
+
+    Returns
+    -------
+    None
+    """
+    data = {
+        "base64_images": [base64_image for _, base64_image, _ in tables],
+        "image_arrays": [image_array for _, _, image_array in tables],
+    }
+
+    try:
+        paddle_results = paddle_client.infer(
+            data,
+            model_name="paddle",
+            table_content_format=table_content_format,
+            trace_info=trace_info,  # traceable_func arg
+            stage_name="table_data_extraction",  # traceable_func arg
+        )
+    except Exception as e:
+        logger.error(f"Unhandled error calling PaddleOCR inference model: {e}", exc_info=True)
+        raise
+
+    for (table_metadata, _, _), (table_content, content_format) in zip(tables, paddle_results):
+        table_metadata["table_content"] = table_content
+        table_metadata["table_content_format"] = content_format
+
+
+def _update_metadata_batched(
+    df: pd.DataFrame, paddle_client: NimClient, max_batch_size: int, trace_info: Dict
+) -> pd.Series:
+    """
+    Collects every eligible table image in the DataFrame and runs PaddleOCR on them in batches.
+
+    Tables are grouped by requested content format, so each batch is a single request, and split into batches of at
+    most `max_batch_size` images. Results are written back into each row's table metadata. Rows that are not tables,
+    and table images below the minimum size, are handled exactly as `_update_metadata` handles them.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame whose "metadata" column holds the rows to update.
+
+    paddle_client : NimClient
+        The client used to call the PaddleOCR inference model.
+
+    max_batch_size : int
+        The largest number of images sent in one request.
+
+    trace_info : Dict
+        Trace information used for logging or debugging.
+
+    Returns
+    -------
+    pd.Series
+        The updated metadata column.
+
+    Raises
+    ------
+    ValueError
+        If a row does not contain metadata.
+    """
+    metadata_column = df.get("metadata")
+    if metadata_column is None or metadata_column.isna().any():
+        logger.error("Row does not contain 'metadata'.")
+        raise ValueError("Row does not contain 'metadata'.")
+
+    pending_tables = defaultdict(list)
+    for metadata in metadata_column:
+        content_metadata = metadata.get("content_metadata", {})
+        table_metadata = metadata.get("table_metadata")
+
+        if (
+            (content_metadata.get("type") != "structured")
+            or (content_metadata.get("subtype") != "table")
+            or (table_metadata is None)
+        ):
+            continue
+
+        base64_image = metadata.get("content")
+        image_array = base64_to_numpy(base64_image)
+        if not check_numpy_image_size(image_array, PADDLE_MIN_WIDTH, PADDLE_MIN_HEIGHT):
+            table_metadata["table_content"] = ""
+            table_metadata["table_content_format"] = ""
+            continue
+
+        table_content_format = table_metadata.get("table_content_format")
+        pending_tables[table_content_format].append((table_metadata, base64_image, image_array))
+
+    for table_content_format, tables in pending_tables.items():
+        for start in range(0, len(tables), max_batch_size):
+            batch = tables[start : start + max_batch_size]  # noqa: E203
+            _update_metadata_batch(batch, paddle_client, table_content_format, trace_info)
+
+    return metadata_column
+
+
 def _extract_table_data(
     df: pd.DataFrame, task_props: Dict[str, Any], validated_config: Any, trace_info: Optional[Dict] = None
 ) -> Tuple[pd.DataFrame, Dict]:
@@ -160,11 +278,17 @@ def _extract_table_data(
         model_interface=paddle_model_interface,
         auth_token=stage_config.auth_token,
         infer_protocol=stage_config.paddle_infer_protocol,
+        model_version=paddle_version,
     )
 
+    max_batch_size = paddle_model_interface.max_batch_size()
+
     try:
-        # Apply the _update_metadata function to each row in the DataFrame
-        df["metadata"] = df.apply(_update_metadata, axis=1, args=(paddle_client, trace_info))
+        if max_batch_size > 1:
+            df["metadata"] = _update_metadata_batched(df, paddle_client, max_batch_size, trace_info)
+        else:
+            # Early access PaddleOCR versions accept one image per request.
+            df["metadata"] = df.apply(_update_metadata, axis=1, args=(paddle_client, trace_info))
 
         return df, {"trace_info": trace_info}
 
@@ -182,6 +306,8 @@ def generate_table_extractor_stage(
     task: str = "table_data_extract",
     task_desc: str = "table_data_extraction",
     pe_count: int = 1,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Generates a multiprocessing stage to perform table data extraction from PDF content.
@@ -207,6 +333,13 @@ def generate_table_extractor_stage(
         The number of process engines to use for table data extraction. This value controls
         how many worker processes will run concurrently. Default is 1.
 
+    payload_transport : str, optional
+        How payloads are passed to the worker pool. "arrow" hands workers a shared memory Arrow IPC
+        buffer instead of a pickled DataFrame. Default is "pickle".
+
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage. Default is None, the shared default pool.
+
     Returns
     -------
     MultiProcessingBaseStage
@@ -218,5 +351,11 @@ def generate_table_extractor_stage(
     _wrapped_process_fn = functools.partial(_extract_table_data, validated_config=validated_config)
 
     return MultiProcessingBaseStage(
-        c=c, pe_count=pe_count, task=task, task_desc=task_desc, process_fn=_wrapped_process_fn
+        c=c,
+        pe_count=pe_count,
+        task=task,
+        task_desc=task_desc,
+        process_fn=_wrapped_process_fn,
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
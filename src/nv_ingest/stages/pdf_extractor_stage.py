@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import base64
 import functools
 import io
 import logging
@@ -14,6 +13,7 @@ from typing import Optional
 
 import pandas as pd
 from morpheus.config import Config
+from nv_ingest_client.util.blob_store import resolve_content
 
 from nv_ingest.extraction_workflows import pdf
 from nv_ingest.schemas.pdf_extractor_schema import PDFExtractorSchema
@@ -74,8 +74,8 @@ def decode_and_extract(
         task_props["params"]["row_data"] = row_data
         # Get source_id
         source_id = base64_row["source_id"] if "source_id" in base64_row.index else None
-        # Decode the base64 content
-        pdf_bytes = base64.b64decode(base64_content)
+        # Decode the base64 content, or read it from the blob store if the job carries a reference
+        pdf_bytes = resolve_content(base64_content)
 
         # Load the PDF
         pdf_stream = io.BytesIO(pdf_bytes)
@@ -152,6 +152,8 @@ def generate_pdf_extractor_stage(
     task: str = "extract",
     task_desc: str = "pdf_content_extractor",
     pe_count: int = 24,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Helper function to generate a multiprocessing stage to perform pdf content extraction.
@@ -168,6 +170,10 @@ def generate_pdf_extractor_stage(
         A descriptor to be used in latency tracing.
     pe_count : int
         Integer for how many process engines to use for pdf content extraction.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -178,5 +184,12 @@ def generate_pdf_extractor_stage(
     _wrapped_process_fn = functools.partial(process_pdf_bytes, validated_config=validated_config)
 
     return MultiProcessingBaseStage(
-        c=c, pe_count=pe_count, task=task, task_desc=task_desc, process_fn=_wrapped_process_fn, document_type="pdf"
+        c=c,
+        pe_count=pe_count,
+        task=task,
+        task_desc=task_desc,
+        process_fn=_wrapped_process_fn,
+        document_type="pdf",
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
@@ -8,6 +8,7 @@ import os
 import traceback
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 import pandas as pd
 from minio import Minio
@@ -116,6 +117,8 @@ def generate_embedding_storage_stage(
     task: str = "store_embedding",
     task_desc: str = "Store_embeddings_minio",
     pe_count: int = 24,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Helper function to generate a multiprocessing stage to perform pdf content extraction.
@@ -132,6 +135,10 @@ def generate_embedding_storage_stage(
         A descriptor to be used in latency tracing.
     pe_count : int
         Integer for how many process engines to use for pdf content extraction.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -142,5 +149,11 @@ def generate_embedding_storage_stage(
     _wrapped_process_fn = functools.partial(_store_embeddings, validated_config=validated_config)
 
     return MultiProcessingBaseStage(
-        c=c, pe_count=pe_count, task=task, task_desc=task_desc, process_fn=_wrapped_process_fn
+        c=c,
+        pe_count=pe_count,
+        task=task,
+        task_desc=task_desc,
+        process_fn=_wrapped_process_fn,
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
@@ -17,6 +17,8 @@ from nv_ingest.schemas.image_caption_extraction_schema import ImageCaptionExtrac
 from nv_ingest.schemas.metadata_schema import ContentTypeEnum
 from nv_ingest.stages.multiprocessing_stage import MultiProcessingBaseStage
 from nv_ingest.util.image_processing.transforms import scale_image_to_encoding_size
+from nv_ingest.util.nim.inference_cache import get_inference_cache
+from nv_ingest.util.nim.inference_cache import make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -67,22 +69,31 @@ def _generate_captions(base64_image: str, prompt: str, api_key: str, endpoint_ur
         "stream": stream,
     }
 
-    try:
-        response = requests.post(endpoint_url, headers=headers, json=payload)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-
-        if stream:
-            result = []
-            for line in response.iter_lines():
-                if line:
-                    result.append(line.decode("utf-8"))
-            return "\n".join(result)
-        else:
-            response_data = response.json()
-            return response_data.get("choices", [{}])[0].get("message", {}).get("content", "No caption returned")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error generating caption: {e}")
-        raise
+    def _request_caption() -> str:
+        try:
+            response = requests.post(endpoint_url, headers=headers, json=payload)
+            response.raise_for_status()  # Raise an exception for HTTP errors
+
+            if stream:
+                result = []
+                for line in response.iter_lines():
+                    if line:
+                        result.append(line.decode("utf-8"))
+                return "\n".join(result)
+            else:
+                response_data = response.json()
+                return response_data.get("choices", [{}])[0].get("message", {}).get("content", "No caption returned")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error generating caption: {e}")
+            raise
+
+    inference_cache = get_inference_cache()
+    if inference_cache is None:
+        return _request_caption()
+
+    # The payload holds the image, prompt and sampling parameters; the endpoint stands in for the model version.
+    cache_key = make_cache_key(payload["model"], endpoint_url, payload)
+    return inference_cache.get_or_compute(cache_key, _request_caption)
 
 
 def caption_extract_stage(
@@ -145,6 +156,8 @@ def generate_caption_extraction_stage(
     task: str = "caption",
     task_desc: str = "caption_extraction",
     pe_count: int = 8,
+    payload_transport: str = "pickle",
+    worker_pool: Optional[str] = None,
 ):
     """
     Generates a caption extraction stage with the specified configuration.
@@ -161,6 +174,10 @@ def generate_caption_extraction_stage(
         A descriptor to be used in latency tracing, by default "caption_extraction".
     pe_count : int, optional
         Number of processing elements to use, by default 8.
+    payload_transport : str, optional
+        How payloads are passed to the worker pool, "pickle" or "arrow", by default "pickle".
+    worker_pool : str, optional
+        Name of the worker pool that runs this stage, by default the shared default pool.
 
     Returns
     -------
@@ -180,5 +197,11 @@ def generate_caption_extraction_stage(
         f"Generating caption extraction stage with {pe_count} processing elements. task: {task}, document_type: *"
     )
     return MultiProcessingBaseStage(
-        c=c, pe_count=pe_count, task=task, task_desc=task_desc, process_fn=_wrapped_caption_extract
+        c=c,
+        pe_count=pe_count,
+        task=task,
+        task_desc=task_desc,
+        process_fn=_wrapped_caption_extract,
+        payload_transport=payload_transport,
+        worker_pool=worker_pool,
     )
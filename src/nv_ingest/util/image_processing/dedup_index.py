@@ -0,0 +1,317 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import logging
+import os
+import time
+from threading import Lock
+from threading import get_ident
+from typing import Any
+from typing import Dict
+from typing import Optional
+from urllib.parse import quote
+
+from nv_ingest.util.process_local import ProcessLocal
+from nv_ingest.util.process_local import register_exit_finalizer
+
+logger = logging.getLogger(__name__)
+
+# "off" (the default), or "disk"/"redis" to remember images across jobs in a directory or Redis server.
+IMAGE_DEDUP_INDEX = os.getenv("IMAGE_DEDUP_INDEX", "off").lower()
+IMAGE_DEDUP_INDEX_DIR = os.getenv("IMAGE_DEDUP_INDEX_DIR", "/tmp/nv_ingest_image_dedup_index")
+IMAGE_DEDUP_INDEX_REDIS_URL = os.getenv("IMAGE_DEDUP_INDEX_REDIS_URL", "redis://localhost:6379/0")
+IMAGE_DEDUP_INDEX_TTL = float(os.getenv("IMAGE_DEDUP_INDEX_TTL", 0))
+# Seconds a job has to store an image it claimed before another job may claim it instead.
+IMAGE_DEDUP_INDEX_LEASE = float(os.getenv("IMAGE_DEDUP_INDEX_LEASE", 600))
+
+
+def get_content_hash(content: str) -> str:
+    """
+    Returns the hex MD5 digest of base64 image content, the hash images are deduplicated by.
+
+    Parameters
+    ----------
+    content : str
+        The base64-encoded image.
+
+    Returns
+    -------
+    str
+        The content hash.
+    """
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+class DiskDedupStore:
+    """
+    An index store of files in a local directory, shared by every process that uses the same directory.
+
+    Each entry is one file. New entries are written to a temporary file and hard-linked into place, so exactly one of
+    several concurrent writers of the same key succeeds and readers never see a partial entry.
+
+    Parameters
+    ----------
+    path : str
+        The index directory. It is created if it does not exist.
+    ttl : float
+        Seconds after which an entry may be replaced, or 0 for never.
+    """
+
+    def __init__(self, path: str, ttl: float = 0):
+        self._path = path
+        self._ttl = ttl
+        os.makedirs(path, exist_ok=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._path, *key.split("/"))
+
+    def _write_tmp(self, path: str, value: bytes) -> str:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(value)
+        return tmp_path
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._entry_path(key)
+        try:
+            if self._ttl and os.stat(path).st_mtime + self._ttl < time.time():
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def add(self, key: str, value: bytes) -> Optional[bytes]:
+        path = self._entry_path(key)
+        tmp_path = self._write_tmp(path, value)
+        try:
+            os.link(tmp_path, path)
+            return None
+        except FileExistsError:
+            existing = self.get(key)
+            if existing is None:
+                # Expired, or removed since the link failed.
+                os.replace(tmp_path, path)
+            return existing
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def replace(self, key: str, value: bytes) -> None:
+        path = self._entry_path(key)
+        os.replace(self._write_tmp(path, value), path)
+
+
+class RedisDedupStore:
+    """
+    An index store in Redis, shared by every process and host that uses the same server.
+
+    Parameters
+    ----------
+    client : redis.Redis
+        The Redis client, or any object with compatible `get` and `set` methods.
+    ttl : float
+        Seconds before an entry expires, or 0 to keep entries until Redis evicts them.
+    prefix : str, optional
+        A prefix for every key written by the index.
+    """
+
+    def __init__(self, client: Any, ttl: float = 0, prefix: str = "nv_ingest:image_dedup:"):
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def add(self, key: str, value: bytes) -> Optional[bytes]:
+        ex = int(self._ttl) if self._ttl > 0 else None
+        if self._client.set(self._prefix + key, value, nx=True, ex=ex):
+            return None
+        return self._client.get(self._prefix + key)
+
+    def replace(self, key: str, value: bytes) -> None:
+        self._client.set(self._prefix + key, value, xx=True, keepttl=True)
+
+
+class ImageDedupIndex:
+    """
+    Remembers which images have been ingested into each collection, across jobs.
+
+    The first job to ingest an image into a collection claims its content hash with a reference to that occurrence.
+    The claim is provisional: it only becomes the reference later jobs get back, so they can skip the image, once the
+    image storage stage has uploaded the first occurrence and committed its URL. Until then other jobs ingest the
+    image themselves, and if the claim is not committed within `lease` seconds (the job failed, was cancelled or does
+    not store images) the next job to see the image claims it instead. Store failures are logged and treated as new
+    images, so they never fail a job.
+
+    Parameters
+    ----------
+    store : DiskDedupStore or RedisDedupStore
+        Where the index is kept.
+    lease : float, optional
+        Seconds a claim may stay uncommitted before another job can take it over.
+    """
+
+    def __init__(self, store: Any, lease: float = IMAGE_DEDUP_INDEX_LEASE):
+        self._store = store
+        self._lease = lease
+        self._lock = Lock()
+        self._metrics = {"claims": 0, "duplicates": 0, "pending": 0, "errors": 0}
+
+    @staticmethod
+    def _key(collection_id: str, content_hash: str) -> str:
+        # Collections are namespaced by directory (or key segment) so the same image is tracked separately in each.
+        return f"c_{quote(collection_id or '', safe='')}/{content_hash}"
+
+    def _count(self, metric: str) -> None:
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def claim(self, collection_id: str, content_hash: str, reference: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Claims an image for ingestion into a collection, unless an earlier job already stored it there.
+
+        Parameters
+        ----------
+        collection_id : str
+            The collection the image is ingested into.
+        content_hash : str
+            The image's `get_content_hash`.
+        reference : dict
+            JSON-serializable details of this occurrence, such as its source.
+
+        Returns
+        -------
+        dict or None
+            The reference of the stored first occurrence, with its "content_url", if there is one. None if the image
+            should be ingested: it is new, or its first occurrence has not been stored (yet).
+        """
+        key = self._key(collection_id, content_hash)
+        entry = json.dumps(dict(reference, content_url="", lease_expires=time.time() + self._lease)).encode()
+        try:
+            existing = self._store.add(key, entry)
+            if existing is None:
+                self._count("claims")
+                return None
+
+            existing = json.loads(existing)
+            if existing.get("content_url"):
+                self._count("duplicates")
+                existing.pop("lease_expires", None)
+                return existing
+
+            if existing.get("lease_expires", 0) < time.time():
+                # The claiming job did not store the image in time; this job claims it instead.
+                self._store.replace(key, entry)
+                self._count("claims")
+            else:
+                self._count("pending")
+        except Exception as e:
+            logger.warning(f"Image dedup index lookup failed: {e}")
+            self._count("errors")
+
+        return None
+
+    def commit(self, collection_id: str, content_hash: str, content_url: str) -> None:
+        """
+        Commits the claim on an image once it is stored, so later jobs reference the stored copy.
+
+        Does nothing if the image is not claimed, or if another copy was committed first.
+
+        Parameters
+        ----------
+        collection_id : str
+            The collection the image was ingested into.
+        content_hash : str
+            The image's `get_content_hash`.
+        content_url : str
+            Where the image was stored.
+        """
+        key = self._key(collection_id, content_hash)
+        try:
+            existing = self._store.get(key)
+            if existing is None:
+                return
+            reference = json.loads(existing)
+            if reference.get("content_url"):
+                return
+            reference.pop("lease_expires", None)
+            reference["content_url"] = content_url
+            self._store.replace(key, json.dumps(reference).encode())
+        except Exception as e:
+            logger.warning(f"Image dedup index update failed: {e}")
+            self._count("errors")
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Returns the number of images claimed, found to be duplicates of stored images, found to be claimed by a job that
+        has not stored them yet, and store errors.
+        """
+        with self._lock:
+            return dict(self._metrics)
+
+
+def _create_store(mode: str) -> Any:
+    if mode == "disk":
+        return DiskDedupStore(IMAGE_DEDUP_INDEX_DIR, IMAGE_DEDUP_INDEX_TTL)
+
+    import redis
+
+    return RedisDedupStore(redis.Redis.from_url(IMAGE_DEDUP_INDEX_REDIS_URL), IMAGE_DEDUP_INDEX_TTL)
+
+
+def _log_metrics(index: ImageDedupIndex) -> None:
+    metrics = index.get_metrics()
+    if any(metrics.values()):
+        logger.info(f"Image dedup index metrics (pid {os.getpid()}): {metrics}")
+
+
+def _create_image_dedup_index() -> Optional[ImageDedupIndex]:
+    mode = IMAGE_DEDUP_INDEX
+    if mode not in ("off", "disk", "redis"):
+        logger.warning(f"Unknown IMAGE_DEDUP_INDEX '{mode}'; cross-job image dedup is disabled.")
+        return None
+    if mode == "off":
+        return None
+
+    try:
+        index = ImageDedupIndex(_create_store(mode))
+    except Exception as e:
+        logger.warning(f"Failed to create the '{mode}' image dedup index; it is disabled: {e}")
+        return None
+    register_exit_finalizer(_log_metrics, index)
+
+    return index
+
+
+# Each process opens its own store; the parent's Redis connections are not reused.
+_image_dedup_index: ProcessLocal[ImageDedupIndex] = ProcessLocal(_create_image_dedup_index)
+
+
+def get_image_dedup_index() -> Optional[ImageDedupIndex]:
+    """
+    Returns the process-wide image dedup index configured by the `IMAGE_DEDUP_INDEX*` environment variables.
+
+    Returns
+    -------
+    ImageDedupIndex or None
+        The index, or None if `IMAGE_DEDUP_INDEX` is "off" or the store could not be created.
+    """
+    return _image_dedup_index.get()
+
+
+def set_image_dedup_index(index: Optional[ImageDedupIndex]) -> None:
+    """
+    Replaces the process-wide image dedup index, for example to disable it or to use a custom store.
+
+    Parameters
+    ----------
+    index : ImageDedupIndex, optional
+        The index to use, or None to disable cross-job dedup.
+    """
+    _image_dedup_index.set(index)
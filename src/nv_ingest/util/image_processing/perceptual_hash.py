@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+import io
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Each hash compares 8 x 8 neighbouring pixels, giving 64 bits.
+HASH_SIZE = 8
+
+
+def _decode_thumbnail(base64_image: str, hash_size: int) -> Optional[np.ndarray]:
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(base64_image))) as image:
+            # Lets JPEG decode straight to a reduced size instead of decoding every pixel and scaling afterwards.
+            image.draft("L", (hash_size * 4, hash_size * 4))
+            thumbnail = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+            return np.asarray(thumbnail, dtype=np.int16)
+    except Exception as e:
+        logger.debug(f"Could not decode image for perceptual hashing: {e}")
+        return None
+
+
+def compute_dhashes(base64_images: Sequence[str], hash_size: int = HASH_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the difference hash (dHash) of base64-encoded images.
+
+    Each image is decoded at a reduced size, converted to grayscale and shrunk to `hash_size + 1` x `hash_size` pixels.
+    Bit `i` of the hash is set when a pixel is brighter than its right-hand neighbour. Re-encoding, rescaling and
+    compression noise change few or none of the bits, so near-duplicate images have hashes a small Hamming distance
+    apart. The comparisons and bit packing run over all images at once.
+
+    Parameters
+    ----------
+    base64_images : Sequence[str]
+        The base64-encoded images.
+    hash_size : int
+        The hash has `hash_size ** 2` bits; at most 8, so it fits in 64 bits.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The uint64 hash of each image, and a boolean mask of the images that could be decoded. Hashes of images that
+        could not be decoded are 0.
+    """
+    thumbnails = [_decode_thumbnail(base64_image, hash_size) for base64_image in base64_images]
+    valid = np.array([thumbnail is not None for thumbnail in thumbnails], dtype=bool)
+
+    hashes = np.zeros(len(thumbnails), dtype=np.uint64)
+    if valid.any():
+        pixels = np.stack([thumbnail for thumbnail in thumbnails if thumbnail is not None])
+        bits = (pixels[:, :, :-1] > pixels[:, :, 1:]).reshape(len(pixels), -1)
+        packed = np.packbits(bits, axis=1, bitorder="little")
+        packed = np.pad(packed, ((0, 0), (0, 8 - packed.shape[1])))
+        hashes[valid] = packed.view("<u8").ravel()
+
+    return hashes, valid
+
+
+class MultiIndexHash:
+    """
+    An index of 64-bit hashes for finding every stored hash within a Hamming distance of a query.
+
+    Hashes are split into `max_distance + 1` disjoint bit ranges and stored in one table per range. Two hashes that
+    differ in at most `max_distance` bits must agree exactly on at least one range (by the pigeonhole principle), so
+    only hashes sharing a range with the query are compared, instead of every stored hash.
+
+    Parameters
+    ----------
+    max_distance : int
+        The largest Hamming distance queries are made with.
+
+    Methods
+    -------
+    get_chunk_keys(values)
+        Splits hashes into their per-range keys.
+    add(value, chunk_keys, item)
+        Stores a hash and an associated item.
+    query(value, chunk_keys)
+        Returns the stored items within `max_distance` of a hash.
+    """
+
+    def __init__(self, max_distance: int):
+        self._max_distance = max_distance
+        if max_distance < 64:
+            bounds = np.linspace(0, 64, max_distance + 2).astype(np.uint64)
+            self._shifts = bounds[:-1]
+            self._masks = np.array([(1 << int(width)) - 1 for width in np.diff(bounds)], dtype=np.uint64)
+        else:
+            # Every pair of hashes matches; keep them all in one bucket.
+            self._shifts = np.zeros(1, dtype=np.uint64)
+            self._masks = np.zeros(1, dtype=np.uint64)
+        self._tables: List[Dict[int, List[Tuple[int, Any]]]] = [{} for _ in range(len(self._shifts))]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get_chunk_keys(self, values: np.ndarray) -> np.ndarray:
+        """
+        Splits hashes into their per-range keys.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            uint64 hashes.
+
+        Returns
+        -------
+        np.ndarray
+            One row of range keys per hash.
+        """
+        return (values.astype(np.uint64)[:, None] >> self._shifts) & self._masks
+
+    def add(self, value: int, chunk_keys: Sequence[int], item: Any) -> None:
+        for table, key in zip(self._tables, chunk_keys):
+            table.setdefault(key, []).append((value, item))
+        self._size += 1
+
+    def query(self, value: int, chunk_keys: Sequence[int]) -> List[Tuple[int, Any]]:
+        """
+        Returns the stored items within `max_distance` of a hash.
+
+        Parameters
+        ----------
+        value : int
+            The hash to search for.
+        chunk_keys : Sequence[int]
+            The hash's row of `get_chunk_keys`.
+
+        Returns
+        -------
+        List[Tuple[int, Any]]
+            `(distance, item)` pairs, each item once, in no particular order.
+        """
+        matches = {}
+        for table, key in zip(self._tables, chunk_keys):
+            for candidate, item in table.get(key, ()):
+                if item not in matches:
+                    distance = (candidate ^ value).bit_count()
+                    if distance <= self._max_distance:
+                        matches[item] = distance
+
+        return [(distance, item) for item, distance in matches.items()]
+
+
+def group_near_duplicates(hashes: np.ndarray, max_distance: int) -> np.ndarray:
+    """
+    Assigns each hash to the first earlier hash within `max_distance` bits of it.
+
+    Images are taken in order. An image within the distance of an earlier group's first image joins the closest such
+    group (the earliest on ties); otherwise it starts a new group. Grouping is against the first image of each group
+    only, so near-duplicates do not chain into groups of dissimilar images. Candidates are found with a
+    `MultiIndexHash`, so the cost grows with the number of images sharing a bit range rather than with the square of
+    the number of images.
+
+    Parameters
+    ----------
+    hashes : np.ndarray
+        The uint64 hashes, in order.
+    max_distance : int
+        The largest Hamming distance between near-duplicates.
+
+    Returns
+    -------
+    np.ndarray
+        For each hash, the position of the first hash of its group.
+    """
+    index = MultiIndexHash(max_distance)
+    chunk_keys = index.get_chunk_keys(hashes).tolist()
+    groups = np.empty(len(hashes), dtype=np.int64)
+    first_index: Dict[int, int] = {}
+
+    for position, value in enumerate(hashes.tolist()):
+        exact = first_index.get(value)
+        if exact is not None:
+            groups[position] = exact
+            continue
+
+        matches = index.query(value, chunk_keys[position])
+        if matches:
+            groups[position] = min(matches)[1]
+        else:
+            groups[position] = position
+            index.add(value, chunk_keys[position], position)
+        first_index[value] = int(groups[position])
+
+    return groups
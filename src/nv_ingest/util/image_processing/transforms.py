@@ -139,7 +139,7 @@ def pad_image(
     Parameters
     ----------
     array : np.ndarray
-        The input image as a NumPy array of shape (H, W, C).
+        The input image as a NumPy array of shape (H, W, C), or (H, W) for a grayscale image.
     target_width : int, optional
         The desired target width of the padded image. Defaults to DEFAULT_MAX_WIDTH.
     target_height : int, optional
@@ -177,7 +177,7 @@ def pad_image(
     final_width = max(width, target_width)
 
     # Create the canvas and place the original image on it
-    canvas = background_color * np.ones((final_height, final_width, array.shape[2]), dtype=dtype)
+    canvas = background_color * np.ones((final_height, final_width) + array.shape[2:], dtype=dtype)
     canvas[pad_height : pad_height + height, pad_width : pad_width + width] = array  # noqa: E203
 
     return canvas, (pad_width, pad_height)
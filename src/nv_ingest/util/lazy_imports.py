@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib
+import typing
+
+
+def lazy_module_attributes(
+    module_name: str, attributes: typing.Dict[str, typing.Tuple[str, str]]
+) -> typing.Tuple[typing.Callable[[str], typing.Any], typing.Callable[[], typing.List[str]]]:
+    """
+    Builds module-level `__getattr__` and `__dir__` functions (PEP 562) that import attributes on first access.
+
+    Packages such as `nv_ingest.extraction_workflows.pdf` expose one helper per extraction method, each pulling in its
+    own third-party dependencies. Resolving them lazily means a worker only pays the import cost of the methods it
+    actually runs, and a missing optional dependency only matters once its method is requested.
+
+    Parameters
+    ----------
+    module_name : str
+        The `__name__` of the module the attributes are exposed from; resolved attributes are cached on it.
+    attributes : Dict[str, Tuple[str, str]]
+        Maps each exposed name to the `(module, attribute)` it is imported from.
+
+    Returns
+    -------
+    Tuple[Callable[[str], Any], Callable[[], List[str]]]
+        The `__getattr__` and `__dir__` functions to assign in the module.
+
+    Examples
+    --------
+    >>> __getattr__, __dir__ = lazy_module_attributes(
+    ...     __name__, {"pdfium": ("nv_ingest.extraction_workflows.pdf.pdfium_helper", "pdfium_extractor")}
+    ... )
+    """
+
+    def __getattr__(name: str) -> typing.Any:
+        try:
+            source_module, source_attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(source_module), source_attribute)
+        # Cache on the module, so later lookups never reach __getattr__ again.
+        setattr(importlib.import_module(module_name), name, value)
+
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted(set(vars(importlib.import_module(module_name))) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import logging
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from nv_ingest.util.message_brokers.redis.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRedisClient:
+    """
+    An asyncio-native counterpart of `RedisClient` for use inside an event loop, such as the REST service.
+
+    Commands, including the blocking pop used to wait for job results, are awaited on a `redis.asyncio` connection
+    pool, so a request waiting on Redis suspends only its own coroutine instead of the whole event loop. Message
+    fragmentation, retries and backoff behave as in `RedisClient`.
+
+    Parameters
+    ----------
+    host : str
+        The hostname of the Redis server.
+    port : int
+        The port number of the Redis server.
+    db : int, optional
+        The database number to connect to. Default is 0.
+    max_retries : int, optional
+        The maximum number of retry attempts for operations. Default is 0 (no retries).
+    max_backoff : int, optional
+        The maximum backoff delay between retries in seconds. Default is 32 seconds.
+    connection_timeout : int, optional
+        The timeout in seconds for connecting to the Redis server. Default is 300 seconds.
+    max_pool_size : int, optional
+        The maximum number of connections in the pool. Commands beyond this many in flight wait for a free connection.
+        Default is 128.
+    pool_timeout : float, optional
+        Seconds a command waits for a free connection before raising a `redis.exceptions.ConnectionError`, or None to
+        wait indefinitely. Default is 30 seconds.
+    redis_allocator : Any, optional
+        The Redis client allocator, allowing for custom client instances. Default is redis.asyncio.Redis.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int = 0,
+        max_retries: int = 0,
+        max_backoff: int = 32,
+        connection_timeout: int = 300,
+        max_pool_size: int = 128,
+        pool_timeout: Optional[float] = 30,
+        redis_allocator: Any = aioredis.Redis,
+    ):
+        self._host = host
+        self._port = port
+        self._db = db
+        self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        # Connections are created lazily, on the event loop that first uses them.
+        self._pool = aioredis.BlockingConnectionPool(
+            host=self._host,
+            port=self._port,
+            db=self._db,
+            socket_connect_timeout=connection_timeout,
+            max_connections=max_pool_size,
+            timeout=pool_timeout,
+        )
+        self._client = redis_allocator(connection_pool=self._pool)
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        self._max_retries = value
+
+    def get_client(self) -> Any:
+        """
+        Returns the Redis client instance.
+
+        Returns
+        -------
+        Any
+            The `redis.asyncio` client. Broken connections are replaced by its pool, so no reconnect is needed.
+        """
+        return self._client
+
+    async def ping(self) -> bool:
+        """
+        Checks if the Redis server is responsive.
+
+        Returns
+        -------
+        bool
+            True if the server responds to a ping, False otherwise.
+        """
+        try:
+            await self._client.ping()
+            return True
+        except (RedisError, OSError):
+            return False
+
+    async def _check_response(
+        self, channel_name: str, timeout: float
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int], Optional[int]]:
+        response = await self._client.blpop([channel_name], timeout)
+        if response is None:
+            raise TimeoutError("No response was received in the specified timeout period")
+
+        if len(response) > 1 and response[1]:
+            try:
+                message = json.loads(response[1])
+                return message, message.get("fragment", 0), message.get("fragment_count", 1)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to decode message: {e}")
+                raise ValueError(f"Failed to decode message from Redis: {e}")
+
+        return None, None, None
+
+    async def fetch_message(self, channel_name: str, timeout: float = 10) -> Optional[Dict[str, Any]]:
+        """
+        Fetches a message from the specified queue with retries on failure. If the message is fragmented, it will
+        continue fetching fragments until all parts have been collected.
+
+        Parameters
+        ----------
+        channel_name : str
+            Channel to fetch the message from.
+        timeout : float
+            The timeout in seconds for waiting until a message is available. If we receive a multi-part message, this
+            value will be temporarily extended in order to collect all fragments.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The full fetched message, or None if the response was empty.
+
+        Raises
+        ------
+        TimeoutError
+            If no message arrived within the timeout.
+        ValueError
+            If fetching the message fails after the specified number of retries or due to other critical errors.
+        """
+        accumulated_time = 0
+        collected_fragments = []
+        fragment_count = None
+        retries = 0
+
+        while True:
+            try:
+                message, fragment, fragment_count = await self._check_response(channel_name, timeout)
+
+                if message is None:
+                    return None
+
+                if fragment_count == 1:
+                    return message
+
+                collected_fragments.append(message)
+                if len(collected_fragments) == fragment_count:
+                    collected_fragments.sort(key=lambda x: x["fragment"])
+                    return RedisClient._combine_fragments(collected_fragments)
+
+            except TimeoutError:
+                if fragment_count and fragment_count > 1:
+                    accumulated_time += timeout
+                    if accumulated_time >= (timeout * fragment_count):
+                        err_msg = f"Failed to reconstruct message from {channel_name} after {accumulated_time} sec."
+                        logger.error(err_msg)
+                        raise ValueError(err_msg)
+                else:
+                    raise
+
+            except RedisError as err:
+                retries += 1
+                logger.error(f"Redis error during fetch: {err}")
+                backoff_delay = min(2**retries, self._max_backoff)
+
+                if self.max_retries > 0 and retries <= self.max_retries:
+                    logger.error(f"Fetch attempt failed, retrying in {backoff_delay}s...")
+                    await asyncio.sleep(backoff_delay)
+                else:
+                    logger.error(f"Failed to fetch message from {channel_name} after {retries} attempts.")
+                    raise ValueError(f"Failed to fetch message from Redis queue after {retries} attempts: {err}")
+
+            except ValueError:
+                raise
+
+            except Exception as e:
+                logger.error(f"Unexpected error during fetch from {channel_name}: {e}")
+                raise ValueError(f"Unexpected error during fetch: {e}")
+
+    async def submit_message(self, channel_name: str, message: str) -> None:
+        """
+        Submits a message to a specified Redis queue with retries on failure.
+
+        Parameters
+        ----------
+        channel_name : str
+            The name of the queue to submit the message to.
+        message : str
+            The message to submit.
+
+        Raises
+        ------
+        RedisError
+            If submitting the message fails after the specified number of retries.
+        """
+        retries = 0
+        while True:
+            try:
+                await self._client.rpush(channel_name, message)
+                logger.debug(f"Message submitted to {channel_name}")
+                return
+            except RedisError as e:
+                retries += 1
+                backoff_delay = min(2**retries, self._max_backoff)
+
+                if self.max_retries == 0 or retries < self.max_retries:
+                    logger.error(f"Submit attempt failed, retrying in {backoff_delay}s... Error: {e}")
+                    await asyncio.sleep(backoff_delay)
+                else:
+                    logger.error(f"Failed to submit message to {channel_name} after {retries} attempts.")
+                    raise
+
+    async def close(self) -> None:
+        """
+        Closes the client and disconnects every pooled connection.
+        """
+        await self._client.aclose()
+        await self._pool.disconnect()
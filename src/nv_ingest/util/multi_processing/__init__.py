@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from .mp_pool_singleton import ProcessWorkerPool
 from .mp_pool_singleton import ProcessWorkerPoolSingleton
+from .worker_pool_registry import WorkerPoolRegistry
 
-__all__ = ["ProcessWorkerPoolSingleton"]
+__all__ = ["ProcessWorkerPool", "ProcessWorkerPoolSingleton", "WorkerPoolRegistry"]
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import os
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# tmpfs mount backing POSIX shared memory; segments created here never touch disk.
+SHM_DIR = os.getenv("NV_INGEST_SHM_DIR", "/dev/shm")
+
+PAYLOAD_TRANSPORT_PICKLE = "pickle"
+PAYLOAD_TRANSPORT_ARROW = "arrow"
+PAYLOAD_TRANSPORTS = (PAYLOAD_TRANSPORT_PICKLE, PAYLOAD_TRANSPORT_ARROW)
+
+
+class ArrowIPCHandle:
+    """
+    A small, picklable reference to an Arrow IPC stream stored in a shared memory segment.
+
+    Handles are what travel through process queues in place of a pickled DataFrame. The segment is owned by
+    whichever side reads it next; reading with `unlink=True` removes the name so the memory is released as soon
+    as the last mapped buffer is dropped.
+
+    Attributes
+    ----------
+    path : str
+        Filesystem path of the shared memory segment.
+    size : int
+        Number of bytes of IPC data in the segment.
+    """
+
+    __slots__ = ("path", "size")
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+
+    def __getstate__(self):
+        return self.path, self.size
+
+    def __setstate__(self, state):
+        self.path, self.size = state
+
+    def __repr__(self):
+        return f"ArrowIPCHandle(path={self.path!r}, size={self.size})"
+
+
+def write_arrow_handle(data: Union[pd.DataFrame, pa.Table]) -> ArrowIPCHandle:
+    """
+    Serializes a DataFrame or Arrow table once into an Arrow IPC stream in shared memory.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or pa.Table
+        The data to serialize. pandas DataFrames are converted without their index.
+
+    Returns
+    -------
+    ArrowIPCHandle
+        A handle that can be passed to another process to read the data back.
+    """
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+
+    # Size the segment exactly; the mock stream only accumulates lengths and does not copy buffers.
+    mock_sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock_sink, table.schema) as writer:
+        writer.write_table(table)
+    size = mock_sink.size()
+
+    path = os.path.join(SHM_DIR, f"nv_ingest_{uuid.uuid4().hex}")
+    try:
+        with pa.create_memory_map(path, size) as sink:
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+    except Exception:
+        release_arrow_handle(ArrowIPCHandle(path, size))
+        raise
+
+    return ArrowIPCHandle(path, size)
+
+
+def read_arrow_handle(handle: ArrowIPCHandle, unlink: bool = True) -> pa.Table:
+    """
+    Maps an Arrow IPC stream from shared memory and returns it as a table without copying column buffers.
+
+    Parameters
+    ----------
+    handle : ArrowIPCHandle
+        The handle returned by `write_arrow_handle`.
+    unlink : bool, optional
+        Remove the segment name after mapping it (default True). The mapping stays valid for as long as the
+        returned table, or anything built zero-copy from it, is alive.
+
+    Returns
+    -------
+    pa.Table
+        The table stored in the segment.
+    """
+    source = pa.memory_map(handle.path, "r")
+    try:
+        return pa.ipc.open_stream(source).read_all()
+    finally:
+        if unlink:
+            release_arrow_handle(handle)
+
+
+def read_arrow_handle_as_dataframe(handle: ArrowIPCHandle, unlink: bool = True) -> pd.DataFrame:
+    """
+    Reads an Arrow IPC stream from shared memory as a pandas DataFrame.
+
+    The table is mapped without copying, but converting it to pandas does copy: payload columns are strings and
+    nested metadata, which pandas holds as Python objects. The conversion releases each Arrow column as soon as it is
+    converted and does not consolidate columns into blocks, so the peak is about one copy of the payload rather than
+    two.
+
+    Parameters
+    ----------
+    handle : ArrowIPCHandle
+        The handle returned by `write_arrow_handle`.
+    unlink : bool, optional
+        Remove the segment name after mapping it (default True).
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame stored in the segment.
+    """
+    table = read_arrow_handle(handle, unlink=unlink)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def release_arrow_handle(handle: ArrowIPCHandle) -> None:
+    """
+    Removes the shared memory segment referenced by a handle, if it still exists.
+
+    Parameters
+    ----------
+    handle : ArrowIPCHandle
+        The handle to release.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        os.unlink(handle.path)
+    except FileNotFoundError:
+        pass
+
+
+def run_with_arrow_payload(
+    process_fn: Callable[[pd.DataFrame, Dict[str, Any]], Any], handle: ArrowIPCHandle, task_props: Dict[str, Any]
+) -> Union[ArrowIPCHandle, pd.DataFrame, Tuple[Any, ...]]:
+    """
+    Worker-side adapter that runs a stage `process_fn` against a payload delivered through shared memory.
+
+    The input payload is read from `handle` and the resulting DataFrame is written back to a new segment, so only
+    handles cross the process boundary. This saves the pickle round-trips through the stage and pool queues; the
+    worker still builds its own pandas copy of the payload (see `read_arrow_handle_as_dataframe`). Any extra values
+    returned by `process_fn` (for example trace info) are passed through unchanged. If the result cannot be
+    represented in Arrow, the DataFrame itself is returned and travels the regular pickled path.
+
+    Parameters
+    ----------
+    process_fn : callable
+        The stage function, accepting a pandas DataFrame and a dictionary of task properties.
+    handle : ArrowIPCHandle
+        Handle to the input payload.
+    task_props : dict
+        Task properties forwarded to `process_fn`.
+
+    Returns
+    -------
+    ArrowIPCHandle, pd.DataFrame or tuple
+        The result in the same shape `process_fn` returned it, with the DataFrame replaced by a handle.
+    """
+    df = read_arrow_handle_as_dataframe(handle)
+    result = process_fn(df, task_props)
+
+    extra_results = ()
+    if isinstance(result, tuple):
+        result, *extra_results = result
+
+    if isinstance(result, pd.DataFrame):
+        try:
+            result = write_arrow_handle(result)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.debug(f"Result payload is not Arrow-compatible, returning it pickled: {e}")
+
+    if extra_results:
+        return (result, *extra_results)
+
+    return result
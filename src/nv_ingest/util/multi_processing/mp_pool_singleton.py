@@ -3,38 +3,46 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import itertools
 import logging
 import math
 import multiprocessing as mp
 import os
-from multiprocessing import Manager
+import pickle
+import threading
+import time
+from multiprocessing import connection
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
 from threading import Lock
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import Optional
+from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
+# Pickled results at or above this size are returned through a shared memory segment instead of the result pipe.
+SHM_RESULT_THRESHOLD = int(os.getenv("NV_INGEST_SHM_RESULT_THRESHOLD", 1 << 20))
+
 
 class SimpleFuture:
     """
     A simplified future object for handling asynchronous task results.
 
-    This class allows the storage and retrieval of the result or exception from an asynchronous task,
-    using multiprocessing primitives for inter-process communication.
-
-    Parameters
-    ----------
-    manager : multiprocessing.Manager
-        A multiprocessing manager that provides shared memory for the result and exception.
+    This class allows the storage and retrieval of the result or exception from an asynchronous task. Futures live
+    only in the parent process; worker processes report results over a result channel and the pool resolves the
+    matching future from its completion table.
 
     Attributes
     ----------
-    _result : multiprocessing.Value
-        A shared memory object to store the result of the asynchronous task.
-    _exception : multiprocessing.Value
-        A shared memory object to store any exception raised during task execution.
-    _done : multiprocessing.Event
+    _result : Any
+        The result of the asynchronous task.
+    _exception : Exception or None
+        Any exception raised during task execution.
+    _done : threading.Event
         An event that signals the completion of the task.
 
     Methods
@@ -43,14 +51,20 @@ class SimpleFuture:
         Sets the result of the task and marks the task as done.
     set_exception(exception)
         Sets the exception of the task and marks the task as done.
-    result()
+    add_done_callback(fn)
+        Registers a callable to be invoked once the task completes.
+    done()
+        Returns True if the task has completed.
+    result(timeout=None)
         Waits for the task to complete and returns the result, or raises the exception if one occurred.
     """
 
-    def __init__(self, manager: Manager):
-        self._result = manager.Value("i", None)
-        self._exception = manager.Value("i", None)
-        self._done = manager.Event()
+    def __init__(self):
+        self._result = None
+        self._exception = None
+        self._done = threading.Event()
+        self._callbacks = []
+        self._callbacks_lock = Lock()
 
     def set_result(self, result: Any) -> None:
         """
@@ -65,8 +79,9 @@ class SimpleFuture:
         -------
         None
         """
-        self._result.value = result
+        self._result = result
         self._done.set()
+        self._run_callbacks()
 
     def set_exception(self, exception: Exception) -> None:
         """
@@ -81,15 +96,63 @@ class SimpleFuture:
         -------
         None
         """
-        self._exception.value = exception
+        self._exception = exception
         self._done.set()
+        self._run_callbacks()
+
+    def add_done_callback(self, fn: Callable[["SimpleFuture"], None]) -> None:
+        """
+        Registers a callable to be invoked with this future once the task completes.
+
+        If the task has already completed, `fn` is called immediately in the calling thread; otherwise it is called
+        from the thread that resolves the future.
+
+        Parameters
+        ----------
+        fn : callable
+            A function accepting the completed future.
+
+        Returns
+        -------
+        None
+        """
+        with self._callbacks_lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _run_callbacks(self) -> None:
+        with self._callbacks_lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception as e:
+                logger.error(f"SimpleFuture done callback raised an exception: {e}")
+
+    def done(self) -> bool:
+        """
+        Returns whether the asynchronous task has completed.
 
-    def result(self) -> Any:
+        Returns
+        -------
+        bool
+            True if a result or exception has been set.
+        """
+        return self._done.is_set()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
         """
         Retrieves the result of the asynchronous task or raises the exception if one occurred.
 
         This method blocks until the task is complete.
 
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. Waits indefinitely when None.
+
         Returns
         -------
         Any
@@ -97,68 +160,126 @@ class SimpleFuture:
 
         Raises
         ------
+        TimeoutError
+            If the task did not complete within `timeout` seconds.
         Exception
             The exception raised during task execution, if any.
         """
-        self._done.wait()
-        if self._exception.value is not None:
-            raise self._exception.value
-        return self._result.value
+        if not self._done.wait(timeout):
+            raise TimeoutError("Timed out waiting for task result.")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
 
 
-class ProcessWorkerPoolSingleton:
+def _send_result(
+    result_conn: connection.Connection, task_id: int, success: bool, value: Any, elapsed: float = 0.0
+) -> None:
     """
-    A singleton process worker pool for managing a fixed number of worker processes.
+    Serializes a task outcome once and sends it to the parent over the worker's result pipe, along with the time
+    the worker spent running the task.
+
+    Small payloads are sent inline. Payloads of at least `SHM_RESULT_THRESHOLD` bytes are written into a shared
+    memory segment and only the segment name travels through the pipe; ownership of the segment passes to the parent,
+    which unlinks it after reading.
+    """
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        success = False
+        payload = pickle.dumps(RuntimeError(f"Unable to serialize task result: {e}"))
+
+    if len(payload) < SHM_RESULT_THRESHOLD:
+        result_conn.send((task_id, success, payload, None, elapsed))
+        return
+
+    shm = shared_memory.SharedMemory(create=True, size=len(payload))
+    try:
+        shm.buf[: len(payload)] = payload
+        # The parent takes ownership of the segment; stop this process's tracker from unlinking it at exit.
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa
+    finally:
+        shm.close()
+
+    result_conn.send((task_id, success, None, (shm.name, len(payload)), elapsed))
+
+
+def _load_result(payload: Optional[bytes], shm_ref: Optional[Tuple[str, int]]) -> Any:
+    """
+    Reconstructs a task outcome sent by `_send_result`, releasing the shared memory segment if one was used.
+    """
+    if shm_ref is None:
+        return pickle.loads(payload)
+
+    name, size = shm_ref
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[:size]
+    try:
+        return pickle.loads(view)
+    finally:
+        view.release()
+        shm.close()
+        shm.unlink()
+
+
+class ProcessWorkerPool:
+    """
+    A named process worker pool managing a fixed number of worker processes.
+
+    Tasks are distributed through a shared task queue. Each worker returns its results over a dedicated result pipe
+    (large results are staged in shared memory), and a collector thread in the parent resolves the matching
+    `SimpleFuture` from a completion table keyed by task id.
 
-    This class implements a process pool using the singleton pattern, ensuring that only one instance
-    of the pool exists. It manages worker processes that can execute tasks asynchronously.
+    A pool can bound the number of tasks waiting behind its busy workers and pin its workers to a set of CPUs, so
+    that capacity can be divided explicitly between pipeline stages. Pools also keep utilization counters that can
+    be read with `get_utilization`.
 
     Attributes
     ----------
-    _instance : ProcessWorkerPoolSingleton or None
-        The singleton instance of the class.
-    _lock : threading.Lock
-        A lock to ensure thread-safe initialization of the singleton instance.
-    _total_workers : int
-        The total number of worker processes.
+    name : str
+        The name of the pool.
+    closed : bool
+        True once the pool has been closed.
 
     Methods
     -------
-    __new__(cls)
-        Ensures only one instance of the class is created.
-    _initialize(total_max_workers)
-        Initializes the worker pool with the specified number of workers.
     submit_task(process_fn, *args)
         Submits a task to the worker pool for asynchronous execution.
+    get_utilization()
+        Returns a snapshot of the pool's configuration and utilization counters.
     close()
         Closes the worker pool and terminates all worker processes.
     """
 
-    _instance: Optional["ProcessWorkerPoolSingleton"] = None
-    _lock: Lock = Lock()
-    _total_workers: int = 0
-
-    def __new__(cls):
+    def __init__(
+        self,
+        name: str,
+        total_max_workers: int,
+        max_queue_depth: int = 0,
+        cpu_affinity: Optional[Iterable[int]] = None,
+    ):
         """
-        Ensures that only one instance of the ProcessWorkerPoolSingleton is created.
-
-        Returns
-        -------
-        ProcessWorkerPoolSingleton
-            The singleton instance of the class.
+        Parameters
+        ----------
+        name : str
+            The name of the pool, used in logs and utilization reports.
+        total_max_workers : int
+            The number of worker processes to create.
+        max_queue_depth : int, optional
+            The maximum number of submitted tasks allowed to wait for a free worker. `submit_task` blocks once the
+            limit is reached. 0 (the default) leaves the queue unbounded.
+        cpu_affinity : iterable of int, optional
+            CPU ids the worker processes are restricted to. Workers inherit the parent's affinity when None.
         """
-        logger.debug("Creating ProcessWorkerPoolSingleton instance...")
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(ProcessWorkerPoolSingleton, cls).__new__(cls)
-                max_workers = math.floor(max(1, len(os.sched_getaffinity(0)) * 0.4))
-                cls._instance._initialize(max_workers)
-                logger.debug(f"ProcessWorkerPoolSingleton instance created: {cls._instance}")
-            else:
-                logger.debug(f"ProcessWorkerPoolSingleton instance already exists: {cls._instance}")
-        return cls._instance
-
-    def _initialize(self, total_max_workers: int) -> None:
+        self._initialize(total_max_workers, name=name, max_queue_depth=max_queue_depth, cpu_affinity=cpu_affinity)
+
+    def _initialize(
+        self,
+        total_max_workers: int,
+        name: str = "default",
+        max_queue_depth: int = 0,
+        cpu_affinity: Optional[Iterable[int]] = None,
+    ) -> None:
         """
         Initializes the worker pool with the specified number of worker processes.
 
@@ -166,26 +287,82 @@ class ProcessWorkerPoolSingleton:
         ----------
         total_max_workers : int
             The maximum number of worker processes to create.
+        name : str, optional
+            The name of the pool.
+        max_queue_depth : int, optional
+            The maximum number of tasks allowed to wait for a free worker; 0 for unbounded.
+        cpu_affinity : iterable of int, optional
+            CPU ids the worker processes are restricted to.
 
         Returns
         -------
         None
+
+        Raises
+        ------
+        ValueError
+            If the worker count or queue depth is out of range, or `cpu_affinity` names CPUs this process cannot use.
         """
+        if total_max_workers < 1:
+            raise ValueError(f"Worker pool '{name}' needs at least one worker, got {total_max_workers}.")
+        if max_queue_depth < 0:
+            raise ValueError(f"Worker pool '{name}' max_queue_depth must be >= 0, got {max_queue_depth}.")
+
+        if cpu_affinity is not None:
+            cpu_affinity = sorted(set(cpu_affinity))
+            unavailable = set(cpu_affinity) - os.sched_getaffinity(0)
+            if not cpu_affinity or unavailable:
+                raise ValueError(f"Worker pool '{name}' cpu_affinity {cpu_affinity} is not a subset of available CPUs.")
+
+        self._name = name
         self._total_max_workers = total_max_workers
+        self._max_queue_depth = max_queue_depth
+        self._cpu_affinity = cpu_affinity
+        # One running task per worker plus `max_queue_depth` waiting tasks; unbounded when no depth is set.
+        self._slots = threading.BoundedSemaphore(total_max_workers + max_queue_depth) if max_queue_depth else None
+        self._closed = False
+
+        self._started_at = time.monotonic()
+        self._completed = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+
         self._context = mp.get_context("fork")
         self._task_queue = self._context.Queue()
-        self._manager = mp.Manager()
+        self._task_ids = itertools.count()
+        self._pending = {}
+        self._pending_lock = Lock()
+        self._result_conns = []
         self._processes = []
-        logger.debug(f"Initializing ProcessWorkerPoolSingleton with {total_max_workers} workers.")
+        logger.debug(f"Initializing worker pool '{name}' with {total_max_workers} workers.")
         for i in range(total_max_workers):
-            p = self._context.Process(target=self._worker, args=(self._task_queue, self._manager))
+            recv_conn, send_conn = self._context.Pipe(duplex=False)
+            p = self._context.Process(
+                target=self._worker, args=(self._task_queue, send_conn, cpu_affinity), name=f"{name}-worker-{i}"
+            )
             p.start()
+            # Only the worker holds the send side, so the pipe reports EOF once that worker exits.
+            send_conn.close()
+            self._result_conns.append(recv_conn)
             self._processes.append(p)
             logger.debug(f"Started worker process {i + 1}/{total_max_workers}: PID {p.pid}")
-        logger.debug(f"Initialized with max workers: {total_max_workers}")
+
+        self._collector_thread = threading.Thread(target=self._collect_results, daemon=True)
+        self._collector_thread.start()
+        logger.debug(f"Initialized worker pool '{name}' with max workers: {total_max_workers}")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
 
     @staticmethod
-    def _worker(task_queue: mp.Queue, manager: mp.Manager) -> None:
+    def _worker(
+        task_queue: mp.Queue, result_conn: connection.Connection, cpu_affinity: Optional[Iterable[int]] = None
+    ) -> None:
         """
         The worker process function that executes tasks from the queue.
 
@@ -193,13 +370,18 @@ class ProcessWorkerPoolSingleton:
         ----------
         task_queue : multiprocessing.Queue
             The queue from which tasks are retrieved.
-        manager : multiprocessing.Manager
-            The manager providing shared memory for inter-process communication.
+        result_conn : multiprocessing.connection.Connection
+            The send side of this worker's result pipe.
+        cpu_affinity : iterable of int, optional
+            CPU ids to pin this process to before taking any work.
 
         Returns
         -------
         None
         """
+        if cpu_affinity:
+            os.sched_setaffinity(0, cpu_affinity)
+
         logger.debug(f"Worker process started: PID {os.getpid()}")
         while True:
             task = task_queue.get()
@@ -207,19 +389,71 @@ class ProcessWorkerPoolSingleton:
                 logger.debug(f"Worker process {os.getpid()} received stop signal.")
                 break
 
-            future, process_fn, args = task
+            task_id, process_fn, args = task
             args, *kwargs = args
+            start = time.perf_counter()
             try:
                 result = process_fn(*args, **{k: v for kwarg in kwargs for k, v in kwarg.items()})
-                future.set_result(result)
+                _send_result(result_conn, task_id, True, result, time.perf_counter() - start)
             except Exception as e:
                 logger.error(f"Future result failure - {e}\n")
-                future.set_exception(e)
+                _send_result(result_conn, task_id, False, e, time.perf_counter() - start)
+
+        result_conn.close()
+
+    def _collect_results(self) -> None:
+        """
+        Receives task outcomes from all worker result pipes and resolves the corresponding futures.
+
+        Runs on a daemon thread in the parent process until every worker's result pipe has been closed.
+
+        Returns
+        -------
+        None
+        """
+        open_conns = list(self._result_conns)
+        while open_conns:
+            for conn in connection.wait(open_conns):
+                try:
+                    task_id, success, payload, shm_ref, elapsed = conn.recv()
+                except (EOFError, OSError):
+                    open_conns.remove(conn)
+                    continue
+
+                try:
+                    value = _load_result(payload, shm_ref)
+                except Exception as e:
+                    success, value = False, e
+
+                with self._pending_lock:
+                    future = self._pending.pop(task_id, None)
+                    if future is not None:
+                        self._busy_seconds += elapsed
+                        if success:
+                            self._completed += 1
+                        else:
+                            self._failed += 1
+
+                if future is None:
+                    logger.warning(f"Received result for unknown task id: {task_id}")
+                    continue
+
+                if self._slots is not None:
+                    self._slots.release()
+
+                if success:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+        logger.debug(f"Worker pool '{self._name}' result collector exiting.")
 
     def submit_task(self, process_fn: Callable, *args: Any) -> SimpleFuture:
         """
         Submits a task to the worker pool for asynchronous execution.
 
+        When the pool has a `max_queue_depth`, this blocks until the task can be queued without exceeding it.
+
         Parameters
         ----------
         process_fn : callable
@@ -231,26 +465,158 @@ class ProcessWorkerPoolSingleton:
         -------
         SimpleFuture
             A future object representing the result of the task.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool has been closed.
         """
-        future = SimpleFuture(self._manager)
-        self._task_queue.put((future, process_fn, args))
+        if self._slots is not None:
+            self._slots.acquire()
+
+        if self._closed:
+            if self._slots is not None:
+                self._slots.release()
+            raise RuntimeError(f"Worker pool '{self._name}' is closed.")
+
+        future = SimpleFuture()
+        with self._pending_lock:
+            task_id = next(self._task_ids)
+            self._pending[task_id] = future
+        self._task_queue.put((task_id, process_fn, args))
         return future
 
+    def get_utilization(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the pool's configuration and utilization counters.
+
+        Returns
+        -------
+        dict
+            - name, workers, max_queue_depth, cpu_affinity: the pool configuration.
+            - busy_workers: workers currently running a task.
+            - queued: submitted tasks waiting for a free worker.
+            - completed, failed: tasks finished since the pool started.
+            - busy_seconds: total worker time spent running tasks.
+            - utilization: busy_seconds as a fraction of the pool's total worker time since it started.
+        """
+        with self._pending_lock:
+            in_flight = len(self._pending)
+            completed = self._completed
+            failed = self._failed
+            busy_seconds = self._busy_seconds
+
+        busy_workers = min(in_flight, self._total_max_workers)
+        capacity_seconds = (time.monotonic() - self._started_at) * self._total_max_workers
+
+        return {
+            "name": self._name,
+            "workers": self._total_max_workers,
+            "max_queue_depth": self._max_queue_depth,
+            "cpu_affinity": self._cpu_affinity,
+            "busy_workers": busy_workers,
+            "queued": in_flight - busy_workers,
+            "completed": completed,
+            "failed": failed,
+            "busy_seconds": busy_seconds,
+            "utilization": min(1.0, busy_seconds / capacity_seconds) if capacity_seconds > 0 else 0.0,
+        }
+
     def close(self) -> None:
         """
         Closes the worker pool and terminates all worker processes.
 
-        This method sends a stop signal to each worker and waits for them to terminate.
+        This method sends a stop signal to each worker and waits for them to terminate. Any task that has not
+        completed by then has its future failed.
 
         Returns
         -------
         None
         """
-        logger.debug("Closing ProcessWorkerPoolSingleton...")
+        logger.debug(f"Closing worker pool '{self._name}'...")
+        self._closed = True
         for _ in range(self._total_max_workers):
             self._task_queue.put(None)  # Send stop signal to all workers
             logger.debug("Sent stop signal to worker.")
         for i, p in enumerate(self._processes):
             p.join()
             logger.debug(f"Worker process {i + 1}/{self._total_max_workers} joined: PID {p.pid}")
-        logger.debug("ProcessWorkerPoolSingleton closed.")
+
+        self._collector_thread.join()
+        for conn in self._result_conns:
+            conn.close()
+
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if self._slots is not None:
+                self._slots.release()
+            future.set_exception(RuntimeError("Worker pool closed before task completed."))
+
+        logger.debug(f"Worker pool '{self._name}' closed: {self.get_utilization()}")
+
+
+class ProcessWorkerPoolSingleton(ProcessWorkerPool):
+    """
+    The default process worker pool, shared by every stage that is not assigned a named pool.
+
+    This class implements the singleton pattern, ensuring that only one default pool exists. It is sized to 40% of
+    the CPUs available to the process.
+
+    Attributes
+    ----------
+    _instance : ProcessWorkerPoolSingleton or None
+        The singleton instance of the class.
+    _lock : threading.Lock
+        A lock to ensure thread-safe initialization of the singleton instance.
+    _total_workers : int
+        The total number of worker processes.
+
+    Methods
+    -------
+    __new__(cls)
+        Ensures only one instance of the class is created.
+    close()
+        Closes the worker pool and releases the singleton instance.
+    """
+
+    _instance: Optional["ProcessWorkerPoolSingleton"] = None
+    _lock: Lock = Lock()
+    _total_workers: int = 0
+
+    def __new__(cls):
+        """
+        Ensures that only one instance of the ProcessWorkerPoolSingleton is created.
+
+        Returns
+        -------
+        ProcessWorkerPoolSingleton
+            The singleton instance of the class.
+        """
+        logger.debug("Creating ProcessWorkerPoolSingleton instance...")
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ProcessWorkerPoolSingleton, cls).__new__(cls)
+                max_workers = math.floor(max(1, len(os.sched_getaffinity(0)) * 0.4))
+                cls._instance._initialize(max_workers)
+                logger.debug(f"ProcessWorkerPoolSingleton instance created: {cls._instance}")
+            else:
+                logger.debug(f"ProcessWorkerPoolSingleton instance already exists: {cls._instance}")
+        return cls._instance
+
+    def __init__(self):
+        # The pool is initialized once, in __new__.
+        pass
+
+    def close(self) -> None:
+        """
+        Closes the worker pool and releases the singleton instance, so the next construction starts a new pool.
+
+        Returns
+        -------
+        None
+        """
+        super().close()
+        with ProcessWorkerPoolSingleton._lock:
+            if ProcessWorkerPoolSingleton._instance is self:
+                ProcessWorkerPoolSingleton._instance = None
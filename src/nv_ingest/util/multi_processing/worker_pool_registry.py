@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from nv_ingest.util.multi_processing.mp_pool_singleton import ProcessWorkerPool
+from nv_ingest.util.multi_processing.mp_pool_singleton import ProcessWorkerPoolSingleton
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_POOL = "default"
+
+
+class WorkerPoolRegistry:
+    """
+    A singleton registry of named process worker pools.
+
+    Pools are declared with `configure` and started lazily the first time a stage asks for them, so a pipeline only
+    forks the workers it actually uses. Requests for the default pool, or for no pool at all, are served by
+    `ProcessWorkerPoolSingleton` unless a pool named "default" has been configured explicitly.
+
+    Methods
+    -------
+    configure(name, workers, max_queue_depth=0, cpu_affinity=None)
+        Declares a named pool.
+    get_pool(name=None)
+        Returns the pool registered under `name`, starting it if needed.
+    assign_stage(stage_name, pool_name)
+        Records which pool a stage should run in.
+    get_stage_pool(stage_name)
+        Returns the pool name assigned to a stage, if any.
+    get_utilization()
+        Returns utilization snapshots for every running pool.
+    close()
+        Closes every pool started through the registry.
+    """
+
+    _instance: Optional["WorkerPoolRegistry"] = None
+    _lock: Lock = Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(WorkerPoolRegistry, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        self._pools: Dict[str, ProcessWorkerPool] = {}
+        self._stage_pools: Dict[str, str] = {}
+        self._pools_lock = Lock()
+
+    def configure(
+        self, name: str, workers: int, max_queue_depth: int = 0, cpu_affinity: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Declares a named pool. The pool is started the first time it is requested.
+
+        Parameters
+        ----------
+        name : str
+            The pool name stages refer to.
+        workers : int
+            The number of worker processes in the pool.
+        max_queue_depth : int, optional
+            The maximum number of tasks allowed to wait for a free worker; 0 (the default) for unbounded.
+        cpu_affinity : iterable of int, optional
+            CPU ids the pool's workers are restricted to.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If a pool with the same name is already running with a different configuration.
+        """
+        config = {
+            "workers": workers,
+            "max_queue_depth": max_queue_depth,
+            "cpu_affinity": sorted(set(cpu_affinity)) if cpu_affinity is not None else None,
+        }
+
+        with self._pools_lock:
+            pool = self._pools.get(name)
+            if pool is not None and not pool.closed and self._configs.get(name) != config:
+                raise ValueError(f"Worker pool '{name}' is already running with configuration {self._configs[name]}.")
+            self._configs[name] = config
+
+        logger.info(f"Configured worker pool '{name}': {config}")
+
+    def get_pool(self, name: Optional[str] = None) -> ProcessWorkerPool:
+        """
+        Returns the pool registered under `name`, starting it if it is not running yet.
+
+        Parameters
+        ----------
+        name : str, optional
+            The pool name. None selects the default pool.
+
+        Returns
+        -------
+        ProcessWorkerPool
+            The requested pool.
+
+        Raises
+        ------
+        ValueError
+            If `name` has not been configured.
+        """
+        name = name or DEFAULT_WORKER_POOL
+
+        with self._pools_lock:
+            pool = self._pools.get(name)
+            if pool is not None and not pool.closed:
+                return pool
+
+            config = self._configs.get(name)
+            if config is None:
+                if name != DEFAULT_WORKER_POOL:
+                    raise ValueError(f"Worker pool '{name}' has not been configured.")
+                pool = ProcessWorkerPoolSingleton()
+            else:
+                pool = ProcessWorkerPool(
+                    name,
+                    config["workers"],
+                    max_queue_depth=config["max_queue_depth"],
+                    cpu_affinity=config["cpu_affinity"],
+                )
+
+            self._pools[name] = pool
+
+        return pool
+
+    def assign_stage(self, stage_name: str, pool_name: str) -> None:
+        """
+        Records which pool a stage should run in.
+
+        Parameters
+        ----------
+        stage_name : str
+            The stage identifier, for example "pdf_extractor".
+        pool_name : str
+            The name of a configured pool, or "default".
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If `pool_name` has not been configured.
+        """
+        with self._pools_lock:
+            if pool_name != DEFAULT_WORKER_POOL and pool_name not in self._configs:
+                raise ValueError(f"Stage '{stage_name}' is assigned to unconfigured worker pool '{pool_name}'.")
+            self._stage_pools[stage_name] = pool_name
+
+    def get_stage_pool(self, stage_name: str) -> Optional[str]:
+        """
+        Returns the pool name assigned to a stage.
+
+        Parameters
+        ----------
+        stage_name : str
+            The stage identifier.
+
+        Returns
+        -------
+        str or None
+            The assigned pool name, or None if the stage uses the default pool.
+        """
+        with self._pools_lock:
+            return self._stage_pools.get(stage_name)
+
+    def get_utilization(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns utilization snapshots for every running pool, keyed by pool name.
+
+        Returns
+        -------
+        dict
+            A mapping of pool name to the result of `ProcessWorkerPool.get_utilization`.
+        """
+        with self._pools_lock:
+            pools = {name: pool for name, pool in self._pools.items() if not pool.closed}
+
+        return {name: pool.get_utilization() for name, pool in pools.items()}
+
+    def close(self) -> None:
+        """
+        Closes every pool started through the registry and forgets all pool configurations and stage assignments.
+
+        Returns
+        -------
+        None
+        """
+        with self._pools_lock:
+            pools, self._pools = self._pools, {}
+            self._configs = {}
+            self._stage_pools = {}
+
+        for pool in pools.values():
+            if not pool.closed:
+                pool.close()
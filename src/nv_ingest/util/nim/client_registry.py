@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import os
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import requests
+import tritonclient.grpc as grpcclient
+from requests.adapters import HTTPAdapter
+
+from nv_ingest.util.process_local import ProcessLocal
+from nv_ingest.util.process_local import register_exit_finalizer
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive connections held per HTTP endpoint; one per thread that may call the endpoint concurrently.
+NIM_HTTP_POOL_MAXSIZE = int(os.getenv("NIM_HTTP_POOL_MAXSIZE", 16))
+
+
+class NimClientRegistry:
+    """
+    A process-local registry of connections to NIM inference endpoints.
+
+    Connections are keyed by (endpoint, protocol, auth token) and reused by every `NimClient` created in the process,
+    so repeated inference calls avoid TCP/TLS and gRPC channel setup. HTTP endpoints share a `requests.Session` with a
+    sized keep-alive pool; gRPC endpoints share a long-lived `grpcclient.InferenceServerClient`.
+
+    Connections are never shared across processes. A forked child starts with an empty registry, and each process
+    closes its own connections when it exits (including pool workers, which exit without running `atexit` hooks).
+
+    Methods
+    -------
+    get_grpc_client(endpoint, auth_token=None)
+        Returns the shared gRPC client for an endpoint.
+    get_http_session(endpoint, auth_token=None)
+        Returns the shared HTTP session for an endpoint.
+    close()
+        Closes every connection held by this process.
+    """
+
+    def __new__(cls):
+        return _registry.get()
+
+    @classmethod
+    def _create(cls) -> "NimClientRegistry":
+        registry = super(NimClientRegistry, cls).__new__(cls)
+        registry._initialize()
+        return registry
+
+    def _initialize(self) -> None:
+        self._connections: Dict[Tuple[str, str, Optional[str]], Any] = {}
+        self._connections_lock = Lock()
+        self._finalizer = None
+
+    def _get_or_create(self, key: Tuple[str, str, Optional[str]], factory: Callable[[], Any]) -> Any:
+        with self._connections_lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                logger.debug(f"Opening {key[1]} connection to {key[0]}")
+                connection = factory()
+                self._connections[key] = connection
+                if self._finalizer is None:
+                    self._finalizer = register_exit_finalizer(self.close)
+        return connection
+
+    def get_grpc_client(self, endpoint: str, auth_token: Optional[str] = None) -> grpcclient.InferenceServerClient:
+        """
+        Returns the shared gRPC client for an endpoint, creating it on first use.
+
+        Parameters
+        ----------
+        endpoint : str
+            The gRPC endpoint, for example "localhost:8001".
+        auth_token : str, optional
+            The authorization token used with the endpoint.
+
+        Returns
+        -------
+        grpcclient.InferenceServerClient
+            A client whose channel stays open for the life of the process.
+        """
+        return self._get_or_create(
+            (endpoint, "grpc", auth_token), lambda: grpcclient.InferenceServerClient(url=endpoint)
+        )
+
+    def get_http_session(self, endpoint: str, auth_token: Optional[str] = None) -> requests.Session:
+        """
+        Returns the shared HTTP session for an endpoint, creating it on first use.
+
+        Parameters
+        ----------
+        endpoint : str
+            The HTTP endpoint URL.
+        auth_token : str, optional
+            The authorization token used with the endpoint.
+
+        Returns
+        -------
+        requests.Session
+            A session that keeps up to `NIM_HTTP_POOL_MAXSIZE` connections to the endpoint alive.
+        """
+
+        def _create_session() -> requests.Session:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=NIM_HTTP_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            return session
+
+        return self._get_or_create((endpoint, "http", auth_token), _create_session)
+
+    def close(self) -> None:
+        """
+        Closes every connection held by this process.
+
+        Returns
+        -------
+        None
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+            finalizer, self._finalizer = self._finalizer, None
+
+        if finalizer is not None:
+            finalizer.cancel()
+
+        for (endpoint, protocol, _), connection in connections.items():
+            try:
+                connection.close()
+                logger.debug(f"Closed {protocol} connection to {endpoint}")
+            except Exception as e:
+                logger.warning(f"Failed to close {protocol} connection to {endpoint}: {e}")
+
+
+# Connections inherited from a parent share its sockets; a forked child starts with a registry of its own.
+_registry: ProcessLocal[NimClientRegistry] = ProcessLocal(NimClientRegistry._create)
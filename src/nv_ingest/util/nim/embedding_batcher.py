@@ -0,0 +1,351 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import httpx
+from openai import AsyncOpenAI
+from openai import DefaultAsyncHttpxClient
+
+from nv_ingest.util.nim.inference_cache import InferenceCache
+from nv_ingest.util.nim.inference_cache import make_cache_key
+from nv_ingest.util.process_local import register_exit_finalizer
+
+logger = logging.getLogger(__name__)
+
+# An embedding, or None and the error message when the request for its batch failed.
+EmbeddingResult = Tuple[Optional[Any], Optional[str]]
+
+
+def _normalize_text(text: str) -> str:
+    # Runs of whitespace do not change what the model sees, so "a  b\n" and "a b" share a cache entry.
+    return " ".join(text.split())
+
+
+class _PendingRequest:
+    """Collects the per-prompt results of one `submit` call, which may be spread across several batches."""
+
+    def __init__(self, future: Future, size: int):
+        self.future = future
+        self.results: List[Optional[EmbeddingResult]] = [None] * size
+        self.remaining = size
+
+    def set_result(self, index: int, result: EmbeddingResult) -> None:
+        self.results[index] = result
+        self.remaining -= 1
+        if self.remaining == 0 and not self.future.done():
+            self.future.set_result(self.results)
+
+
+class EmbeddingBatcher:
+    """
+    Batches embedding requests across callers and sends them to an embedding NIM through one long-lived client.
+
+    Prompts submitted by any thread are queued on a private event loop. A batch is sent as soon as `batch_size`
+    prompts are queued, or `max_batch_wait` seconds after the oldest queued prompt arrived, whichever comes first.
+    This lets several small documents share one request. Each caller gets back the results for its own prompts, in
+    order. At most `max_concurrent_requests` requests are in flight, and the HTTP connection pool is sized to match.
+
+    With a `cache`, embeddings are stored under a hash of the model, input type, truncation, encoding format and the
+    whitespace-normalized prompt. Only prompts that miss the cache are sent, and repeated prompts within one
+    submission are sent once.
+
+    Parameters
+    ----------
+    api_key : str
+        The API key used with the embedding NIM.
+    embedding_nim_endpoint : str
+        The URL of the embedding NIM.
+    embedding_model : str
+        The embedding model to use.
+    encoding_format : str
+        The format embeddings are returned in, "float" or "base64".
+    input_type : str
+        "passage" or "query".
+    truncate : str
+        How inputs over the model's token limit are handled: "START", "END" or "NONE".
+    batch_size : int
+        The maximum number of prompts sent in one request.
+    max_batch_wait : float
+        The longest time, in seconds, a prompt waits for its batch to fill before it is sent anyway.
+    max_concurrent_requests : int
+        The maximum number of requests in flight.
+    client : AsyncOpenAI, optional
+        The client to use. By default one is created with a connection pool of `max_concurrent_requests`.
+    cache : InferenceCache, optional
+        The cache of previously computed embeddings. Failed embeddings are never cached.
+
+    Methods
+    -------
+    submit(prompts)
+        Queues prompts and returns a future for their results.
+    embed(prompts)
+        Queues prompts and waits for their results.
+    get_cache_metrics()
+        Returns the number of prompts served from the cache and the bytes of text not sent.
+    close()
+        Stops the event loop and closes the client, unless it was passed in.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        embedding_nim_endpoint: str,
+        embedding_model: str,
+        encoding_format: str,
+        input_type: str,
+        truncate: str,
+        batch_size: int,
+        max_batch_wait: float,
+        max_concurrent_requests: int,
+        client: Optional[AsyncOpenAI] = None,
+        cache: Optional[InferenceCache] = None,
+    ):
+        self._api_key = api_key
+        self._embedding_nim_endpoint = embedding_nim_endpoint
+        self._embedding_model = embedding_model
+        self._encoding_format = encoding_format
+        self._input_type = input_type
+        self._truncate = truncate
+        self._batch_size = batch_size
+        self._max_batch_wait = max_batch_wait
+        self._max_concurrent_requests = max_concurrent_requests
+        self._client = client
+        self._owns_client = client is None
+        self._cache = cache
+        self._cache_metrics = {"hits": 0, "misses": 0, "bytes_saved": 0}
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._finalizer = None
+
+        # Only touched from the event loop thread.
+        self._pending: List[Tuple[str, _PendingRequest, int]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks = set()
+
+    def _create_client(self) -> AsyncOpenAI:
+        limits = httpx.Limits(
+            max_connections=self._max_concurrent_requests,
+            max_keepalive_connections=self._max_concurrent_requests,
+        )
+        return AsyncOpenAI(
+            api_key=self._api_key,
+            base_url=self._embedding_nim_endpoint,
+            http_client=DefaultAsyncHttpxClient(limits=limits),
+        )
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                if self._owns_client:
+                    self._client = self._create_client()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="embedding-batcher", daemon=True)
+                self._thread.start()
+                self._finalizer = register_exit_finalizer(self.close)
+        return self._loop
+
+    def submit(self, prompts: List[str]) -> Future:
+        """
+        Queues prompts for embedding.
+
+        Parameters
+        ----------
+        prompts : List[str]
+            The prompts to embed.
+
+        Returns
+        -------
+        Future
+            A future resolving to one `(embedding, error)` tuple per prompt, in order. `error` is None on success;
+            otherwise `embedding` is None and `error` describes why the prompt's batch failed.
+        """
+        future = Future()
+        if not prompts:
+            future.set_result([])
+            return future
+
+        if self._cache is None:
+            self._enqueue_threadsafe(list(prompts), future)
+            return future
+
+        results: List[Optional[EmbeddingResult]] = [None] * len(prompts)
+        miss_indices: Dict[str, List[int]] = {}
+        miss_prompts = []
+        hits = bytes_saved = 0
+        for index, prompt in enumerate(prompts):
+            key = self._get_cache_key(prompt)
+            indices = miss_indices.get(key)
+            if indices is not None:
+                indices.append(index)
+            else:
+                hit, embedding = self._cache.get(key)
+                if not hit:
+                    miss_indices[key] = [index]
+                    miss_prompts.append(prompt)
+                    continue
+                results[index] = (embedding, None)
+            hits += 1
+            bytes_saved += len(prompt.encode("utf-8"))
+
+        with self._lock:
+            self._cache_metrics["hits"] += hits
+            self._cache_metrics["misses"] += len(miss_prompts)
+            self._cache_metrics["bytes_saved"] += bytes_saved
+
+        if not miss_prompts:
+            future.set_result(results)
+            return future
+
+        def _scatter_misses(miss_future: Future) -> None:
+            try:
+                for (key, indices), result in zip(miss_indices.items(), miss_future.result()):
+                    if result[1] is None:
+                        self._cache.put(key, result[0])
+                    for index in indices:
+                        results[index] = result
+                future.set_result(results)
+            except Exception as e:
+                future.set_exception(e)
+
+        miss_future = Future()
+        miss_future.add_done_callback(_scatter_misses)
+        self._enqueue_threadsafe(miss_prompts, miss_future)
+
+        return future
+
+    def embed(self, prompts: List[str]) -> List[EmbeddingResult]:
+        """
+        Queues prompts for embedding and waits for the results.
+
+        Parameters
+        ----------
+        prompts : List[str]
+            The prompts to embed.
+
+        Returns
+        -------
+        List[Tuple[Any, Optional[str]]]
+            One `(embedding, error)` tuple per prompt, in order. See `submit`.
+        """
+        return self.submit(prompts).result()
+
+    def get_cache_metrics(self) -> Dict[str, int]:
+        """
+        Returns cache counters for every prompt submitted so far.
+
+        Returns
+        -------
+        dict
+            "hits" (prompts answered without a request, including repeats within a submission), "misses" (prompts
+            sent to the NIM) and "bytes_saved" (UTF-8 bytes of prompt text that was not sent).
+        """
+        with self._lock:
+            return dict(self._cache_metrics)
+
+    def _get_cache_key(self, prompt: str) -> str:
+        return make_cache_key(
+            self._embedding_model,
+            None,
+            _normalize_text(prompt),
+            input_type=self._input_type,
+            truncate=self._truncate,
+            encoding_format=self._encoding_format,
+        )
+
+    def _enqueue_threadsafe(self, prompts: List[str], future: Future) -> None:
+        loop = self._ensure_started()
+        loop.call_soon_threadsafe(self._enqueue, prompts, future)
+
+    def _enqueue(self, prompts: List[str], future: Future) -> None:
+        request = _PendingRequest(future, len(prompts))
+        self._pending.extend((prompt, request, index) for index, prompt in enumerate(prompts))
+
+        while len(self._pending) >= self._batch_size:
+            self._flush()
+
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self._max_batch_wait, self._flush)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending[: self._batch_size], self._pending[self._batch_size :]
+        if batch:
+            # The loop only holds weak references to tasks.
+            task = self._loop.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, _PendingRequest, int]]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        prompts = [prompt for prompt, _, _ in batch]
+        async with self._semaphore:
+            try:
+                resp = await self._client.embeddings.create(
+                    input=prompts,
+                    model=self._embedding_model,
+                    encoding_format=self._encoding_format,
+                    extra_body={"input_type": self._input_type, "truncate": self._truncate},
+                )
+                if len(resp.data) != len(prompts):
+                    raise ValueError(f"Expected {len(prompts)} embeddings, got {len(resp.data)}")
+                results = [(item.embedding, None) for item in resp.data]
+            except Exception as e:
+                logger.debug(f"Embedding request for {len(prompts)} prompts failed: {e}")
+                results = [(None, f"Embedding error: {e}")] * len(prompts)
+
+        for (_, request, index), result in zip(batch, results):
+            request.set_result(index, result)
+
+    def close(self) -> None:
+        """
+        Stops the event loop and closes the client, unless it was passed in. Requests still in flight are abandoned.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+            finalizer, self._finalizer = self._finalizer, None
+
+        if finalizer is not None:
+            finalizer.cancel()
+
+        if loop is None:
+            return
+
+        if self._owns_client:
+            try:
+                asyncio.run_coroutine_threadsafe(self._client.close(), loop).result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Failed to close embedding client: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+        self._pending = []
+        self._flush_handle = None
+        self._semaphore = None
+        self._tasks = set()
+        if self._owns_client:
+            self._client = None
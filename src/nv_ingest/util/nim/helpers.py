@@ -18,7 +18,10 @@ from packaging import version as pkgversion
 
 from nv_ingest.util.image_processing.transforms import normalize_image
 from nv_ingest.util.image_processing.transforms import pad_image
+from nv_ingest.util.nim.client_registry import NimClientRegistry
 from nv_ingest.util.nim.decorators import multiprocessing_cache
+from nv_ingest.util.nim.inference_cache import get_inference_cache
+from nv_ingest.util.nim.inference_cache import make_cache_key
 from nv_ingest.util.tracing.tagging import traceable_func
 
 logger = logging.getLogger(__name__)
@@ -103,6 +106,12 @@ class ModelInterface:
 class NimClient:
     """
     A client for interfacing with a model inference server using gRPC or HTTP protocols.
+
+    Connections are borrowed from the process-local `NimClientRegistry`, so clients created for the same endpoint
+    share a keep-alive HTTP session or gRPC channel instead of opening a new connection each time.
+
+    When the inference cache is enabled (see `get_inference_cache`), `infer` returns cached results for inputs it has
+    already seen for the same model, model version and parameters.
     """
 
     def __init__(
@@ -112,6 +121,7 @@ class NimClient:
         endpoints: Tuple[str, str],
         auth_token: Optional[str] = None,
         timeout: float = 30.0,
+        model_version: Optional[str] = None,
     ):
         """
         Initialize the NimClient with the specified model interface, protocol, and server endpoints.
@@ -128,6 +138,9 @@ class NimClient:
             Authorization token for HTTP requests (default: None).
         timeout : float, optional
             Timeout for HTTP requests in seconds (default: 30.0).
+        model_version : str, optional
+            The version of the served model, used to key cached results. When not given, cached results are keyed by
+            endpoint instead, so they are not shared with other deployments of the model (default: None).
 
         Raises
         ------
@@ -141,17 +154,19 @@ class NimClient:
         self.timeout = timeout  # Timeout for HTTP requests
 
         grpc_endpoint, http_endpoint = endpoints
+        self._cache_version = model_version or f"{self.protocol}://{grpc_endpoint or http_endpoint}"
 
         if self.protocol == "grpc":
             if not grpc_endpoint:
                 raise ValueError("gRPC endpoint must be provided for gRPC protocol")
             logger.debug(f"Creating gRPC client with {grpc_endpoint}")
-            self.client = grpcclient.InferenceServerClient(url=grpc_endpoint)
+            self.client = NimClientRegistry().get_grpc_client(grpc_endpoint, auth_token)
         elif self.protocol == "http":
             if not http_endpoint:
                 raise ValueError("HTTP endpoint must be provided for HTTP protocol")
             logger.debug(f"Creating HTTP client with {http_endpoint}")
             self.endpoint_url = generate_url(http_endpoint)
+            self.session = NimClientRegistry().get_http_session(self.endpoint_url, auth_token)
             self.headers = {"accept": "application/json", "content-type": "application/json"}
             if self.auth_token:
                 self.headers["Authorization"] = f"Bearer {self.auth_token}"
@@ -183,6 +198,17 @@ class NimClient:
             If an invalid protocol is specified.
         """
 
+        inference_cache = get_inference_cache()
+        if inference_cache is not None:
+            # stage_name only labels traces; every other kwarg can change the parsed result.
+            cache_kwargs = {k: v for k, v in kwargs.items() if k != "stage_name"}
+            cache_key = make_cache_key(
+                self.model_interface.name(), self._cache_version, data, model_name=model_name, **cache_kwargs
+            )
+            hit, results = inference_cache.get(cache_key)
+            if hit:
+                return results
+
         # Prepare data for inference
         prepared_data = self.model_interface.prepare_data_for_inference(data)
 
@@ -208,6 +234,10 @@ class NimClient:
         results = self.model_interface.process_inference_results(
             parsed_output, original_image_shapes=data.get("original_image_shapes"), **kwargs
         )
+
+        if inference_cache is not None:
+            inference_cache.put(cache_key, results)
+
         return results
 
     def _grpc_infer(self, formatted_input: np.ndarray, model_name: str) -> np.ndarray:
@@ -264,7 +294,7 @@ class NimClient:
 
         while attempt <= max_retries:
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.endpoint_url, json=formatted_input, headers=self.headers, timeout=self.timeout
                 )
                 status_code = response.status_code
@@ -314,8 +344,13 @@ class NimClient:
         raise Exception(f"Failed to get a successful response after {max_retries} retries.")
 
     def close(self):
-        if self.protocol == "grpc" and hasattr(self.client, "close"):
-            self.client.close()
+        """
+        Releases the client.
+
+        The underlying connection belongs to `NimClientRegistry` and stays open for reuse by other clients; it is
+        closed when the process exits or `NimClientRegistry().close()` is called.
+        """
+        pass
 
 
 def create_inference_client(
@@ -323,6 +358,7 @@ def create_inference_client(
     model_interface: ModelInterface,
     auth_token: Optional[str] = None,
     infer_protocol: Optional[str] = None,
+    model_version: Optional[str] = None,
 ) -> NimClient:
     """
     Create a NimClient for interfacing with a model inference server.
@@ -337,6 +373,8 @@ def create_inference_client(
         Authorization token for HTTP requests (default: None).
     infer_protocol : str, optional
         The protocol to use ("grpc" or "http"). If not specified, it is inferred from the endpoints.
+    model_version : str, optional
+        The version of the served model, used to key cached inference results (default: None).
 
     Returns
     -------
@@ -359,7 +397,7 @@ def create_inference_client(
     if infer_protocol not in ["grpc", "http"]:
         raise ValueError("Invalid infer_protocol specified. Must be 'grpc' or 'http'.")
 
-    return NimClient(model_interface, infer_protocol, endpoints, auth_token)
+    return NimClient(model_interface, infer_protocol, endpoints, auth_token, model_version=model_version)
 
 
 def preprocess_image_for_paddle(array: np.ndarray, paddle_version: Optional[str] = None) -> np.ndarray:
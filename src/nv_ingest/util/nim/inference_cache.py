@@ -0,0 +1,639 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import pickle
+import struct
+import time
+from collections import OrderedDict
+from threading import Lock
+from threading import get_ident
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from nv_ingest.util.process_local import ProcessLocal
+from nv_ingest.util.process_local import register_exit_finalizer
+
+logger = logging.getLogger(__name__)
+
+# "off" (the default), "memory" for a per-process LRU only, or "disk"/"redis" to add a tier shared between processes.
+NIM_INFERENCE_CACHE = os.getenv("NIM_INFERENCE_CACHE", "off").lower()
+NIM_INFERENCE_CACHE_MAX_BYTES = int(os.getenv("NIM_INFERENCE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+NIM_INFERENCE_CACHE_TTL = float(os.getenv("NIM_INFERENCE_CACHE_TTL", 24 * 60 * 60))
+NIM_INFERENCE_CACHE_DIR = os.getenv(
+    "NIM_INFERENCE_CACHE_DIR",
+    os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "nv_ingest", "inference_cache"),
+)
+NIM_INFERENCE_CACHE_DIR_MAX_BYTES = int(os.getenv("NIM_INFERENCE_CACHE_DIR_MAX_BYTES", 4 * 1024 * 1024 * 1024))
+NIM_INFERENCE_CACHE_REDIS_URL = os.getenv("NIM_INFERENCE_CACHE_REDIS_URL", "redis://localhost:6379/0")
+# When set, shared tier entries are signed with this key and entries without a valid signature are ignored.
+NIM_INFERENCE_CACHE_HMAC_KEY = os.getenv("NIM_INFERENCE_CACHE_HMAC_KEY", "")
+
+_EXPIRY_HEADER = struct.Struct("<d")
+_LENGTH_HEADER = struct.Struct("<I")
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+def _update_hash(hasher, value: Any) -> None:
+    # Every value is prefixed with a type tag so, for example, "1" and 1 or ["a", "b"] and "ab" hash differently.
+    if value is None:
+        hasher.update(b"N")
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"A{value.dtype.str}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        hasher.update(b"B%d:" % len(value))
+        hasher.update(value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        hasher.update(b"S%d:" % len(encoded))
+        hasher.update(encoded)
+    elif isinstance(value, dict):
+        hasher.update(b"D%d:" % len(value))
+        for key in sorted(value, key=str):
+            _update_hash(hasher, str(key))
+            _update_hash(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"L%d:" % len(value))
+        for item in value:
+            _update_hash(hasher, item)
+    else:
+        _update_hash(hasher, f"{type(value).__name__}:{value!r}")
+
+
+def make_cache_key(model_name: str, model_version: Optional[str], data: Any, /, **kwargs) -> str:
+    """
+    Builds a content-addressed cache key for an inference request.
+
+    Parameters
+    ----------
+    model_name : str
+        The model (or model interface) the request is sent to.
+    model_version : str, optional
+        The model version. Callers that cannot resolve a version should pass something that identifies the deployment,
+        such as the endpoint, so results from different deployments are not mixed.
+    data : Any
+        The inference input. Numpy arrays are hashed by dtype, shape and contents.
+    **kwargs
+        Parameters that affect the result, such as thresholds or output formats.
+
+    Returns
+    -------
+    str
+        A hex digest identifying the request.
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    _update_hash(hasher, model_name)
+    _update_hash(hasher, model_version)
+    _update_hash(hasher, data)
+    _update_hash(hasher, kwargs)
+    return hasher.hexdigest()
+
+
+def _encode_node(value: Any, buffers: List[bytes], offset: List[int]) -> Any:
+    # JSON objects are reserved for tagged values, so a dict, tuple or buffer can never be mistaken for another.
+    def _buffer(data: bytes) -> List[int]:
+        start = offset[0]
+        buffers.append(data)
+        offset[0] += len(data)
+        return [start, len(data)]
+
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("Arrays of Python objects cannot be stored in the shared tier.")
+        return {"a": [np.lib.format.dtype_to_descr(value.dtype), list(value.shape), *_buffer(value.tobytes())]}
+    if isinstance(value, np.generic):
+        if value.dtype.hasobject:
+            raise TypeError("Python objects cannot be stored in the shared tier.")
+        return {"n": [np.lib.format.dtype_to_descr(value.dtype), *_buffer(value.tobytes())]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"b": _buffer(bytes(value))}
+    if isinstance(value, list):
+        return [_encode_node(item, buffers, offset) for item in value]
+    if isinstance(value, tuple):
+        return {"t": [_encode_node(item, buffers, offset) for item in value]}
+    if isinstance(value, dict):
+        return {
+            "d": [
+                [_encode_node(key, buffers, offset), _encode_node(item, buffers, offset)] for key, item in value.items()
+            ]
+        }
+    raise TypeError(f"Values of type {type(value).__name__} cannot be stored in the shared tier.")
+
+
+def _decode_node(node: Any, data: memoryview) -> Any:
+    if isinstance(node, list):
+        return [_decode_node(item, data) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    tag, args = next(iter(node.items()))
+    if tag == "t":
+        return tuple(_decode_node(item, data) for item in args)
+    if tag == "d":
+        return {_decode_node(key, data): _decode_node(item, data) for key, item in args}
+    if tag == "b":
+        start, size = args
+        return bytes(data[start : start + size])  # noqa: E203
+    if tag == "a":
+        descr, shape, start, size = args
+        dtype = np.lib.format.descr_to_dtype(descr)
+        return np.frombuffer(data[start : start + size], dtype=dtype).reshape(shape).copy()  # noqa: E203
+    if tag == "n":
+        descr, start, size = args
+        dtype = np.lib.format.descr_to_dtype(descr)
+        return np.frombuffer(data[start : start + size], dtype=dtype)[0]  # noqa: E203
+    raise ValueError(f"Unknown shared tier tag {tag!r}.")
+
+
+def encode_shared_value(value: Any) -> bytes:
+    """
+    Serializes a result for a shared tier without pickle, so reading an entry can never run code.
+
+    The format is a JSON description of the value followed by the raw bytes of its NumPy arrays and byte strings.
+    Supported values are None, bools, numbers, strings, bytes, NumPy arrays and scalars (except of object dtype), and
+    lists, tuples and dicts of these.
+
+    Parameters
+    ----------
+    value : Any
+        The result to serialize.
+
+    Returns
+    -------
+    bytes
+        The serialized result.
+
+    Raises
+    ------
+    TypeError
+        If the value contains an unsupported type.
+    """
+    buffers: List[bytes] = []
+    header = json.dumps(_encode_node(value, buffers, [0]), separators=(",", ":")).encode("utf-8")
+    return b"".join([_LENGTH_HEADER.pack(len(header)), header, *buffers])
+
+
+def decode_shared_value(payload: bytes) -> Any:
+    """
+    Deserializes a result written by `encode_shared_value`.
+
+    Parameters
+    ----------
+    payload : bytes
+        The serialized result.
+
+    Returns
+    -------
+    Any
+        The result. Arrays are copies, so they are writable and independent of `payload`.
+    """
+    data = memoryview(payload)
+    (header_size,) = _LENGTH_HEADER.unpack_from(data)
+    header_end = _LENGTH_HEADER.size + header_size
+    node = json.loads(bytes(data[_LENGTH_HEADER.size : header_end]))  # noqa: E203
+    return _decode_node(node, data[header_end:])
+
+
+class DiskCacheTier:
+    """
+    A cache tier of files in a local directory, shared by every process that uses the same directory.
+
+    Each entry is one file, written atomically. When the directory grows past `max_bytes`, the least recently used
+    entries (by modification time, which is refreshed on every hit) are removed until it is back under 90% of the
+    limit.
+
+    Parameters
+    ----------
+    path : str
+        The cache directory. It is created readable and writable by its owner only if it does not exist; a warning is
+        logged if an existing directory can be written by other users.
+    max_bytes : int
+        The approximate maximum size of the directory.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._bytes_since_scan = 0
+        self._lock = Lock()
+        os.makedirs(path, mode=0o700, exist_ok=True)
+
+        stat = os.stat(path)
+        if stat.st_mode & 0o022 or (hasattr(os, "getuid") and stat.st_uid != os.getuid()):
+            logger.warning(
+                f"Inference cache directory {path} can be written by other users, who can then change cached results."
+            )
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._path, key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return entry
+
+    def put(self, key: str, entry: bytes) -> None:
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(entry)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._bytes_since_scan += len(entry)
+            scan = self._bytes_since_scan > self._max_bytes // 10
+            if scan:
+                self._bytes_since_scan = 0
+        if scan:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Removes the least recently used entries if the directory is over its size limit.
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        entries = []
+        total_bytes = 0
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_bytes += stat.st_size
+
+        if total_bytes <= self._max_bytes:
+            return 0
+
+        removed = 0
+        target_bytes = int(self._max_bytes * 0.9)
+        for _, size, path in sorted(entries):
+            if total_bytes <= target_bytes:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+        return removed
+
+
+class RedisCacheTier:
+    """
+    A cache tier in Redis, shared by every process and host that uses the same server.
+
+    Entries expire through Redis key TTLs; size-based eviction is left to the server's `maxmemory-policy`.
+
+    Parameters
+    ----------
+    client : redis.Redis
+        The Redis client, or any object with compatible `get`, `set` and `delete` methods.
+    ttl : float
+        Seconds before an entry expires, or 0 to keep entries until Redis evicts them.
+    prefix : str, optional
+        A prefix for every key written by the cache.
+    """
+
+    def __init__(self, client: Any, ttl: float, prefix: str = "nv_ingest:inference_cache:"):
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def put(self, key: str, entry: bytes) -> None:
+        self._client.set(self._prefix + key, entry, ex=int(self._ttl) if self._ttl > 0 else None)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+
+class InferenceCache:
+    """
+    A two-tier cache of inference results keyed by `make_cache_key`.
+
+    The first tier is an in-process LRU bounded by the pickled size of its entries. The optional second tier
+    (`DiskCacheTier` or `RedisCacheTier`) is shared between processes; hits in it are promoted to the first tier.
+    Entries expire `ttl` seconds after they are stored. Results are stored serialized, so callers always get their own
+    copy. Failures of the shared tier are logged and treated as misses; they never fail an inference call.
+
+    Only the in-process tier uses pickle. Shared entries are written with `encode_shared_value`, which cannot run code
+    when read, and results it does not support stay in the in-process tier. With `hmac_key`, shared entries are also
+    signed, and entries whose signature does not match (including any written without the key) are ignored.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The maximum total size of the in-process tier.
+    ttl : float
+        Seconds before an entry expires, or 0 for no expiry.
+    shared_tier : DiskCacheTier or RedisCacheTier, optional
+        The tier shared between processes.
+    hmac_key : bytes, optional
+        The key shared entries are signed with.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = NIM_INFERENCE_CACHE_MAX_BYTES,
+        ttl: float = 0,
+        shared_tier: Any = None,
+        hmac_key: Optional[bytes] = None,
+    ):
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._shared_tier = shared_tier
+        self._hmac_key = hmac_key
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._metrics = {
+            "memory_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "shared_errors": 0,
+        }
+
+    def _count(self, metric: str) -> None:
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def _store_local(self, key: str, expires_at: float, payload: bytes) -> None:
+        if len(payload) > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            self._entries[key] = (expires_at, payload)
+            self._bytes += len(payload)
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._metrics["evictions"] += 1
+
+    def _get_local(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, payload = entry
+            if expires_at and expires_at < time.time():
+                del self._entries[key]
+                self._bytes -= len(payload)
+                self._metrics["expirations"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._metrics["memory_hits"] += 1
+            return payload
+
+    def _sign(self, key: str, entry: bytes) -> bytes:
+        # The key is signed with the entry, so an entry cannot be copied to another key.
+        return hmac.new(self._hmac_key, key.encode("utf-8") + entry, hashlib.sha256).digest()
+
+    def _get_shared(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            entry = self._shared_tier.get(key)
+        except Exception as e:
+            logger.warning(f"Inference cache shared tier lookup failed: {e}")
+            self._count("shared_errors")
+            return None
+
+        if entry is None:
+            return None
+
+        if self._hmac_key:
+            signature, entry = entry[:_SIGNATURE_SIZE], entry[_SIGNATURE_SIZE:]
+            if not hmac.compare_digest(signature, self._sign(key, entry)):
+                logger.warning("Ignoring an inference cache shared tier entry with an invalid signature.")
+                self._count("shared_errors")
+                return None
+
+        if len(entry) < _EXPIRY_HEADER.size:
+            return None
+
+        (expires_at,) = _EXPIRY_HEADER.unpack_from(entry)
+        if expires_at and expires_at < time.time():
+            self._count("expirations")
+            try:
+                self._shared_tier.delete(key)
+            except Exception:
+                pass
+            return None
+
+        try:
+            value = decode_shared_value(entry[_EXPIRY_HEADER.size :])  # noqa: E203
+        except Exception as e:
+            logger.warning(f"Ignoring an unreadable inference cache shared tier entry: {e}")
+            self._count("shared_errors")
+            return None
+
+        self._count("shared_hits")
+        return expires_at, value
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Looks up a result.
+
+        Parameters
+        ----------
+        key : str
+            A key from `make_cache_key`.
+
+        Returns
+        -------
+        Tuple[bool, Any]
+            Whether the key was found, and the cached result if it was.
+        """
+        payload = self._get_local(key)
+        if payload is not None:
+            return True, pickle.loads(payload)
+
+        if self._shared_tier is not None:
+            shared_entry = self._get_shared(key)
+            if shared_entry is not None:
+                expires_at, value = shared_entry
+                self._store_local(key, expires_at, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+                return True, value
+
+        self._count("misses")
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores a result in every tier.
+
+        Parameters
+        ----------
+        key : str
+            A key from `make_cache_key`.
+        value : Any
+            The result to cache. It must be picklable, and supported by `encode_shared_value` to reach the shared tier.
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        expires_at = time.time() + self._ttl if self._ttl > 0 else 0.0
+
+        self._store_local(key, expires_at, payload)
+        self._count("stores")
+
+        if self._shared_tier is not None:
+            try:
+                entry = _EXPIRY_HEADER.pack(expires_at) + encode_shared_value(value)
+            except TypeError as e:
+                logger.debug(f"Inference cache result kept in the in-process tier only: {e}")
+                return
+
+            if self._hmac_key:
+                entry = self._sign(key, entry) + entry
+            try:
+                self._shared_tier.put(key, entry)
+            except Exception as e:
+                logger.warning(f"Inference cache shared tier store failed: {e}")
+                self._count("shared_errors")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached result for `key`, calling `compute` and caching its result on a miss.
+        """
+        hit, value = self.get(key)
+        if hit:
+            return value
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns hit, miss and eviction counters and the size of the in-process tier.
+
+        Returns
+        -------
+        dict
+            The counters, plus "entries", "bytes" and "hit_rate".
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["entries"] = len(self._entries)
+            metrics["bytes"] = self._bytes
+
+        lookups = metrics["memory_hits"] + metrics["shared_hits"] + metrics["misses"]
+        metrics["hit_rate"] = (metrics["memory_hits"] + metrics["shared_hits"]) / lookups if lookups else 0.0
+        return metrics
+
+    def clear(self) -> None:
+        """
+        Empties the in-process tier. The shared tier is left to its own expiry and eviction.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _create_shared_tier(mode: str) -> Any:
+    if mode == "disk":
+        return DiskCacheTier(NIM_INFERENCE_CACHE_DIR, NIM_INFERENCE_CACHE_DIR_MAX_BYTES)
+    if mode == "redis":
+        import redis
+
+        return RedisCacheTier(redis.Redis.from_url(NIM_INFERENCE_CACHE_REDIS_URL), NIM_INFERENCE_CACHE_TTL)
+    return None
+
+
+def _log_metrics(cache: InferenceCache) -> None:
+    metrics = cache.get_metrics()
+    if metrics["memory_hits"] or metrics["shared_hits"] or metrics["misses"]:
+        logger.info(f"Inference cache metrics (pid {os.getpid()}): {metrics}")
+
+
+def _create_inference_cache() -> Optional[InferenceCache]:
+    mode = NIM_INFERENCE_CACHE
+    if mode not in ("off", "memory", "disk", "redis"):
+        logger.warning(f"Unknown NIM_INFERENCE_CACHE '{mode}'; the inference cache is disabled.")
+        return None
+    if mode == "off":
+        return None
+
+    try:
+        cache = InferenceCache(
+            max_bytes=NIM_INFERENCE_CACHE_MAX_BYTES,
+            ttl=NIM_INFERENCE_CACHE_TTL,
+            shared_tier=_create_shared_tier(mode),
+            hmac_key=NIM_INFERENCE_CACHE_HMAC_KEY.encode("utf-8") or None,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to create the '{mode}' inference cache; the cache is disabled: {e}")
+        return None
+    register_exit_finalizer(_log_metrics, cache)
+
+    return cache
+
+
+# Each process builds its own cache; the parent's shared tier connections are not reused.
+_inference_cache: ProcessLocal[InferenceCache] = ProcessLocal(_create_inference_cache)
+
+
+def get_inference_cache() -> Optional[InferenceCache]:
+    """
+    Returns the process-wide inference cache configured by the `NIM_INFERENCE_CACHE*` environment variables.
+
+    Returns
+    -------
+    InferenceCache or None
+        The cache, or None if `NIM_INFERENCE_CACHE` is "off" or the shared tier could not be created.
+    """
+    return _inference_cache.get()
+
+
+def set_inference_cache(cache: Optional[InferenceCache]) -> None:
+    """
+    Replaces the process-wide inference cache, for example to disable it or to use a custom tier.
+
+    Parameters
+    ----------
+    cache : InferenceCache, optional
+        The cache to use, or None to disable caching.
+    """
+    _inference_cache.set(cache)
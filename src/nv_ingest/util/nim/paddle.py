@@ -2,7 +2,9 @@ import json
 import logging
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
@@ -16,10 +18,16 @@ from nv_ingest.util.nim.helpers import preprocess_image_for_paddle
 
 logger = logging.getLogger(__name__)
 
+PADDLE_MAX_BATCH_SIZE = 8
+
 
 class PaddleOCRModelInterface(ModelInterface):
     """
     An interface for handling inference with a PaddleOCR model, supporting both gRPC and HTTP protocols.
+
+    Data containing a single "base64_image" is handled one image at a time. Data containing a list of
+    "base64_images" is sent as one batched request, and `parse_output` returns one (content, format) tuple per image
+    in the same order. Batching requires a PaddleOCR version newer than the early access API; see `max_batch_size`.
     """
 
     def __init__(
@@ -47,28 +55,46 @@ class PaddleOCRModelInterface(ModelInterface):
         """
         return f"PaddleOCR - {self.paddle_version}"
 
+    def max_batch_size(self) -> int:
+        """
+        Get the largest number of images that can be sent in one request.
+
+        Returns
+        -------
+        int
+            `PADDLE_MAX_BATCH_SIZE`, or 1 for early access versions whose API accepts a single image per request.
+        """
+        return 1 if self._is_version_early_access_legacy_api() else PADDLE_MAX_BATCH_SIZE
+
     def prepare_data_for_inference(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Prepare input data for inference by decoding the base64 image into a numpy array.
+        Prepare input data for inference by decoding the base64 image, or images, into numpy arrays.
 
         Parameters
         ----------
         data : dict
-            The input data containing a base64-encoded image.
+            The input data containing a base64-encoded image under "base64_image", or a list of them under
+            "base64_images".
 
         Returns
         -------
         dict
-            The updated data dictionary with the decoded image array.
+            The updated data dictionary with the decoded image array, or arrays under "image_arrays". Batches that
+            already carry decoded "image_arrays" are not decoded again.
         """
 
+        if "base64_images" in data:
+            if "image_arrays" not in data:
+                data["image_arrays"] = [base64_to_numpy(base64_image) for base64_image in data["base64_images"]]
+            return data
+
         # Expecting base64_image in data
         base64_image = data["base64_image"]
         image_array = base64_to_numpy(base64_image)
         data["image_array"] = image_array
 
         # Cache image dimensions for computing bounding boxes.
-        self._width, self._height = image_array.shape[:2]
+        self._height, self._width = image_array.shape[:2]
 
         return data
 
@@ -96,10 +122,18 @@ class PaddleOCRModelInterface(ModelInterface):
             If an invalid protocol is specified.
         """
 
+        if "image_arrays" in data:
+            return self._format_batch_input(data, protocol)
+
         if protocol == "grpc":
             logger.debug("Formatting input for gRPC PaddleOCR model")
-            image_data = data["image_array"]
-            image_data = preprocess_image_for_paddle(image_data, self.paddle_version)
+            original = data["image_array"]
+            image_data = preprocess_image_for_paddle(original, self.paddle_version)
+            if image_data is not original:
+                # Coordinates are normalized to the padded tensor, as in a batch of one.
+                self._width, self._height = self._grpc_coordinate_scale(
+                    original, image_data.shape[1], image_data.shape[2]
+                )
             image_data = image_data.astype(np.float32)
             image_data = np.expand_dims(image_data, axis=0)
 
@@ -149,6 +183,9 @@ class PaddleOCRModelInterface(ModelInterface):
             )
             table_content_format = TableFormatEnum.SIMPLE
 
+        if data is not None and "image_arrays" in data:
+            return self._extract_batch_content(response, protocol, data, table_content_format)
+
         if protocol == "grpc":
             logger.debug("Parsing output from gRPC PaddleOCR model")
             return self._extract_content_from_paddle_grpc_response(response, table_content_format)
@@ -178,6 +215,101 @@ class PaddleOCRModelInterface(ModelInterface):
         # For PaddleOCR, the output is the table content as a string
         return output
 
+    def _format_batch_input(self, data: Dict[str, Any], protocol: str) -> Any:
+        """
+        Format a batch of images as a single request.
+
+        For gRPC, each image is preprocessed and zero-padded on the bottom and right to the largest height and width in
+        the batch, then stacked into one (N, C, H, W) array. The factors that map normalized box coordinates back to
+        each image's pixel space are stored in data["coordinate_scales"]. For HTTP, the images are listed in one
+        payload and coordinates are relative to each original image.
+        """
+        image_arrays = data["image_arrays"]
+
+        if protocol == "grpc":
+            logger.debug(f"Formatting batch of {len(image_arrays)} images for gRPC PaddleOCR model")
+            processed = [preprocess_image_for_paddle(image, self.paddle_version) for image in image_arrays]
+            batch_height = max(image.shape[1] for image in processed)
+            batch_width = max(image.shape[2] for image in processed)
+
+            batch = np.zeros((len(processed), processed[0].shape[0], batch_height, batch_width), dtype=np.float32)
+            coordinate_scales = []
+            for i, (image, original) in enumerate(zip(processed, image_arrays)):
+                batch[i, :, : image.shape[1], : image.shape[2]] = image
+                coordinate_scales.append(self._grpc_coordinate_scale(original, batch_height, batch_width))
+            data["coordinate_scales"] = coordinate_scales
+
+            return batch
+        elif protocol == "http":
+            logger.debug(f"Formatting batch of {len(image_arrays)} images for HTTP PaddleOCR model")
+            data["coordinate_scales"] = [(image.shape[1], image.shape[0]) for image in image_arrays]
+            image_urls = [f"data:image/png;base64,{base64_img}" for base64_img in data["base64_images"]]
+
+            return {"input": [{"type": "image_url", "url": image_url} for image_url in image_urls]}
+        else:
+            raise ValueError("Invalid protocol specified. Must be 'grpc' or 'http'.")
+
+    @staticmethod
+    def _grpc_coordinate_scale(original: np.ndarray, tensor_height: int, tensor_width: int) -> Tuple[float, float]:
+        """
+        Get the (x, y) factors that map box coordinates normalized to a gRPC input tensor of the given height and width
+        back to pixels of the original image. preprocess_image_for_paddle scales the longest side of the original image
+        to 960 pixels before the tensor is padded.
+        """
+        resize_factor = 960 / max(original.shape[:2])
+        return tensor_width / resize_factor, tensor_height / resize_factor
+
+    def _extract_batch_content(
+        self, response: Any, protocol: str, data: Dict[str, Any], table_content_format: str
+    ) -> List[Tuple[str, str]]:
+        """
+        Split a batched response into one (content, table_content_format) tuple per image, in request order.
+        """
+        if protocol == "grpc":
+            if not isinstance(response, np.ndarray):
+                raise ValueError("Unexpected response format: response is not a NumPy array.")
+            bboxes_bytestr, texts_bytestr, _ = response
+            batch_bounding_boxes = json.loads(bboxes_bytestr.decode("utf8"))
+            batch_text_predictions = json.loads(texts_bytestr.decode("utf8"))
+        elif protocol == "http":
+            if "data" not in response or not response["data"]:
+                raise RuntimeError("Unexpected response format: 'data' key is missing or empty.")
+            items = sorted(response["data"], key=lambda item: item.get("index", 0))
+            batch_bounding_boxes, batch_text_predictions = [], []
+            for item in items:
+                text_detections = item["text_detections"]
+                batch_text_predictions.append([detection["text_prediction"]["text"] for detection in text_detections])
+                batch_bounding_boxes.append(
+                    [
+                        [(point["x"], point["y"]) for point in detection["bounding_box"]["points"]]
+                        for detection in text_detections
+                    ]
+                )
+        else:
+            raise ValueError("Invalid protocol specified. Must be 'grpc' or 'http'.")
+
+        coordinate_scales = data["coordinate_scales"]
+        if len(batch_text_predictions) != len(coordinate_scales):
+            raise RuntimeError(
+                f"Expected {len(coordinate_scales)} results from PaddleOCR batch, got {len(batch_text_predictions)}."
+            )
+
+        results = []
+        for bounding_boxes, text_predictions, (x_scale, y_scale) in zip(
+            batch_bounding_boxes, batch_text_predictions, coordinate_scales
+        ):
+            if table_content_format == TableFormatEnum.SIMPLE:
+                content = " ".join(text_predictions)
+            elif table_content_format == TableFormatEnum.PSEUDO_MARKDOWN:
+                content = self._convert_paddle_response_to_psuedo_markdown(
+                    bounding_boxes, text_predictions, x_scale=x_scale, y_scale=y_scale
+                )
+            else:
+                raise ValueError(f"Unexpected table format: {table_content_format}")
+            results.append((content, table_content_format))
+
+        return results
+
     def _is_version_early_access_legacy_api(self):
         return self.paddle_version and (pkgversion.parse(self.paddle_version) < pkgversion.parse("0.2.1-rc2"))
 
@@ -273,7 +405,10 @@ class PaddleOCRModelInterface(ModelInterface):
 
         return content, table_content_format
 
-    def _convert_paddle_response_to_psuedo_markdown(self, bounding_boxes, text_predictions):
+    def _convert_paddle_response_to_psuedo_markdown(self, bounding_boxes, text_predictions, x_scale=None, y_scale=None):
+        x_scale = self._width if x_scale is None else x_scale
+        y_scale = self._height if y_scale is None else y_scale
+
         bboxes = []
         texts = []
         for box, txt in zip(bounding_boxes, text_predictions):
@@ -282,8 +417,8 @@ class PaddleOCRModelInterface(ModelInterface):
             points = []
             for point in box:
                 # The coordinates from Paddle are normlized. Convert them back to integers for DBSCAN.
-                x = float(point[0]) * self._width
-                y = float(point[1]) * self._height
+                x = float(point[0]) * x_scale
+                y = float(point[1]) * y_scale
                 points.append([x, y])
             bboxes.append(points)
             texts.append(txt)
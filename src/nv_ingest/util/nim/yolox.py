@@ -14,8 +14,6 @@ from typing import Optional
 
 import cv2
 import numpy as np
-import torch
-import torchvision
 from packaging import version as pkgversion
 from PIL import Image
 
@@ -352,61 +350,89 @@ class YoloxPageElementsModelInterface(ModelInterface):
         return self.yolox_version and (pkgversion.parse(self.yolox_version) < pkgversion.parse("1.0.0-rc0"))
 
 
-def postprocess_model_prediction(prediction, num_classes, conf_thre=0.7, nms_thre=0.45, class_agnostic=False):
-    # Convert numpy array to torch tensor
-    prediction = torch.from_numpy(prediction.copy())
-
-    # Compute box corners
-    box_corner = prediction.new(prediction.shape)
-    box_corner[:, :, 0] = prediction[:, :, 0] - prediction[:, :, 2] / 2
-    box_corner[:, :, 1] = prediction[:, :, 1] - prediction[:, :, 3] / 2
-    box_corner[:, :, 2] = prediction[:, :, 0] + prediction[:, :, 2] / 2
-    box_corner[:, :, 3] = prediction[:, :, 1] + prediction[:, :, 3] / 2
-    prediction[:, :, :4] = box_corner[:, :, :4]
-
-    output = [None for _ in range(len(prediction))]
-
-    for i, image_pred in enumerate(prediction):
-        # If no detections, continue to the next image
-        if not image_pred.size(0):
-            continue
+def _iou_matrix(boxes_a, boxes_b):
+    # IoU of every box in boxes_a, (N, 4), with every box in boxes_b, (M, 4), both in (x1, y1, x2, y2) format.
+    x1 = np.maximum(boxes_a[:, None, 0], boxes_b[None, :, 0])
+    y1 = np.maximum(boxes_a[:, None, 1], boxes_b[None, :, 1])
+    x2 = np.minimum(boxes_a[:, None, 2], boxes_b[None, :, 2])
+    y2 = np.minimum(boxes_a[:, None, 3], boxes_b[None, :, 3])
+    inter_area = np.maximum(x2 - x1, 0) * np.maximum(y2 - y1, 0)
 
-        # Ensure image_pred is 2D
-        if image_pred.ndim == 1:
-            image_pred = image_pred.unsqueeze(0)
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
 
-        # Get score and class with highest confidence
-        class_conf, class_pred = torch.max(image_pred[:, 5 : 5 + num_classes], 1, keepdim=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return inter_area / (area_a[:, None] + area_b[None, :] - inter_area)
 
-        # Confidence mask
-        squeezed_conf = class_conf.squeeze(dim=1)
-        conf_mask = image_pred[:, 4] * squeezed_conf >= conf_thre
 
-        # Apply confidence mask
-        detections = torch.cat((image_pred[:, :5], class_conf, class_pred.float()), 1)
-        detections = detections[conf_mask]
-
-        if not detections.size(0):
+def postprocess_model_prediction(prediction, num_classes, conf_thre=0.7, nms_thre=0.45, class_agnostic=False):
+    """
+    Converts raw YOLOX output to per-image detections, filtering by confidence and applying non-maximum suppression.
+
+    Boxes are decoded and filtered for the whole batch at once.
+
+    Parameters
+    ----------
+    prediction : np.ndarray
+        The model output, of shape (batch_size, num_anchors, 5 + num_classes), with rows of center x, center y, width,
+        height, objectness and per-class scores.
+    num_classes : int
+        The number of classes.
+    conf_thre : float, optional
+        Detections whose objectness times class score is below this are dropped.
+    nms_thre : float, optional
+        The IoU threshold of non-maximum suppression.
+    class_agnostic : bool, optional
+        If True, detections of different classes suppress each other.
+
+    Returns
+    -------
+    List[Optional[np.ndarray]]
+        For each image, None if nothing was detected, or an (N, 7) array with rows of x1, y1, x2, y2, objectness,
+        class score and class index, ordered by decreasing score.
+    """
+    prediction = np.asarray(prediction)
+    output = [None for _ in range(len(prediction))]
+    if prediction.ndim != 3 or not prediction.shape[1]:
+        return output
+
+    class_scores = prediction[:, :, 5 : 5 + num_classes]
+    class_pred = class_scores.argmax(axis=2)
+    class_conf = np.take_along_axis(class_scores, class_pred[:, :, None], axis=2)[:, :, 0]
+
+    image_idxs, anchor_idxs = np.nonzero(prediction[:, :, 4] * class_conf >= conf_thre)
+    if not image_idxs.size:
+        return output
+
+    candidates = prediction[image_idxs, anchor_idxs]
+    detections = np.empty((len(candidates), 7), dtype=prediction.dtype)
+    detections[:, 0:2] = candidates[:, 0:2] - candidates[:, 2:4] / 2
+    detections[:, 2:4] = candidates[:, 0:2] + candidates[:, 2:4] / 2
+    detections[:, 4] = candidates[:, 4]
+    detections[:, 5] = class_conf[image_idxs, anchor_idxs]
+    detections[:, 6] = class_pred[image_idxs, anchor_idxs]
+
+    scores = (detections[:, 4] * detections[:, 5]).astype(np.float32)
+    boxes_xywh = np.concatenate((detections[:, 0:2], candidates[:, 2:4]), axis=1).astype(np.float64)
+
+    # Suppression runs per image in OpenCV's greedy NMS: a single pass over the batch would compare every box with
+    # the kept boxes of every image.
+    image_bounds = np.searchsorted(image_idxs, np.arange(len(prediction) + 1))
+    for i in range(len(prediction)):
+        start, end = image_bounds[i], image_bounds[i + 1]
+        if start == end:
             continue
 
-        # Apply Non-Maximum Suppression (NMS)
         if class_agnostic:
-            nms_out_index = torchvision.ops.nms(
-                detections[:, :4],
-                detections[:, 4] * detections[:, 5],
-                nms_thre,
-            )
+            keep = cv2.dnn.NMSBoxes(boxes_xywh[start:end], scores[start:end], 0.0, nms_thre)
         else:
-            nms_out_index = torchvision.ops.batched_nms(
-                detections[:, :4],
-                detections[:, 4] * detections[:, 5],
-                detections[:, 6],
-                nms_thre,
-            )
-        detections = detections[nms_out_index]
+            class_ids = detections[start:end, 6].astype(np.int32)
+            keep = cv2.dnn.NMSBoxesBatched(boxes_xywh[start:end], scores[start:end], class_ids, 0.0, nms_thre)
 
-        # Append detections to output
-        output[i] = detections
+        # Kept indices are ordered by decreasing score.
+        keep = np.asarray(keep, dtype=int).reshape(-1)
+        if keep.size:
+            output[i] = detections[start:end][keep]
 
     return output
 
@@ -432,7 +458,6 @@ def postprocess_results(results, original_image_shapes, min_score=0.0):
             continue
 
         try:
-            result = result.cpu().numpy()
             scores = result[:, 4] * result[:, 5]
             result = result[scores > min_score]
 
@@ -447,27 +472,19 @@ def postprocess_results(results, original_image_shapes, min_score=0.0):
             bboxes[:, [1, 3]] /= original_image_shape[0]
             bboxes = np.clip(bboxes, 0.0, 1.0)
 
-            label_idxs = result[:, 6]
+            label_idxs = result[:, 6].astype(int)
             scores = scores[scores > min_score]
         except Exception as e:
             raise ValueError(f"Error in postprocessing {result.shape} and {original_image_shape}: {e}")
 
-        annotation_dict = {label: [] for label in labels}
+        # additional preprocessing for tables: extend the upper bounds to capture titles if any.
+        is_table = label_idxs == labels.index("table")
+        heights = bboxes[is_table, 3] - bboxes[is_table, 1]
+        bboxes[is_table, 1] = np.clip(bboxes[is_table, 1] - heights * 0.2, 0.0, 1.0)
 
         # bboxes are in format [x_min, y_min, x_max, y_max]
-        for j in range(len(bboxes)):
-            label = labels[int(label_idxs[j])]
-            bbox = bboxes[j]
-            score = scores[j]
-
-            # additional preprocessing for tables: extend the upper bounds to capture titles if any.
-            if label == "table":
-                height = bbox[3] - bbox[1]
-                bbox[1] = (bbox[1] - height * 0.2).clip(0.0, 1.0)
-
-            annotation_dict[label].append([round(float(x), 4) for x in np.concatenate((bbox, [score]))])
-
-        out.append(annotation_dict)
+        annotations = np.round(np.concatenate((bboxes, scores[:, None]), axis=1).astype(np.float64), 4)
+        out.append({label: annotations[label_idxs == i].tolist() for i, label in enumerate(labels)})
 
     # {label: [[x1, y1, x2, y2, confidence], ...], ...}
     return out
@@ -571,6 +588,9 @@ def weighted_boxes_fusion(
     Custom wbf implementation that supports a class_agnostic mode and a biggest box fusion.
     Boxes are expected to be in normalized (x0, y0, x1, y1) format.
 
+    Each box is linked to the other box it overlaps most, if their IoU is above `iou_thr`, and every connected group
+    of linked boxes is fused into one box.
+
     Args:
         boxes_list (list[np array[n x 4]]): List of boxes. One list per model.
         scores_list (list[np array[n]]): List of confidences.
@@ -605,49 +625,106 @@ def weighted_boxes_fusion(
     if len(filtered_boxes) == 0:
         return np.zeros((0, 4)), np.zeros((0,)), np.zeros((0,))
 
-    overall_boxes = []
-    for label in filtered_boxes:
-        boxes = filtered_boxes[label]
-        np.empty((0, 8))
-
-        clusters = []
+    overall_boxes = np.concatenate(
+        [
+            fuse_clustered_boxes(boxes, cluster_boxes(boxes[:, 4:], iou_thr), conf_type, merge_type)
+            for boxes in filtered_boxes.values()
+        ]
+    )
 
-        # Clusterize boxes
-        for j in range(len(boxes)):
-            ids = [i for i in range(len(boxes)) if i != j]
-            index, best_iou = find_matching_box_fast(boxes[ids], boxes[j], iou_thr)
+    if conf_type == "max":
+        overall_boxes[:, 1] /= weights.max()
+    else:  # avg; the cluster's box count was stored in the model index field.
+        overall_boxes[:, 1] *= overall_boxes[:, 3] / weights.sum()
+    overall_boxes[:, 3] = -1  # model index field is retained for consistency but is not used.
 
-            if index != -1:
-                index = ids[index]
-                cluster_idx = [clust_idx for clust_idx, clust in enumerate(clusters) if (j in clust or index in clust)]
-                if len(cluster_idx):
-                    cluster_idx = cluster_idx[0]
-                    clusters[cluster_idx] = list(set(clusters[cluster_idx] + [index, j]))
-                else:
-                    clusters.append([index, j])
-            else:
-                clusters.append([j])
-
-        for j, c in enumerate(clusters):
-            if merge_type == "weighted":
-                weighted_box = get_weighted_box(boxes[c], conf_type)
-            elif merge_type == "biggest":
-                weighted_box = get_biggest_box(boxes[c], conf_type)
-
-            if conf_type == "max":
-                weighted_box[1] = weighted_box[1] / weights.max()
-            else:  # avg
-                weighted_box[1] = weighted_box[1] * len(c) / weights.sum()
-            overall_boxes.append(weighted_box)
-
-    overall_boxes = np.array(overall_boxes)
-    overall_boxes = overall_boxes[overall_boxes[:, 1].argsort()[::-1]]
+    overall_boxes = overall_boxes[np.argsort(-overall_boxes[:, 1], kind="stable")]
     boxes = overall_boxes[:, 4:]
     scores = overall_boxes[:, 1]
     labels = overall_boxes[:, 0]
     return boxes, scores, labels
 
 
+def cluster_boxes(boxes, iou_thr):
+    """
+    Groups boxes that overlap, linking each box to the other box it overlaps most if their IoU is above `iou_thr`.
+
+    Args:
+        boxes (np array [n x 4]): Boxes in (x1, y1, x2, y2) format.
+        iou_thr (float): IoU threshold for linking boxes.
+
+    Returns:
+        np array [n]: The cluster of each box, numbered from 0 in order of each cluster's first box.
+    """
+    n = len(boxes)
+    ious = _iou_matrix(boxes, boxes)
+    np.fill_diagonal(ious, -1)
+    best_match = ious.argmax(axis=1)
+    linked = ious[np.arange(n), best_match] > iou_thr
+    src, dst = np.nonzero(linked)[0], best_match[linked]
+
+    # Propagate the smallest box index through the links until every box is labeled with its cluster's first box.
+    cluster = np.arange(n)
+    while True:
+        new_cluster = cluster.copy()
+        np.minimum.at(new_cluster, src, cluster[dst])
+        np.minimum.at(new_cluster, dst, cluster[src])
+        new_cluster = new_cluster[new_cluster]
+        if np.array_equal(new_cluster, cluster):
+            break
+        cluster = new_cluster
+
+    return np.unique(cluster, return_inverse=True)[1]
+
+
+def fuse_clustered_boxes(boxes, clusters, conf_type="avg", merge_type="weighted"):
+    """
+    Merges each cluster of boxes into one box.
+
+    The merged label is the cluster's label if all of its boxes agree, or else the label of its most confident
+    non-title (class 2) box.
+
+    Args:
+        boxes (np array [n x 8]): Boxes as rows of label, score, weight, model index, x1, y1, x2, y2, ordered by
+            decreasing score, as returned by prefilter_boxes.
+        clusters (np array [n]): The cluster of each box, as returned by cluster_boxes.
+        conf_type (str, optional): Confidence merging type, "avg" or "max". Defaults to "avg".
+        merge_type (str, optional): "weighted" averages the boxes weighted by score, "biggest" takes the box that
+            encloses them all. Defaults to "weighted".
+
+    Returns:
+        np array [k x 8]: One merged box per cluster. The model index field holds the number of boxes merged.
+    """
+    order = np.argsort(clusters, kind="stable")
+    boxes = boxes[order]
+    starts = np.flatnonzero(np.r_[True, clusters[order][1:] != clusters[order][:-1]])
+    sizes = np.diff(np.r_[starts, len(boxes)])
+
+    merged = np.zeros((len(starts), 8), dtype=np.float32)
+    if merge_type == "biggest":
+        merged[:, 4:6] = np.minimum.reduceat(boxes[:, 4:6], starts)
+        merged[:, 6:8] = np.maximum.reduceat(boxes[:, 6:8], starts)
+    else:  # weighted
+        merged[:, 4:] = (
+            np.add.reduceat(boxes[:, 1:2] * boxes[:, 4:], starts) / np.add.reduceat(boxes[:, 1], starts)[:, None]
+        )
+
+    labels = boxes[:, 0]
+    # Boxes keep their decreasing score order within a cluster, so its first non-title box is its most confident one.
+    first_non_title = np.minimum.reduceat(np.where(labels != 2, np.arange(len(boxes)), len(boxes)), starts)
+    is_uniform = np.minimum.reduceat(labels, starts) == np.maximum.reduceat(labels, starts)
+    merged[:, 0] = np.where(is_uniform, labels[starts], labels[np.minimum(first_non_title, len(boxes) - 1)])
+
+    if conf_type == "max":
+        merged[:, 1] = np.maximum.reduceat(boxes[:, 1], starts)
+    else:  # avg
+        merged[:, 1] = np.add.reduceat(boxes[:, 1], starts) / sizes
+    merged[:, 2] = np.add.reduceat(boxes[:, 2], starts)
+    merged[:, 3] = sizes
+
+    return merged
+
+
 def prefilter_boxes(boxes, scores, labels, weights, thr, class_agnostic=False):
     """
     Reformats and filters boxes.
@@ -664,178 +741,65 @@ def prefilter_boxes(boxes, scores, labels, weights, thr, class_agnostic=False):
     Returns:
         dict[np array [? x 8]]: Filtered boxes.
     """
-    # Create dict with boxes stored by its label
-    new_boxes = dict()
-
     for t in range(len(boxes)):
         if len(boxes[t]) != len(scores[t]):
-            print(
-                "Error. Length of boxes arrays not equal to length of scores array: {} != {}".format(
-                    len(boxes[t]), len(scores[t])
-                )
+            raise ValueError(
+                f"Length of boxes arrays not equal to length of scores array: {len(boxes[t])} != {len(scores[t])}"
             )
-            exit()
-
         if len(boxes[t]) != len(labels[t]):
-            print(
-                "Error. Length of boxes arrays not equal to length of labels array: {} != {}".format(
-                    len(boxes[t]), len(labels[t])
-                )
+            raise ValueError(
+                f"Length of boxes arrays not equal to length of labels array: {len(boxes[t])} != {len(labels[t])}"
             )
-            exit()
-
-        for j in range(len(boxes[t])):
-            score = scores[t][j]
-            if score < thr:
-                continue
-            label = int(labels[t][j])
-            box_part = boxes[t][j]
-            x1 = float(box_part[0])
-            y1 = float(box_part[1])
-            x2 = float(box_part[2])
-            y2 = float(box_part[3])
-
-            # Box data checks
-            if x2 < x1:
-                warnings.warn("X2 < X1 value in box. Swap them.")
-                x1, x2 = x2, x1
-            if y2 < y1:
-                warnings.warn("Y2 < Y1 value in box. Swap them.")
-                y1, y2 = y2, y1
-            if x1 < 0:
-                warnings.warn("X1 < 0 in box. Set it to 0.")
-                x1 = 0
-            if x1 > 1:
-                warnings.warn("X1 > 1 in box. Set it to 1. Check that you normalize boxes in [0, 1] range.")
-                x1 = 1
-            if x2 < 0:
-                warnings.warn("X2 < 0 in box. Set it to 0.")
-                x2 = 0
-            if x2 > 1:
-                warnings.warn("X2 > 1 in box. Set it to 1. Check that you normalize boxes in [0, 1] range.")
-                x2 = 1
-            if y1 < 0:
-                warnings.warn("Y1 < 0 in box. Set it to 0.")
-                y1 = 0
-            if y1 > 1:
-                warnings.warn("Y1 > 1 in box. Set it to 1. Check that you normalize boxes in [0, 1] range.")
-                y1 = 1
-            if y2 < 0:
-                warnings.warn("Y2 < 0 in box. Set it to 0.")
-                y2 = 0
-            if y2 > 1:
-                warnings.warn("Y2 > 1 in box. Set it to 1. Check that you normalize boxes in [0, 1] range.")
-                y2 = 1
-            if (x2 - x1) * (y2 - y1) == 0.0:
-                warnings.warn("Zero area box skipped: {}.".format(box_part))
-                continue
-
-            # [label, score, weight, model index, x1, y1, x2, y2]
-            b = [int(label), float(score) * weights[t], weights[t], t, x1, y1, x2, y2]
-
-            label_k = "*" if class_agnostic else label
-            if label_k not in new_boxes:
-                new_boxes[label_k] = []
-            new_boxes[label_k].append(b)
-
-    # Sort each list in dict by score and transform it to numpy array
-    for k in new_boxes:
-        current_boxes = np.array(new_boxes[k])
-        new_boxes[k] = current_boxes[current_boxes[:, 1].argsort()[::-1]]
-
-    return new_boxes
-
-
-def find_matching_box_fast(boxes_list, new_box, match_iou):
-    """
-    Reimplementation of find_matching_box with numpy instead of loops. Gives significant speed up for larger arrays
-    (~100x). This was previously the bottleneck since the function is called for every entry in the array.
-    """
-
-    def bb_iou_array(boxes, new_box):
-        # bb interesection over union
-        xA = np.maximum(boxes[:, 0], new_box[0])
-        yA = np.maximum(boxes[:, 1], new_box[1])
-        xB = np.minimum(boxes[:, 2], new_box[2])
-        yB = np.minimum(boxes[:, 3], new_box[3])
 
-        interArea = np.maximum(xB - xA, 0) * np.maximum(yB - yA, 0)
+    if not len(boxes):
+        return dict()
 
-        # compute the area of both the prediction and ground-truth rectangles
-        boxAArea = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
-        boxBArea = (new_box[2] - new_box[0]) * (new_box[3] - new_box[1])
+    model_idxs = np.concatenate([np.full(len(model_boxes), t) for t, model_boxes in enumerate(boxes)])
+    all_boxes = np.concatenate([np.reshape(model_boxes, (-1, 4)) for model_boxes in boxes]).astype(np.float64)
+    all_scores = np.concatenate([np.reshape(model_scores, -1) for model_scores in scores]).astype(np.float64)
+    all_labels = np.concatenate([np.reshape(model_labels, -1) for model_labels in labels]).astype(int)
 
-        iou = interArea / (boxAArea + boxBArea - interArea)
-
-        return iou
-
-    if boxes_list.shape[0] == 0:
-        return -1, match_iou
-
-    ious = bb_iou_array(boxes_list[:, 4:], new_box[4:])
-    # ious[boxes[:, 0] != new_box[0]] = -1
-
-    best_idx = np.argmax(ious)
-    best_iou = ious[best_idx]
-
-    if best_iou <= match_iou:
-        best_iou = match_iou
-        best_idx = -1
-
-    return best_idx, best_iou
-
-
-def get_biggest_box(boxes, conf_type="avg"):
-    """
-    Merges boxes by using the biggest box.
+    keep = all_scores >= thr
+    all_boxes, all_scores, all_labels, model_idxs = (
+        all_boxes[keep],
+        all_scores[keep],
+        all_labels[keep],
+        model_idxs[keep],
+    )
 
-    Args:
-        boxes (np array [n x 8]): Boxes to merge.
-        conf_type (str, optional): Confidence merging type. Defaults to "avg".
+    # Box data checks
+    if (all_boxes[:, 2] < all_boxes[:, 0]).any():
+        warnings.warn("X2 < X1 value in box. Swap them.")
+    if (all_boxes[:, 3] < all_boxes[:, 1]).any():
+        warnings.warn("Y2 < Y1 value in box. Swap them.")
+    all_boxes = np.concatenate(
+        (np.minimum(all_boxes[:, :2], all_boxes[:, 2:]), np.maximum(all_boxes[:, :2], all_boxes[:, 2:])), axis=1
+    )
+    if ((all_boxes < 0) | (all_boxes > 1)).any():
+        warnings.warn("Box coordinates outside of [0, 1] clipped. Check that you normalize boxes in [0, 1] range.")
+        all_boxes = np.clip(all_boxes, 0, 1)
+    is_empty = (all_boxes[:, 2] - all_boxes[:, 0]) * (all_boxes[:, 3] - all_boxes[:, 1]) == 0.0
+    if is_empty.any():
+        warnings.warn("Zero area boxes skipped: {}.".format(all_boxes[is_empty]))
+        all_boxes, all_scores, all_labels, model_idxs = (
+            all_boxes[~is_empty],
+            all_scores[~is_empty],
+            all_labels[~is_empty],
+            model_idxs[~is_empty],
+        )
 
-    Returns:
-        np array [8]: Merged box.
-    """
-    box = np.zeros(8, dtype=np.float32)
-    box[4:] = boxes[0][4:]
-    conf_list = []
-    w = 0
-    for b in boxes:
-        box[4] = min(box[4], b[4])
-        box[5] = min(box[5], b[5])
-        box[6] = max(box[6], b[6])
-        box[7] = max(box[7], b[7])
-        conf_list.append(b[1])
-        w += b[2]
-
-    box[0] = merge_labels(np.array([b[0] for b in boxes]), np.array([b[1] for b in boxes]))
-    #     print(box[0], np.array([b[0] for b in boxes]))
-
-    box[1] = np.max(conf_list) if conf_type == "max" else np.mean(conf_list)
-    box[2] = w
-    box[3] = -1  # model index field is retained for consistency but is not used.
-    return box
-
-
-def merge_labels(labels, confs):
-    """
-    Custom function for merging labels.
-    If all labels are the same, return the unique value.
-    Else, return the label of the most confident non-title (class 2) box.
+    box_weights = np.asarray(weights, dtype=np.float64)[model_idxs]
+    # [label, score, weight, model index, x1, y1, x2, y2]
+    rows = np.column_stack((all_labels, all_scores * box_weights, box_weights, model_idxs, all_boxes))
 
-    Args:
-        labels (np array [n]): Labels.
-        confs (np array [n]): Confidence.
+    # Split the boxes by label and sort each group by score
+    new_boxes = dict()
+    for label in ["*"] if class_agnostic else np.unique(all_labels).tolist():
+        label_rows = rows if label == "*" else rows[all_labels == label]
+        if len(label_rows):
+            new_boxes[label] = label_rows[np.argsort(-label_rows[:, 1], kind="stable")]
 
-    Returns:
-        int: Label.
-    """
-    if len(np.unique(labels)) == 1:
-        return labels[0]
-    else:  # Most confident and not a title
-        confs = confs[confs != 2]
-        labels = labels[labels != 2]
-        return labels[np.argmax(confs)]
+    return new_boxes
 
 
 def match_with_title(chart_bbox, title_bboxes, iou_th=0.01):
@@ -908,33 +872,3 @@ def expand_boxes(boxes, r_x=1, r_y=1):
 
     boxes = np.clip(boxes, 0, 1)
     return boxes
-
-
-def get_weighted_box(boxes, conf_type="avg"):
-    """
-    Merges boxes by using the weighted fusion.
-
-    Args:
-        boxes (np array [n x 8]): Boxes to merge.
-        conf_type (str, optional): Confidence merging type. Defaults to "avg".
-
-    Returns:
-        np array [8]: Merged box.
-    """
-    box = np.zeros(8, dtype=np.float32)
-    conf = 0
-    conf_list = []
-    w = 0
-    for b in boxes:
-        box[4:] += b[1] * b[4:]
-        conf += b[1]
-        conf_list.append(b[1])
-        w += b[2]
-
-    box[0] = merge_labels(np.array([b[0] for b in boxes]), np.array([b[1] for b in boxes]))
-
-    box[1] = np.max(conf_list) if conf_type == "max" else np.mean(conf_list)
-    box[2] = w
-    box[3] = -1  # model index field is retained for consistency but is not used.
-    box[4:] /= conf
-    return box
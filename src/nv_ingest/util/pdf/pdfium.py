@@ -2,7 +2,9 @@
 # All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import ctypes
 import logging
+import threading
 from typing import Any
 from typing import List
 from typing import Optional
@@ -28,6 +30,9 @@ PDFIUM_PAGEOBJ_MAPPING = {
     5: "FORM",  # FPDF_PAGEOBJ_FORM
 }
 
+# Per-thread buffer that pages rendered at a target resolution are drawn into before being copied out.
+_render_buffers = threading.local()
+
 
 def convert_bitmap_to_corrected_numpy(bitmap: pdfium.PdfBitmap) -> np.ndarray:
     """
@@ -116,12 +121,95 @@ def pdfium_try_get_bitmap_as_numpy(image_obj) -> np.ndarray:
     return img_array
 
 
+def _get_render_buffer(size: int) -> ctypes.Array:
+    buffer = getattr(_render_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = (ctypes.c_ubyte * size)()
+        _render_buffers.buffer = buffer
+
+    return buffer
+
+
+def _make_buffered_bitmap(width: int, height: int, format: int, rev_byteorder: bool = False) -> pdfium.PdfBitmap:
+    # A `bitmap_maker` for `PdfPage.render` that draws into the thread's reusable buffer rather than a new one.
+    n_channels = 1 if format == pdfium.raw.FPDFBitmap_Gray else 3
+    buffer = _get_render_buffer(width * height * n_channels)
+
+    return pdfium.PdfBitmap.new_native(width, height, format, rev_byteorder=rev_byteorder, buffer=buffer)
+
+
+def get_target_render_scale(page: pdfium.PdfPage, target_resolution: Tuple[int, int], max_dpi: int = 300) -> float:
+    """
+    Returns the pdfium scale at which a page renders to fit within a target resolution, preserving its aspect ratio.
+
+    Parameters
+    ----------
+    page : pdfium.PdfPage
+        The page.
+    target_resolution : Tuple[int, int]
+        The (width, height) the rendered page must fit within.
+    max_dpi : int, optional
+        The scale is capped at this DPI, so small pages are not rendered larger than they would be at it. Defaults
+        to 300.
+
+    Returns
+    -------
+    float
+        The scale, in pixels per PDF point.
+    """
+    page_width, page_height = page.get_size()
+    # Shrink the scale slightly so that rounding the rendered size up cannot exceed the target.
+    fit_scale = min((target_resolution[0] - 0.5) / page_width, (target_resolution[1] - 0.5) / page_height)
+
+    return min(fit_scale, max_dpi / 72)
+
+
+def pdfium_render_page_to_numpy(
+    page: pdfium.PdfPage, target_resolution: Tuple[int, int], max_dpi: int = 300, grayscale: bool = False
+) -> np.ndarray:
+    """
+    Renders a page straight to a NumPy array that fits within a target resolution.
+
+    The page is rendered once at the scale that fits the target, rather than at a fixed DPI and then downsampled, into
+    a buffer that is reused by the thread's later renders, and copied out in RGB (or grayscale) order without going
+    through PIL.
+
+    Parameters
+    ----------
+    page : pdfium.PdfPage
+        The page to render.
+    target_resolution : Tuple[int, int]
+        The (width, height) the rendered page must fit within, typically a model's input resolution.
+    max_dpi : int, optional
+        The highest DPI to render at, for pages that are small relative to the target. Defaults to 300.
+    grayscale : bool, optional
+        If True, renders a single-channel (height, width) image. Defaults to False, a (height, width, 3) RGB image.
+
+    Returns
+    -------
+    np.ndarray
+        The rendered page, as uint8.
+    """
+    scale = get_target_render_scale(page, target_resolution, max_dpi=max_dpi)
+    render_options = {"grayscale": True} if grayscale else {"rev_byteorder": True}
+
+    bitmap = page.render(scale=scale, rotation=0, bitmap_maker=_make_buffered_bitmap, **render_options)
+    try:
+        img_arr = bitmap.to_numpy().copy()
+    finally:
+        bitmap.close()
+
+    return img_arr
+
+
 @traceable_func(trace_name="pdf_content_extractor::pdfium_pages_to_numpy")
 def pdfium_pages_to_numpy(
     pages: List[pdfium.PdfPage],
     render_dpi=300,
     scale_tuple: Optional[Tuple[int, int]] = None,
     padding_tuple: Optional[Tuple[int, int]] = None,
+    target_resolution: Optional[Tuple[int, int]] = None,
+    grayscale: bool = False,
 ) -> tuple[list[ndarray | ndarray[Any, dtype[Any]]], list[tuple[int, int]]]:
     """
     Converts a list of PdfPage objects to a list of NumPy arrays, where each array
@@ -131,6 +219,10 @@ def pdfium_pages_to_numpy(
     specified scaling using the thumbnail approach, and adds padding if requested. The
     DPI for rendering can be specified, with a default value of 300 DPI.
 
+    If `target_resolution` is given, each page is instead rendered directly at the scale
+    that fits it within the target (at most `render_dpi`) with `pdfium_render_page_to_numpy`,
+    which avoids rendering a full-resolution page only to shrink it.
+
     Parameters
     ----------
     pages : List[pdfium.PdfPage]
@@ -142,6 +234,11 @@ def pdfium_pages_to_numpy(
         Defaults to None.
     padding_tuple : Optional[Tuple[int, int]], optional
         A tuple (width, height) to pad the image to. Defaults to None.
+    target_resolution : Optional[Tuple[int, int]], optional
+        A tuple (width, height) to render the pages to fit within. Takes the place of
+        `scale_tuple`. Defaults to None.
+    grayscale : bool, optional
+        If True and `target_resolution` is given, renders single-channel images. Defaults to False.
 
     Returns
     -------
@@ -165,18 +262,21 @@ def pdfium_pages_to_numpy(
     scale = render_dpi / 72  # 72 DPI is the base DPI in PDFium
 
     for page in pages:
-        # Render the page as a bitmap with the specified scale
-        page_bitmap = page.render(scale=scale, rotation=0)
+        if target_resolution:
+            img_arr = pdfium_render_page_to_numpy(page, target_resolution, max_dpi=render_dpi, grayscale=grayscale)
+        else:
+            # Render the page as a bitmap with the specified scale
+            page_bitmap = page.render(scale=scale, rotation=0)
 
-        # Convert the bitmap to a PIL image
-        pil_image = page_bitmap.to_pil()
+            # Convert the bitmap to a PIL image
+            pil_image = page_bitmap.to_pil()
 
-        # Apply scaling using the thumbnail approach if specified
-        if scale_tuple:
-            pil_image.thumbnail(scale_tuple, Image.LANCZOS)
+            # Apply scaling using the thumbnail approach if specified
+            if scale_tuple:
+                pil_image.thumbnail(scale_tuple, Image.LANCZOS)
 
-        # Convert the PIL image to a NumPy array
-        img_arr = np.array(pil_image)
+            # Convert the PIL image to a NumPy array
+            img_arr = np.array(pil_image)
 
         # Apply padding if specified
         if padding_tuple:
@@ -15,6 +15,7 @@ def setup_ingestion_pipeline(
     pipe: Pipeline, morpheus_pipeline_config: Config, ingest_config: typing.Dict[str, typing.Any]
 ):
     default_cpu_count = get_default_cpu_count()
+    configure_worker_pools(ingest_config)
     add_meter_stage = os.environ.get("MESSAGE_CLIENT_TYPE") != "simple"
 
     ########################################################################################################
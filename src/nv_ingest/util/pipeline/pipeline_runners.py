@@ -21,6 +21,7 @@ from pydantic import BaseModel
 
 from nv_ingest.schemas import PipelineConfigSchema
 from nv_ingest.util.converters.containers import merge_dict
+from nv_ingest.util.multi_processing import WorkerPoolRegistry
 from morpheus.utils.logger import configure_logging
 from nv_ingest.util.pipeline import setup_ingestion_pipeline
 from morpheus.pipeline.pipeline import Pipeline
@@ -94,6 +95,7 @@ def _launch_pipeline(morpheus_pipeline_config, ingest_config) -> float:
     total_elapsed = (end_run - start_abs).total_seconds()
 
     logger.info(f"Pipeline run completed in {run_elapsed:.2f} seconds")
+    logger.info(f"Worker pool utilization: {json.dumps(WorkerPoolRegistry().get_utilization())}")
     logger.info(f"Total time elapsed: {total_elapsed:.2f} seconds")
 
     return total_elapsed
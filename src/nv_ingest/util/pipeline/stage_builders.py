@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import json
 import logging
 import math
 import os
@@ -22,6 +23,7 @@ from nv_ingest.modules.telemetry.otel_meter import OpenTelemetryMeterLoaderFacto
 from nv_ingest.modules.telemetry.otel_tracer import OpenTelemetryTracerLoaderFactory
 from nv_ingest.modules.transforms.embed_extractions import EmbedExtractionsLoaderFactory
 from nv_ingest.modules.transforms.nemo_doc_splitter import NemoDocSplitterLoaderFactory
+from nv_ingest.schemas.worker_pool_schema import WorkerPoolsSchema
 from nv_ingest.stages.docx_extractor_stage import generate_docx_extractor_stage
 from nv_ingest.stages.extractors.image_extractor_stage import generate_image_extractor_stage
 from nv_ingest.stages.filters import generate_dedup_stage
@@ -33,6 +35,8 @@ from nv_ingest.stages.pptx_extractor_stage import generate_pptx_extractor_stage
 from nv_ingest.stages.storages.embedding_storage_stage import generate_embedding_storage_stage
 from nv_ingest.stages.storages.image_storage_stage import ImageStorageStage
 from nv_ingest.stages.transforms.image_caption_extraction import generate_caption_extraction_stage
+from nv_ingest.util.multi_processing import WorkerPoolRegistry
+from nv_ingest.util.multi_processing.worker_pool_registry import DEFAULT_WORKER_POOL
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +101,47 @@ def get_table_detection_service(env_var_prefix):
     return grpc_endpoint, http_endpoint, auth_token, infer_protocol
 
 
+def get_payload_transport(env_var_prefix):
+    prefix = env_var_prefix.upper()
+    payload_transport = os.environ.get(
+        f"{prefix}_PAYLOAD_TRANSPORT",
+        os.environ.get("NV_INGEST_PAYLOAD_TRANSPORT", "pickle"),
+    ).lower()
+
+    logger.info(f"{prefix}_PAYLOAD_TRANSPORT: {payload_transport}")
+
+    return payload_transport
+
+
+def configure_worker_pools(ingest_config):
+    worker_pools_config = ingest_config.get("worker_pools")
+    if worker_pools_config is None:
+        worker_pools_config = json.loads(os.environ.get("NV_INGEST_WORKER_POOLS", "{}"))
+
+    validated_config = WorkerPoolsSchema(**worker_pools_config)
+    registry = WorkerPoolRegistry()
+    for pool_name, pool_config in validated_config.pools.items():
+        registry.configure(
+            pool_name,
+            pool_config.workers,
+            max_queue_depth=pool_config.max_queue_depth,
+            cpu_affinity=pool_config.cpu_affinity,
+        )
+    for stage_name, pool_name in validated_config.stages.items():
+        registry.assign_stage(stage_name, pool_name)
+
+    return validated_config
+
+
+def get_worker_pool(env_var_prefix):
+    prefix = env_var_prefix.upper()
+    worker_pool = os.environ.get(f"{prefix}_WORKER_POOL", WorkerPoolRegistry().get_stage_pool(env_var_prefix))
+
+    logger.info(f"{prefix}_WORKER_POOL: {worker_pool or DEFAULT_WORKER_POOL}")
+
+    return worker_pool
+
+
 def get_default_cpu_count():
     default_cpu_count = os.environ.get("NV_INGEST_MAX_UTIL", int(max(1, math.floor(len(os.sched_getaffinity(0))))))
 
@@ -121,6 +166,7 @@ def add_source_stage(pipe, morpheus_pipeline_config, ingest_config):
                     "client_type": client_type,
                 },
                 "task_queue": task_queue_name,
+                "blob_store_threshold_bytes": int(os.environ.get("BLOB_STORE_THRESHOLD_BYTES", 0)),
             },
         ),
     )
@@ -187,6 +233,8 @@ def add_pdf_extractor_stage(pipe, morpheus_pipeline_config, ingest_config, defau
                 "yolox_endpoints": (yolox_grpc, yolox_http),
                 "yolox_infer_protocol": yolox_protocol,
                 "auth_token": yolox_auth,  # All auth tokens are the same for the moment
+                "page_shard_threshold": int(os.environ.get("PDF_EXTRACTOR_PAGE_SHARD_THRESHOLD", 0)),
+                "page_shard_workers": int(os.environ.get("PDF_EXTRACTOR_PAGE_SHARD_WORKERS", 4)),
             }
         },
     )
@@ -197,6 +245,8 @@ def add_pdf_extractor_stage(pipe, morpheus_pipeline_config, ingest_config, defau
             pe_count=8,
             task="extract",
             task_desc="pdf_content_extractor",
+            payload_transport=get_payload_transport("pdf_extractor"),
+            worker_pool=get_worker_pool("pdf_extractor"),
         )
     )
 
@@ -218,7 +268,13 @@ def add_table_extractor_stage(pipe, morpheus_pipeline_config, ingest_config, def
     )
 
     table_extractor_stage = pipe.add_stage(
-        generate_table_extractor_stage(morpheus_pipeline_config, table_content_extractor_config, pe_count=5)
+        generate_table_extractor_stage(
+            morpheus_pipeline_config,
+            table_content_extractor_config,
+            pe_count=5,
+            payload_transport=get_payload_transport("table_extractor"),
+            worker_pool=get_worker_pool("table_extractor"),
+        )
     )
 
     return table_extractor_stage
@@ -243,12 +299,19 @@ def add_chart_extractor_stage(pipe, morpheus_pipeline_config, ingest_config, def
                 "paddle_endpoints": (paddle_grpc, paddle_http),
                 "paddle_infer_protocol": paddle_protocol,
                 "auth_token": yolox_auth,
+                "max_concurrent_charts": int(os.environ.get("CHART_EXTRACTOR_MAX_CONCURRENT_CHARTS", 8)),
             }
         },
     )
 
     table_extractor_stage = pipe.add_stage(
-        generate_chart_extractor_stage(morpheus_pipeline_config, table_content_extractor_config, pe_count=5)
+        generate_chart_extractor_stage(
+            morpheus_pipeline_config,
+            table_content_extractor_config,
+            pe_count=5,
+            payload_transport=get_payload_transport("chart_extractor"),
+            worker_pool=get_worker_pool("chart_extractor"),
+        )
     )
 
     return table_extractor_stage
@@ -274,6 +337,8 @@ def add_image_extractor_stage(pipe, morpheus_pipeline_config, ingest_config, def
             pe_count=8,
             task="extract",
             task_desc="docx_content_extractor",
+            payload_transport=get_payload_transport("image_extractor"),
+            worker_pool=get_worker_pool("image_extractor"),
         )
     )
     return image_extractor_stage
@@ -286,6 +351,8 @@ def add_docx_extractor_stage(pipe, morpheus_pipeline_config, default_cpu_count):
             pe_count=1,
             task="extract",
             task_desc="docx_content_extractor",
+            payload_transport=get_payload_transport("docx_extractor"),
+            worker_pool=get_worker_pool("docx_extractor"),
         )
     )
     return docx_extractor_stage
@@ -298,6 +365,8 @@ def add_pptx_extractor_stage(pipe, morpheus_pipeline_config, default_cpu_count):
             pe_count=1,
             task="extract",
             task_desc="pptx_content_extractor",
+            payload_transport=get_payload_transport("pptx_extractor"),
+            worker_pool=get_worker_pool("pptx_extractor"),
         )
     )
     return pptx_extractor_stage
@@ -312,6 +381,8 @@ def add_image_dedup_stage(pipe, morpheus_pipeline_config, ingest_config, default
             pe_count=2,
             task="dedup",
             task_desc="dedup_images",
+            payload_transport=get_payload_transport("image_dedup"),
+            worker_pool=get_worker_pool("image_dedup"),
         )
     )
     return image_dedup_stage
@@ -326,15 +397,33 @@ def add_image_filter_stage(pipe, morpheus_pipeline_config, ingest_config, defaul
             pe_count=2,
             task="filter",
             task_desc="filter_images",
+            payload_transport=get_payload_transport("image_filter"),
+            worker_pool=get_worker_pool("image_filter"),
         )
     )
     return image_filter_stage
 
 
+def get_nemo_splitter_config(ingest_config):
+    # The tokenizer env vars fill in whatever the pipeline config's text_splitting_module does not set, so they apply
+    # whether or not that section is present.
+    splitter_config = dict(ingest_config.get("text_splitting_module") or {})
+
+    tokenizer_path = os.getenv("TEXT_SPLITTER_TOKENIZER_PATH")
+    if tokenizer_path and not splitter_config.get("tokenizer_path"):
+        splitter_config["tokenizer_path"] = tokenizer_path
+
+    tokenizer_cache_max_bytes = os.getenv("TEXT_SPLITTER_TOKENIZER_CACHE_MAX_BYTES")
+    if tokenizer_cache_max_bytes is not None:
+        splitter_config.setdefault("tokenizer_cache_max_bytes", int(tokenizer_cache_max_bytes))
+
+    return splitter_config
+
+
 def add_nemo_splitter_stage(pipe, morpheus_pipeline_config, ingest_config):
     nemo_splitter_loader = NemoDocSplitterLoaderFactory.get_instance(
         module_name="nemo_doc_splitter",
-        module_config=ingest_config.get("text_splitting_module", {}),
+        module_config=get_nemo_splitter_config(ingest_config),
     )
     nemo_splitter_stage = pipe.add_stage(
         LinearModulesStage(
@@ -377,6 +466,8 @@ def add_image_caption_stage(pipe, morpheus_pipeline_config, ingest_config, defau
             pe_count=2,
             task="caption",
             task_desc="caption_ext",
+            payload_transport=get_payload_transport("image_caption"),
+            worker_pool=get_worker_pool("image_caption"),
         )
     )
 
@@ -392,7 +483,17 @@ def add_embed_extractions_stage(pipe, morpheus_pipeline_config, ingest_config):
         module_name="embed_extractions",
         module_config=ingest_config.get(
             "embed_extractions_module",
-            {"api_key": api_key, "embedding_nim_endpoint": embedding_nim_endpoint, "embedding_model": embedding_model},
+            {
+                "api_key": api_key,
+                "embedding_nim_endpoint": embedding_nim_endpoint,
+                "embedding_model": embedding_model,
+                "max_batch_wait_ms": int(os.getenv("EMBEDDING_MAX_BATCH_WAIT_MS", 20)),
+                "max_concurrent_requests": int(os.getenv("EMBEDDING_MAX_CONCURRENT_REQUESTS", 8)),
+                "cache_mode": os.getenv("EMBEDDING_CACHE", "off"),
+                "cache_max_bytes": int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+                "cache_dir": os.getenv("EMBEDDING_CACHE_DIR", "/tmp/nv_ingest_embedding_cache"),
+                "cache_dir_max_bytes": int(os.getenv("EMBEDDING_CACHE_DIR_MAX_BYTES", 4 * 1024 * 1024 * 1024)),
+            },
         ),
     )
     embed_extractions_stage = pipe.add_stage(
@@ -415,6 +516,8 @@ def add_embedding_storage_stage(pipe, morpheus_pipeline_config):
             pe_count=2,
             task="store_embedding",
             task_desc="store_embedding_minio",
+            payload_transport=get_payload_transport("embedding_storage"),
+            worker_pool=get_worker_pool("embedding_storage"),
         )
     )
 
@@ -442,6 +545,8 @@ def add_sink_stage(pipe, morpheus_pipeline_config, ingest_config):
                     "port": task_broker_port,
                     "client_type": client_type,
                 },
+                "embedding_dtype": os.environ.get("MESSAGE_BROKER_SINK_EMBEDDING_DTYPE") or None,
+                "blob_store_threshold_bytes": int(os.environ.get("BLOB_STORE_THRESHOLD_BYTES", 0)),
             },
         ),
     )
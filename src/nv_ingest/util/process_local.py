@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from multiprocessing import util as mp_util
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Run before the multiprocessing finalizers that tear down queues and pipes.
+FINALIZER_EXIT_PRIORITY = 50
+
+
+def register_exit_finalizer(callback: Callable[..., Any], *args: Any) -> mp_util.Finalize:
+    """
+    Registers `callback(*args)` to run when the current process exits.
+
+    Unlike `atexit` hooks, multiprocessing finalizers also run in pool workers, which exit without running `atexit`.
+    They run before the finalizers that tear down multiprocessing queues and pipes.
+
+    Parameters
+    ----------
+    callback : Callable
+        The function to call at exit.
+    *args : Any
+        Positional arguments for `callback`.
+
+    Returns
+    -------
+    multiprocessing.util.Finalize
+        The finalizer; call its `cancel()` method if the callback has already run, or is no longer needed.
+    """
+    return mp_util.Finalize(None, callback, args=args, exitpriority=FINALIZER_EXIT_PRIORITY)
+
+
+class ProcessLocal(Generic[T]):
+    """
+    A value created lazily, at most once per process, and never inherited by forked children.
+
+    The first `get()` in a process calls `factory` under a lock and caches what it returns, including None, for example
+    when a feature is disabled by configuration. A forked child starts over: the lock is replaced, as another thread may
+    have held it at fork time, and the parent's value is dropped without being closed, as it may share the parent's
+    sockets or threads.
+
+    Parameters
+    ----------
+    factory : Callable[[], Optional[T]]
+        Creates the process's value.
+
+    Methods
+    -------
+    get()
+        Returns the process's value, creating it on first use.
+    set(value)
+        Replaces the process's value.
+    reset()
+        Forgets the process's value, so the next `get()` creates a new one.
+    """
+
+    def __init__(self, factory: Callable[[], Optional[T]]):
+        self._factory = factory
+        self.reset()
+        os.register_at_fork(after_in_child=self.reset)
+
+    def get(self) -> Optional[T]:
+        if self._configured:
+            return self._value
+
+        with self._lock:
+            if not self._configured:
+                self._value = self._factory()
+                self._configured = True
+
+        return self._value
+
+    def set(self, value: Optional[T]) -> None:
+        with self._lock:
+            self._value = value
+            self._configured = True
+
+    def reset(self) -> None:
+        self._lock = Lock()
+        self._value = None
+        self._configured = False
@@ -3,12 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+import threading
 from collections import defaultdict
-from collections import deque
-from statistics import mean
-from statistics import median
 
-TELEMETRY_WINDOW_SIZE = os.getenv("TELEMETRY_WINDOW_SIZE", 100)
+from nv_ingest.util.telemetry.streaming_stats import DEFAULT_QUANTILES
+from nv_ingest.util.telemetry.streaming_stats import StreamingStat
+
+TELEMETRY_WINDOW_SIZE = int(os.getenv("TELEMETRY_WINDOW_SIZE", 100))
 
 
 class GlobalStats:
@@ -16,7 +17,10 @@ class GlobalStats:
     Singleton class for maintaining global and job-specific statistics within a pipeline.
 
     This class is designed to keep track of various statistics, including the number of submitted and completed jobs,
-    as well as dynamic statistics (mean and median) for job-specific metrics over a sliding window.
+    as well as streaming statistics for job-specific metrics such as stage latencies: mean and median over a sliding
+    window, and cumulative count, mean, min, max, quantiles and a latency histogram (see `StreamingStat`). Updates
+    cost O(1), except for keeping the window sorted for the median, which is O(window size). All access is serialized
+    by a lock, so stages on different threads can record while the telemetry stages read `snapshot()`.
 
     Usage
     -----
@@ -33,6 +37,10 @@ class GlobalStats:
     # Retrieving statistics
     submitted_jobs = global_stats.get_stat("submitted_jobs")
     job_1_mean = global_stats.get_job_stat("job_1", "mean")
+    job_1_p99 = global_stats.get_job_stat("job_1", "p99")
+
+    # Point-in-time copy of everything, as plain values
+    snapshot = global_stats.snapshot()
 
     Methods
     -------
@@ -49,17 +57,20 @@ class GlobalStats:
         Increments a specific global statistic by the given value (default is 1).
 
     append_job_stat(job_name, value):
-        Appends a value to the job-specific statistics and updates the mean and median for the job.
+        Adds a value to the job-specific statistics.
 
     get_stat(stat_name):
         Retrieves the value of a specific global statistic.
 
     get_job_stat(job_name, stat_name):
-        Retrieves the value of a specific job-specific statistic (mean or median).
+        Retrieves the value of a specific job-specific statistic (see `StreamingStat.get`).
 
     get_all_stats():
         Returns a dictionary containing all global and job-specific statistics.
 
+    snapshot(quantiles=DEFAULT_QUANTILES):
+        Returns a consistent, JSON-serializable copy of all statistics.
+
     Attributes
     ----------
     max_jobs : int
@@ -69,7 +80,7 @@ class GlobalStats:
         Dictionary to hold global statistics.
 
     job_stats : defaultdict
-        Dictionary to hold job-specific statistics, with each job having its own deque for values, mean, and median.
+        Dictionary to hold job-specific statistics, with a `StreamingStat` per job.
 
     Example
     -------
@@ -99,46 +110,71 @@ class GlobalStats:
         GlobalStats._instance = self
 
         self.max_jobs = TELEMETRY_WINDOW_SIZE
+        self._lock = threading.Lock()
 
         self.reset_all_stats()
 
     def reset_all_stats(self):
-        self.stats = {
-            "submitted_jobs": 0,
-            "completed_jobs": 0,
-            "failed_jobs": 0,
-        }
-        self.job_stats = defaultdict(lambda: {"values": deque(), "mean": 0.0, "median": 0.0})
+        with self._lock:
+            self.stats = {
+                "submitted_jobs": 0,
+                "completed_jobs": 0,
+                "failed_jobs": 0,
+                "embedding_cache_hits": 0,
+                "embedding_cache_misses": 0,
+                "embedding_cache_bytes_saved": 0,
+            }
+            self.job_stats = defaultdict(lambda: StreamingStat(window_size=self.max_jobs))
 
     def set_stat(self, stat_name, value):
-        self.stats[stat_name] = value
+        with self._lock:
+            self.stats[stat_name] = value
 
     def increment_stat(self, stat_name, value=1):
-        self.stats[stat_name] += value
+        with self._lock:
+            self.stats[stat_name] += value
 
     def append_job_stat(self, job_name, value):
-        job_stat = self.job_stats[job_name]
-        values = job_stat["values"]
-
-        if len(values) >= self.max_jobs:
-            values.popleft()
-        values.append(value)
-
-        job_stat["mean"] = mean(values)
-        job_stat["median"] = median(values)
+        with self._lock:
+            self.job_stats[job_name].add(value)
 
     def get_stat(self, stat_name):
-        if stat_name not in self.stats:
-            raise ValueError(f"Key {stat_name} does not exist.")
-        return self.stats[stat_name]
+        with self._lock:
+            if stat_name not in self.stats:
+                raise ValueError(f"Key {stat_name} does not exist.")
+            return self.stats[stat_name]
 
     def get_job_stat(self, job_name, stat_name):
-        return self.job_stats[job_name][stat_name]
+        with self._lock:
+            return self.job_stats[job_name].get(stat_name)
 
     def get_all_stats(self):
+        return self.snapshot()
+
+    def snapshot(self, quantiles=DEFAULT_QUANTILES):
+        """
+        Returns a point-in-time copy of all statistics as plain, JSON-serializable values.
+
+        Only copying the counters happens under the lock; quantiles are computed from the copies afterwards, so readers
+        such as the OpenTelemetry meter hold up recording stages as little as possible.
+
+        Parameters
+        ----------
+        quantiles : Sequence[float]
+            Quantiles reported for each job statistic.
+
+        Returns
+        -------
+        dict
+            `global_stats`, the global counters, and `job_stats`, a `StreamingStat.snapshot` per job.
+        """
+        with self._lock:
+            global_stats = self.stats.copy()
+            job_stats = {job_name: stat.copy() for job_name, stat in self.job_stats.items()}
+
         return {
-            "global_stats": self.stats.copy(),
-            "job_stats": {job_name: stats.copy() for job_name, stats in self.job_stats.items()},
+            "global_stats": global_stats,
+            "job_stats": {job_name: stat.snapshot(quantiles) for job_name, stat in job_stats.items()},
         }
 
     def __str__(self):
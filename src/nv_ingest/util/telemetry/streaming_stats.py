@@ -0,0 +1,265 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+from bisect import bisect_left
+from bisect import insort
+from collections import deque
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+# Latency bucket upper bounds in milliseconds, matching OpenTelemetry's default explicit bucket boundaries.
+DEFAULT_LATENCY_BUCKETS_MS = (0, 5, 10, 25, 50, 75, 100, 250, 500, 750, 1000, 2500, 5000, 7500, 10000)
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class DDSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch, Masson et al., VLDB 2019).
+
+    Positive values are counted in logarithmically sized buckets, so any quantile is returned within
+    `relative_accuracy` of the true value, whatever the distribution. Values at or below zero share a single bucket.
+    Adding a value is O(1); sketches built with the same accuracy merge by adding bucket counts, so per-worker sketches
+    can be combined into one. The number of buckets grows with the logarithm of the value range: latencies from 1 us to
+    1 h need about 1100 buckets at the default 1% accuracy.
+
+    Parameters
+    ----------
+    relative_accuracy : float
+        Maximum relative error of the reported quantiles, in (0, 1).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value > 0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._bins[key] = self._bins.get(key, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+
+    def merge(self, other: "DDSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def copy(self) -> "DDSketch":
+        sketch = DDSketch(self.relative_accuracy)
+        sketch._bins = self._bins.copy()
+        sketch.zero_count = self.zero_count
+        sketch.count = self.count
+        return sketch
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the estimated `q`-quantile, or None if the sketch is empty.
+
+        Parameters
+        ----------
+        q : float
+            Quantile to estimate, in [0, 1].
+
+        Returns
+        -------
+        Optional[float]
+            The estimate, within `relative_accuracy` of the value of that rank.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be in [0, 1], got {q}")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(key-1), gamma^key], in the relative sense.
+                return 2 * self._gamma**key / (1 + self._gamma)
+
+        return 2 * self._gamma ** max(self._bins) / (1 + self._gamma)
+
+
+class StreamingStat:
+    """
+    Streaming statistics for one series of values, such as the latency of a pipeline stage.
+
+    Two views are kept:
+
+    - over the last `window_size` values: `mean` (running sum, O(1) per value) and `median` (sorted window, kept with
+      a binary search and a list insert and delete, which shift up to `window_size` elements: O(window_size) per
+      value, though a small constant for the default window of 100), as GlobalStats has always reported them;
+    - since creation: `count`, `total_mean`, `min`, `max`, quantiles from a DDSketch, and counts per latency bucket,
+      all O(1) per value.
+
+    The class is not thread-safe on its own; GlobalStats serializes access to it.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of most recent values the windowed mean and median are computed over.
+    bucket_bounds : Sequence[float]
+        Inclusive upper bounds of the histogram buckets; values above the last bound fall in an overflow bucket.
+    relative_accuracy : float
+        Relative accuracy of the quantile sketch.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 100,
+        bucket_bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+        relative_accuracy: float = 0.01,
+    ):
+        self.window_size = window_size
+        self.bucket_bounds = tuple(bucket_bounds)
+
+        self.values = deque()
+        self._sorted_window = []
+        self._window_sum = 0.0
+        self._evictions = 0
+
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = DDSketch(relative_accuracy)
+        self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+
+    def add(self, value: float) -> None:
+        if len(self.values) >= self.window_size:
+            evicted = self.values.popleft()
+            del self._sorted_window[bisect_left(self._sorted_window, evicted)]
+            self._window_sum -= evicted
+            self._evictions += 1
+        self.values.append(value)
+        insort(self._sorted_window, value)
+        self._window_sum += value
+        if self._evictions >= self.window_size:
+            # Resum once per window, so floating-point error from the running updates cannot accumulate.
+            self._window_sum = math.fsum(self.values)
+            self._evictions = 0
+
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+        self.bucket_counts[bisect_left(self.bucket_bounds, value)] += 1
+
+    def merge(self, other: "StreamingStat") -> None:
+        """
+        Folds the cumulative statistics of `other` into this one. The window is left as is, as windows from different
+        sources have no meaningful order.
+        """
+        if other.bucket_bounds != self.bucket_bounds:
+            raise ValueError("Only statistics with the same histogram buckets can be merged.")
+
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        self.bucket_counts = [mine + theirs for mine, theirs in zip(self.bucket_counts, other.bucket_counts)]
+
+    def copy(self) -> "StreamingStat":
+        stat = StreamingStat(self.window_size, self.bucket_bounds, self.sketch.relative_accuracy)
+        stat.values = self.values.copy()
+        stat._sorted_window = self._sorted_window.copy()
+        stat._window_sum = self._window_sum
+        stat._evictions = self._evictions
+        stat.count = self.count
+        stat.total = self.total
+        stat.min = self.min
+        stat.max = self.max
+        stat.sketch = self.sketch.copy()
+        stat.bucket_counts = self.bucket_counts.copy()
+        return stat
+
+    @property
+    def mean(self) -> float:
+        return self._window_sum / len(self.values) if self.values else 0.0
+
+    @property
+    def median(self) -> float:
+        window = self._sorted_window
+        if not window:
+            return 0.0
+        middle = len(window) // 2
+        return window[middle] if len(window) % 2 else (window[middle - 1] + window[middle]) / 2
+
+    def quantile(self, q: float) -> float:
+        estimate = self.sketch.quantile(q)
+        if estimate is None:
+            return 0.0
+        # The sketch's bucket midpoint can fall just outside the observed range.
+        return min(max(estimate, self.min), self.max)
+
+    def get(self, stat_name: str) -> Any:
+        """
+        Returns one statistic by name: `values`, `mean`, `median`, `count`, `total_mean`, `min`, `max`, or a quantile
+        as `p<percent>`, e.g. `p95` or `p99.9`.
+        """
+        if stat_name == "values":
+            return self.values
+        if stat_name in ("mean", "median", "count"):
+            return getattr(self, stat_name)
+        if stat_name == "total_mean":
+            return self.total / self.count if self.count else 0.0
+        if stat_name in ("min", "max"):
+            return getattr(self, stat_name) if self.count else 0.0
+        if stat_name.startswith("p"):
+            try:
+                return self.quantile(float(stat_name[1:]) / 100)
+            except ValueError:
+                pass
+        raise KeyError(stat_name)
+
+    # Job statistics used to be plain dicts; keep `job_stats[name]["mean"]` style access working.
+    __getitem__ = get
+
+    def snapshot(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        Returns the statistics as a dictionary of plain, JSON-serializable values.
+
+        Parameters
+        ----------
+        quantiles : Sequence[float]
+            Quantiles to report, each under the key `p<percent>`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The window's `values` (as a list), windowed `mean` and `median`, cumulative `count`, `total_mean`, `min`,
+            `max` and quantiles, and a `histogram` with the bucket `bounds` and their `counts`, the last count being
+            the overflow bucket.
+        """
+        snapshot = {"values": list(self.values)}
+        snapshot.update(
+            {stat_name: self.get(stat_name) for stat_name in ("mean", "median", "count", "total_mean", "min", "max")}
+        )
+        for q in quantiles:
+            snapshot[f"p{q * 100:g}"] = self.quantile(q)
+        snapshot["histogram"] = {"bounds": list(self.bucket_bounds), "counts": list(self.bucket_counts)}
+
+        return snapshot
@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import uuid
+from typing import Iterable
+from typing import List
+from typing import Literal
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from nv_ingest.schemas.metadata_schema import ContentTypeEnum
+from nv_ingest.util.text_splitting.tokenizer import CachedTokenizer
+
+SplitBy = Literal["word", "sentence", "passage", "token"]
+
+_SPLIT_DELIMITERS = {
+    "passage": "\n\n",
+    "sentence": ".",
+    "word": " ",
+}
+
+
+def get_unit_offsets(text: str, split_by: SplitBy) -> np.ndarray:
+    """
+    Returns the boundaries of the units (words, sentences or passages) of a text.
+
+    Each unit ends just after its delimiter, so unit `i` is `text[offsets[i]:offsets[i + 1]]` and the units
+    concatenate back to `text`.
+
+    Parameters
+    ----------
+    text : str
+        The text to split.
+    split_by : {"word", "sentence", "passage"}
+        Splits after every space, period or blank line respectively.
+
+    Returns
+    -------
+    np.ndarray
+        `n_units + 1` increasing character offsets, starting at 0 and ending at `len(text)`.
+    """
+    delimiter = _SPLIT_DELIMITERS.get(split_by)
+    if delimiter is None:
+        raise NotImplementedError(
+            "DocumentSplitter only supports 'passage', 'sentence', 'word' or 'token' split_by options."
+        )
+
+    parts = text.split(delimiter)
+    lengths = np.fromiter(map(len, parts), dtype=np.int64, count=len(parts))
+    lengths[:-1] += len(delimiter)
+
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    return offsets
+
+
+def _get_document_unit_offsets(
+    texts: List[str], split_by: SplitBy, tokenizer: Optional[CachedTokenizer]
+) -> List[np.ndarray]:
+    if split_by != "token":
+        return [get_unit_offsets(text, split_by) for text in texts]
+
+    if tokenizer is None:
+        raise ValueError("split_by 'token' requires a tokenizer; configure the splitter's tokenizer_path.")
+
+    return tokenizer.get_unit_offsets(texts)
+
+
+def _get_window_offsets(
+    unit_offsets: np.ndarray,
+    split_length: int,
+    split_overlap: int,
+    max_character_length: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    step = split_length - split_overlap
+    if step < 1:
+        raise ValueError("split_overlap must be smaller than split_length.")
+
+    n_units = len(unit_offsets) - 1
+
+    n_windows = 1 if n_units <= split_length else 1 + -(-(n_units - split_length) // step)
+    first_units = np.arange(n_windows, dtype=np.int64) * step
+    starts = unit_offsets[first_units]
+    ends = unit_offsets[np.minimum(first_units + split_length, n_units)]
+    lengths = ends - starts
+
+    if not max_character_length:
+        keep = lengths > 0
+        return starts[keep], ends[keep]
+
+    # Number of pieces each window is cut into; empty windows get none.
+    n_pieces = -(-lengths // max_character_length)
+    window_index = np.repeat(np.arange(n_windows), n_pieces)
+    piece_index = np.arange(len(window_index)) - np.repeat(np.cumsum(n_pieces) - n_pieces, n_pieces)
+
+    piece_starts = starts[window_index] + piece_index * max_character_length
+    piece_ends = np.minimum(piece_starts + max_character_length, ends[window_index])
+
+    return piece_starts, piece_ends
+
+
+def get_split_offsets(
+    text: str,
+    split_by: SplitBy,
+    split_length: int,
+    split_overlap: int,
+    max_character_length: Optional[int],
+    tokenizer: Optional[CachedTokenizer] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the character ranges of the splits of a text.
+
+    Splits are windows of `split_length` units that start every `split_length - split_overlap` units; the last window
+    may be shorter. Windows longer than `max_character_length` characters are cut into consecutive pieces of at most
+    that length, and empty windows are dropped.
+
+    Parameters
+    ----------
+    text : str
+        The text to split.
+    split_by : {"word", "sentence", "passage", "token"}
+        The unit windows are measured in.
+    split_length : int
+        The number of units in each window.
+    split_overlap : int
+        The number of units shared by consecutive windows.
+    max_character_length : int, optional
+        The maximum length of a split, in characters. Not applied when splitting by token.
+    tokenizer : CachedTokenizer, optional
+        The tokenizer used when splitting by token.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The start and end offset of every split in `text`.
+
+    Raises
+    ------
+    ValueError
+        If `split_overlap` is not smaller than `split_length`, or if splitting by token without a tokenizer.
+    """
+    (unit_offsets,) = _get_document_unit_offsets([text], split_by, tokenizer)
+    if split_by == "token":
+        max_character_length = None
+
+    return _get_window_offsets(unit_offsets, split_length, split_overlap, max_character_length)
+
+
+def split_text(
+    text: str,
+    split_by: SplitBy,
+    split_length: int,
+    split_overlap: int,
+    max_character_length: Optional[int],
+    tokenizer: Optional[CachedTokenizer] = None,
+) -> List[str]:
+    """
+    Splits a text into overlapping windows of units. See `get_split_offsets`.
+
+    Returns
+    -------
+    List[str]
+        The splits, in order.
+    """
+    starts, ends = get_split_offsets(text, split_by, split_length, split_overlap, max_character_length, tokenizer)
+    return _slice_splits(text, starts, ends)
+
+
+def _slice_splits(text: str, starts: np.ndarray, ends: np.ndarray) -> List[str]:
+    return [text[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+def get_window_texts(splits: List[str], window_size: int) -> List[str]:
+    """
+    Returns, for every split, the concatenation of the `window_size` splits on either side of it and itself.
+
+    The splits are joined once and each window is sliced out of the result using prefix offsets, rather than
+    re-joining the neighbouring splits for every window.
+
+    Parameters
+    ----------
+    splits : List[str]
+        The splits of one text.
+    window_size : int
+        The number of neighbouring splits on each side.
+
+    Returns
+    -------
+    List[str]
+        One window text per split.
+    """
+    n_splits = len(splits)
+    joined = "".join(splits)
+
+    prefix = np.zeros(n_splits + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, splits), dtype=np.int64, count=n_splits), out=prefix[1:])
+
+    split_index = np.arange(n_splits)
+    window_starts = prefix[np.maximum(split_index - window_size, 0)]
+    window_ends = prefix[np.minimum(split_index + 1 + window_size, n_splits)]
+
+    return [joined[start:end] for start, end in zip(window_starts.tolist(), window_ends.tolist())]
+
+
+def split_documents(
+    metadata_column: Iterable[dict],
+    split_by: SplitBy,
+    split_length: int,
+    split_overlap: int,
+    max_character_length: Optional[int],
+    sentence_window_size: Optional[int],
+    tokenizer: Optional[CachedTokenizer] = None,
+) -> pd.DataFrame:
+    """
+    Splits the content of text documents into chunk documents.
+
+    Each chunk's metadata is a shallow copy of its parent's with "content" replaced by the chunk text (and "window" and
+    "original_text" added when `sentence_window_size` is positive). Nested structures such as source metadata are
+    shared with the parent rather than deep-copied, so they must not be modified in place afterwards. Chunks that are
+    empty or whitespace are dropped.
+
+    Parameters
+    ----------
+    metadata_column : Iterable[dict]
+        The metadata of each text document.
+    split_by : {"word", "sentence", "passage", "token"}
+        The unit splits are measured in.
+    split_length : int
+        The number of units in each chunk.
+    split_overlap : int
+        The number of units shared by consecutive chunks.
+    max_character_length : int, optional
+        The maximum length of a chunk, in characters. Not applied when splitting by token.
+    sentence_window_size : int, optional
+        The number of neighbouring chunks on each side included in each chunk's window text.
+    tokenizer : CachedTokenizer, optional
+        The tokenizer used when splitting by token. All documents are tokenized in one batch.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per chunk, with "document_type", "metadata" and "uuid" columns.
+
+    Raises
+    ------
+    ValueError
+        If a document has no content, or if splitting by token without a tokenizer.
+    """
+    metadata_column = list(metadata_column)
+    contents = [metadata["content"] for metadata in metadata_column]
+    if any(content is None for content in contents):
+        raise ValueError("DocumentSplitter only works with text documents but one or more 'content' values are None.")
+
+    if split_by == "token":
+        max_character_length = None
+    unit_offsets = _get_document_unit_offsets(contents, split_by, tokenizer)
+
+    chunk_metadata = []
+    for metadata, content, offsets in zip(metadata_column, contents, unit_offsets):
+        starts, ends = _get_window_offsets(offsets, split_length, split_overlap, max_character_length)
+        splits = _slice_splits(content, starts, ends)
+        windows = get_window_texts(splits, sentence_window_size) if sentence_window_size else None
+
+        for i, split in enumerate(splits):
+            if not split.strip():
+                continue
+
+            chunk = dict(metadata)
+            if windows is not None:
+                chunk["window"] = windows[i]
+                chunk["original_text"] = split
+            chunk["content"] = split
+            chunk_metadata.append(chunk)
+
+    n_chunks = len(chunk_metadata)
+
+    return pd.DataFrame(
+        {
+            "document_type": [ContentTypeEnum.TEXT.value] * n_chunks,
+            "metadata": chunk_metadata,
+            "uuid": [str(uuid.uuid4()) for _ in range(n_chunks)],
+        }
+    )
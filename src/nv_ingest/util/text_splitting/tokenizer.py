@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import functools
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+
+from nv_ingest.util.nim.inference_cache import InferenceCache
+from nv_ingest.util.nim.inference_cache import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+class CachedTokenizer:
+    """
+    Computes token boundaries with a local tokenizer, caching them by text.
+
+    Texts are looked up in the cache by a hash of the tokenizer name and the text, and all misses are tokenized in one
+    `encode_batch` call, so repeated strings (across documents, messages or jobs handled by the same process) are only
+    tokenized once.
+
+    Parameters
+    ----------
+    tokenizer : tokenizers.Tokenizer
+        The tokenizer, or any object with a compatible `encode_batch(texts, add_special_tokens=False)` whose results
+        have character `offsets`.
+    name : str
+        Identifies the tokenizer in cache keys, such as the path it was loaded from.
+    cache : InferenceCache, optional
+        The cache of token boundaries. By default nothing is cached.
+
+    Methods
+    -------
+    get_unit_offsets(texts)
+        Returns the token boundaries of each text.
+    count_tokens(texts)
+        Returns the number of tokens in each text.
+    get_cache_metrics()
+        Returns the cache counters.
+    """
+
+    def __init__(self, tokenizer: Any, name: str, cache: Optional[InferenceCache] = None):
+        self._tokenizer = tokenizer
+        self._name = name
+        self._cache = cache
+
+    def _encode(self, texts: List[str]) -> List[np.ndarray]:
+        encodings = self._tokenizer.encode_batch(texts, add_special_tokens=False)
+
+        unit_offsets = []
+        for text, encoding in zip(texts, encodings):
+            token_starts = np.fromiter((start for start, _ in encoding.offsets), dtype=np.int64)
+            offsets = np.empty(max(len(token_starts), 1) + 1, dtype=np.int64)
+            offsets[1:-1] = token_starts[1:]
+            offsets[0] = 0
+            offsets[-1] = len(text)
+            # Tokens that share a character (e.g. byte-level pieces of one code point) start at the same offset.
+            np.maximum.accumulate(offsets, out=offsets)
+            unit_offsets.append(offsets)
+
+        return unit_offsets
+
+    def get_unit_offsets(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Returns the token boundaries of each text.
+
+        Token `i` of a text covers `text[offsets[i]:offsets[i + 1]]`, including any whitespace before the next token,
+        so the tokens concatenate back to the text. A text without tokens is a single unit.
+
+        Parameters
+        ----------
+        texts : List[str]
+            The texts to tokenize.
+
+        Returns
+        -------
+        List[np.ndarray]
+            `n_tokens + 1` increasing character offsets per text, starting at 0 and ending at the text's length.
+        """
+        if self._cache is None:
+            return self._encode(texts)
+
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        miss_indices: Dict[str, List[int]] = {}
+        miss_texts = []
+        for index, text in enumerate(texts):
+            key = make_cache_key(self._name, None, text)
+            indices = miss_indices.get(key)
+            if indices is not None:
+                indices.append(index)
+                continue
+
+            hit, offsets = self._cache.get(key)
+            if hit:
+                results[index] = offsets
+            else:
+                miss_indices[key] = [index]
+                miss_texts.append(text)
+
+        if miss_texts:
+            for (key, indices), offsets in zip(miss_indices.items(), self._encode(miss_texts)):
+                self._cache.put(key, offsets)
+                for index in indices:
+                    results[index] = offsets
+
+        return results
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """
+        Returns the number of tokens in each text.
+
+        Parameters
+        ----------
+        texts : List[str]
+            The texts to tokenize.
+
+        Returns
+        -------
+        List[int]
+            The token count of each text; empty or whitespace texts count as one.
+        """
+        return [len(offsets) - 1 for offsets in self.get_unit_offsets(texts)]
+
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the cache counters, or an empty dictionary when there is no cache. See `InferenceCache.get_metrics`.
+        """
+        return self._cache.get_metrics() if self._cache is not None else {}
+
+
+@functools.lru_cache(maxsize=None)
+def load_tokenizer(tokenizer_path: str, cache_max_bytes: int = 0) -> CachedTokenizer:
+    """
+    Loads a tokenizer from a local `tokenizer.json` file. Each process loads a given file once.
+
+    Parameters
+    ----------
+    tokenizer_path : str
+        The path of a Hugging Face `tokenizers` JSON file, such as the `tokenizer.json` shipped with the embedding
+        model.
+    cache_max_bytes : int
+        The size of the in-process cache of token boundaries, or 0 for no cache.
+
+    Returns
+    -------
+    CachedTokenizer
+        The tokenizer.
+    """
+    from tokenizers import Tokenizer
+
+    logger.info(f"Loading tokenizer from {tokenizer_path}")
+    tokenizer = Tokenizer.from_file(tokenizer_path)
+    cache = InferenceCache(max_bytes=cache_max_bytes) if cache_max_bytes > 0 else None
+
+    return CachedTokenizer(tokenizer, tokenizer_path, cache=cache)
@@ -176,7 +176,10 @@ def traceable_func(trace_name=None, dedupe=True):
                 trace_entry_key += "_{}"
                 trace_exit_key += "_{}"
                 i = 0
-                while (trace_entry_key.format(i) in trace_info) or (trace_exit_key.format(i) in trace_info):
+                # Claim the index with setdefault so concurrent calls sharing `trace_info` never reuse a key.
+                while (trace_exit_key.format(i) in trace_info) or (
+                    trace_info.setdefault(trace_entry_key.format(i), ts_entry) is not ts_entry
+                ):
                     i += 1
                 trace_entry_key = trace_entry_key.format(i)
                 trace_exit_key = trace_exit_key.format(i)
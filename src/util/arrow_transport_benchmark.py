@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark comparing the "pickle" and "arrow" payload transports of MultiProcessingBaseStage.
+
+A DataFrame of base64-like content is sent through ProcessWorkerPoolSingleton to a pass-through
+worker and back, the same round trip a stage performs. Reports MB/s and the peak RSS of the parent
+and worker processes combined. Each payload size runs in a fresh interpreter so peak RSS is not
+carried over from a previous scenario.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import click
+import pandas as pd
+import psutil
+
+ROW_BYTES = 1024 * 1024
+
+
+def passthrough(df, task_props):
+    df["processed"] = True
+    return df
+
+
+def make_payload(size_mb):
+    rows = max(1, size_mb)
+    return pd.DataFrame(
+        {
+            "source_id": [f"doc_{i}" for i in range(rows)],
+            "content": [f"{i:08d}" + "A" * (ROW_BYTES - 8) for i in range(rows)],
+        }
+    )
+
+
+class PeakRSSSampler:
+    """Samples the combined RSS of this process and its children on a background thread."""
+
+    def __init__(self, interval=0.01):
+        self._interval = interval
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak = 0
+
+    def _sample(self):
+        total = self._process.memory_info().rss
+        for child in self._process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._sample())
+            time.sleep(self._interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_scenario(transport, size_mb, iterations):
+    from nv_ingest.util.multi_processing import ProcessWorkerPoolSingleton
+    from nv_ingest.util.multi_processing.arrow_transport import read_arrow_handle_as_dataframe
+    from nv_ingest.util.multi_processing.arrow_transport import run_with_arrow_payload
+    from nv_ingest.util.multi_processing.arrow_transport import write_arrow_handle
+
+    pool = ProcessWorkerPoolSingleton()
+    df = make_payload(size_mb)
+    payload_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+    try:
+        with PeakRSSSampler() as sampler:
+            baseline_rss = sampler._sample()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                if transport == "arrow":
+                    handle = write_arrow_handle(df)
+                    handle = pool.submit_task(run_with_arrow_payload, (passthrough, handle, {})).result()
+                    result = read_arrow_handle_as_dataframe(handle)
+                else:
+                    result = pool.submit_task(passthrough, (df, {})).result()
+                assert len(result) == len(df)
+                del result
+            elapsed = time.perf_counter() - start
+    finally:
+        pool.close()
+
+    return {
+        "transport": transport,
+        "payload_mb": payload_mb,
+        "mb_per_sec": payload_mb * iterations / elapsed,
+        "peak_rss_mb": sampler.peak / (1024 * 1024),
+        "rss_growth_mb": (sampler.peak - baseline_rss) / (1024 * 1024),
+    }
+
+
+@click.command()
+@click.option("--sizes", default="10,100,500", help="Comma separated payload sizes in MB")
+@click.option("--iterations", default=5, help="Round trips per scenario")
+@click.option("--transports", default="pickle,arrow", help="Comma separated transports to compare")
+@click.option("--scenario", default=None, hidden=True, help="Run a single transport:size scenario and print JSON")
+def main(sizes, iterations, transports, scenario):
+    if scenario:
+        transport, size_mb = scenario.split(":")
+        print(json.dumps(run_scenario(transport, int(size_mb), iterations)))
+        return
+
+    print(f"{'transport':<10} {'MB':>8} {'MB/s':>10} {'peak RSS MB':>12} {'RSS growth MB':>14}")
+    for size_mb in [int(s) for s in sizes.split(",")]:
+        for transport in transports.split(","):
+            out = subprocess.run(
+                [sys.executable, __file__, "--iterations", str(iterations), "--scenario", f"{transport}:{size_mb}"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            stats = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"{stats['transport']:<10} {stats['payload_mb']:>8.1f} {stats['mb_per_sec']:>10.1f} "
+                f"{stats['peak_rss_mb']:>12.1f} {stats['rss_growth_mb']:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
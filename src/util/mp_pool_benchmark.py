@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark comparing the result path of ProcessWorkerPoolSingleton against the previous
+Manager-backed future implementation.
+
+Each client thread submits a DataFrame, waits for its result, and repeats, which mirrors how
+MultiProcessingBaseStage drives the pool. Reports tasks/sec and p50/p99 round-trip latency.
+"""
+
+import logging
+import math
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+import numpy as np
+import pandas as pd
+
+from nv_ingest.util.multi_processing import ProcessWorkerPoolSingleton
+
+logger = logging.getLogger(__name__)
+
+
+class ManagerFuture:
+    """The previous SimpleFuture: result, exception and completion all live in a Manager server process."""
+
+    def __init__(self, manager):
+        self._result = manager.Value("i", None)
+        self._exception = manager.Value("i", None)
+        self._done = manager.Event()
+
+    def set_result(self, result):
+        self._result.value = result
+        self._done.set()
+
+    def set_exception(self, exception):
+        self._exception.value = exception
+        self._done.set()
+
+    def result(self):
+        self._done.wait()
+        if self._exception.value is not None:
+            raise self._exception.value
+        return self._result.value
+
+
+class ManagerPool:
+    """Minimal reproduction of the previous Manager-backed ProcessWorkerPoolSingleton."""
+
+    def __init__(self, n_workers):
+        self._n_workers = n_workers
+        self._context = mp.get_context("fork")
+        self._task_queue = self._context.Queue()
+        self._manager = mp.Manager()
+        self._processes = []
+        for _ in range(n_workers):
+            p = self._context.Process(target=self._worker, args=(self._task_queue,))
+            p.start()
+            self._processes.append(p)
+
+    @staticmethod
+    def _worker(task_queue):
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            future, process_fn, args = task
+            try:
+                future.set_result(process_fn(*args[0]))
+            except Exception as e:
+                future.set_exception(e)
+
+    def submit_task(self, process_fn, *args):
+        future = ManagerFuture(self._manager)
+        self._task_queue.put((future, process_fn, args))
+        return future
+
+    def close(self):
+        for _ in self._processes:
+            self._task_queue.put(None)
+        for p in self._processes:
+            p.join()
+        self._manager.shutdown()
+
+
+def passthrough_task(df):
+    df["processed"] = True
+    return df
+
+
+def make_dataframe(rows, content_bytes):
+    # Distinct strings per row so pickle cannot memoize a shared object.
+    return pd.DataFrame(
+        {
+            "source_id": [f"doc_{i}" for i in range(rows)],
+            "content": [f"{i:08d}" + "A" * content_bytes for i in range(rows)],
+        }
+    )
+
+
+def run_closed_loop(pool, df, num_tasks, concurrency):
+    latencies = []
+    lock = threading.Lock()
+    per_client = math.ceil(num_tasks / concurrency)
+
+    def client():
+        local = []
+        for _ in range(per_client):
+            start = time.perf_counter()
+            pool.submit_task(passthrough_task, (df,)).result()
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for f in [executor.submit(client) for _ in range(concurrency)]:
+            f.result()
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1000.0
+    return {
+        "tasks_per_sec": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+    }
+
+
+@click.command()
+@click.option("--num_tasks", default=200, help="Number of tasks per scenario")
+@click.option("--concurrency", default=0, help="Concurrent submitters (default: number of pool workers)")
+@click.option("--small_rows", default=10, help="Rows in the small DataFrame scenario")
+@click.option("--small_bytes", default=1024, help="Bytes of content per row in the small DataFrame scenario")
+@click.option("--large_rows", default=100, help="Rows in the large DataFrame scenario")
+@click.option("--large_bytes", default=256 * 1024, help="Bytes of content per row in the large DataFrame scenario")
+def main(num_tasks, concurrency, small_rows, small_bytes, large_rows, large_bytes):
+    n_workers = math.floor(max(1, len(os.sched_getaffinity(0)) * 0.4))
+    concurrency = concurrency or n_workers
+
+    scenarios = {
+        "small": make_dataframe(small_rows, small_bytes),
+        "large": make_dataframe(large_rows, large_bytes),
+    }
+    implementations = {
+        "manager": lambda: ManagerPool(n_workers),
+        "pipe+shm": ProcessWorkerPoolSingleton,
+    }
+
+    print(f"workers={n_workers} concurrency={concurrency} tasks={num_tasks}")
+    print(f"{'impl':<10} {'scenario':<8} {'MB/task':>8} {'tasks/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for impl_name, make_pool in implementations.items():
+        pool = make_pool()
+        try:
+            for scenario_name, df in scenarios.items():
+                size_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+                run_closed_loop(pool, df, min(num_tasks, concurrency * 2), concurrency)  # warm up
+                stats = run_closed_loop(pool, df, num_tasks, concurrency)
+                print(
+                    f"{impl_name:<10} {scenario_name:<8} {size_mb:>8.2f} {stats['tasks_per_sec']:>10.1f} "
+                    f"{stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f}"
+                )
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of page rasterization for the table and chart detection path of the pdfium extractor.
+
+Renders every page of a PDF the way the extractor used to (at `--dpi`, through PIL, then downsampled to fit
+`--target` with a LANCZOS thumbnail) and with `target_resolution` (rendered once at the scale that fits the target,
+into a reused buffer, without PIL), optionally also in grayscale. Reports the mean time per page and the peak memory
+allocated while rendering one page, as traced by tracemalloc (numpy and pypdfium2's ctypes buffers are traced).
+"""
+
+import time
+import tracemalloc
+
+import click
+import pypdfium2 as pdfium
+
+from nv_ingest.util.pdf.pdfium import pdfium_pages_to_numpy
+
+
+def _measure(pages, repeats, **kwargs):
+    # Warm up, so that the reused render buffer is not counted as a per-page allocation.
+    pdfium_pages_to_numpy(pages[:1], **kwargs)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for page in pages:
+            pdfium_pages_to_numpy([page], **kwargs)
+    per_page_ms = (time.perf_counter() - start) * 1000.0 / (repeats * len(pages))
+
+    peak_bytes = 0
+    for page in pages:
+        tracemalloc.start()
+        images, _ = pdfium_pages_to_numpy([page], **kwargs)
+        peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return per_page_ms, peak_bytes, images[0].shape
+
+
+@click.command()
+@click.argument("pdf_path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--dpi", default=300, help="Render DPI of the downsampling path, and the cap of the targeted path")
+@click.option("--target", default=1536, help="Width and height pages are fitted within")
+@click.option("--repeats", default=3, help="Times each page is rendered for timing")
+def main(pdf_path, dpi, target, repeats):
+    doc = pdfium.PdfDocument(pdf_path)
+    pages = [doc[i] for i in range(len(doc))]
+    target_resolution = (target, target)
+
+    modes = {
+        "downsample": dict(render_dpi=dpi, scale_tuple=target_resolution),
+        "target": dict(render_dpi=dpi, target_resolution=target_resolution),
+        "target-gray": dict(render_dpi=dpi, target_resolution=target_resolution, grayscale=True),
+    }
+
+    print(f"{len(pages)} pages, dpi={dpi}, target={target}x{target}")
+    print(f"{'mode':<12} {'ms/page':>9} {'peak MB':>9} {'speedup':>8}  output")
+    baseline_ms = None
+    for name, kwargs in modes.items():
+        per_page_ms, peak_bytes, shape = _measure(pages, repeats, **kwargs)
+        baseline_ms = baseline_ms or per_page_ms
+        print(f"{name:<12} {per_page_ms:>9.1f} {peak_bytes / 2**20:>9.1f} {baseline_ms / per_page_ms:>7.1f}x  {shape}")
+
+
+if __name__ == "__main__":
+    main()
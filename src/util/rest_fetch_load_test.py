@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Load test of the REST service's `fetch_job` path against a live Redis server, with a blocking and an asyncio Redis
+client.
+
+Inside one event loop, as in the uvicorn worker, `--pending` clients poll jobs that are still running (each fetch
+waits `--fetch_timeout` seconds and then times out, which the service returns as a 202) while `--ready` fetches of
+finished jobs arrive at the same time. Reports the wall time and the p50/p99 latency of the ready fetches. With the
+blocking client (the service's previous `RedisClient`), each waiting fetch holds the event loop, so the ready fetches
+queue behind all of the pending ones; with `AsyncRedisClient` they complete immediately.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+import click
+import numpy as np
+import redis
+
+from nv_ingest.util.message_brokers.redis.async_redis_client import AsyncRedisClient
+from nv_ingest.util.message_brokers.redis.redis_client import RedisClient
+
+
+class BlockingFetcher:
+    """The service's previous fetch path: a synchronous client called from a coroutine."""
+
+    def __init__(self, host, port):
+        self._client = RedisClient(host=host, port=port)
+
+    async def fetch_message(self, channel_name, timeout):
+        return self._client.fetch_message(channel_name, timeout=timeout)
+
+    async def ping(self):
+        return self._client.ping()
+
+    async def close(self):
+        pass
+
+
+def _job_result(job_id):
+    return json.dumps({"status": "success", "description": "", "data": [{"job_id": job_id}]})
+
+
+async def run_scenario(fetcher, host, port, pending, ready, fetch_timeout):
+    run_id = uuid.uuid4().hex
+    pending_ids = [f"load_test:{run_id}:pending:{i}" for i in range(pending)]
+    ready_ids = [f"load_test:{run_id}:ready:{i}" for i in range(ready)]
+
+    setup_client = redis.Redis(host=host, port=port)
+    for job_id in ready_ids:
+        setup_client.rpush(job_id, _job_result(job_id))
+
+    # Open the pool's connections up front, as they would be in a long-running service.
+    await asyncio.gather(*[fetcher.ping() for _ in range(pending + ready)])
+
+    # Every request arrives at the start, so latencies are measured from there, including time spent queued.
+    start = time.perf_counter()
+
+    async def _fetch(job_id):
+        try:
+            await fetcher.fetch_message(job_id, timeout=fetch_timeout)
+        except TimeoutError:
+            pass
+        return time.perf_counter() - start
+
+    pending_tasks = [asyncio.create_task(_fetch(job_id)) for job_id in pending_ids]
+    await asyncio.sleep(0)  # Let the pending fetches start waiting first.
+    ready_latencies = await asyncio.gather(*[_fetch(job_id) for job_id in ready_ids])
+    await asyncio.gather(*pending_tasks)
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(ready_latencies) * 1000.0
+    return {
+        "elapsed_s": elapsed,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+    }
+
+
+@click.command()
+@click.option("--redis_host", default="localhost", help="Redis host")
+@click.option("--redis_port", default=6379, help="Redis port")
+@click.option("--pending", default=4, help="Concurrent fetches of jobs that are still running")
+@click.option("--ready", default=200, help="Concurrent fetches of finished jobs")
+@click.option("--fetch_timeout", default=1.0, help="Seconds a fetch waits for a running job (5 in the service)")
+def main(redis_host, redis_port, pending, ready, fetch_timeout):
+    fetchers = {
+        "blocking": lambda: BlockingFetcher(redis_host, redis_port),
+        "asyncio": lambda: AsyncRedisClient(redis_host, redis_port, max_pool_size=pending + ready),
+    }
+
+    print(f"pending={pending} ready={ready} fetch_timeout={fetch_timeout}s")
+    print(f"{'client':<10} {'wall s':>8} {'ready p50 ms':>13} {'ready p99 ms':>13}")
+    for name, make_fetcher in fetchers.items():
+
+        async def _run():
+            fetcher = make_fetcher()
+            try:
+                return await run_scenario(fetcher, redis_host, redis_port, pending, ready, fetch_timeout)
+            finally:
+                await fetcher.close()
+
+        stats = asyncio.run(_run())
+        print(f"{name:<10} {stats['elapsed_s']:>8.2f} {stats['p50_ms']:>13.2f} {stats['p99_ms']:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
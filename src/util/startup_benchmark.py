@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cold-start profile of the pipeline worker and client entry points.
+
+Imports each target in a fresh interpreter with `python -X importtime`, `--runs` times, and reports the median wall
+time of the interpreter plus the modules with the largest cumulative import time. Targets are module names, e.g.
+`nv_ingest_client.nv_ingest_cli` or `nv_ingest.stages.pdf_extractor_stage`; the default set covers the CLI and the
+modules the microservice entrypoint loads before building the pipeline.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import click
+
+DEFAULT_TARGETS = (
+    "nv_ingest_client.nv_ingest_cli",
+    "nv_ingest.schemas",
+    "nv_ingest.extraction_workflows.pdf",
+    "nv_ingest.util.pipeline.stage_builders",
+)
+
+
+def _profile_import(target):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    if result.returncode != 0:
+        raise click.ClickException(f"Importing {target} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            cumulative_us[name.strip()] = int(cumulative)
+
+    return wall_ms, cumulative_us
+
+
+@click.command()
+@click.argument("targets", nargs=-1)
+@click.option("--runs", default=5, help="Fresh interpreters started per target")
+@click.option("--top", default=10, help="Slowest modules reported per target")
+def main(targets, runs, top):
+    for target in targets or DEFAULT_TARGETS:
+        wall_times = []
+        module_times = defaultdict(list)
+        for _ in range(runs):
+            wall_ms, cumulative_us = _profile_import(target)
+            wall_times.append(wall_ms)
+            for name, us in cumulative_us.items():
+                module_times[name].append(us)
+
+        print(f"{target}: {statistics.median(wall_times):.0f} ms median wall time over {runs} runs")
+        slowest = sorted(module_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+        for name, times in slowest[:top]:
+            print(f"  {statistics.median(times) / 1000.0:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark comparing the row-by-row document splitter nemo_doc_splitter used to run with the offset-based
+`split_documents` engine.
+
+A synthetic corpus of one text document per page is split by both implementations with the same settings. The legacy
+path joins unit lists per window, re-joins neighbouring splits for every window text, deep-copies the parent metadata
+for every chunk and builds the output frame from a list of row dictionaries. Reports wall time per implementation,
+chunks per second and the speedup, and checks that both produce the same chunks.
+"""
+
+import copy
+import random
+import time
+import uuid
+
+import click
+import pandas as pd
+
+from nv_ingest.schemas.metadata_schema import ContentTypeEnum
+from nv_ingest.util.text_splitting.splitter import split_documents
+
+_DELIMITERS = {"word": " ", "sentence": ".", "passage": "\n\n"}
+
+_WORDS = [
+    "the",
+    "model",
+    "extracts",
+    "tables",
+    "charts",
+    "and",
+    "text",
+    "from",
+    "each",
+    "page",
+    "of",
+    "document",
+    "pipeline",
+    "embedding",
+    "retrieval",
+]
+
+
+def make_corpus(pages, words_per_page, seed):
+    rng = random.Random(seed)
+    rows = []
+    for page in range(pages):
+        words = []
+        for i in range(words_per_page):
+            words.append(rng.choice(_WORDS))
+            if i % 17 == 16:
+                words[-1] += "."
+            if i % 120 == 119:
+                words[-1] += "\n\n"
+        rows.append(
+            {
+                "document_type": ContentTypeEnum.TEXT.value,
+                "metadata": {
+                    "content": " ".join(words),
+                    "content_metadata": {"type": "text", "page_number": page, "hierarchy": {"page": page}},
+                    "source_metadata": {"source_id": f"doc_{page // 100}.pdf", "source_type": "pdf"},
+                    "text_metadata": {"text_type": "page", "keywords": [], "summary": ""},
+                },
+                "uuid": str(uuid.uuid4()),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def legacy_split_documents(df, split_by, split_length, split_overlap, max_character_length, sentence_window_size):
+    delimiter = _DELIMITERS[split_by]
+    step = split_length - split_overlap
+
+    split_docs = []
+    for _, row in df.iterrows():
+        units = row["metadata"]["content"].split(delimiter)
+        for i in range(len(units) - 1):
+            units[i] += delimiter
+
+        text_splits = []
+        start = 0
+        while True:
+            txt = "".join(units[start : start + split_length])
+            if max_character_length and len(txt) > max_character_length:
+                while txt:
+                    text_splits.append(txt[:max_character_length])
+                    txt = txt[max_character_length:]
+            elif len(txt) > 0:
+                text_splits.append(txt)
+            if start + split_length >= len(units):
+                break
+            start += step
+
+        for i, text in enumerate(text_splits):
+            if not text.strip():
+                continue
+            metadata = copy.deepcopy(row["metadata"])
+            if sentence_window_size > 0:
+                metadata["window"] = "".join(
+                    text_splits[max(0, i - sentence_window_size) : min(i + 1 + sentence_window_size, len(text_splits))]
+                )
+                metadata["original_text"] = text
+            metadata["content"] = text
+            split_docs.append(
+                {"document_type": ContentTypeEnum.TEXT.value, "metadata": metadata, "uuid": str(uuid.uuid4())}
+            )
+
+    return pd.DataFrame(split_docs)
+
+
+def vectorized_split_documents(df, split_by, split_length, split_overlap, max_character_length, sentence_window_size):
+    return split_documents(
+        df["metadata"], split_by, split_length, split_overlap, max_character_length, sentence_window_size
+    )
+
+
+def _chunk_texts(df):
+    return [(m["content"], m.get("window")) for m in df["metadata"]]
+
+
+@click.command()
+@click.option("--pages", default=10_000, help="Number of pages (text documents) in the corpus")
+@click.option("--words-per-page", default=500, help="Words of text per page")
+@click.option("--split-by", type=click.Choice(list(_DELIMITERS)), default="word", help="Unit to split by")
+@click.option("--split-length", default=60, help="Units per chunk")
+@click.option("--split-overlap", default=10, help="Units shared by consecutive chunks")
+@click.option("--max-character-length", default=450, help="Maximum characters per chunk, 0 for no limit")
+@click.option("--sentence-window-size", default=1, help="Neighbouring chunks in each window text, 0 for none")
+@click.option("--iterations", default=3, help="Timed runs per implementation; the best is reported")
+@click.option("--seed", default=0, help="Corpus random seed")
+def main(
+    pages,
+    words_per_page,
+    split_by,
+    split_length,
+    split_overlap,
+    max_character_length,
+    sentence_window_size,
+    iterations,
+    seed,
+):
+    df = make_corpus(pages, words_per_page, seed)
+    corpus_mb = df["metadata"].map(lambda m: len(m["content"])).sum() / (1024 * 1024)
+    args = (split_by, split_length, split_overlap, max_character_length or None, sentence_window_size)
+
+    results = {}
+    for name, fn in [("legacy", legacy_split_documents), ("vectorized", vectorized_split_documents)]:
+        best = float("inf")
+        for _ in range(iterations):
+            start = time.perf_counter()
+            out = fn(df, *args)
+            best = min(best, time.perf_counter() - start)
+        results[name] = (best, out)
+
+    if _chunk_texts(results["legacy"][1]) != _chunk_texts(results["vectorized"][1]):
+        raise click.ClickException("Legacy and vectorized splitters produced different chunks.")
+
+    print(f"corpus: {pages} pages, {corpus_mb:.1f} MB of text")
+    print(f"{'implementation':<14} {'seconds':>10} {'chunks':>10} {'chunks/s':>12}")
+    for name, (elapsed, out) in results.items():
+        print(f"{name:<14} {elapsed:>10.3f} {len(out):>10} {len(out) / elapsed:>12.0f}")
+    print(f"speedup: {results['legacy'][0] / results['vectorized'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark comparing the embedding requests needed for a corpus split by characters and by tokens.
+
+A synthetic corpus is split with the default word/character settings of nemo_doc_splitter and with
+`split_by="token"` using the embedding model's tokenizer. For each, reports the number of chunks, the number of
+embedding requests at the embedding stage's batch size, the tokens sent, how full the chunks are relative to the
+model's input limit and how many chunks exceed it (and would be truncated by the NIM). The token split is run twice to
+show the effect of the tokenization cache on a re-ingested corpus.
+"""
+
+import math
+import random
+import time
+
+import click
+import numpy as np
+
+from nv_ingest.util.nim.inference_cache import InferenceCache
+from nv_ingest.util.text_splitting.splitter import split_documents
+from nv_ingest.util.text_splitting.tokenizer import CachedTokenizer
+
+_WORDS = (
+    "the model extracts tables charts and text from each page of a document before the pipeline computes embeddings "
+    "for retrieval quarterly revenue increased operating margin guidance customers infrastructure accelerated"
+).split()
+
+
+def make_corpus(pages, words_per_page, seed):
+    rng = random.Random(seed)
+    metadata = []
+    for page in range(pages):
+        words = []
+        for i in range(words_per_page):
+            words.append(rng.choice(_WORDS))
+            if i % 17 == 16:
+                words[-1] += "."
+            if i % 120 == 119:
+                words[-1] += "\n\n"
+        metadata.append({"content": " ".join(words), "content_metadata": {"page_number": page}})
+    return metadata
+
+
+def summarize(chunks, tokenizer, batch_size, max_input_tokens):
+    token_counts = np.array(tokenizer.count_tokens(chunks))
+    return {
+        "chunks": len(chunks),
+        "requests": math.ceil(len(chunks) / batch_size),
+        "tokens": int(token_counts.sum()),
+        "fill": float(np.minimum(token_counts, max_input_tokens).mean() / max_input_tokens),
+        "truncated": int((token_counts > max_input_tokens).sum()),
+    }
+
+
+@click.command()
+@click.option("--tokenizer-path", required=True, help="Path of the embedding model's tokenizer.json")
+@click.option("--pages", default=10_000, help="Number of pages (text documents) in the corpus")
+@click.option("--words-per-page", default=500, help="Words of text per page")
+@click.option("--split-length", default=60, help="Words per chunk for the word split")
+@click.option("--split-overlap", default=10, help="Words shared by consecutive chunks for the word split")
+@click.option("--max-character-length", default=450, help="Maximum characters per chunk for the word split")
+@click.option("--token-length", default=500, help="Tokens per chunk for the token split")
+@click.option("--token-overlap", default=50, help="Tokens shared by consecutive chunks for the token split")
+@click.option("--max-input-tokens", default=512, help="Input token limit of the embedding model")
+@click.option("--batch-size", default=100, help="Chunks per embedding request")
+@click.option("--seed", default=0, help="Corpus random seed")
+def main(
+    tokenizer_path,
+    pages,
+    words_per_page,
+    split_length,
+    split_overlap,
+    max_character_length,
+    token_length,
+    token_overlap,
+    max_input_tokens,
+    batch_size,
+    seed,
+):
+    from tokenizers import Tokenizer
+
+    corpus = make_corpus(pages, words_per_page, seed)
+    # The tokenizer used to measure chunks has no cache, so measuring never warms the splitter's cache.
+    counter = CachedTokenizer(Tokenizer.from_file(tokenizer_path), tokenizer_path)
+    splitter_tokenizer = CachedTokenizer(
+        Tokenizer.from_file(tokenizer_path), tokenizer_path, cache=InferenceCache(max_bytes=1024 * 1024 * 1024)
+    )
+
+    results = {}
+    timings = {}
+
+    start = time.perf_counter()
+    df = split_documents(corpus, "word", split_length, split_overlap, max_character_length, 0)
+    timings["word"] = time.perf_counter() - start
+    results["word"] = summarize([m["content"] for m in df["metadata"]], counter, batch_size, max_input_tokens)
+
+    for name in ["token (cold)", "token (cached)"]:
+        start = time.perf_counter()
+        df = split_documents(corpus, "token", token_length, token_overlap, None, 0, tokenizer=splitter_tokenizer)
+        timings[name] = time.perf_counter() - start
+    results["token"] = summarize([m["content"] for m in df["metadata"]], counter, batch_size, max_input_tokens)
+
+    print(f"corpus: {pages} pages, limit {max_input_tokens} tokens, {batch_size} chunks per request")
+    print(f"{'split':<8} {'chunks':>10} {'requests':>10} {'tokens':>12} {'fill':>7} {'truncated':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:<8} {stats['chunks']:>10} {stats['requests']:>10} {stats['tokens']:>12} "
+            f"{stats['fill']:>7.1%} {stats['truncated']:>10}"
+        )
+    saved = 1 - results["token"]["requests"] / results["word"]["requests"]
+    print(f"embedding requests saved by token split: {saved:.1%}")
+
+    print(f"{'split time':<16} {'seconds':>10}")
+    for name, elapsed in timings.items():
+        print(f"{name:<16} {elapsed:>10.3f}")
+    print(f"tokenization cache: {splitter_tokenizer.get_cache_metrics()['memory_hits']} hits")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,23 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
+import threading
 from io import BytesIO
 from io import StringIO
+from unittest.mock import Mock
+from unittest.mock import patch
 
 import pandas as pd
+import pypdfium2 as pdfium
 import pytest
 
+from nv_ingest.extraction_workflows.pdf.pdfium_helper import TableAndChartPipeline
+from nv_ingest.extraction_workflows.pdf.pdfium_helper import _get_page_shards
+from nv_ingest.extraction_workflows.pdf.pdfium_helper import _get_yolox_batch_sizes
+from nv_ingest.extraction_workflows.pdf.pdfium_helper import _merge_trace_info
 from nv_ingest.extraction_workflows.pdf.pdfium_helper import pdfium_extractor
 from nv_ingest.schemas.metadata_schema import TextTypeEnum
+from nv_ingest.schemas.pdf_extractor_schema import PDFiumConfigSchema
 
 
 @pytest.fixture
@@ -215,3 +224,184 @@ def test_pdfium_extractor_table_extraction_on_pdf_with_tables(pdf_stream_embedde
     # Access data in the cloud table
     assert list(dfs[7].columns) == ["Dependency", "Minimum Version", "Notes"]
     assert dfs[7]["Dependency"].to_list() == ["fsspec", "gcsfs", "pandas-gbq", "s3fs"]
+
+
+@pytest.fixture
+def pdfium_config():
+    return PDFiumConfigSchema(yolox_endpoints=("yolox:8001", None), yolox_infer_protocol="grpc")
+
+
+@pytest.mark.parametrize(
+    "page_count,expected",
+    [(0, []), (1, [1]), (3, [2, 1]), (8, [8]), (13, [8, 4, 1]), (20, [8, 8, 4])],
+)
+def test_get_yolox_batch_sizes(page_count, expected):
+    assert _get_yolox_batch_sizes(page_count) == expected
+
+
+def _table_annotation(images):
+    return [{"table": [[0.1, 0.1, 0.5, 0.5, 0.9]], "chart": [], "title": []} for _ in images]
+
+
+def test_table_and_chart_pipeline_overlaps_rendering_with_inference(pdfium_config):
+    doc = pdfium.PdfDocument("data/multimodal_test.pdf")
+    page_count = len(doc)
+    all_pages_rendered = threading.Event()
+    batch_sizes = []
+
+    def mock_infer(data, model_name, **kwargs):
+        batch_sizes.append(len(data["images"]))
+        # The first batch only completes once later pages have been rendered without waiting on it.
+        assert all_pages_rendered.wait(timeout=5)
+        return _table_annotation(data["images"])
+
+    mock_client = Mock()
+    mock_client.infer.side_effect = mock_infer
+
+    with patch.object(TableAndChartPipeline, "_create_yolox_client", return_value=mock_client):
+        pipeline = TableAndChartPipeline(pdfium_config, page_count)
+        for page_idx in range(page_count):
+            page = doc.get_page(page_idx)
+            pipeline.add_page(page, page_idx)
+            page.close()
+        all_pages_rendered.set()
+        tables_and_charts = pipeline.finish()
+
+    assert batch_sizes == [2, 1]
+    assert [page_idx for page_idx, _ in tables_and_charts] == list(range(page_count))
+    assert all(table.type_string == "table" for _, table in tables_and_charts)
+
+
+def test_table_and_chart_pipeline_bounds_inflight_batches(pdfium_config):
+    doc = pdfium.PdfDocument("data/functional_validation.pdf")
+    release = threading.Event()
+    started = []
+
+    def mock_infer(data, model_name, **kwargs):
+        started.append(len(data["images"]))
+        assert release.wait(timeout=5)
+        return _table_annotation(data["images"])
+
+    mock_client = Mock()
+    mock_client.infer.side_effect = mock_infer
+
+    with patch.object(TableAndChartPipeline, "_create_yolox_client", return_value=mock_client):
+        # Five pages are sent as batches of 4 and 1; with one batch in flight the second must wait.
+        pipeline = TableAndChartPipeline(pdfium_config, len(doc), max_inflight_batches=1)
+        for page_idx in range(4):
+            pipeline.add_page(doc.get_page(page_idx), page_idx)
+
+        blocked = threading.Thread(target=pipeline.add_page, args=(doc.get_page(4), 4))
+        blocked.start()
+        blocked.join(timeout=0.5)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(timeout=5)
+        tables_and_charts = pipeline.finish()
+
+    assert started == [4, 1]
+    assert [page_idx for page_idx, _ in tables_and_charts] == [0, 1, 2, 3, 4]
+
+
+def test_table_and_chart_pipeline_raises_inference_failure(pdfium_config):
+    doc = pdfium.PdfDocument("data/multimodal_test.pdf")
+
+    mock_client = Mock()
+    mock_client.infer.side_effect = RuntimeError("Inference error")
+
+    with patch.object(TableAndChartPipeline, "_create_yolox_client", return_value=mock_client):
+        pipeline = TableAndChartPipeline(pdfium_config, len(doc))
+        with pytest.raises(RuntimeError, match="Inference error"):
+            for page_idx in range(len(doc)):
+                pipeline.add_page(doc.get_page(page_idx), page_idx)
+            pipeline.finish()
+
+
+@pytest.mark.parametrize(
+    "page_count,threshold,workers,expected",
+    [
+        (100, 0, 4, [range(100)]),
+        (100, 101, 4, [range(100)]),
+        (100, 100, 1, [range(100)]),
+        (100, 100, 4, [range(0, 25), range(25, 50), range(50, 75), range(75, 100)]),
+        (10, 5, 4, [range(0, 3), range(3, 6), range(6, 9), range(9, 10)]),
+        (5, 2, 8, [range(0, 1), range(1, 2), range(2, 3), range(3, 4), range(4, 5)]),
+    ],
+)
+def test_get_page_shards(page_count, threshold, workers, expected):
+    config = PDFiumConfigSchema(
+        yolox_endpoints=("yolox:8001", None), page_shard_threshold=threshold, page_shard_workers=workers
+    )
+    assert _get_page_shards(page_count, config) == expected
+
+
+def test_get_page_shards_without_pdfium_config():
+    assert _get_page_shards(1000, {}) == [range(1000)]
+
+
+def test_merge_trace_info_renumbers_colliding_entries():
+    trace_info = {"trace::entry::yolox_0": 1, "trace::exit::yolox_0": 2}
+    shard_trace_info = {
+        "trace::entry::yolox_0": 3,
+        "trace::exit::yolox_0": 4,
+        "trace::entry::yolox_1": 5,
+        "trace::exit::yolox_1": 6,
+        "trace::entry::render": 7,
+        "trace::exit::render": 8,
+    }
+
+    _merge_trace_info(trace_info, shard_trace_info)
+
+    assert trace_info == {
+        "trace::entry::yolox_0": 1,
+        "trace::exit::yolox_0": 2,
+        "trace::entry::yolox_1": 3,
+        "trace::exit::yolox_1": 4,
+        "trace::entry::yolox_2": 5,
+        "trace::exit::yolox_2": 6,
+        "trace::entry::render": 7,
+        "trace::exit::render": 8,
+    }
+
+
+@pytest.mark.parametrize("text_depth", ["page", "document"])
+def test_pdfium_extractor_page_shards_match_unsharded(document_df, text_depth):
+    import multiprocessing as mp
+    import sys
+    from concurrent.futures import ProcessPoolExecutor
+
+    pdfium_helper = sys.modules[pdfium_extractor.__module__]
+
+    with open("data/functional_validation.pdf", "rb") as f:
+        pdf_bytes = f.read()
+
+    def extract(threshold):
+        config = PDFiumConfigSchema(
+            yolox_endpoints=("yolox:8001", None), page_shard_threshold=threshold, page_shard_workers=3
+        )
+        return pdfium_extractor(
+            BytesIO(pdf_bytes),
+            extract_text=True,
+            extract_images=False,
+            extract_tables=False,
+            extract_charts=False,
+            row_data=document_df.iloc[0],
+            text_depth=text_depth,
+            pdfium_config=config,
+            trace_info={},
+        )
+
+    # Shard processes normally start from a forkserver; forked ones already have the module imported.
+    with ProcessPoolExecutor(max_workers=3, mp_context=mp.get_context("fork")) as executor:
+        with patch.object(pdfium_helper, "_get_shard_executor", return_value=executor) as mock_get_executor:
+            sharded = extract(threshold=2)
+        assert mock_get_executor.call_count == 1
+
+    unsharded = extract(threshold=0)
+
+    def contents(extracted_data):
+        return [(x[0], x[1]["content"], x[1]["content_metadata"]["page_number"]) for x in extracted_data]
+
+    assert len(sharded) == (5 if text_depth == "page" else 1)
+    assert contents(sharded) == contents(unsharded)
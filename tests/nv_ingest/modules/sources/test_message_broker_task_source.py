@@ -250,3 +250,43 @@ def test_process_message_exception_without_job_id(job_payload):
 
     with pytest.raises(Exception) as exc_info:
         process_message(job, ts_fetched)
+
+
+@pytest.mark.skipif(not MORPHEUS_IMPORT_OK, reason="Morpheus modules are not available.")
+@pytest.mark.skipif(
+    not CUDA_DRIVER_OK,
+    reason="Test environment does not have a compatible CUDA driver.",
+)
+def test_process_message_offloads_large_content(job_payload):
+    """
+    Test that process_message moves large content to the blob store only when a threshold is set.
+    """
+    job = json.loads(job_payload)
+    ts_fetched = datetime.now()
+
+    with patch(f"{MODULE_UNDER_TEST}.offload_job_payload") as mock_offload:
+        process_message(json.loads(job_payload), ts_fetched)
+        mock_offload.assert_not_called()
+
+        process_message(job, ts_fetched, blob_store_threshold_bytes=1024)
+        mock_offload.assert_called_once_with(job, 1024)
+
+
+@pytest.mark.skipif(not MORPHEUS_IMPORT_OK, reason="Morpheus modules are not available.")
+@pytest.mark.skipif(
+    not CUDA_DRIVER_OK,
+    reason="Test environment does not have a compatible CUDA driver.",
+)
+def test_process_message_offload_results_opt_in(job_payload):
+    """
+    Test that process_message marks only jobs submitted with offload_results for result offloading.
+    """
+    ts_fetched = datetime.now()
+
+    result = process_message(json.loads(job_payload), ts_fetched)
+    assert result.get_metadata("offload_results") is None
+
+    job = json.loads(job_payload)
+    job["offload_results"] = True
+    result = process_message(job, ts_fetched)
+    assert result.get_metadata("offload_results") is True
@@ -71,6 +71,19 @@ def test_invalid_endpoint_format():
         )
 
 
+def test_max_concurrent_charts():
+    endpoints = {
+        "cached_endpoints": ("grpc://cached_service", None),
+        "deplot_endpoints": ("grpc://deplot_service", None),
+        "paddle_endpoints": ("grpc://paddle_service", None),
+    }
+    assert ChartExtractorConfigSchema(**endpoints).max_concurrent_charts == 8
+    assert ChartExtractorConfigSchema(**endpoints, max_concurrent_charts=32).max_concurrent_charts == 32
+
+    with pytest.raises(ValidationError):
+        ChartExtractorConfigSchema(**endpoints, max_concurrent_charts=0)
+
+
 # Test cases for ChartExtractorSchema
 def test_chart_extractor_schema_defaults():
     config = ChartExtractorSchema()
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from pydantic import ValidationError
+
+from nv_ingest.schemas.embed_extractions_schema import EmbedExtractionsSchema
+
+
+def test_embed_extractions_schema_defaults():
+    schema = EmbedExtractionsSchema()
+    assert schema.batch_size == 100
+    assert schema.max_batch_wait_ms == 20
+    assert schema.max_concurrent_requests == 8
+    assert schema.progress_engines == 4
+    assert schema.cache_mode == "off"
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("max_batch_wait_ms", -1),
+        ("max_concurrent_requests", 0),
+        ("progress_engines", 0),
+        ("cache_mode", "redis"),
+        ("cache_max_bytes", 0),
+    ],
+)
+def test_embed_extractions_schema_invalid_values(field, value):
+    with pytest.raises(ValidationError):
+        EmbedExtractionsSchema(**{field: value})
+
+
+def test_embed_extractions_schema_forbids_extra_fields():
+    with pytest.raises(ValidationError):
+        EmbedExtractionsSchema(unknown_field=1)
+
+
+def test_embed_extractions_schema_disk_cache_requires_dir():
+    with pytest.raises(ValidationError):
+        EmbedExtractionsSchema(cache_mode="disk")
+
+    schema = EmbedExtractionsSchema(cache_mode="DISK", cache_dir="/tmp/embedding_cache")
+    assert schema.cache_mode == "disk"
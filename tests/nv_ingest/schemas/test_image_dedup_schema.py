@@ -32,3 +32,12 @@ def test_task_type_str_bool_sensitivity(dtype):
 
     with pytest.raises(ValidationError):
         _ = ImageDedupSchema(**img_dedup_module_config)
+
+
+def test_perceptual_hash_threshold():
+    assert ImageDedupSchema().perceptual_hash_threshold == 6
+    assert ImageDedupSchema(perceptual_hash_threshold=10).perceptual_hash_threshold == 10
+
+    for invalid in [-1, 65]:
+        with pytest.raises(ValidationError):
+            ImageDedupSchema(perceptual_hash_threshold=invalid)
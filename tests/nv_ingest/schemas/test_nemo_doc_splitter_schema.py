@@ -67,3 +67,13 @@ def test_document_splitter_schema_optional_fields_none():
     schema = DocumentSplitterSchema(max_character_length=None, sentence_window_size=None)
     assert schema.max_character_length is None
     assert schema.sentence_window_size is None
+
+
+def test_document_splitter_schema_token_requires_tokenizer_path():
+    with pytest.raises(ValidationError) as excinfo:
+        DocumentSplitterSchema(split_by="token")
+    assert "tokenizer_path must be set" in str(excinfo.value)
+
+    schema = DocumentSplitterSchema(split_by="token", split_length=512, tokenizer_path="/models/tokenizer.json")
+    assert schema.tokenizer_path == "/models/tokenizer.json"
+    assert schema.tokenizer_cache_max_bytes == 64 * 1024 * 1024
@@ -44,3 +44,20 @@ def test_redis_task_sink_schema_invalid_progress_engines(progress_engines):
     """
     with pytest.raises(ValidationError):
         MessageBrokerTaskSinkSchema(progress_engines=progress_engines)
+
+
+@pytest.mark.parametrize("embedding_dtype,expected", [(None, None), ("float32", "float32"), ("FLOAT16", "float16")])
+def test_redis_task_sink_schema_embedding_dtype(embedding_dtype, expected):
+    """
+    Test that embedding_dtype defaults to JSON floats and accepts packed float32 or float16, case-insensitively.
+    """
+    schema = MessageBrokerTaskSinkSchema(embedding_dtype=embedding_dtype)
+    assert schema.embedding_dtype == expected
+
+
+def test_redis_task_sink_schema_invalid_embedding_dtype():
+    """
+    Test that unsupported embedding dtypes are rejected.
+    """
+    with pytest.raises(ValidationError):
+        MessageBrokerTaskSinkSchema(embedding_dtype="float64")
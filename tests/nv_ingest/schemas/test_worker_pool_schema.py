@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from pydantic import ValidationError
+
+from nv_ingest.schemas.worker_pool_schema import WorkerPoolSchema
+from nv_ingest.schemas.worker_pool_schema import WorkerPoolsSchema
+
+
+def test_worker_pool_schema_defaults():
+    schema = WorkerPoolSchema(workers=4)
+    assert schema.workers == 4
+    assert schema.max_queue_depth == 0
+    assert schema.cpu_affinity is None
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"workers": 0},
+        {"workers": 1, "max_queue_depth": -1},
+        {"workers": 1, "cpu_affinity": []},
+        {"workers": 1, "cpu_affinity": [-1]},
+        {"workers": 1, "unknown": True},
+    ],
+)
+def test_worker_pool_schema_invalid(config):
+    with pytest.raises(ValidationError):
+        WorkerPoolSchema(**config)
+
+
+def test_worker_pools_schema_defaults():
+    schema = WorkerPoolsSchema()
+    assert schema.pools == {}
+    assert schema.stages == {}
+
+
+def test_worker_pools_schema_stage_assignments():
+    schema = WorkerPoolsSchema(
+        pools={"nim": {"workers": 2, "max_queue_depth": 8, "cpu_affinity": [0, 1]}},
+        stages={"table_extractor": "nim", "pdf_extractor": "default"},
+    )
+    assert schema.pools["nim"].cpu_affinity == [0, 1]
+    assert schema.stages["table_extractor"] == "nim"
+
+
+def test_worker_pools_schema_undefined_pool():
+    with pytest.raises(ValidationError, match="undefined worker pool"):
+        WorkerPoolsSchema(stages={"table_extractor": "nim"})
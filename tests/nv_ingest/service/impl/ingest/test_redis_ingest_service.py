@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import base64
+import json
+import os
+import time
+from collections import defaultdict
+from collections import deque
+
+import pytest
+from nv_ingest_client.util.blob_store import FileBlobStore
+
+from nv_ingest.schemas.message_wrapper_schema import MessageWrapper
+from nv_ingest.service.impl.ingest.redis_ingest_service import RedisIngestService
+from nv_ingest.util.message_brokers.redis.async_redis_client import AsyncRedisClient
+
+MODULE_UNDER_TEST = "nv_ingest.service.impl.ingest.redis_ingest_service"
+
+
+class FakeAsyncRedis:
+    """An in-memory stand-in for redis.asyncio.Redis lists whose BLPOP waits without blocking the event loop."""
+
+    def __init__(self, connection_pool=None):
+        self.lists = defaultdict(deque)
+        self._changed = None
+
+    def _condition(self):
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def rpush(self, name, value):
+        async with self._condition():
+            self.lists[name].append(value)
+            self._condition().notify_all()
+        return len(self.lists[name])
+
+    async def blpop(self, keys, timeout=0):
+        async def _pop():
+            async with self._condition():
+                while True:
+                    for key in keys:
+                        if self.lists[key]:
+                            return key, self.lists[key].popleft()
+                    await self._condition().wait()
+
+        try:
+            return await asyncio.wait_for(_pop(), timeout or None)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def service(redis):
+    service = RedisIngestService("localhost", 6379, "task_queue")
+    service._ingest_client = AsyncRedisClient("localhost", 6379, redis_allocator=lambda connection_pool: redis)
+    return service
+
+
+def _job_result(job_id):
+    return json.dumps({"status": "success", "description": "", "data": [{"job_id": job_id}]})
+
+
+def test_submit_job_queues_the_job(service, redis):
+    job_spec = {
+        "job_payload": {"content": ["abc"], "source_name": ["a"], "source_id": ["a"], "document_type": ["pdf"]},
+        "job_id": "ignored",
+        "tasks": [],
+    }
+
+    job_id = asyncio.run(service.submit_job(MessageWrapper(payload=json.dumps(job_spec)), "job-1"))
+
+    assert job_id == "job-1"
+    assert json.loads(redis.lists["task_queue"][0])["job_id"] == "job-1"
+
+
+def test_submit_job_offloads_large_content(service, redis, tmp_path, monkeypatch):
+    store = FileBlobStore(str(tmp_path))
+    monkeypatch.setattr(f"{MODULE_UNDER_TEST}.BLOB_STORE_THRESHOLD_BYTES", 100)
+    monkeypatch.setattr("nv_ingest_client.util.blob_store.get_blob_store", lambda: store)
+    pdf = os.urandom(1000)
+    job_spec = {
+        "job_payload": {
+            "content": [base64.b64encode(pdf).decode("utf-8")],
+            "source_name": ["a"],
+            "source_id": ["a"],
+            "document_type": ["pdf"],
+        },
+        "job_id": "ignored",
+        "tasks": [],
+    }
+
+    asyncio.run(service.submit_job(MessageWrapper(payload=json.dumps(job_spec)), "job-1"))
+
+    queued = json.loads(redis.lists["task_queue"][0])
+    assert store.get(queued["job_payload"]["content"][0]) == pdf
+
+
+def test_fetch_job(service, redis):
+    redis.lists["job-1"].append(_job_result("job-1"))
+
+    assert asyncio.run(service.fetch_job("job-1"))["data"] == [{"job_id": "job-1"}]
+
+
+def test_fetch_job_resolves_offloaded_results(service, redis, tmp_path, monkeypatch):
+    store = FileBlobStore(str(tmp_path))
+    monkeypatch.setattr("nv_ingest_client.util.blob_store.get_blob_store", lambda: store)
+    image = os.urandom(1000)
+    result = {
+        "status": "success",
+        "description": "",
+        "data": [{"document_type": "image", "metadata": {"content": store.put(image)}}],
+    }
+    redis.lists["job-1"].append(json.dumps(result))
+
+    response = asyncio.run(service.fetch_job("job-1"))
+
+    assert response["data"][0]["metadata"]["content"] == base64.b64encode(image).decode("utf-8")
+
+
+def test_concurrent_fetches_do_not_block_each_other(service, redis):
+    """
+    Load test: one fetch waits on a slow job while many fetches of finished jobs run concurrently.
+
+    With a blocking Redis client, the waiting fetch would hold the event loop until its job finished (or the fetch
+    timed out), so every other request, and the job's own completion, would queue behind it.
+    """
+    slow_job_delay = 1.0
+    n_fast_jobs = 50
+
+    async def _fetch(job_id):
+        start = time.perf_counter()
+        response = await service.fetch_job(job_id)
+        return response["data"][0]["job_id"], time.perf_counter() - start
+
+    async def _finish_slow_job():
+        await asyncio.sleep(slow_job_delay)
+        await redis.rpush("slow", _job_result("slow"))
+
+    async def _run():
+        for i in range(n_fast_jobs):
+            await redis.rpush(f"fast-{i}", _job_result(f"fast-{i}"))
+
+        slow_fetch = asyncio.create_task(_fetch("slow"))
+        finisher = asyncio.create_task(_finish_slow_job())
+        await asyncio.sleep(0.05)  # Let the slow fetch start waiting first.
+
+        fast_results = await asyncio.gather(*[_fetch(f"fast-{i}") for i in range(n_fast_jobs)])
+        slow_result = await slow_fetch
+        await finisher
+
+        return fast_results, slow_result
+
+    fast_results, slow_result = asyncio.run(_run())
+
+    assert [job_id for job_id, _ in fast_results] == [f"fast-{i}" for i in range(n_fast_jobs)]
+    assert max(latency for _, latency in fast_results) < slow_job_delay / 2
+    assert slow_result[0] == "slow"
+    assert slow_job_delay * 0.9 < slow_result[1] < slow_job_delay * 3
+
+
+def test_close_instance(monkeypatch):
+    closed = []
+
+    async def _close(self):
+        closed.append(self)
+
+    monkeypatch.setattr(RedisIngestService, "close", _close)
+    asyncio.run(RedisIngestService.closeInstance())
+    assert closed == []
+
+    instance = RedisIngestService.getInstance()
+    asyncio.run(RedisIngestService.closeInstance())
+
+    assert closed == [instance]
+    assert RedisIngestService.getInstance() is not instance
+    asyncio.run(RedisIngestService.closeInstance())
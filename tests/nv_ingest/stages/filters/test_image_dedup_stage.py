@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+import io
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+from nv_ingest.schemas.image_dedup_schema import ImageDedupSchema
+from nv_ingest.schemas.metadata_schema import ContentTypeEnum
+from nv_ingest.stages.filters.image_dedup import dedup_image_stage
+from nv_ingest.util.image_processing.dedup_index import DiskDedupStore
+from nv_ingest.util.image_processing.dedup_index import ImageDedupIndex
+from nv_ingest.util.image_processing.dedup_index import get_content_hash
+
+MODULE_UNDER_TEST = "nv_ingest.stages.filters.image_dedup"
+
+
+def _image_row(content, source_id, collection_id="docs", page_number=0):
+    return {
+        "document_type": ContentTypeEnum.IMAGE,
+        "metadata": {
+            "content": content,
+            "content_url": "",
+            "content_metadata": {"type": "image", "page_number": page_number},
+            "image_metadata": {"image_type": "png", "uploaded_image_url": ""},
+            "source_metadata": {"source_id": source_id, "collection_id": collection_id},
+        },
+    }
+
+
+@pytest.fixture
+def dedup_index(tmp_path):
+    index = ImageDedupIndex(DiskDedupStore(str(tmp_path)))
+    with patch(f"{MODULE_UNDER_TEST}.get_image_dedup_index", return_value=index):
+        yield index
+
+
+def _run(rows):
+    df = pd.DataFrame(rows)
+    return dedup_image_stage(df, {"content_type": "image", "params": {"filter": True}}, MagicMock())
+
+
+def test_dedup_without_index_only_dedups_within_job():
+    with patch(f"{MODULE_UNDER_TEST}.get_image_dedup_index", return_value=None):
+        first = _run([_image_row("logo", "a.pdf"), _image_row("logo", "a.pdf")])
+        second = _run([_image_row("logo", "b.pdf")])
+
+    assert (first["document_type"] == ContentTypeEnum.IMAGE).sum() == 1
+    assert (second["document_type"] == ContentTypeEnum.IMAGE).sum() == 1
+
+
+def test_images_from_earlier_jobs_become_references(dedup_index):
+    first = _run([_image_row("logo", "a.pdf", page_number=3), _image_row("chart", "a.pdf")])
+    dedup_index.commit("docs", get_content_hash("logo"), "http://minio:9000/nv-ingest/a.pdf/0.png")
+
+    second = _run([_image_row("logo", "b.pdf"), _image_row("photo", "b.pdf")])
+    other_collection = _run([_image_row("logo", "c.pdf", collection_id="other")])
+
+    assert (first["document_type"] == ContentTypeEnum.IMAGE).all()
+    assert second["document_type"].tolist() == [ContentTypeEnum.INFO_MSG, ContentTypeEnum.IMAGE]
+    assert (other_collection["document_type"] == ContentTypeEnum.IMAGE).all()
+
+    reference = second.iloc[0]["metadata"]
+    assert reference["content"] == ""
+    assert reference["content_url"] == "http://minio:9000/nv-ingest/a.pdf/0.png"
+    assert reference["image_metadata"]["uploaded_image_url"] == "http://minio:9000/nv-ingest/a.pdf/0.png"
+    assert reference["info_message_metadata"]["filter"] is True
+    assert "'a.pdf' page 3" in reference["info_message_metadata"]["message"]
+    assert second.iloc[1]["metadata"]["content"] == "photo"
+
+
+def test_images_not_stored_by_the_first_job_keep_their_content(dedup_index):
+    # The first job does not store images, so nothing is committed.
+    _run([_image_row("logo", "a.pdf")])
+
+    second = _run([_image_row("logo", "b.pdf")])
+
+    assert (second["document_type"] == ContentTypeEnum.IMAGE).all()
+    assert second.iloc[0]["metadata"]["content"] == "logo"
+
+
+def test_images_claimed_by_a_failed_job_are_ingested_again(dedup_index):
+    # The first job claims the image, then fails before the storage stage.
+    _run([_image_row("logo", "a.pdf")])
+
+    with patch("nv_ingest.util.image_processing.dedup_index.time.time", return_value=time.time() + 601):
+        retry = _run([_image_row("logo", "b.pdf")])
+    dedup_index.commit("docs", get_content_hash("logo"), "http://minio:9000/nv-ingest/b.pdf/0.png")
+    third = _run([_image_row("logo", "c.pdf")])
+
+    assert retry.iloc[0]["metadata"]["content"] == "logo"
+    assert third["document_type"].tolist() == [ContentTypeEnum.INFO_MSG]
+    assert third.iloc[0]["metadata"]["content_url"] == "http://minio:9000/nv-ingest/b.pdf/0.png"
+    assert "'b.pdf'" in third.iloc[0]["metadata"]["info_message_metadata"]["message"]
+
+
+def _png(array):
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def test_perceptual_dedup_matches_rescaled_copies():
+    gradient = np.tile(np.linspace(0, 255, 64, dtype=np.uint8), (48, 1))
+    original = _png(gradient)
+    rescaled = _png(np.asarray(Image.fromarray(gradient).resize((40, 30))))
+    different = _png(gradient[:, ::-1].copy())
+    rows = [_image_row(original, "a.pdf"), _image_row(rescaled, "a.pdf"), _image_row(different, "a.pdf")]
+
+    with patch(f"{MODULE_UNDER_TEST}.get_image_dedup_index", return_value=None):
+        exact = dedup_image_stage(pd.DataFrame(rows), {"params": {"filter": True}}, ImageDedupSchema())
+        perceptual = dedup_image_stage(
+            pd.DataFrame(rows), {"params": {"filter": True, "method": "perceptual"}}, ImageDedupSchema()
+        )
+
+    assert len(exact) == 3
+    assert [m["content"] for m in perceptual["metadata"]] == [original, different]
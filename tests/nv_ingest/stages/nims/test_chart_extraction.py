@@ -5,7 +5,7 @@ import pytest
 import requests
 import pandas as pd
 
-from nv_ingest.stages.nim.chart_extraction import _update_metadata
+from nv_ingest.stages.nim.chart_extraction import _update_metadata_concurrent
 from nv_ingest.stages.nim.chart_extraction import _extract_chart_data
 
 MODULE_UNDER_TEST = "nv_ingest.stages.nim.chart_extraction"
@@ -92,7 +92,7 @@ def mock_clients_and_requests():
 
     # Patching create_inference_client and requests.post
     with patch(f"{MODULE_UNDER_TEST}.create_inference_client") as mock_create_client, patch(
-        "requests.post"
+        "requests.Session.post"
     ) as mock_requests_post:
         # Mock create_inference_client to return dummy clients
         def side_effect_create_inference_client(endpoints, auth_token, protocol):
@@ -132,7 +132,7 @@ def mock_clients_and_requests_failure():
 
     # Patching create_inference_client and requests.post
     with patch(f"{MODULE_UNDER_TEST}.create_inference_client") as mock_create_client, patch(
-        "requests.post", return_value=mock_response_failure
+        "requests.Session.post", return_value=mock_response_failure
     ) as mock_requests_post:
         # Mock create_inference_client to return dummy clients
         def side_effect_create_inference_client(endpoints, auth_token, protocol):
@@ -148,46 +148,43 @@ def mock_clients_and_requests_failure():
         yield deplot_client, cached_client, mock_create_client, mock_requests_post
 
 
-def test_update_metadata_missing_metadata(dataframe_missing_metadata, mock_clients_and_requests):
+def test_update_metadata_concurrent_missing_metadata(dataframe_missing_metadata, mock_clients_and_requests):
     deplot_client, cached_client, _, _ = mock_clients_and_requests
 
-    row = dataframe_missing_metadata.iloc[0]
     trace_info = {}
     with pytest.raises(ValueError, match="Row does not contain 'metadata'."):
-        _update_metadata(row, cached_client, deplot_client, trace_info)
+        _update_metadata_concurrent(dataframe_missing_metadata, cached_client, deplot_client, 1, trace_info)
 
 
-def test_update_metadata_non_chart_content(dataframe_non_chart, mock_clients_and_requests):
+def test_update_metadata_concurrent_non_chart_content(dataframe_non_chart, mock_clients_and_requests):
     deplot_client, cached_client, _, _ = mock_clients_and_requests
 
-    row = dataframe_non_chart.iloc[0]
+    original_metadata = dataframe_non_chart.iloc[0]["metadata"].copy()
     trace_info = {}
-    result = _update_metadata(row, cached_client, deplot_client, trace_info)
+    result = _update_metadata_concurrent(dataframe_non_chart, cached_client, deplot_client, 1, trace_info)
     # The metadata should remain unchanged
-    assert result == row["metadata"]
+    assert result.iloc[0] == original_metadata
 
 
 @pytest.mark.xfail
-def test_update_metadata_successful_update(sample_dataframe, mock_clients_and_requests):
+def test_update_metadata_concurrent_successful_update(sample_dataframe, mock_clients_and_requests):
     deplot_client, cached_client, _, _ = mock_clients_and_requests
 
-    row = sample_dataframe.iloc[0]
     trace_info = {}
-    result = _update_metadata(row, cached_client, deplot_client, trace_info)
+    result = _update_metadata_concurrent(sample_dataframe, cached_client, deplot_client, 1, trace_info)
     # The table_content should be updated with combined result
     expected_content = "Combined content: cached_result_content + deplot_result_content"
-    assert result["table_metadata"]["table_content"] == expected_content
+    assert result.iloc[0]["table_metadata"]["table_content"] == expected_content
 
 
 @pytest.mark.xfail
-def test_update_metadata_inference_failure(sample_dataframe, mock_clients_and_requests_failure):
+def test_update_metadata_concurrent_inference_failure(sample_dataframe, mock_clients_and_requests_failure):
     deplot_client, cached_client, _, mock_requests_post = mock_clients_and_requests_failure
 
-    row = sample_dataframe.iloc[0]
     trace_info = {}
 
     with pytest.raises(RuntimeError, match="An error occurred during inference: Inference error"):
-        _update_metadata(row, cached_client, deplot_client, trace_info)
+        _update_metadata_concurrent(sample_dataframe, cached_client, deplot_client, 1, trace_info)
 
     # Verify that requests.post was called and raised an exception
     assert mock_requests_post.call_count >= 1  # At least one call failed
@@ -254,3 +251,93 @@ def test_extract_chart_data_inference_failure(sample_dataframe, mock_clients_and
     # Verify that the mocked methods were called
     assert mock_create_client.call_count == 2
     assert mock_requests_post.call_count >= 1  # At least one call failed
+
+
+def _chart_validated_config(max_concurrent_charts):
+    validated_config = Mock()
+    validated_config.stage_config.deplot_endpoints = ("deplot_grpc", None)
+    validated_config.stage_config.cached_endpoints = ("cached_grpc", None)
+    validated_config.stage_config.auth_token = "mock_token"
+    validated_config.stage_config.deplot_infer_protocol = "grpc"
+    validated_config.stage_config.cached_infer_protocol = "grpc"
+    validated_config.stage_config.max_concurrent_charts = max_concurrent_charts
+    return validated_config
+
+
+def _chart_rows(base64_encoded_image, count):
+    rows = [
+        {
+            "content": f"{base64_encoded_image}{i}",
+            "content_metadata": {"type": "structured", "subtype": "chart"},
+            "table_metadata": {"table_content": "original_content"},
+        }
+        for i in range(count)
+    ]
+    rows.insert(1, {"content": "text", "content_metadata": {"type": "text"}, "table_metadata": None})
+    return pd.DataFrame({"metadata": rows})
+
+
+def _mock_chart_clients(infer):
+    clients = {}
+    for model_name in ("cached", "deplot"):
+        client = Mock()
+        client.infer.side_effect = lambda data, model_name, **kwargs: infer(data, model_name)
+        clients[model_name] = client
+    return clients["cached"], clients["deplot"]
+
+
+def test_extract_chart_data_runs_models_and_rows_concurrently(base64_encoded_image):
+    import threading
+    import time
+
+    num_charts = 4
+    max_concurrent_charts = 2
+    lock = threading.Lock()
+    in_flight = {"current": 0, "peak": 0, "calls": 0}
+    first_wave = threading.Barrier(2 * max_concurrent_charts)
+
+    def infer(data, model_name):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            in_flight["calls"] += 1
+            call = in_flight["calls"]
+        try:
+            if call <= 2 * max_concurrent_charts:
+                # Only passes if both model calls for the first two charts are in flight together.
+                first_wave.wait(timeout=5)
+            time.sleep(0.01)
+            return f"{model_name}:{data['base64_image'][-1]}"
+        finally:
+            with lock:
+                in_flight["current"] -= 1
+
+    cached_client, deplot_client = _mock_chart_clients(infer)
+    df = _chart_rows(base64_encoded_image, num_charts)
+
+    with patch(f"{MODULE_UNDER_TEST}._create_clients", return_value=(cached_client, deplot_client)), patch(
+        f"{MODULE_UNDER_TEST}.join_cached_and_deplot_output", side_effect=lambda cached, deplot: f"{cached}|{deplot}"
+    ):
+        updated_df, _ = _extract_chart_data(df, {}, _chart_validated_config(max_concurrent_charts), {})
+
+    assert in_flight["peak"] == 2 * max_concurrent_charts
+    assert cached_client.infer.call_count == num_charts
+    assert deplot_client.infer.call_count == num_charts
+
+    contents = [m["table_metadata"]["table_content"] for m in updated_df["metadata"] if m["table_metadata"]]
+    assert contents == [f"cached:{i}|deplot:{i}" for i in range(num_charts)]
+    assert updated_df.loc[1, "metadata"]["table_metadata"] is None
+
+
+def test_extract_chart_data_concurrent_inference_failure(base64_encoded_image):
+    def infer(data, model_name):
+        if model_name == "deplot" and data["base64_image"].endswith("1"):
+            raise RuntimeError("Inference error")
+        return model_name
+
+    cached_client, deplot_client = _mock_chart_clients(infer)
+    df = _chart_rows(base64_encoded_image, 3)
+
+    with patch(f"{MODULE_UNDER_TEST}._create_clients", return_value=(cached_client, deplot_client)):
+        with pytest.raises(RuntimeError, match="Inference error"):
+            _extract_chart_data(df, {}, _chart_validated_config(2), {})
@@ -42,6 +42,10 @@ class MockPaddleOCRModelInterface:
         )
         table_content_format = "simple"
 
+        data = kwargs.get("data") or {}
+        if "base64_images" in data:
+            return [(table_content, table_content_format)] * len(data["base64_images"])
+
         return table_content, table_content_format
 
     def process_inference_results(self, output, **kwargs):
@@ -67,7 +71,7 @@ def mock_paddle_client_and_requests():
 
     # Patching create_inference_client and requests.post
     with patch(f"{MODULE_UNDER_TEST}.create_inference_client", return_value=paddle_client) as mock_create_client, patch(
-        "requests.post", return_value=mock_response
+        "requests.Session.post", return_value=mock_response
     ) as mock_requests_post:
         yield paddle_client, mock_create_client, mock_requests_post
 
@@ -282,7 +286,7 @@ def test_update_metadata_inference_failure(sample_dataframe, mock_paddle_client_
 
     row = sample_dataframe.iloc[0]
     trace_info = {}
-    with patch("requests.post", return_value=mock_response):
+    with patch("requests.Session.post", return_value=mock_response):
         with pytest.raises(RuntimeError, match="HTTP request failed: Inference error"):
             _update_metadata(row, paddle_client, trace_info)
 
@@ -369,7 +373,7 @@ def test_extract_table_data_image_too_small_2(base64_encoded_small_image):
     model_interface = PaddleOCRModelInterface()
     trace_info = {}
 
-    def mock_create_inference_client(endpoints, model_interface, auth_token, infer_protocol):
+    def mock_create_inference_client(endpoints, model_interface, auth_token, infer_protocol, model_version=None):
         paddle_client = NimClient(model_interface, "http", ("mock_httpendpoint", "mock_grpc_endpoint"))
 
         return paddle_client
@@ -397,8 +401,71 @@ def test_extract_table_data_image_too_small_2(base64_encoded_small_image):
 
     with patch(f"{MODULE_UNDER_TEST}.create_inference_client", side_effect=mock_create_inference_client), patch(
         f"{MODULE_UNDER_TEST}.get_version", return_value="0.1.0"
-    ), patch("requests.post", return_value=mock_response):
+    ), patch("requests.Session.post", return_value=mock_response):
         updated_df, _ = _extract_table_data(df, {}, validated_config, trace_info)
 
     # The table_content should remain unchanged because the image is too small
     assert updated_df.loc[0, "metadata"]["table_metadata"]["table_content"] == ""
+
+
+def _table_row(base64_image, table_content_format="simple"):
+    return {
+        "content": base64_image,
+        "content_metadata": {"type": "structured", "subtype": "table"},
+        "table_metadata": {"table_content": "", "table_content_format": table_content_format},
+    }
+
+
+def test_extract_table_data_batches_tables(base64_encoded_image, base64_encoded_small_image):
+    from nv_ingest.util.nim.paddle import PADDLE_MAX_BATCH_SIZE
+
+    num_tables = PADDLE_MAX_BATCH_SIZE + 2
+    rows = [_table_row(base64_encoded_image) for _ in range(num_tables)]
+    rows.insert(1, _table_row(base64_encoded_small_image))
+    rows.insert(3, {"content": "", "content_metadata": {"type": "text"}, "table_metadata": None})
+    rows.append(_table_row(base64_encoded_image, table_content_format="pseudo_markdown"))
+    df = pd.DataFrame({"metadata": rows})
+
+    validated_config = Mock()
+    validated_config.stage_config.paddle_endpoints = ("mock_endpoint_grpc", "mock_endpoint_http")
+
+    calls = []
+
+    def mock_infer(data, model_name, table_content_format=None, **kwargs):
+        calls.append((len(data["base64_images"]), table_content_format))
+        offset = sum(size for size, fmt in calls[:-1] if fmt == table_content_format)
+        return [(f"{table_content_format}_{offset + i}", table_content_format) for i in range(calls[-1][0])]
+
+    mock_nim_client = Mock(spec=NimClient)
+    mock_nim_client.infer.side_effect = mock_infer
+
+    with patch(f"{MODULE_UNDER_TEST}.create_inference_client", return_value=mock_nim_client), patch(
+        f"{MODULE_UNDER_TEST}.get_version", return_value="0.2.1"
+    ):
+        updated_df, _ = _extract_table_data(df, {}, validated_config, {})
+
+    assert calls == [(PADDLE_MAX_BATCH_SIZE, "simple"), (2, "simple"), (1, "pseudo_markdown")]
+
+    contents = [
+        metadata["table_metadata"]["table_content"]
+        for metadata in updated_df["metadata"]
+        if metadata["table_metadata"] is not None
+    ]
+    expected_simple = [f"simple_{i}" for i in range(num_tables)]
+    assert contents == expected_simple[:1] + [""] + expected_simple[1:] + ["pseudo_markdown_0"]
+
+
+def test_extract_table_data_legacy_version_is_not_batched(sample_dataframe):
+    validated_config = Mock()
+    validated_config.stage_config.paddle_endpoints = ("mock_endpoint_grpc", "mock_endpoint_http")
+
+    mock_nim_client = Mock(spec=NimClient)
+    mock_nim_client.infer.return_value = ("content", "simple")
+
+    with patch(f"{MODULE_UNDER_TEST}.create_inference_client", return_value=mock_nim_client), patch(
+        f"{MODULE_UNDER_TEST}.get_version", return_value="0.1.0"
+    ):
+        updated_df, _ = _extract_table_data(sample_dataframe, {}, validated_config, {})
+
+    assert "base64_image" in mock_nim_client.infer.call_args[0][0]
+    assert updated_df.loc[0, "metadata"]["table_metadata"]["table_content"] == "content"
@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import pandas as pd
 import pytest
+from nv_ingest_client.util.blob_store import FileBlobStore
 
 from nv_ingest.stages.extractors.image_extractor_stage import decode_and_extract
 from nv_ingest.stages.extractors.image_extractor_stage import process_image
@@ -198,3 +199,19 @@ def test_decode_and_extract_handles_exception_in_extraction(mock_image_helpers):
 
     # Verify the exception message
     assert str(excinfo.value) == "Extraction error"
+
+
+@patch(f"{MODULE_UNDER_TEST}.image_helpers")
+def test_decode_and_extract_resolves_blob_reference(mock_image_helpers, tmp_path):
+    mock_func = MagicMock(return_value="extracted_data")
+    mock_image_helpers.image = mock_func
+
+    store = FileBlobStore(str(tmp_path))
+    base64_row = pd.Series({"content": store.put(b"dummy_image_data"), "document_type": "image", "source_id": 1})
+    task_props = {"method": "image", "params": {}}
+
+    with patch("nv_ingest_client.util.blob_store.get_blob_store", return_value=store):
+        result = decode_and_extract(base64_row, task_props, MagicMock(), default="image")
+
+    assert result == "extracted_data"
+    assert mock_func.call_args[0][0].getvalue() == b"dummy_image_data"
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import ctypes
+import multiprocessing as mp
+import queue
+import threading
+
+import pandas as pd
+
+from nv_ingest.stages.multiprocessing_stage import MultiProcessingBaseStage
+from nv_ingest.util.multi_processing.mp_pool_singleton import SimpleFuture
+
+
+class ManualPool:
+    """A stand-in process pool whose futures are resolved explicitly by the test."""
+
+    def __init__(self):
+        self.submitted = []
+        self.cond = threading.Condition()
+
+    def submit_task(self, process_fn, args):
+        future = SimpleFuture()
+        with self.cond:
+            self.submitted.append((future, process_fn, args))
+            self.cond.notify_all()
+        return future
+
+    def wait_for_submissions(self, count, timeout=5.0):
+        with self.cond:
+            return self.cond.wait_for(lambda: len(self.submitted) >= count, timeout=timeout)
+
+    def complete(self, index):
+        future, process_fn, args = self.submitted[index]
+        try:
+            future.set_result(process_fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+
+def _tag(df, task_props):
+    df["tag"] = task_props["tag"]
+    return df
+
+
+def _fail(df, task_props):
+    raise ValueError("processing failed")
+
+
+def _work_package(tag):
+    return {"type": "on_next", "value": {"payload": pd.DataFrame({"a": [1]}), "task_props": {"tag": tag}, "cm_id": tag}}
+
+
+def _start_handler(pool, process_fn, max_in_flight, preserve_order=False):
+    input_queue = queue.Queue()
+    response_queue = queue.Queue()
+    cancellation_token = mp.Value(ctypes.c_int8, False)
+    thread = threading.Thread(
+        target=MultiProcessingBaseStage.work_package_input_handler,
+        args=(input_queue, response_queue, cancellation_token, process_fn, pool, max_in_flight, preserve_order),
+        daemon=True,
+    )
+    thread.start()
+    return input_queue, response_queue, thread
+
+
+def _collect(response_queue):
+    events = []
+    while True:
+        event = response_queue.get(timeout=5.0)
+        if event["type"] == "on_completed":
+            return events
+        events.append(event)
+
+
+def test_submits_up_to_max_in_flight_without_waiting():
+    pool = ManualPool()
+    input_queue, response_queue, thread = _start_handler(pool, _tag, max_in_flight=3)
+
+    for tag in range(5):
+        input_queue.put(_work_package(tag))
+
+    assert pool.wait_for_submissions(3)
+    assert not pool.wait_for_submissions(4, timeout=0.2), "Should not exceed max_in_flight submissions"
+
+    pool.complete(0)
+    assert pool.wait_for_submissions(4), "Completing a package should free an in-flight slot"
+
+    for index in range(1, 4):
+        pool.complete(index)
+    assert pool.wait_for_submissions(5)
+    pool.complete(4)
+
+    input_queue.put({"type": "on_completed"})
+    events = _collect(response_queue)
+    thread.join(timeout=5.0)
+
+    assert sorted(event["value"]["payload"]["tag"][0] for event in events) == list(range(5))
+
+
+def test_results_emitted_in_completion_order():
+    pool = ManualPool()
+    input_queue, response_queue, thread = _start_handler(pool, _tag, max_in_flight=3)
+
+    for tag in range(3):
+        input_queue.put(_work_package(tag))
+    assert pool.wait_for_submissions(3)
+
+    for index in (2, 0, 1):
+        pool.complete(index)
+        event = response_queue.get(timeout=5.0)
+        assert event["value"]["cm_id"] == index
+
+    input_queue.put({"type": "on_completed"})
+    assert _collect(response_queue) == []
+    thread.join(timeout=5.0)
+
+
+def test_results_reordered_when_preserving_order():
+    pool = ManualPool()
+    input_queue, response_queue, thread = _start_handler(pool, _tag, max_in_flight=3, preserve_order=True)
+
+    for tag in range(3):
+        input_queue.put(_work_package(tag))
+    assert pool.wait_for_submissions(3)
+
+    for index in (2, 1, 0):
+        pool.complete(index)
+
+    input_queue.put({"type": "on_completed"})
+    events = _collect(response_queue)
+    thread.join(timeout=5.0)
+
+    assert [event["value"]["cm_id"] for event in events] == [0, 1, 2]
+
+
+def test_completion_waits_for_in_flight_work():
+    pool = ManualPool()
+    input_queue, response_queue, thread = _start_handler(pool, _tag, max_in_flight=2)
+
+    input_queue.put(_work_package(0))
+    input_queue.put({"type": "on_completed"})
+    assert pool.wait_for_submissions(1)
+
+    thread.join(timeout=0.2)
+    assert thread.is_alive(), "Handler should drain in-flight work before completing"
+
+    pool.complete(0)
+    events = _collect(response_queue)
+    thread.join(timeout=5.0)
+
+    assert len(events) == 1
+    assert events[0]["type"] == "on_next"
+
+
+def test_failed_work_package_emits_error():
+    pool = ManualPool()
+    input_queue, response_queue, thread = _start_handler(pool, _fail, max_in_flight=2)
+
+    input_queue.put(_work_package(0))
+    assert pool.wait_for_submissions(1)
+    pool.complete(0)
+
+    input_queue.put({"type": "on_completed"})
+    events = _collect(response_queue)
+    thread.join(timeout=5.0)
+
+    assert events[0]["type"] == "on_error"
+    assert events[0]["value"]["error"] is True
+    assert "processing failed" in events[0]["value"]["error_message"]
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import time
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from nv_ingest.util.image_processing.dedup_index import DiskDedupStore
+from nv_ingest.util.image_processing.dedup_index import ImageDedupIndex
+from nv_ingest.util.image_processing.dedup_index import RedisDedupStore
+from nv_ingest.util.image_processing.dedup_index import _create_image_dedup_index
+from nv_ingest.util.image_processing.dedup_index import get_content_hash
+from nv_ingest.util.image_processing.dedup_index import get_image_dedup_index
+from nv_ingest.util.process_local import ProcessLocal
+
+MODULE_UNDER_TEST = "nv_ingest.util.image_processing.dedup_index"
+
+
+class FakeRedis:
+    """A dict-backed stand-in for the parts of redis.Redis used by RedisDedupStore."""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None, nx=False, xx=False, keepttl=False):
+        if (nx and key in self.store) or (xx and key not in self.store):
+            return None
+        self.store[key] = value
+        if not keepttl:
+            self.expiry[key] = ex
+        return True
+
+
+@pytest.fixture(params=["disk", "redis"])
+def dedup_index(request, tmp_path):
+    if request.param == "disk":
+        return ImageDedupIndex(DiskDedupStore(str(tmp_path)))
+    return ImageDedupIndex(RedisDedupStore(FakeRedis()))
+
+
+def test_first_committed_claim_wins(dedup_index):
+    content_hash = get_content_hash("aW1hZ2U=")
+
+    assert dedup_index.claim("docs", content_hash, {"source_id": "first.pdf"}) is None
+    dedup_index.commit("docs", content_hash, "http://minio:9000/nv-ingest/first.pdf/1.png")
+
+    assert dedup_index.claim("docs", content_hash, {"source_id": "second.pdf"}) == {
+        "source_id": "first.pdf",
+        "content_url": "http://minio:9000/nv-ingest/first.pdf/1.png",
+    }
+    # Collections are deduplicated independently.
+    assert dedup_index.claim("other", content_hash, {"source_id": "third.pdf"}) is None
+    assert dedup_index.get_metrics() == {"claims": 2, "duplicates": 1, "pending": 0, "errors": 0}
+
+
+def test_uncommitted_claims_are_not_duplicates(dedup_index):
+    # The first job has not stored the image yet, or does not store images at all.
+    assert dedup_index.claim("docs", "abc", {"source_id": "first.pdf"}) is None
+
+    assert dedup_index.claim("docs", "abc", {"source_id": "second.pdf"}) is None
+    assert dedup_index.get_metrics() == {"claims": 1, "duplicates": 0, "pending": 1, "errors": 0}
+
+
+def test_expired_claims_are_taken_over(dedup_index):
+    # The first job failed before storing the image.
+    assert dedup_index.claim("docs", "abc", {"source_id": "failed.pdf"}) is None
+
+    with patch(f"{MODULE_UNDER_TEST}.time.time", return_value=time.time() + 601):
+        assert dedup_index.claim("docs", "abc", {"source_id": "retry.pdf"}) is None
+    dedup_index.commit("docs", "abc", "http://minio:9000/nv-ingest/retry.pdf/1.png")
+
+    assert dedup_index.claim("docs", "abc", {"source_id": "third.pdf"}) == {
+        "source_id": "retry.pdf",
+        "content_url": "http://minio:9000/nv-ingest/retry.pdf/1.png",
+    }
+    assert dedup_index.get_metrics() == {"claims": 2, "duplicates": 1, "pending": 0, "errors": 0}
+
+
+def test_commit_keeps_the_first_url(dedup_index):
+    dedup_index.claim("docs", "abc", {"source_id": "first.pdf"})
+
+    dedup_index.commit("docs", "abc", "http://minio:9000/nv-ingest/first.pdf/1.png")
+    dedup_index.commit("docs", "abc", "http://minio:9000/nv-ingest/second.pdf/1.png")
+    dedup_index.commit("docs", "unclaimed", "http://minio:9000/nv-ingest/second.pdf/2.png")
+
+    assert dedup_index.claim("docs", "abc", {}) == {
+        "source_id": "first.pdf",
+        "content_url": "http://minio:9000/nv-ingest/first.pdf/1.png",
+    }
+    assert dedup_index.claim("docs", "unclaimed", {}) is None
+
+
+def test_disk_store_is_shared_and_expires(tmp_path):
+    first = DiskDedupStore(str(tmp_path), ttl=60)
+    second = DiskDedupStore(str(tmp_path), ttl=60)
+
+    assert first.add("c_docs/abc", b"first") is None
+    assert second.add("c_docs/abc", b"second") == b"first"
+    assert not [name for name in os.listdir(tmp_path / "c_docs") if name.endswith(".tmp")]
+
+    with patch(f"{MODULE_UNDER_TEST}.time.time", return_value=time.time() + 61):
+        assert second.add("c_docs/abc", b"second") is None
+    assert first.get("c_docs/abc") == b"second"
+
+
+def test_collection_ids_cannot_escape_the_index(tmp_path):
+    index = ImageDedupIndex(DiskDedupStore(str(tmp_path)))
+
+    index.claim("../outside", "abc", {})
+
+    assert os.listdir(tmp_path) == ["c_..%2Foutside"]
+
+
+def test_redis_store_sets_ttl():
+    redis_client = FakeRedis()
+    index = ImageDedupIndex(RedisDedupStore(redis_client, ttl=3600))
+
+    index.claim("", "abc", {})
+    index.commit("", "abc", "http://minio:9000/nv-ingest/a/1.png")
+
+    assert redis_client.expiry == {"nv_ingest:image_dedup:c_/abc": 3600}
+
+
+def test_store_failures_are_new_images():
+    store = Mock()
+    store.add.side_effect = ConnectionError("redis is down")
+    store.get.side_effect = ConnectionError("redis is down")
+    index = ImageDedupIndex(store)
+
+    assert index.claim("docs", "abc", {}) is None
+    index.commit("docs", "abc", "http://minio:9000/nv-ingest/a/1.png")
+
+    assert index.get_metrics()["errors"] == 2
+
+
+def test_get_image_dedup_index_disabled_by_default():
+    with patch(f"{MODULE_UNDER_TEST}._image_dedup_index", ProcessLocal(_create_image_dedup_index)), patch(
+        f"{MODULE_UNDER_TEST}.IMAGE_DEDUP_INDEX", "off"
+    ):
+        assert get_image_dedup_index() is None
+
+
+def test_get_image_dedup_index_disk_mode(tmp_path):
+    with patch(f"{MODULE_UNDER_TEST}._image_dedup_index", ProcessLocal(_create_image_dedup_index)), patch(
+        f"{MODULE_UNDER_TEST}.IMAGE_DEDUP_INDEX", "disk"
+    ), patch(f"{MODULE_UNDER_TEST}.IMAGE_DEDUP_INDEX_DIR", str(tmp_path)):
+        index = get_image_dedup_index()
+        assert isinstance(index, ImageDedupIndex)
+        assert get_image_dedup_index() is index
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+import io
+import random
+
+import numpy as np
+from PIL import Image
+
+from nv_ingest.util.image_processing.perceptual_hash import MultiIndexHash
+from nv_ingest.util.image_processing.perceptual_hash import compute_dhashes
+from nv_ingest.util.image_processing.perceptual_hash import group_near_duplicates
+
+
+def _make_image(seed, size=(128, 96)):
+    rng = np.random.default_rng(seed)
+    # Smooth random structure, like a chart or photo, rather than per-pixel noise.
+    coarse = rng.integers(0, 256, size=(6, 8, 3), dtype=np.uint8)
+    return Image.fromarray(coarse).resize(size, Image.Resampling.BICUBIC)
+
+
+def _encode(image, fmt="PNG", **kwargs):
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, **kwargs)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def _distance(a, b):
+    return (int(a) ^ int(b)).bit_count()
+
+
+def test_near_duplicates_have_close_hashes():
+    image = _make_image(0)
+    noisy = np.clip(np.asarray(image, dtype=np.int16) + np.random.default_rng(1).integers(-6, 7, (96, 128, 3)), 0, 255)
+    variants = [
+        _encode(image),
+        _encode(image.convert("RGB"), "JPEG", quality=40),
+        _encode(image.resize((100, 75), Image.Resampling.BILINEAR)),
+        _encode(Image.fromarray(noisy.astype(np.uint8))),
+    ]
+
+    hashes, valid = compute_dhashes(variants + [_encode(_make_image(2))])
+
+    assert valid.all()
+    assert hashes.dtype == np.uint64
+    assert all(_distance(hashes[0], h) <= 6 for h in hashes[1:4])
+    assert _distance(hashes[0], hashes[4]) > 12
+
+
+def test_undecodable_images_are_flagged():
+    hashes, valid = compute_dhashes(["bm90IGFuIGltYWdl", _encode(_make_image(0))])
+
+    assert valid.tolist() == [False, True]
+    assert hashes[0] == 0
+
+
+def test_multi_index_hash_query_matches_brute_force():
+    rng = random.Random(0)
+    values = [rng.getrandbits(64) for _ in range(500)]
+    # Add near neighbours of a few values.
+    values += [values[i] ^ (1 << rng.randrange(64)) ^ (1 << rng.randrange(64)) for i in range(0, 500, 50)]
+
+    index = MultiIndexHash(6)
+    keys = index.get_chunk_keys(np.array(values, dtype=np.uint64)).tolist()
+    for position, value in enumerate(values):
+        index.add(value, keys[position], position)
+
+    assert len(index) == len(values)
+    queries = values[:20] + [rng.getrandbits(64)]
+    query_keys = index.get_chunk_keys(np.array(queries, dtype=np.uint64)).tolist()
+    for query, query_key in zip(queries, query_keys):
+        expected = sorted((_distance(query, v), i) for i, v in enumerate(values) if _distance(query, v) <= 6)
+        assert sorted(index.query(query, query_key)) == expected
+
+
+def test_group_near_duplicates():
+    base = 0xF0F0_F0F0_F0F0_F0F0
+    hashes = np.array([base, base ^ 0b11, 0x0F0F_0F0F_0F0F_0F0F, base, base ^ 0b1111_1111], dtype=np.uint64)
+
+    assert group_near_duplicates(hashes, 2).tolist() == [0, 0, 2, 0, 4]
+    assert group_near_duplicates(hashes, 0).tolist() == [0, 1, 2, 0, 4]
+    assert group_near_duplicates(np.array([], dtype=np.uint64), 6).tolist() == []
+    assert group_near_duplicates(hashes, 64).tolist() == [0, 0, 0, 0, 0]
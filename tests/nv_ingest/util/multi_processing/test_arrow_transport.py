@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pickle
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from nv_ingest.util.multi_processing.arrow_transport import ArrowIPCHandle
+from nv_ingest.util.multi_processing.arrow_transport import read_arrow_handle
+from nv_ingest.util.multi_processing.arrow_transport import read_arrow_handle_as_dataframe
+from nv_ingest.util.multi_processing.arrow_transport import release_arrow_handle
+from nv_ingest.util.multi_processing.arrow_transport import run_with_arrow_payload
+from nv_ingest.util.multi_processing.arrow_transport import write_arrow_handle
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame(
+        {
+            "document_type": ["pdf", "pdf", "image"],
+            "metadata": [{"content": "abc", "page": 1}, {"content": "def", "page": 2}, {"content": "ghi", "page": 3}],
+            "uuid": ["a", "b", "c"],
+        }
+    )
+
+
+def _mark_processed(df, task_props):
+    df["processed"] = task_props["flag"]
+    return df
+
+
+def _mark_processed_with_trace(df, task_props):
+    return _mark_processed(df, task_props), {"trace_info": {"trace::entry::test": 1}}
+
+
+def _return_unconvertible(df, task_props):
+    return pd.DataFrame({"mixed": [1, "two", [3]]})
+
+
+def test_round_trip_dataframe(sample_df):
+    handle = write_arrow_handle(sample_df)
+    assert os.path.exists(handle.path)
+
+    result = read_arrow_handle_as_dataframe(handle)
+
+    pd.testing.assert_frame_equal(result, sample_df)
+    assert not os.path.exists(handle.path), "Segment should be unlinked after reading"
+
+
+def test_round_trip_arrow_table(sample_df):
+    table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    handle = write_arrow_handle(table)
+
+    assert read_arrow_handle(handle).equals(table)
+
+
+def test_read_without_unlink_keeps_segment(sample_df):
+    handle = write_arrow_handle(sample_df)
+    read_arrow_handle(handle, unlink=False)
+    assert os.path.exists(handle.path)
+    release_arrow_handle(handle)
+    assert not os.path.exists(handle.path)
+
+
+def test_release_is_idempotent(sample_df):
+    handle = write_arrow_handle(sample_df)
+    release_arrow_handle(handle)
+    release_arrow_handle(handle)
+
+
+def test_handle_is_picklable(sample_df):
+    handle = write_arrow_handle(sample_df)
+    restored = pickle.loads(pickle.dumps(handle))
+    assert isinstance(restored, ArrowIPCHandle)
+    assert (restored.path, restored.size) == (handle.path, handle.size)
+    release_arrow_handle(handle)
+
+
+def test_run_with_arrow_payload_returns_handle(sample_df):
+    result = run_with_arrow_payload(_mark_processed, write_arrow_handle(sample_df), {"flag": True})
+
+    assert isinstance(result, ArrowIPCHandle)
+    df = read_arrow_handle_as_dataframe(result)
+    assert df["processed"].tolist() == [True, True, True]
+
+
+def test_run_with_arrow_payload_passes_extra_results(sample_df):
+    result, extra = run_with_arrow_payload(_mark_processed_with_trace, write_arrow_handle(sample_df), {"flag": False})
+
+    assert isinstance(result, ArrowIPCHandle)
+    assert extra == {"trace_info": {"trace::entry::test": 1}}
+    release_arrow_handle(result)
+
+
+def test_run_with_arrow_payload_falls_back_to_dataframe(sample_df):
+    result = run_with_arrow_payload(_return_unconvertible, write_arrow_handle(sample_df), {})
+
+    assert isinstance(result, pd.DataFrame)
+    assert result["mixed"].tolist() == [1, "two", [3]]
@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from nv_ingest.util.multi_processing.mp_pool_singleton import SHM_RESULT_THRESHOLD
+from nv_ingest.util.multi_processing.mp_pool_singleton import ProcessWorkerPool
+from nv_ingest.util.multi_processing.mp_pool_singleton import ProcessWorkerPoolSingleton
+from nv_ingest.util.multi_processing.mp_pool_singleton import SimpleFuture
+
+
+def _add(a, b, scale=1):
+    return (a + b) * scale
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+def _make_bytes(size):
+    return b"x" * size
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _affinity():
+    return sorted(os.sched_getaffinity(0))
+
+
+def _double_column(df, column):
+    df[column] = df[column] * 2
+    return df
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessWorkerPoolSingleton()
+    yield pool
+    pool.close()
+
+
+def test_simple_future_result():
+    future = SimpleFuture()
+    assert not future.done()
+    future.set_result(42)
+    assert future.done()
+    assert future.result() == 42
+
+
+def test_simple_future_exception():
+    future = SimpleFuture()
+    future.set_exception(ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        future.result()
+
+
+def test_simple_future_timeout():
+    future = SimpleFuture()
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.01)
+
+
+def test_simple_future_done_callback():
+    future = SimpleFuture()
+    seen = []
+    future.add_done_callback(lambda f: seen.append(f.result()))
+    assert seen == []
+    future.set_result("done")
+    assert seen == ["done"]
+
+
+def test_simple_future_done_callback_after_completion():
+    future = SimpleFuture()
+    future.set_exception(ValueError("boom"))
+    seen = []
+    future.add_done_callback(seen.append)
+    assert seen == [future]
+
+
+def test_singleton(pool):
+    assert ProcessWorkerPoolSingleton() is pool, "ProcessWorkerPoolSingleton should be a singleton"
+
+
+def test_submit_task_returns_result(pool):
+    future = pool.submit_task(_add, (1, 2))
+    assert future.result(timeout=30) == 3
+
+
+def test_submit_task_with_kwargs(pool):
+    future = pool.submit_task(_add, (1, 2), {"scale": 10})
+    assert future.result(timeout=30) == 30
+
+
+def test_submit_task_propagates_exception(pool):
+    future = pool.submit_task(_fail, ("bad input",))
+    with pytest.raises(ValueError, match="bad input"):
+        future.result(timeout=30)
+
+
+def test_large_result_uses_shared_memory(pool):
+    size = SHM_RESULT_THRESHOLD * 2
+    future = pool.submit_task(_make_bytes, (size,))
+    result = future.result(timeout=30)
+    assert len(result) == size
+
+
+def test_many_tasks_resolve_to_correct_futures(pool):
+    futures = [pool.submit_task(_add, (i, i)) for i in range(50)]
+    assert [f.result(timeout=30) for f in futures] == [i * 2 for i in range(50)]
+
+
+def test_dataframe_round_trip(pool):
+    df = pd.DataFrame({"value": range(10)})
+    result = pool.submit_task(_double_column, (df, "value")).result(timeout=30)
+    assert result["value"].tolist() == [i * 2 for i in range(10)]
+
+
+def test_close_resets_singleton():
+    pool = ProcessWorkerPoolSingleton()
+    pool.close()
+    new_pool = ProcessWorkerPoolSingleton()
+    assert new_pool is not pool
+    new_pool.close()
+
+
+def test_named_pool_runs_tasks():
+    pool = ProcessWorkerPool("named", 2)
+    try:
+        assert pool.name == "named"
+        assert [pool.submit_task(_add, (i, 1)).result(timeout=30) for i in range(3)] == [1, 2, 3]
+    finally:
+        pool.close()
+    assert pool.closed
+
+
+def test_named_pool_rejects_invalid_config():
+    with pytest.raises(ValueError):
+        ProcessWorkerPool("empty", 0)
+    with pytest.raises(ValueError):
+        ProcessWorkerPool("negative_depth", 1, max_queue_depth=-1)
+    with pytest.raises(ValueError):
+        ProcessWorkerPool("bad_affinity", 1, cpu_affinity=[max(os.sched_getaffinity(0)) + 1])
+
+
+def test_named_pool_cpu_affinity():
+    cpu = min(os.sched_getaffinity(0))
+    pool = ProcessWorkerPool("pinned", 1, cpu_affinity=[cpu])
+    try:
+        assert pool.submit_task(_affinity, ()).result(timeout=30) == [cpu]
+    finally:
+        pool.close()
+
+
+def test_named_pool_max_queue_depth_blocks_submit():
+    pool = ProcessWorkerPool("bounded", 1, max_queue_depth=1)
+    try:
+        futures = [pool.submit_task(_sleep, (0.5,)), pool.submit_task(_sleep, (0.5,))]
+
+        submitted = threading.Event()
+
+        def submit_third():
+            futures.append(pool.submit_task(_add, (1, 1)))
+            submitted.set()
+
+        thread = threading.Thread(target=submit_third)
+        thread.start()
+        assert not submitted.wait(0.2), "submit_task should block while the queue is full"
+        assert submitted.wait(30)
+        thread.join()
+
+        assert [f.result(timeout=30) for f in futures] == [0.5, 0.5, 2]
+    finally:
+        pool.close()
+
+
+def test_named_pool_utilization():
+    pool = ProcessWorkerPool("measured", 1, max_queue_depth=4)
+    try:
+        futures = [pool.submit_task(_sleep, (0.2,)) for _ in range(3)]
+        utilization = pool.get_utilization()
+        assert utilization["name"] == "measured"
+        assert utilization["workers"] == 1
+        assert utilization["max_queue_depth"] == 4
+        assert utilization["busy_workers"] == 1
+        assert utilization["queued"] == 2
+
+        for future in futures:
+            future.result(timeout=30)
+        with pytest.raises(ValueError):
+            pool.submit_task(_fail, ("bad input",)).result(timeout=30)
+
+        utilization = pool.get_utilization()
+        assert utilization["completed"] == 3
+        assert utilization["failed"] == 1
+        assert utilization["busy_workers"] == 0
+        assert utilization["busy_seconds"] >= 0.6
+        assert 0.0 < utilization["utilization"] <= 1.0
+    finally:
+        pool.close()
+
+
+def test_named_pool_submit_after_close_raises():
+    pool = ProcessWorkerPool("closed", 1)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.submit_task(_add, (1, 2))
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from nv_ingest.util.multi_processing.mp_pool_singleton import ProcessWorkerPoolSingleton
+from nv_ingest.util.multi_processing.worker_pool_registry import WorkerPoolRegistry
+
+
+def _add(a, b):
+    return a + b
+
+
+@pytest.fixture
+def registry():
+    registry = WorkerPoolRegistry()
+    yield registry
+    registry.close()
+
+
+def test_registry_is_singleton(registry):
+    assert WorkerPoolRegistry() is registry
+
+
+def test_default_pool_is_singleton(registry):
+    assert registry.get_pool() is ProcessWorkerPoolSingleton()
+    assert registry.get_pool("default") is registry.get_pool()
+
+
+def test_named_pools_are_separate(registry):
+    registry.configure("pdf", 1)
+    registry.configure("nim", 1, max_queue_depth=2)
+
+    pdf_pool = registry.get_pool("pdf")
+    nim_pool = registry.get_pool("nim")
+
+    assert pdf_pool is not nim_pool
+    assert registry.get_pool("pdf") is pdf_pool
+    assert pdf_pool.submit_task(_add, (1, 2)).result(timeout=30) == 3
+    assert nim_pool.submit_task(_add, (3, 4)).result(timeout=30) == 7
+
+
+def test_unconfigured_pool_raises(registry):
+    with pytest.raises(ValueError, match="has not been configured"):
+        registry.get_pool("missing")
+
+
+def test_reconfiguring_running_pool_raises(registry):
+    registry.configure("pdf", 1)
+    registry.get_pool("pdf")
+
+    registry.configure("pdf", 1)  # Same configuration is accepted.
+    with pytest.raises(ValueError, match="already running"):
+        registry.configure("pdf", 2)
+
+
+def test_stage_assignment(registry):
+    registry.configure("nim", 1)
+    registry.assign_stage("table_extractor", "nim")
+
+    assert registry.get_stage_pool("table_extractor") == "nim"
+    assert registry.get_stage_pool("pdf_extractor") is None
+
+    with pytest.raises(ValueError, match="unconfigured worker pool"):
+        registry.assign_stage("chart_extractor", "missing")
+
+
+def test_utilization_reports_running_pools(registry):
+    registry.configure("pdf", 1)
+    registry.get_pool("pdf").submit_task(_add, (1, 2)).result(timeout=30)
+
+    utilization = registry.get_utilization()
+    assert list(utilization) == ["pdf"]
+    assert utilization["pdf"]["completed"] == 1
+
+
+def test_close_closes_pools(registry):
+    registry.configure("pdf", 1)
+    pool = registry.get_pool("pdf")
+    registry.close()
+
+    assert pool.closed
+    assert registry.get_utilization() == {}
+    with pytest.raises(ValueError):
+        registry.get_pool("pdf")
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing as mp
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from nv_ingest.util.nim.client_registry import NIM_HTTP_POOL_MAXSIZE
+from nv_ingest.util.nim.client_registry import NimClientRegistry
+from nv_ingest.util.nim.helpers import NimClient
+
+MODULE_UNDER_TEST = "nv_ingest.util.nim.client_registry"
+
+
+@pytest.fixture
+def registry():
+    registry = NimClientRegistry()
+    yield registry
+    registry.close()
+
+
+def _connection_count_in_child(queue):
+    queue.put(len(NimClientRegistry()._connections))
+
+
+def test_registry_is_singleton(registry):
+    assert NimClientRegistry() is registry
+
+
+def test_http_session_reused_per_endpoint_and_auth(registry):
+    session = registry.get_http_session("http://nim:8000/v1/infer", "token")
+
+    assert registry.get_http_session("http://nim:8000/v1/infer", "token") is session
+    assert registry.get_http_session("http://nim:8000/v1/infer", "other") is not session
+    assert registry.get_http_session("http://other:8000/v1/infer", "token") is not session
+
+
+def test_http_session_pool_size(registry):
+    session = registry.get_http_session("http://nim:8000/v1/infer")
+    adapter = session.get_adapter("http://nim:8000/v1/infer")
+
+    assert adapter._pool_maxsize == NIM_HTTP_POOL_MAXSIZE
+
+
+def test_grpc_client_reused_per_endpoint(registry):
+    with patch(
+        f"{MODULE_UNDER_TEST}.grpcclient.InferenceServerClient", side_effect=lambda url: Mock()
+    ) as mock_grpc_client:
+        client = registry.get_grpc_client("nim:8001")
+        assert registry.get_grpc_client("nim:8001") is client
+        assert registry.get_grpc_client("other:8001") is not client
+
+    assert mock_grpc_client.call_count == 2
+
+
+def test_nim_clients_share_connections(registry):
+    with patch(f"{MODULE_UNDER_TEST}.grpcclient.InferenceServerClient"):
+        grpc_a = NimClient(None, "grpc", ("nim:8001", None))
+        grpc_b = NimClient(None, "grpc", ("nim:8001", None))
+
+    http_a = NimClient(None, "http", (None, "http://nim:8000/v1/infer"), auth_token="token")
+    http_b = NimClient(None, "http", (None, "http://nim:8000/v1/infer"), auth_token="token")
+
+    assert grpc_a.client is grpc_b.client
+    assert http_a.session is http_b.session
+
+    # Closing a client leaves the shared connection open for the others.
+    grpc_a.close()
+    grpc_a.client.close.assert_not_called()
+
+
+def test_close_closes_connections(registry):
+    with patch(f"{MODULE_UNDER_TEST}.grpcclient.InferenceServerClient") as mock_grpc_client:
+        registry.get_grpc_client("nim:8001")
+        session = registry.get_http_session("http://nim:8000/v1/infer")
+
+        with patch.object(session, "close") as mock_session_close:
+            registry.close()
+
+    mock_grpc_client.return_value.close.assert_called_once()
+    mock_session_close.assert_called_once()
+    assert registry.get_http_session("http://nim:8000/v1/infer") is not session
+
+
+def test_forked_child_starts_empty(registry):
+    registry.get_http_session("http://nim:8000/v1/infer")
+
+    context = mp.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_connection_count_in_child, args=(queue,))
+    process.start()
+    count = queue.get(timeout=30)
+    process.join()
+
+    assert count == 0
+    assert len(registry._connections) == 1
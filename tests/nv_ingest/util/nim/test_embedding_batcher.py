@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from nv_ingest.util.nim.embedding_batcher import EmbeddingBatcher
+from nv_ingest.util.nim.inference_cache import DiskCacheTier
+from nv_ingest.util.nim.inference_cache import InferenceCache
+
+
+class FakeEmbeddingsClient:
+    """Records each embeddings request and returns the length of every prompt as its embedding."""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    async def _create(self, input, model, encoding_format, extra_body):
+        self.requests.append(list(input))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on is not None and self.fail_on in input:
+                raise RuntimeError("bad input")
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(prompt))]) for prompt in input])
+        finally:
+            self.in_flight -= 1
+
+    async def close(self):
+        self.closed = True
+
+
+def _make_batcher(
+    client, batch_size=4, max_batch_wait=0.05, max_concurrent_requests=2, cache=None, input_type="passage"
+):
+    return EmbeddingBatcher(
+        api_key="api_key",
+        embedding_nim_endpoint="http://embedding:8000/v1",
+        embedding_model="nvidia/nv-embedqa-e5-v5",
+        encoding_format="float",
+        input_type=input_type,
+        truncate="END",
+        batch_size=batch_size,
+        max_batch_wait=max_batch_wait,
+        max_concurrent_requests=max_concurrent_requests,
+        client=client,
+        cache=cache,
+    )
+
+
+@pytest.fixture
+def client():
+    return FakeEmbeddingsClient()
+
+
+def test_embed_returns_results_in_order(client):
+    batcher = _make_batcher(client)
+    try:
+        assert batcher.embed(["a", "bb", "ccc"]) == [([1.0], None), ([2.0], None), ([3.0], None)]
+        assert batcher.embed([]) == []
+    finally:
+        batcher.close()
+
+    assert client.closed is False  # The caller owns clients it passes in.
+
+
+def test_prompts_from_several_callers_share_a_batch(client):
+    batcher = _make_batcher(client, batch_size=4, max_batch_wait=10)
+    try:
+        first = batcher.submit(["a", "bb"])
+        second = batcher.submit(["ccc", "dddd"])
+
+        assert second.result(timeout=5) == [([3.0], None), ([4.0], None)]
+        assert first.result(timeout=5) == [([1.0], None), ([2.0], None)]
+    finally:
+        batcher.close()
+
+    assert client.requests == [["a", "bb", "ccc", "dddd"]]
+
+
+def test_partial_batch_is_sent_after_max_wait(client):
+    batcher = _make_batcher(client, batch_size=100, max_batch_wait=0.01)
+    try:
+        assert batcher.embed(["a"]) == [([1.0], None)]
+    finally:
+        batcher.close()
+
+    assert client.requests == [["a"]]
+
+
+def test_large_submission_is_split_into_batches(client):
+    batcher = _make_batcher(client, batch_size=4)
+    try:
+        results = batcher.embed(["x" * i for i in range(1, 11)])
+    finally:
+        batcher.close()
+
+    assert results == [([float(i)], None) for i in range(1, 11)]
+    assert [len(request) for request in client.requests] == [4, 4, 2]
+
+
+def test_requests_in_flight_are_bounded():
+    client = FakeEmbeddingsClient(delay=0.05)
+    batcher = _make_batcher(client, batch_size=1, max_concurrent_requests=2)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: batcher.embed(["x" * i]), range(1, 9)))
+    finally:
+        batcher.close()
+
+    assert results == [[([float(i)], None)] for i in range(1, 9)]
+    assert len(client.requests) == 8
+    assert client.max_in_flight == 2
+
+
+def test_failed_batch_only_affects_its_own_prompts():
+    client = FakeEmbeddingsClient(fail_on="bad")
+    batcher = _make_batcher(client, batch_size=2)
+    try:
+        results = batcher.embed(["a", "bad", "ccc", "dddd"])
+    finally:
+        batcher.close()
+
+    assert results[0] == (None, "Embedding error: bad input")
+    assert results[1] == (None, "Embedding error: bad input")
+    assert results[2:] == [([3.0], None), ([4.0], None)]
+
+
+def test_batcher_can_be_reused_after_close(client):
+    batcher = _make_batcher(client)
+    batcher.embed(["a"])
+    batcher.close()
+    batcher.close()
+
+    try:
+        assert batcher.embed(["bb"]) == [([2.0], None)]
+    finally:
+        batcher.close()
+
+
+def test_cache_serves_repeated_prompts_without_requests(client):
+    batcher = _make_batcher(client, cache=InferenceCache())
+    try:
+        assert batcher.embed(["header", "body", "header"]) == [([6.0], None), ([4.0], None), ([6.0], None)]
+        # Whitespace is normalized before hashing.
+        assert batcher.embed(["  header\n", "footer"]) == [([6.0], None), ([6.0], None)]
+        assert batcher.embed(["body"]) == [([4.0], None)]
+    finally:
+        batcher.close()
+
+    assert client.requests == [["header", "body"], ["footer"]]
+    assert batcher.get_cache_metrics() == {
+        "hits": 3,
+        "misses": 3,
+        "bytes_saved": len("header") + len("  header\n") + len("body"),
+    }
+
+
+def test_cache_does_not_store_failures():
+    client = FakeEmbeddingsClient(fail_on="bad")
+    batcher = _make_batcher(client, cache=InferenceCache())
+    try:
+        assert batcher.embed(["bad"]) == [(None, "Embedding error: bad input")]
+        client.fail_on = None
+        assert batcher.embed(["bad"]) == [([3.0], None)]
+    finally:
+        batcher.close()
+
+    assert client.requests == [["bad"], ["bad"]]
+
+
+def test_cache_key_depends_on_request_parameters(client):
+    cache = InferenceCache()
+    batcher = _make_batcher(client, cache=cache)
+    query_batcher = _make_batcher(client, cache=cache, input_type="query")
+    try:
+        batcher.embed(["text"])
+        query_batcher.embed(["text"])
+    finally:
+        batcher.close()
+        query_batcher.close()
+
+    assert client.requests == [["text"], ["text"]]
+
+
+def test_disk_cache_persists_across_batchers(client, tmp_path):
+    def _make_disk_cache():
+        return InferenceCache(shared_tier=DiskCacheTier(str(tmp_path), max_bytes=1024 * 1024))
+
+    first = _make_batcher(client, cache=_make_disk_cache())
+    try:
+        first.embed(["disclaimer"])
+    finally:
+        first.close()
+
+    second = _make_batcher(client, cache=_make_disk_cache())
+    try:
+        assert second.embed(["disclaimer"]) == [([10.0], None)]
+    finally:
+        second.close()
+
+    assert client.requests == [["disclaimer"]]
@@ -18,6 +18,7 @@ from nv_ingest.util.nim.helpers import (
     is_ready,
     get_version,
 )
+from nv_ingest.util.nim.client_registry import NimClientRegistry
 
 MODULE_UNDER_TEST = "nv_ingest.util.nim.helpers"
 
@@ -45,6 +46,15 @@ class MockModelInterface:
         return f"processed_{output}"
 
 
+@pytest.fixture(autouse=True)
+def reset_client_registry():
+    """
+    Drop connections shared through NimClientRegistry so each test sees its own mocked clients.
+    """
+    yield
+    NimClientRegistry().close()
+
+
 @pytest.fixture
 def mock_backoff(mocker):
     """
@@ -166,7 +176,7 @@ def test_nimclient_infer_http(mock_model_interface, http_endpoints):
     client = NimClient(mock_model_interface, "http", http_endpoints)
 
     # Mock the HTTP request
-    with patch(f"{MODULE_UNDER_TEST}.requests.post") as mock_post:
+    with patch(f"{MODULE_UNDER_TEST}.requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.json.return_value = {"output": "response_data"}
         mock_response.raise_for_status = Mock()
@@ -181,7 +191,7 @@ def test_nimclient_infer_http(mock_model_interface, http_endpoints):
 def test_nimclient_infer_http_error(mock_model_interface, http_endpoints):
     data = {"input_data": "test"}
 
-    with patch(f"{MODULE_UNDER_TEST}.requests.post") as mock_post:
+    with patch(f"{MODULE_UNDER_TEST}.requests.Session.post") as mock_post:
         client = NimClient(mock_model_interface, "http", http_endpoints)
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = Exception("HTTP Inference error")
@@ -409,7 +419,7 @@ def test_create_inference_client_nimclient_parameters(mock_model_interface, grpc
             infer_protocol=infer_protocol,
         )
         mock_nim_client_class.assert_called_once_with(
-            mock_model_interface, infer_protocol, (grpc_endpoint, http_endpoint), auth_token
+            mock_model_interface, infer_protocol, (grpc_endpoint, http_endpoint), auth_token, model_version=None
         )
 
 
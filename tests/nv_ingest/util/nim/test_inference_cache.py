@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pickle
+import struct
+import time
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from nv_ingest.util.nim.helpers import NimClient
+from nv_ingest.util.nim.inference_cache import DiskCacheTier
+from nv_ingest.util.nim.inference_cache import InferenceCache
+from nv_ingest.util.nim.inference_cache import RedisCacheTier
+from nv_ingest.util.nim.inference_cache import _create_inference_cache
+from nv_ingest.util.nim.inference_cache import decode_shared_value
+from nv_ingest.util.nim.inference_cache import encode_shared_value
+from nv_ingest.util.nim.inference_cache import get_inference_cache
+from nv_ingest.util.nim.inference_cache import make_cache_key
+from nv_ingest.util.nim.inference_cache import set_inference_cache
+from nv_ingest.util.process_local import ProcessLocal
+
+MODULE_UNDER_TEST = "nv_ingest.util.nim.inference_cache"
+
+
+class FakeRedis:
+    """A dict-backed stand-in for the parts of redis.Redis used by RedisCacheTier."""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.expiry[key] = ex
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def inference_cache():
+    cache = InferenceCache(max_bytes=1024 * 1024)
+    set_inference_cache(cache)
+    yield cache
+    set_inference_cache(None)
+
+
+def test_make_cache_key_is_content_addressed():
+    image = np.arange(12, dtype=np.uint8).reshape(2, 2, 3)
+    key = make_cache_key("yolox", "1.0.0", {"images": [image]}, conf_thresh=0.5)
+
+    assert make_cache_key("yolox", "1.0.0", {"images": [image.copy()]}, conf_thresh=0.5) == key
+    assert make_cache_key("yolox", "1.0.1", {"images": [image]}, conf_thresh=0.5) != key
+    assert make_cache_key("paddle", "1.0.0", {"images": [image]}, conf_thresh=0.5) != key
+    assert make_cache_key("yolox", "1.0.0", {"images": [image]}, conf_thresh=0.6) != key
+    assert make_cache_key("yolox", "1.0.0", {"images": [image.reshape(3, 2, 2)]}, conf_thresh=0.5) != key
+    assert make_cache_key("yolox", "1.0.0", {"images": [image.astype(np.float32)]}, conf_thresh=0.5) != key
+    assert make_cache_key("m", None, {"a": "1"}) != make_cache_key("m", None, {"a": 1})
+    assert make_cache_key("m", None, ["a", "b"]) != make_cache_key("m", None, ["ab"])
+
+
+def test_get_returns_a_copy_of_the_stored_value():
+    cache = InferenceCache()
+    cache.put("key", {"table": [[0.1, 0.2]]})
+
+    hit, value = cache.get("key")
+    value["table"].append("mutated")
+
+    assert hit
+    assert cache.get("key") == (True, {"table": [[0.1, 0.2]]})
+    assert cache.get("missing") == (False, None)
+
+
+def test_lru_evicts_least_recently_used_by_size():
+    value = "x" * 100
+    entry_size = len(pickle.dumps(value, protocol=5))
+    cache = InferenceCache(max_bytes=entry_size * 2)
+
+    cache.put("a", value)
+    cache.put("b", value)
+    cache.get("a")
+    cache.put("c", value)
+
+    assert cache.get("a")[0]
+    assert not cache.get("b")[0]
+    assert cache.get("c")[0]
+    assert cache.get_metrics()["evictions"] == 1
+    assert cache.get_metrics()["bytes"] == entry_size * 2
+
+
+def test_entries_expire_after_ttl():
+    cache = InferenceCache(ttl=10)
+    cache.put("key", "value")
+
+    with patch(f"{MODULE_UNDER_TEST}.time.time", return_value=time.time() + 11):
+        assert cache.get("key") == (False, None)
+
+    assert cache.get_metrics()["expirations"] == 1
+
+
+def test_metrics_count_hits_and_misses():
+    cache = InferenceCache()
+    cache.get_or_compute("key", lambda: "value")
+    cache.get_or_compute("key", lambda: pytest.fail("should be cached"))
+
+    metrics = cache.get_metrics()
+    assert metrics["misses"] == 1
+    assert metrics["memory_hits"] == 1
+    assert metrics["stores"] == 1
+    assert metrics["entries"] == 1
+    assert metrics["hit_rate"] == 0.5
+
+
+def test_redis_tier_is_shared_between_caches():
+    redis_client = FakeRedis()
+    first = InferenceCache(ttl=60, shared_tier=RedisCacheTier(redis_client, ttl=60))
+    second = InferenceCache(ttl=60, shared_tier=RedisCacheTier(redis_client, ttl=60))
+
+    first.put("key", [1, 2, 3])
+
+    assert second.get("key") == (True, [1, 2, 3])
+    assert second.get_metrics()["shared_hits"] == 1
+    # Promoted to the second cache's in-process tier.
+    assert second.get("key") == (True, [1, 2, 3])
+    assert second.get_metrics()["memory_hits"] == 1
+    assert redis_client.expiry == {"nv_ingest:inference_cache:key": 60}
+
+
+def test_shared_tier_failures_are_misses():
+    shared_tier = Mock()
+    shared_tier.get.side_effect = ConnectionError("redis is down")
+    shared_tier.put.side_effect = ConnectionError("redis is down")
+    cache = InferenceCache(shared_tier=shared_tier)
+
+    assert cache.get("key") == (False, None)
+    cache.put("key", "value")
+
+    assert cache.get("key") == (True, "value")
+    assert cache.get_metrics()["shared_errors"] == 2
+
+
+def test_disk_tier_is_shared_and_expires(tmp_path):
+    first = InferenceCache(ttl=60, shared_tier=DiskCacheTier(str(tmp_path), max_bytes=1024 * 1024))
+    second = InferenceCache(ttl=60, shared_tier=DiskCacheTier(str(tmp_path), max_bytes=1024 * 1024))
+
+    first.put("abcd", "value")
+    assert second.get("abcd") == (True, "value")
+
+    third = InferenceCache(ttl=60, shared_tier=DiskCacheTier(str(tmp_path), max_bytes=1024 * 1024))
+    with patch(f"{MODULE_UNDER_TEST}.time.time", return_value=time.time() + 61):
+        assert third.get("abcd") == (False, None)
+    assert not os.path.exists(tmp_path / "ab" / "abcd")
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    writer = DiskCacheTier(str(tmp_path), max_bytes=1024 * 1024)
+    for i, key in enumerate(["aa1", "bb2", "cc3"]):
+        writer.put(key, b"x" * 400)
+        os.utime(tmp_path / key[:2] / key, (i, i))
+
+    tier = DiskCacheTier(str(tmp_path), max_bytes=1000)
+
+    # Trims to 90% of the limit, oldest entries first.
+    assert tier.evict() == 1
+    assert tier.get("aa1") is None
+    assert tier.get("bb2") == b"x" * 400
+    assert tier.get("cc3") == b"x" * 400
+    assert tier.evict() == 0
+
+
+def test_shared_value_round_trip():
+    value = {
+        "table": [(np.float32(0.5), 1, "a")],
+        1: None,
+        "offsets": np.arange(6, dtype=np.int64).reshape(2, 3),
+        "raw": b"\x00\x01",
+        "flags": [True, float("inf")],
+    }
+
+    decoded = decode_shared_value(encode_shared_value(value))
+
+    assert decoded.keys() == value.keys()
+    assert decoded["table"] == value["table"]
+    assert isinstance(decoded["table"][0][0], np.float32)
+    np.testing.assert_array_equal(decoded["offsets"], value["offsets"])
+    assert decoded["offsets"].dtype == np.int64
+    assert decoded["offsets"].flags.writeable
+    assert decoded["raw"] == value["raw"]
+    assert decoded["flags"] == value["flags"]
+    assert decoded[1] is None
+
+
+def test_shared_tier_entries_are_not_unpickled():
+    redis_client = FakeRedis()
+    cache = InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0))
+
+    class Exploit:
+        def __reduce__(self):
+            return (pytest.fail, ("unpickled a shared tier entry",))
+
+    redis_client.store["nv_ingest:inference_cache:key"] = struct.pack("<d", 0) + pickle.dumps(Exploit())
+
+    assert cache.get("key") == (False, None)
+    assert cache.get_metrics()["shared_errors"] == 1
+
+
+def test_unsupported_values_stay_in_process():
+    redis_client = FakeRedis()
+    cache = InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0))
+
+    cache.put("key", {1, 2})
+
+    assert cache.get("key") == (True, {1, 2})
+    assert redis_client.store == {}
+
+
+def test_signed_shared_entries():
+    redis_client = FakeRedis()
+    writer = InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0), hmac_key=b"secret")
+    writer.put("key", "value")
+    writer.put("other", "other value")
+
+    assert InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0), hmac_key=b"secret").get("key") == (
+        True,
+        "value",
+    )
+
+    # Entries signed with another key, copied to another key or written unsigned are ignored.
+    assert InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0), hmac_key=b"wrong").get("key") == (
+        False,
+        None,
+    )
+    redis_client.store["nv_ingest:inference_cache:key"] = redis_client.store["nv_ingest:inference_cache:other"]
+    assert InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0), hmac_key=b"secret").get("key") == (
+        False,
+        None,
+    )
+    InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0)).put("key", "unsigned")
+    assert InferenceCache(shared_tier=RedisCacheTier(redis_client, ttl=0), hmac_key=b"secret").get("key") == (
+        False,
+        None,
+    )
+
+
+def test_disk_tier_directory_is_private(tmp_path):
+    DiskCacheTier(str(tmp_path / "cache"), max_bytes=1024)
+
+    assert os.stat(tmp_path / "cache").st_mode & 0o777 == 0o700
+
+
+def test_disk_tier_warns_about_shared_directory(tmp_path, caplog):
+    os.chmod(tmp_path, 0o777)
+
+    DiskCacheTier(str(tmp_path), max_bytes=1024)
+
+    assert "can be written by other users" in caplog.text
+
+
+def test_get_inference_cache_disabled_by_default():
+    with patch(f"{MODULE_UNDER_TEST}._inference_cache", ProcessLocal(_create_inference_cache)), patch(
+        f"{MODULE_UNDER_TEST}.NIM_INFERENCE_CACHE", "off"
+    ):
+        assert get_inference_cache() is None
+
+
+def test_get_inference_cache_memory_mode():
+    with patch(f"{MODULE_UNDER_TEST}._inference_cache", ProcessLocal(_create_inference_cache)), patch(
+        f"{MODULE_UNDER_TEST}.NIM_INFERENCE_CACHE", "memory"
+    ):
+        cache = get_inference_cache()
+        assert isinstance(cache, InferenceCache)
+        assert get_inference_cache() is cache
+
+
+def test_nimclient_infer_uses_cache(inference_cache):
+    model_interface = Mock()
+    model_interface.name.return_value = "yolox"
+    model_interface.prepare_data_for_inference.side_effect = lambda data: data
+    model_interface.format_input.return_value = np.zeros((1, 3), dtype=np.float32)
+    model_interface.parse_output.return_value = "parsed"
+    model_interface.process_inference_results.side_effect = lambda output, **kwargs: {"result": output}
+
+    with patch("nv_ingest.util.nim.client_registry.grpcclient.InferenceServerClient") as mock_grpc:
+        mock_grpc.return_value.infer.return_value.as_numpy.return_value = np.zeros(1)
+        client = NimClient(model_interface, "grpc", ("grpc_endpoint", None), model_version="1.0.0")
+
+        image = np.ones((4, 4, 3), dtype=np.uint8)
+        first = client.infer({"images": [image]}, model_name="yolox", conf_thresh=0.5, stage_name="a")
+        second = client.infer({"images": [image.copy()]}, model_name="yolox", conf_thresh=0.5, stage_name="b")
+        client.infer({"images": [image]}, model_name="yolox", conf_thresh=0.6)
+
+    assert first == second == {"result": "parsed"}
+    assert mock_grpc.return_value.infer.call_count == 2
+    assert inference_cache.get_metrics()["memory_hits"] == 1
+    assert inference_cache.get_metrics()["misses"] == 2
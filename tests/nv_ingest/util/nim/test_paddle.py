@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ import pytest
 from nv_ingest.schemas.metadata_schema import TableFormatEnum
 from nv_ingest.util.image_processing.transforms import base64_to_numpy
 from nv_ingest.util.nim.helpers import preprocess_image_for_paddle
+from nv_ingest.util.nim.paddle import PADDLE_MAX_BATCH_SIZE
 from nv_ingest.util.nim.paddle import PaddleOCRModelInterface
 
 _MODULE_UNDER_TEST = "nv_ingest.util.nim.paddle"
@@ -175,3 +177,129 @@ def test_parse_output_grpc_legacy(legacy_paddle_ocr_model):
     )
     assert result[0] == "mock_text"
     assert result[1] == "simple"
+
+
+def test_max_batch_size(paddle_ocr_model, legacy_paddle_ocr_model):
+    assert paddle_ocr_model.max_batch_size() == PADDLE_MAX_BATCH_SIZE
+    assert legacy_paddle_ocr_model.max_batch_size() == 1
+
+
+def test_prepare_data_for_inference_batch(paddle_ocr_model):
+    with patch(f"{_MODULE_UNDER_TEST}.base64_to_numpy") as mock_base64_to_numpy:
+        mock_base64_to_numpy.side_effect = [np.zeros((100, 50, 3)), np.zeros((40, 80, 3))]
+
+        data = {"base64_images": ["first", "second"]}
+        result = paddle_ocr_model.prepare_data_for_inference(data)
+
+    assert [image.shape for image in result["image_arrays"]] == [(100, 50, 3), (40, 80, 3)]
+
+
+def test_format_input_grpc_batch_pads_to_largest_image(paddle_ocr_model):
+    images = [np.zeros((100, 50, 3), dtype=np.uint8), np.zeros((40, 80, 3), dtype=np.uint8)]
+    expected = [preprocess_image_for_paddle(image, "0.2.1") for image in images]
+
+    data = {"base64_images": ["first", "second"], "image_arrays": images}
+    result = paddle_ocr_model.format_input(data, protocol="grpc")
+
+    batch_height = max(image.shape[1] for image in expected)
+    batch_width = max(image.shape[2] for image in expected)
+    assert result.shape == (2, 3, batch_height, batch_width)
+    assert result.dtype == np.float32
+    for i, image in enumerate(expected):
+        np.testing.assert_array_equal(result[i, :, : image.shape[1], : image.shape[2]], image)
+    assert len(data["coordinate_scales"]) == 2
+
+
+def test_format_input_http_batch(paddle_ocr_model):
+    images = [np.zeros((100, 50, 3)), np.zeros((40, 80, 3))]
+    data = {"base64_images": ["first", "second"], "image_arrays": images}
+    result = paddle_ocr_model.format_input(data, protocol="http")
+
+    assert result == {
+        "input": [
+            {"type": "image_url", "url": "data:image/png;base64,first"},
+            {"type": "image_url", "url": "data:image/png;base64,second"},
+        ]
+    }
+    assert data["coordinate_scales"] == [(50, 100), (80, 40)]
+
+
+def test_parse_output_http_batch_in_request_order(paddle_ocr_model, mock_paddle_http_response):
+    first = dict(mock_paddle_http_response["data"][0], index=0)
+    second = {
+        "index": 1,
+        "text_detections": [
+            dict(
+                mock_paddle_http_response["data"][0]["text_detections"][0],
+                text_prediction={"text": "second_text", "confidence": 0.9},
+            )
+        ],
+    }
+    response = {"data": [second, first]}
+    data = {"image_arrays": [np.zeros((10, 10, 3))] * 2, "coordinate_scales": [(10, 10), (10, 10)]}
+
+    result = paddle_ocr_model.parse_output(
+        response, protocol="http", data=data, table_content_format=TableFormatEnum.SIMPLE
+    )
+
+    assert result == [("mock_text", TableFormatEnum.SIMPLE), ("second_text", TableFormatEnum.SIMPLE)]
+
+
+def test_parse_output_grpc_batch(paddle_ocr_model):
+    bboxes = b"[[[[0.1, 0.2], [0.2, 0.2], [0.2, 0.3], [0.1, 0.3]]], [[[0.1, 0.2], [0.2, 0.2], [0.2, 0.3], [0.1, 0.3]]]]"
+    texts = b'[["first"], ["second"]]'
+    scores = b"[[0.99], [0.98]]"
+    response = np.array([bboxes, texts, scores])
+    data = {"image_arrays": [np.zeros((10, 10, 3))] * 2, "coordinate_scales": [(100, 100), (100, 100)]}
+
+    result = paddle_ocr_model.parse_output(
+        response, protocol="grpc", data=data, table_content_format=TableFormatEnum.SIMPLE
+    )
+
+    assert result == [("first", TableFormatEnum.SIMPLE), ("second", TableFormatEnum.SIMPLE)]
+
+
+def test_parse_output_batch_size_mismatch(paddle_ocr_model, mock_paddle_http_response):
+    data = {"image_arrays": [np.zeros((10, 10, 3))] * 2, "coordinate_scales": [(10, 10), (10, 10)]}
+
+    with pytest.raises(RuntimeError, match="Expected 2 results"):
+        paddle_ocr_model.parse_output(
+            mock_paddle_http_response, protocol="http", data=data, table_content_format=TableFormatEnum.SIMPLE
+        )
+
+
+@pytest.mark.parametrize("protocol", ["grpc", "http"])
+def test_single_and_batch_use_same_coordinate_scales(paddle_ocr_model, protocol):
+    # A wide image: boxes 5% of the height apart are on one row, but would be split if x and y scales were swapped.
+    image = np.zeros((100, 1000, 3), dtype=np.uint8)
+    boxes = [
+        [[0.1, 0.10], [0.2, 0.10], [0.2, 0.12], [0.1, 0.12]],
+        [[0.5, 0.15], [0.6, 0.15], [0.6, 0.17], [0.5, 0.17]],
+    ]
+    texts = ["first", "second"]
+
+    def make_response(batch_size):
+        if protocol == "grpc":
+            return np.array(
+                [json.dumps([boxes] * batch_size).encode(), json.dumps([texts] * batch_size).encode(), b"[]"]
+            )
+        detections = [
+            {
+                "text_prediction": {"text": text, "confidence": 0.99},
+                "bounding_box": {"points": [{"x": x, "y": y} for x, y in box], "confidence": None},
+            }
+            for box, text in zip(boxes, texts)
+        ]
+        return {"data": [{"index": i, "text_detections": detections} for i in range(batch_size)]}
+
+    with patch(f"{_MODULE_UNDER_TEST}.base64_to_numpy", return_value=image):
+        single_data = paddle_ocr_model.prepare_data_for_inference({"base64_image": "image"})
+        batch_data = paddle_ocr_model.prepare_data_for_inference({"base64_images": ["image", "image"]})
+
+    paddle_ocr_model.format_input(single_data, protocol=protocol)
+    single = paddle_ocr_model.parse_output(make_response(1), protocol=protocol, data=single_data)
+    paddle_ocr_model.format_input(batch_data, protocol=protocol)
+    batch = paddle_ocr_model.parse_output(make_response(2), protocol=protocol, data=batch_data)
+
+    assert single == ("| first | second |\n", TableFormatEnum.PSEUDO_MARKDOWN)
+    assert batch == [single, single]
@@ -5,6 +5,10 @@ import base64
 from PIL import Image
 
 from nv_ingest.util.nim.yolox import YoloxPageElementsModelInterface
+from nv_ingest.util.nim.yolox import postprocess_model_prediction
+from nv_ingest.util.nim.yolox import postprocess_results
+from nv_ingest.util.nim.yolox import prefilter_boxes
+from nv_ingest.util.nim.yolox import weighted_boxes_fusion
 
 
 @pytest.fixture(params=["0.2.0", "1.0.0"])
@@ -262,3 +266,99 @@ def test_process_inference_results(model_interface):
                 assert bbox[4] >= 0.6
         if "title" in result:
             assert isinstance(result["title"], list)
+
+
+def _prediction_row(cx, cy, w, h, objectness, class_scores):
+    return [cx, cy, w, h, objectness, *class_scores]
+
+
+def test_postprocess_model_prediction_nms():
+    prediction = np.array(
+        [
+            [
+                _prediction_row(100, 100, 50, 50, 0.9, [0.9, 0.05, 0.05]),
+                _prediction_row(102, 101, 50, 50, 0.8, [0.1, 0.8, 0.1]),  # Overlaps the first box.
+                _prediction_row(400, 400, 60, 20, 0.7, [0.1, 0.1, 0.8]),
+                _prediction_row(600, 600, 60, 20, 0.001, [0.1, 0.1, 0.8]),  # Below the confidence threshold.
+            ],
+            [_prediction_row(0, 0, 0, 0, 0.0, [0.0, 0.0, 0.0])] * 4,
+        ],
+        dtype=np.float32,
+    )
+
+    agnostic = postprocess_model_prediction(prediction, 3, conf_thre=0.01, nms_thre=0.5, class_agnostic=True)
+    per_class = postprocess_model_prediction(prediction, 3, conf_thre=0.01, nms_thre=0.5, class_agnostic=False)
+
+    assert agnostic[1] is None and per_class[1] is None
+    np.testing.assert_allclose(
+        agnostic[0],
+        [[75, 75, 125, 125, 0.9, 0.9, 0], [370, 390, 430, 410, 0.7, 0.8, 2]],
+        rtol=1e-6,
+    )
+    # Boxes of different classes do not suppress each other, and detections stay ordered by score.
+    assert per_class[0][:, 6].tolist() == [0, 1, 2]
+
+
+def test_postprocess_results_normalizes_and_labels_boxes():
+    detections = np.array(
+        [
+            [100, 200, 300, 400, 0.9, 1.0, 0],
+            [0, 0, 512, 512, 0.5, 0.9, 1],
+            [10, 10, 20, 20, 0.1, 0.5, 2],  # Below min_score.
+        ],
+        dtype=np.float32,
+    )
+
+    (annotations,) = postprocess_results([detections], [(1024, 1024, 3)], min_score=0.1)
+
+    # Tables are extended upward by 20% of their height.
+    assert annotations["table"] == [[0.0977, 0.1562, 0.293, 0.3906, 0.9]]
+    assert annotations["chart"] == [[0.0, 0.0, 0.5, 0.5, 0.45]]
+    assert annotations["title"] == []
+
+
+def test_weighted_boxes_fusion_merges_chains_of_overlapping_boxes():
+    boxes = np.array([[0.1, 0.1, 0.3, 0.3], [0.25, 0.25, 0.5, 0.5], [0.45, 0.45, 0.7, 0.7], [0.8, 0.8, 0.9, 0.9]])
+    scores = np.array([0.9, 0.5, 0.8, 0.7])
+    labels = np.array([1, 1, 1, 1])
+
+    merged_boxes, merged_scores, merged_labels = weighted_boxes_fusion(
+        boxes[:, None], scores[:, None], labels[:, None], iou_thr=0.01, merge_type="biggest", conf_type="max"
+    )
+
+    np.testing.assert_allclose(merged_boxes, [[0.1, 0.1, 0.7, 0.7], [0.8, 0.8, 0.9, 0.9]], rtol=1e-6)
+    np.testing.assert_allclose(merged_scores, [0.9, 0.7], rtol=1e-6)
+    assert merged_labels.tolist() == [1, 1]
+
+
+def test_weighted_boxes_fusion_weighted_class_agnostic():
+    boxes = [np.array([[0.0, 0.0, 0.4, 0.4], [0.2, 0.2, 0.6, 0.6]])]
+    scores = [np.array([0.75, 0.25])]
+    labels = [np.array([2, 1])]
+
+    merged_boxes, merged_scores, merged_labels = weighted_boxes_fusion(
+        boxes, scores, labels, iou_thr=0.1, merge_type="weighted", conf_type="avg", class_agnostic=True
+    )
+
+    np.testing.assert_allclose(merged_boxes, [[0.05, 0.05, 0.45, 0.45]], rtol=1e-6)
+    np.testing.assert_allclose(merged_scores, [1.0], rtol=1e-6)  # Average of 0.5, times 2 boxes over 1 model.
+    assert merged_labels.tolist() == [1]  # Mixed labels take the most confident non-title label.
+
+
+def test_prefilter_boxes_cleans_boxes():
+    boxes = [np.array([[0.5, 0.1, 0.2, 0.4], [-0.1, 0.2, 0.3, 1.2], [0.3, 0.3, 0.3, 0.5], [0.1, 0.1, 0.2, 0.2]])]
+    scores = [np.array([0.6, 0.9, 0.8, 0.05])]
+    labels = [np.array([0, 0, 1, 1])]
+
+    with pytest.warns(UserWarning):
+        filtered = prefilter_boxes(boxes, scores, labels, np.ones(1), thr=0.1)
+
+    # Swapped coordinates are fixed, out of range ones clipped, and empty and low-score boxes dropped.
+    assert list(filtered) == [0]
+    np.testing.assert_allclose(filtered[0][:, 4:], [[0.0, 0.2, 0.3, 1.0], [0.2, 0.1, 0.5, 0.4]])
+    np.testing.assert_allclose(filtered[0][:, 1], [0.9, 0.6])
+
+
+def test_prefilter_boxes_length_mismatch():
+    with pytest.raises(ValueError):
+        prefilter_boxes([np.zeros((2, 4))], [np.zeros(1)], [np.zeros(2)], np.ones(1), thr=0.0)
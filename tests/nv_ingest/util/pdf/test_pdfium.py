@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+
+import numpy as np
+import pypdfium2 as pdfium
+import pytest
+
+from nv_ingest.util.pdf.pdfium import get_target_render_scale
+from nv_ingest.util.pdf.pdfium import pdfium_pages_to_numpy
+from nv_ingest.util.pdf.pdfium import pdfium_render_page_to_numpy
+
+_MULTIMODAL_PDF = Path(__file__).resolve().parents[4] / "data" / "multimodal_test.pdf"
+
+
+@pytest.fixture
+def document():
+    doc = pdfium.PdfDocument.new()
+    doc.new_page(612, 792)  # US letter
+    doc.new_page(792, 612)  # Landscape
+    doc.new_page(100, 50)  # Smaller than the target at 300 DPI
+    yield doc
+    doc.close()
+
+
+def test_target_render_scale(document):
+    assert get_target_render_scale(document[0], (1536, 1536)) == pytest.approx(1535.5 / 792)
+    assert get_target_render_scale(document[1], (1536, 1536)) == pytest.approx(1535.5 / 792)
+    assert get_target_render_scale(document[2], (1536, 1536)) == pytest.approx(300 / 72)
+    assert get_target_render_scale(document[2], (1536, 1536), max_dpi=72) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "page_idx,expected_shape",
+    [
+        (0, (1536, 1187, 3)),
+        (1, (1187, 1536, 3)),
+        (2, (209, 417, 3)),
+    ],
+)
+def test_render_page_fits_target(document, page_idx, expected_shape):
+    img = pdfium_render_page_to_numpy(document[page_idx], (1536, 1536))
+
+    assert img.shape == expected_shape
+    assert img.dtype == np.uint8
+    assert (img == 255).all()  # A blank page renders white.
+
+
+def test_render_page_grayscale(document):
+    img = pdfium_render_page_to_numpy(document[0], (1024, 1024), grayscale=True)
+
+    assert img.shape == (1024, 791)
+
+
+def test_rendered_pages_do_not_share_the_render_buffer(document):
+    images, offsets = pdfium_pages_to_numpy([document[0], document[1]], target_resolution=(512, 512))
+
+    assert images[0].shape == (512, 396, 3)
+    assert images[1].shape == (396, 512, 3)
+    assert not np.shares_memory(images[0], images[1])
+    assert offsets == [(0, 0), (0, 0)]
+
+
+def test_target_resolution_with_padding(document):
+    images, offsets = pdfium_pages_to_numpy(
+        [document[0]], target_resolution=(512, 512), padding_tuple=(512, 512), grayscale=True
+    )
+
+    assert images[0].shape == (512, 512)
+    assert offsets == [(58, 0)]
+
+
+@pytest.mark.skipif(not _MULTIMODAL_PDF.exists(), reason="Test document is not available.")
+def test_target_resolution_matches_downsampled_render():
+    doc = pdfium.PdfDocument(str(_MULTIMODAL_PDF))
+    pages = [doc[i] for i in range(len(doc))]
+
+    downsampled, _ = pdfium_pages_to_numpy(pages, scale_tuple=(1536, 1536))
+    rendered, _ = pdfium_pages_to_numpy(pages, target_resolution=(1536, 1536))
+
+    for expected, actual in zip(downsampled, rendered):
+        assert abs(expected.shape[0] - actual.shape[0]) <= 1 and abs(expected.shape[1] - actual.shape[1]) <= 1
+        height, width = min(expected.shape[0], actual.shape[0]), min(expected.shape[1], actual.shape[1])
+        diff = np.abs(expected[:height, :width].astype(int) - actual[:height, :width].astype(int))
+        assert diff.mean() < 5
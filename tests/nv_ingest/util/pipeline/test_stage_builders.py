@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from ....import_checks import MORPHEUS_IMPORT_OK
+
+if MORPHEUS_IMPORT_OK:
+    from nv_ingest.util.pipeline.stage_builders import get_nemo_splitter_config
+
+
+@pytest.mark.skipif(not MORPHEUS_IMPORT_OK, reason="Morpheus modules are not available.")
+def test_nemo_splitter_config_merges_tokenizer_env_into_provided_config(monkeypatch):
+    monkeypatch.setenv("TEXT_SPLITTER_TOKENIZER_PATH", "/models/tokenizer.json")
+    monkeypatch.setenv("TEXT_SPLITTER_TOKENIZER_CACHE_MAX_BYTES", "1024")
+    ingest_config = {"text_splitting_module": {"raise_on_failure": True}}
+
+    config = get_nemo_splitter_config(ingest_config)
+
+    assert config == {
+        "raise_on_failure": True,
+        "tokenizer_path": "/models/tokenizer.json",
+        "tokenizer_cache_max_bytes": 1024,
+    }
+    assert ingest_config == {"text_splitting_module": {"raise_on_failure": True}}
+
+
+@pytest.mark.skipif(not MORPHEUS_IMPORT_OK, reason="Morpheus modules are not available.")
+def test_nemo_splitter_config_prefers_explicit_values(monkeypatch):
+    monkeypatch.setenv("TEXT_SPLITTER_TOKENIZER_PATH", "/models/env.json")
+    monkeypatch.setenv("TEXT_SPLITTER_TOKENIZER_CACHE_MAX_BYTES", "1024")
+
+    config = get_nemo_splitter_config(
+        {"text_splitting_module": {"tokenizer_path": "/models/config.json", "tokenizer_cache_max_bytes": 0}}
+    )
+
+    assert config == {"tokenizer_path": "/models/config.json", "tokenizer_cache_max_bytes": 0}
+
+
+@pytest.mark.skipif(not MORPHEUS_IMPORT_OK, reason="Morpheus modules are not available.")
+def test_nemo_splitter_config_without_section_or_env(monkeypatch):
+    monkeypatch.delenv("TEXT_SPLITTER_TOKENIZER_PATH", raising=False)
+    monkeypatch.delenv("TEXT_SPLITTER_TOKENIZER_CACHE_MAX_BYTES", raising=False)
+
+    assert get_nemo_splitter_config({}) == {}
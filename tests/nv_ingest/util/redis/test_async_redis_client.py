@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+from redis import RedisError
+
+from nv_ingest.util.message_brokers.redis.async_redis_client import AsyncRedisClient
+
+MODULE_UNDER_TEST = "nv_ingest.util.message_brokers.redis.async_redis_client"
+
+TEST_PAYLOAD = '{"job_id": 123, "job_payload": "abc"}'
+
+
+@pytest.fixture
+def mock_redis():
+    mock = AsyncMock()
+    mock.ping.return_value = True
+    mock.blpop.return_value = ("queue", TEST_PAYLOAD)
+    mock.rpush.return_value = 1
+
+    return mock
+
+
+@pytest.fixture
+def async_redis_client(mock_redis):
+    return AsyncRedisClient(host="localhost", port=6379, redis_allocator=Mock(return_value=mock_redis))
+
+
+@pytest.fixture
+def no_sleep():
+    with patch(f"{MODULE_UNDER_TEST}.asyncio.sleep", new=AsyncMock()) as sleep:
+        yield sleep
+
+
+def test_ping(async_redis_client, mock_redis):
+    assert asyncio.run(async_redis_client.ping()) is True
+
+    mock_redis.ping.side_effect = RedisError("Ping failed")
+    assert asyncio.run(async_redis_client.ping()) is False
+
+
+def test_fetch_message_successful(async_redis_client, mock_redis):
+    message = asyncio.run(async_redis_client.fetch_message("queue", timeout=5))
+
+    assert json.dumps(message) == TEST_PAYLOAD
+    mock_redis.blpop.assert_awaited_once_with(["queue"], 5)
+
+
+def test_fetch_message_timeout(async_redis_client, mock_redis):
+    mock_redis.blpop.return_value = None
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(async_redis_client.fetch_message("queue", timeout=5))
+
+
+def test_fetch_message_combines_fragments(async_redis_client, mock_redis):
+    fragments = [
+        {"status": "success", "description": "", "data": [f"item_{i}"], "fragment": i, "fragment_count": 3}
+        for i in range(3)
+    ]
+    mock_redis.blpop.side_effect = [("queue", json.dumps(fragment)) for fragment in reversed(fragments)]
+
+    message = asyncio.run(async_redis_client.fetch_message("queue"))
+
+    assert message["data"] == ["item_0", "item_1", "item_2"]
+    assert "fragment" not in message
+
+
+def test_fetch_message_with_retries(async_redis_client, mock_redis, no_sleep):
+    mock_redis.blpop.side_effect = [RedisError("Temporary fetch failure"), ("queue", TEST_PAYLOAD)]
+    async_redis_client.max_retries = 1
+
+    message = asyncio.run(async_redis_client.fetch_message("queue"))
+
+    assert json.dumps(message) == TEST_PAYLOAD
+    assert mock_redis.blpop.await_count == 2
+    no_sleep.assert_awaited_once()
+
+
+def test_fetch_message_exceeds_max_retries(async_redis_client, mock_redis, no_sleep):
+    mock_redis.blpop.side_effect = RedisError("Persistent fetch failure")
+
+    with pytest.raises(ValueError):
+        asyncio.run(async_redis_client.fetch_message("queue"))
+
+    assert mock_redis.blpop.await_count == 1
+
+
+def test_fetch_message_invalid_json(async_redis_client, mock_redis):
+    mock_redis.blpop.return_value = ("queue", "not json")
+
+    with pytest.raises(ValueError):
+        asyncio.run(async_redis_client.fetch_message("queue"))
+
+
+def test_submit_message_with_retries(async_redis_client, mock_redis, no_sleep):
+    mock_redis.rpush.side_effect = [RedisError("Temporary submission failure"), 1]
+
+    asyncio.run(async_redis_client.submit_message("test_queue", "test_message"))
+
+    assert mock_redis.rpush.await_count == 2
+    mock_redis.rpush.assert_awaited_with("test_queue", "test_message")
+
+
+def test_submit_message_exceeds_max_retries(async_redis_client, mock_redis, no_sleep):
+    async_redis_client.max_retries = 1
+    mock_redis.rpush.side_effect = RedisError("Persistent submission failure")
+
+    with pytest.raises(RedisError):
+        asyncio.run(async_redis_client.submit_message("test_queue", "test_message"))
+
+    assert mock_redis.rpush.await_count == 1
@@ -2,10 +2,14 @@
 # All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import threading
 from collections import deque
 from statistics import mean
 from statistics import median
 
+import pytest
+
 from nv_ingest.util.telemetry.global_stats import GlobalStats
 
 
@@ -86,3 +90,62 @@ def test_get_all_stats():
     assert all_stats["global_stats"]["submitted_jobs"] == 5, "Global stats should be retrieved correctly"
     assert all_stats["job_stats"]["job_1"]["mean"] == 15, "Job stats should be retrieved correctly"
     assert all_stats["job_stats"]["job_1"]["median"] == 15, "Job stats should be retrieved correctly"
+
+
+def test_get_job_stat_quantiles():
+    gs = GlobalStats.get_instance()
+    for value in range(1, 101):
+        gs.append_job_stat("job_1", value)
+
+    assert gs.get_job_stat("job_1", "p50") == pytest.approx(50, rel=0.01)
+    assert gs.get_job_stat("job_1", "p99") == pytest.approx(99, rel=0.01)
+    assert gs.get_job_stat("job_1", "count") == 100
+
+
+def test_snapshot_is_a_detached_copy():
+    gs = GlobalStats.get_instance()
+    gs.set_stat("submitted_jobs", 1)
+    gs.append_job_stat("job_1", 10)
+
+    snapshot = gs.snapshot()
+    gs.set_stat("submitted_jobs", 2)
+    gs.append_job_stat("job_1", 30)
+
+    assert snapshot["global_stats"]["submitted_jobs"] == 1
+    assert snapshot["job_stats"]["job_1"]["count"] == 1
+    assert snapshot["job_stats"]["job_1"]["mean"] == 10
+    json.dumps(snapshot)
+
+
+def test_concurrent_updates_and_snapshots():
+    gs = GlobalStats.get_instance()
+    threads, per_thread = 8, 2_000
+
+    def record():
+        for i in range(per_thread):
+            gs.increment_stat("completed_jobs")
+            gs.append_job_stat("stage", i)
+
+    def read():
+        for _ in range(200):
+            gs.snapshot()
+
+    workers = [threading.Thread(target=record) for _ in range(threads)] + [threading.Thread(target=read)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    snapshot = gs.snapshot()
+    assert snapshot["global_stats"]["completed_jobs"] == threads * per_thread
+    assert snapshot["job_stats"]["stage"]["count"] == threads * per_thread
+    assert sum(snapshot["job_stats"]["stage"]["histogram"]["counts"]) == threads * per_thread
+
+
+def test_get_all_stats_keeps_window_values():
+    gs = GlobalStats.get_instance()
+    gs.max_jobs = 2
+    for value in (10, 20, 30):
+        gs.append_job_stat("job_1", value)
+
+    assert gs.get_all_stats()["job_stats"]["job_1"]["values"] == [20, 30]
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import random
+from statistics import mean
+from statistics import median
+
+import numpy as np
+import pytest
+
+from nv_ingest.util.telemetry.streaming_stats import DDSketch
+from nv_ingest.util.telemetry.streaming_stats import StreamingStat
+
+
+@pytest.mark.parametrize("q", [0.0, 0.5, 0.95, 0.99, 1.0])
+def test_ddsketch_quantiles_within_relative_accuracy(q):
+    values = np.random.default_rng(0).lognormal(mean=3, sigma=1.5, size=10_000)
+    sketch = DDSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    expected = np.quantile(values, q, method="lower")
+    assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_ddsketch_merge_matches_single_sketch():
+    values = np.random.default_rng(1).exponential(100, size=2_000)
+    whole, left, right = DDSketch(), DDSketch(), DDSketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 2 else right).add(value)
+
+    left.merge(right)
+
+    assert left.count == whole.count
+    for q in (0.5, 0.95, 0.99):
+        assert left.quantile(q) == whole.quantile(q)
+
+    with pytest.raises(ValueError):
+        left.merge(DDSketch(relative_accuracy=0.05))
+
+
+def test_ddsketch_zero_and_empty():
+    sketch = DDSketch()
+    assert sketch.quantile(0.5) is None
+
+    for value in (0, 0, 0, 10):
+        sketch.add(value)
+
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(10, rel=0.01)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def test_streaming_stat_window_matches_statistics_module():
+    stat = StreamingStat(window_size=7)
+    values = [random.Random(i).uniform(0, 1000) for i in range(50)]
+
+    for i, value in enumerate(values, start=1):
+        stat.add(value)
+        window = values[max(0, i - 7) : i]
+        assert stat.mean == pytest.approx(mean(window))
+        assert stat.median == median(window)
+        assert list(stat.values) == window
+
+    assert stat.count == len(values)
+    assert stat.get("total_mean") == pytest.approx(mean(values))
+    assert stat.get("min") == min(values) and stat.get("max") == max(values)
+
+
+def test_streaming_stat_histogram_and_snapshot():
+    stat = StreamingStat(window_size=10, bucket_bounds=(10, 100))
+    for value in (5, 10, 11, 100, 1000):
+        stat.add(value)
+
+    snapshot = stat.snapshot(quantiles=(0.5, 0.999))
+
+    assert snapshot["histogram"] == {"bounds": [10, 100], "counts": [2, 2, 1]}
+    assert snapshot["count"] == 5
+    assert snapshot["p50"] == pytest.approx(11, rel=0.01)
+    assert snapshot["p99.9"] == pytest.approx(100, rel=0.01)
+    assert stat["p50"] == snapshot["p50"]
+    json.dumps(snapshot)
+
+
+def test_streaming_stat_merge_and_copy():
+    first, second = StreamingStat(), StreamingStat()
+    for value in range(1, 51):
+        first.add(value)
+        second.add(value + 50)
+
+    copy = first.copy()
+    first.merge(second)
+
+    assert first.count == 100 and first.get("max") == 100
+    assert first.get("total_mean") == pytest.approx(50.5)
+    assert sum(first.bucket_counts) == 100
+    assert first.quantile(0.5) == pytest.approx(50, rel=0.02)
+    assert copy.count == 50 and copy.get("max") == 50
+
+
+def test_streaming_stat_empty_and_unknown():
+    stat = StreamingStat()
+
+    assert stat.snapshot()["mean"] == 0.0 and stat.snapshot()["p99"] == 0.0 and stat.get("min") == 0.0
+    with pytest.raises(KeyError):
+        stat.get("variance")
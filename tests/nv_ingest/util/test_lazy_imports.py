@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from nv_ingest.util.lazy_imports import lazy_module_attributes
+
+_HEAVY_MODULES = {"cv2", "docx", "pptx", "pymilvus", "pypdfium2", "torch", "torchvision", "tritonclient", "wand"}
+
+
+def _imported_modules(module_name):
+    """Imports `module_name` in a fresh interpreter, returning its `-X importtime` cumulative times by module (us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    if result.returncode != 0:
+        pytest.skip(f"{module_name} cannot be imported here: {result.stderr.strip().splitlines()[-1]}")
+
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            imported[name.strip()] = int(cumulative)
+
+    return imported
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "nv_ingest.schemas",
+        "nv_ingest.extraction_workflows.docx",
+        "nv_ingest.extraction_workflows.image",
+        "nv_ingest.extraction_workflows.pdf",
+        "nv_ingest.extraction_workflows.pptx",
+        "nv_ingest_client.nv_ingest_cli",
+    ],
+)
+def test_entry_modules_do_not_import_heavy_dependencies(module_name):
+    imported = _imported_modules(module_name)
+
+    heavy = sorted(name for name in imported if name.split(".")[0] in _HEAVY_MODULES and "." not in name)
+    top_offenders = sorted(imported.items(), key=lambda item: item[1], reverse=True)[:10]
+    assert not heavy, f"{module_name} imports {heavy}; slowest imports (us): {top_offenders}"
+
+
+def test_lazy_module_attributes_resolves_and_caches():
+    module = types.ModuleType("lazy_test_module")
+    module.__getattr__, module.__dir__ = lazy_module_attributes(
+        "lazy_test_module", {"join": ("os.path", "join"), "missing": ("os.path", "no_such_attribute")}
+    )
+    sys.modules["lazy_test_module"] = module
+    try:
+        assert "join" not in vars(module)
+        assert "join" in dir(module)
+
+        assert module.join is os.path.join
+        assert vars(module)["join"] is os.path.join
+
+        assert not hasattr(module, "unknown")
+        with pytest.raises(AttributeError):
+            module.missing
+    finally:
+        del sys.modules["lazy_test_module"]
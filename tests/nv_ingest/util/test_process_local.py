@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing as mp
+import threading
+from unittest.mock import Mock
+
+from nv_ingest.util.process_local import ProcessLocal
+from nv_ingest.util.process_local import register_exit_finalizer
+
+
+def _value_in_child(process_local, queue):
+    queue.put(process_local.get())
+
+
+def test_get_creates_value_once():
+    factory = Mock(side_effect=lambda: object())
+    process_local = ProcessLocal(factory)
+
+    threads = [threading.Thread(target=process_local.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert process_local.get() is process_local.get()
+    factory.assert_called_once()
+
+
+def test_get_caches_none():
+    factory = Mock(return_value=None)
+    process_local = ProcessLocal(factory)
+
+    assert process_local.get() is None
+    assert process_local.get() is None
+    factory.assert_called_once()
+
+
+def test_set_and_reset():
+    process_local = ProcessLocal(lambda: "created")
+
+    process_local.set("replaced")
+    assert process_local.get() == "replaced"
+
+    process_local.reset()
+    assert process_local.get() == "created"
+
+
+def test_forked_child_creates_its_own_value():
+    process_local = ProcessLocal(lambda: mp.current_process().pid)
+    parent_value = process_local.get()
+
+    context = mp.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_value_in_child, args=(process_local, queue))
+    process.start()
+    child_value = queue.get(timeout=30)
+    process.join()
+
+    assert child_value == process.pid
+    assert process_local.get() == parent_value
+
+
+def test_register_exit_finalizer():
+    callback = Mock()
+    finalizer = register_exit_finalizer(callback, "arg")
+
+    assert finalizer.still_active()
+
+    finalizer()
+    callback.assert_called_once_with("arg")
+    assert not finalizer.still_active()
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import pytest
+
+from nv_ingest.schemas.metadata_schema import ContentTypeEnum
+from nv_ingest.util.text_splitting.splitter import get_unit_offsets
+from nv_ingest.util.text_splitting.splitter import get_window_texts
+from nv_ingest.util.text_splitting.splitter import split_documents
+from nv_ingest.util.text_splitting.splitter import split_text
+from nv_ingest.util.text_splitting.tokenizer import CachedTokenizer
+
+_DELIMITERS = {"word": " ", "sentence": ".", "passage": "\n\n"}
+
+
+def _reference_split_text(text, split_by, split_length, split_overlap, max_character_length):
+    # A direct list-based version of the splitter: units keep their delimiter, windows of `split_length` units start
+    # every `split_length - split_overlap` units until every unit is covered, long windows are cut into pieces.
+    delimiter = _DELIMITERS[split_by]
+    units = text.split(delimiter)
+    units = [unit + delimiter for unit in units[:-1]] + units[-1:]
+
+    step = split_length - split_overlap
+    windows = [units[0:split_length]]
+    start = step
+    while start + split_length - step < len(units):
+        windows.append(units[start : start + split_length])
+        start += step
+
+    splits = []
+    for window in windows:
+        window_text = "".join(window)
+        if max_character_length and len(window_text) > max_character_length:
+            splits.extend(
+                window_text[i : i + max_character_length] for i in range(0, len(window_text), max_character_length)
+            )
+        elif window_text:
+            splits.append(window_text)
+    return splits
+
+
+@pytest.mark.parametrize(
+    "text,split_by,expected",
+    [
+        ("a b c", "word", [0, 2, 4, 5]),
+        ("a. b.", "sentence", [0, 2, 5, 5]),
+        ("a\n\n\n\nb\n\n\nc", "passage", [0, 3, 5, 8, 10]),
+        ("", "word", [0, 0]),
+    ],
+)
+def test_get_unit_offsets(text, split_by, expected):
+    assert get_unit_offsets(text, split_by).tolist() == expected
+
+
+def test_get_unit_offsets_rejects_unknown_unit():
+    with pytest.raises(NotImplementedError):
+        get_unit_offsets("text", "paragraph")
+
+
+@pytest.mark.parametrize(
+    "text,split_length,split_overlap,max_character_length,expected",
+    [
+        ("a b c d e", 3, 1, None, ["a b c ", "c d e"]),
+        ("a b c d e f", 3, 1, None, ["a b c ", "c d e ", "e f"]),
+        ("a b c d", 3, 0, None, ["a b c ", "d"]),
+        ("a b", 3, 1, None, ["a b"]),
+        ("abcdefghij", 1, 0, 4, ["abcd", "efgh", "ij"]),
+        ("", 3, 1, 4, []),
+    ],
+)
+def test_split_text(text, split_length, split_overlap, max_character_length, expected):
+    assert split_text(text, "word", split_length, split_overlap, max_character_length) == expected
+
+
+def test_split_text_rejects_overlap_not_smaller_than_length():
+    with pytest.raises(ValueError, match="split_overlap must be smaller than split_length"):
+        split_text("a b c", "word", 2, 2, None)
+
+
+@pytest.mark.parametrize("split_by", ["word", "sentence", "passage"])
+def test_split_text_matches_reference(split_by):
+    rng = random.Random(split_by)
+    vocabulary = ["alpha", "beta", "gamma", "delta", " ", ".", "\n\n", "\n"]
+    for _ in range(200):
+        text = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 80)))
+        split_length = rng.randint(1, 8)
+        split_overlap = rng.randint(0, split_length - 1)
+        max_character_length = rng.choice([None, 5, 17, 450])
+
+        assert split_text(text, split_by, split_length, split_overlap, max_character_length) == _reference_split_text(
+            text, split_by, split_length, split_overlap, max_character_length
+        )
+
+
+def test_get_window_texts():
+    splits = ["A.", " B.", " C.", " D."]
+    assert get_window_texts(splits, 1) == ["A. B.", "A. B. C.", " B. C. D.", " C. D."]
+    assert get_window_texts(splits, 10) == ["A. B. C. D."] * 4
+    assert get_window_texts([], 1) == []
+
+
+def test_split_documents_builds_chunk_rows():
+    source_metadata = {"source_id": "doc.pdf"}
+    metadata_column = [
+        {"content": "First. Second. Third.", "source_metadata": source_metadata},
+        {"content": "Only.", "source_metadata": source_metadata},
+    ]
+
+    df = split_documents(metadata_column, "sentence", 1, 0, None, 1)
+
+    assert df.columns.tolist() == ["document_type", "metadata", "uuid"]
+    assert (df["document_type"] == ContentTypeEnum.TEXT.value).all()
+    assert df["uuid"].nunique() == len(df)
+    assert [m["content"] for m in df["metadata"]] == ["First.", " Second.", " Third.", "Only."]
+    assert [m["window"] for m in df["metadata"]] == [
+        "First. Second.",
+        "First. Second. Third.",
+        " Second. Third.",
+        "Only.",
+    ]
+    assert [m["original_text"] for m in df["metadata"]] == ["First.", " Second.", " Third.", "Only."]
+    # Parent metadata is not modified, and nested structures are shared rather than copied.
+    assert metadata_column[0]["content"] == "First. Second. Third."
+    assert all(m["source_metadata"] is source_metadata for m in df["metadata"])
+
+
+def test_split_documents_drops_whitespace_chunks():
+    df = split_documents([{"content": "a   b"}], "word", 1, 0, None, 0)
+
+    assert [m["content"] for m in df["metadata"]] == ["a ", "b"]
+    assert "window" not in df["metadata"][0]
+
+
+def test_split_documents_without_content():
+    with pytest.raises(ValueError, match="'content' values are None"):
+        split_documents([{"content": None}], "word", 10, 0, None, 0)
+
+    assert split_documents([], "word", 10, 0, None, 0).empty
+
+
+@pytest.fixture
+def word_level_tokenizer():
+    tokenizers = pytest.importorskip("tokenizers")
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+
+    tokenizer = tokenizers.Tokenizer(WordLevel({"[UNK]": 0}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    return CachedTokenizer(tokenizer, "word_level")
+
+
+def test_split_text_by_token(word_level_tokenizer):
+    text = "one two, three four. five"
+
+    # Tokens: "one", "two", ",", "three", "four", ".", "five"; max_character_length is not applied.
+    assert split_text(text, "token", 3, 1, 5, tokenizer=word_level_tokenizer) == [
+        "one two, ",
+        ", three four",
+        "four. five",
+    ]
+
+
+def test_split_documents_by_token(word_level_tokenizer):
+    df = split_documents(
+        [{"content": "a b c d e"}, {"content": "f g"}], "token", 2, 0, 450, 0, tokenizer=word_level_tokenizer
+    )
+
+    assert [m["content"] for m in df["metadata"]] == ["a b ", "c d ", "e", "f g"]
+
+
+def test_split_by_token_requires_tokenizer():
+    with pytest.raises(ValueError, match="requires a tokenizer"):
+        split_documents([{"content": "a b"}], "token", 2, 0, None, 0)
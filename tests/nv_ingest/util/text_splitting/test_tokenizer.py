@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from nv_ingest.util.nim.inference_cache import InferenceCache
+from nv_ingest.util.text_splitting.tokenizer import CachedTokenizer
+from nv_ingest.util.text_splitting.tokenizer import load_tokenizer
+
+
+class FakeTokenizer:
+    """Tokenizes on runs of non-whitespace and records every text it encodes."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode_batch(self, texts, add_special_tokens=True):
+        assert add_special_tokens is False
+        self.encoded.extend(texts)
+        return [SimpleNamespace(offsets=[m.span() for m in re.finditer(r"\S+", text)]) for text in texts]
+
+
+def _units(text, offsets):
+    return [text[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def test_get_unit_offsets_covers_the_text():
+    tokenizer = CachedTokenizer(FakeTokenizer(), "fake")
+
+    offsets = tokenizer.get_unit_offsets(["  alpha beta\ngamma  ", "", "   "])
+
+    assert _units("  alpha beta\ngamma  ", offsets[0].tolist()) == ["  alpha ", "beta\n", "gamma  "]
+    assert offsets[1].tolist() == [0, 0]
+    assert offsets[2].tolist() == [0, 3]
+    assert tokenizer.count_tokens(["alpha beta gamma", ""]) == [3, 1]
+
+
+def test_repeated_texts_are_tokenized_once():
+    fake = FakeTokenizer()
+    tokenizer = CachedTokenizer(fake, "fake", cache=InferenceCache(max_bytes=1024 * 1024))
+
+    first = tokenizer.get_unit_offsets(["header text", "body one", "header text"])
+    second = tokenizer.get_unit_offsets(["body two", "header text"])
+
+    assert fake.encoded == ["header text", "body one", "body two"]
+    assert first[0].tolist() == first[2].tolist() == second[1].tolist() == [0, 7, 11]
+    assert tokenizer.get_cache_metrics()["memory_hits"] == 1
+
+
+def test_cache_is_keyed_by_tokenizer_name():
+    fake = FakeTokenizer()
+    cache = InferenceCache(max_bytes=1024 * 1024)
+
+    CachedTokenizer(fake, "first", cache=cache).get_unit_offsets(["some text"])
+    CachedTokenizer(fake, "second", cache=cache).get_unit_offsets(["some text"])
+
+    assert fake.encoded == ["some text", "some text"]
+
+
+def test_load_tokenizer_from_file(tmp_path):
+    tokenizers = pytest.importorskip("tokenizers")
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+
+    tokenizer = tokenizers.Tokenizer(WordLevel({"[UNK]": 0, "hello": 1, "world": 2}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    path = str(tmp_path / "tokenizer.json")
+    tokenizer.save(path)
+
+    loaded = load_tokenizer(path, 1024 * 1024)
+
+    assert load_tokenizer(path, 1024 * 1024) is loaded
+    assert _units("hello, world", loaded.get_unit_offsets(["hello, world"])[0].tolist()) == ["hello", ", ", "world"]
+    assert loaded.get_cache_metrics()["stores"] == 1
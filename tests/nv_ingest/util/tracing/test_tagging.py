@@ -187,3 +187,27 @@ def test_traceable_func_dedupe_disabled():
 
     assert "trace::entry::no_dedupe_test_1" not in trace_info
     assert "trace::exit::no_dedupe_test_1" not in trace_info
+
+
+def test_traceable_func_dedupe_concurrent_calls():
+    """
+    Test that concurrent calls sharing a trace_info dictionary each get their own trace keys.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    num_calls = 8
+    barrier = threading.Barrier(num_calls)
+
+    @traceable_func(trace_name="concurrent_test")
+    def concurrent_test(**kwargs):
+        barrier.wait(timeout=5)
+
+    trace_info = {}
+    with ThreadPoolExecutor(max_workers=num_calls) as executor:
+        for future in [executor.submit(concurrent_test, trace_info=trace_info) for _ in range(num_calls)]:
+            future.result()
+
+    for i in range(num_calls):
+        assert f"trace::entry::concurrent_test_{i}" in trace_info
+        assert f"trace::exit::concurrent_test_{i}" in trace_info
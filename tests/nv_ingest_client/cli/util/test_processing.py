@@ -3,8 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from nv_ingest_client.cli.util.processing import JobSpecPrefetcher
+from nv_ingest_client.cli.util.processing import create_and_process_jobs
 from nv_ingest_client.cli.util.processing import get_valid_filename
 from nv_ingest_client.cli.util.processing import save_response_data
 
@@ -82,3 +87,125 @@ def test_get_valid_filename():
     with pytest.raises(ValueError) as excinfo:
         get_valid_filename("$.$.$")
         assert "Could not derive file name from '$.$.$'" in str(excinfo.value)
+
+
+class _FakeClient:
+    """Completes each job after the delay given for its file, and times out the first `timeouts` fetches of each."""
+
+    def __init__(self, delays, timeouts=0):
+        self.delays = delays
+        self.timeouts = timeouts
+        self.fetch_attempts = {}
+        self.submitted = []
+        self.completed = []
+        self.max_in_flight = 0
+        self._in_flight = set()
+        self._job_specs = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=16)
+
+    def add_job(self, job_spec):
+        job_id = str(len(self._job_specs))
+        self._job_specs[job_id] = job_spec
+        return job_id
+
+    def submit_job(self, job_id, job_queue_id):
+        assert self._job_specs[job_id].payload
+        source = self._job_specs[job_id].source_id
+        with self._lock:
+            self.submitted.append(source)
+            self._in_flight.add(job_id)
+            self.max_in_flight = max(self.max_in_flight, len(self._in_flight))
+
+    def _fetch(self, job_id, timeout):
+        source = self._job_specs[job_id].source_id
+        attempt = self.fetch_attempts[job_id] = self.fetch_attempts.get(job_id, 0) + 1
+        if attempt <= self.timeouts:
+            raise TimeoutError()
+
+        time.sleep(self.delays[source])
+        with self._lock:
+            self._in_flight.discard(job_id)
+            self.completed.append(source)
+        return [({"status": "success", "description": "", "data": [], "trace": {}}, job_id, f"trace-{job_id}")]
+
+    def fetch_job_result_async(self, job_ids, timeout=10, data_only=True):
+        return {self._pool.submit(self._fetch, job_ids, timeout): job_ids}
+
+
+@pytest.fixture
+def text_files(tmp_path):
+    files = []
+    for i in range(8):
+        path = tmp_path / f"doc_{i}.txt"
+        path.write_text(" ".join([f"document{i}"] * 300))  # Estimated as one page
+        files.append(str(path))
+    return files
+
+
+def test_create_and_process_jobs_keeps_window_full(text_files):
+    # The first document is slow; the others must not wait for it.
+    delays = {file: 0.01 for file in text_files}
+    delays[text_files[0]] = 0.5
+    client = _FakeClient(delays)
+
+    total_files, _, total_pages, trace_ids = create_and_process_jobs(
+        text_files, client, tasks={}, output_directory=None, batch_size=3
+    )
+
+    assert total_files == len(text_files)
+    assert total_pages == len(text_files)
+    assert client.submitted == text_files
+    assert client.max_in_flight == 3
+    assert client.completed[-1] == text_files[0]
+    assert set(trace_ids) == set(text_files)
+
+
+def test_create_and_process_jobs_refetches_timed_out_jobs(text_files):
+    client = _FakeClient({file: 0 for file in text_files}, timeouts=2)
+
+    _, _, total_pages, _ = create_and_process_jobs(text_files, client, tasks={}, output_directory=None, batch_size=4)
+
+    assert total_pages == len(text_files)
+    assert sorted(client.completed) == sorted(text_files)
+    assert all(attempts == 3 for attempts in client.fetch_attempts.values())
+
+
+def test_create_and_process_jobs_skips_unreadable_files(text_files, tmp_path):
+    unreadable = tmp_path / "unknown.xyz"
+    unreadable.write_text("Not a supported document type")
+    unreadable = str(unreadable)
+    client = _FakeClient({file: 0 for file in text_files})
+
+    total_files, _, total_pages, _ = create_and_process_jobs(
+        [unreadable] + text_files, client, tasks={}, output_directory=None, batch_size=2
+    )
+
+    assert total_files == len(text_files) + 1
+    assert client.submitted == text_files
+
+    with pytest.raises(RuntimeError, match="unknown.xyz"):
+        create_and_process_jobs([unreadable], client, tasks={}, output_directory=None, batch_size=2, fail_on_error=True)
+
+
+def test_job_spec_prefetcher(text_files):
+    prefetcher = JobSpecPrefetcher(text_files, {}, depth=2)
+    try:
+        items = []
+        while (item := prefetcher.get()) is not None:
+            items.append(item)
+
+        assert [file for file, _, _ in items] == text_files
+        assert all(job_spec.payload and page_count == 1 for _, job_spec, page_count in items)
+        assert prefetcher.get() is None
+    finally:
+        prefetcher.stop()
+
+
+def test_job_spec_prefetcher_raises_task_errors(text_files):
+    prefetcher = JobSpecPrefetcher(text_files, {"not_a_task": object()}, depth=2)
+    try:
+        with pytest.raises(ValueError, match="Invalid task type"):
+            prefetcher.get()
+    finally:
+        prefetcher.stop()
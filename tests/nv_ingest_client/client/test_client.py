@@ -2,7 +2,9 @@
 # All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
 import json
+import os
 import random
 import re
 import uuid
@@ -22,6 +24,7 @@ from nv_ingest_client.primitives.jobs import JobStateEnum
 from nv_ingest_client.primitives.tasks import ExtractTask
 from nv_ingest_client.primitives.tasks import SplitTask
 from nv_ingest_client.primitives.tasks import TaskType
+from nv_ingest_client.util.blob_store import FileBlobStore
 
 MODULE_UNDER_TEST = "nv_ingest_client.client.client"
 
@@ -328,6 +331,66 @@ def test_successful_job_submission(nv_ingest_client_with_jobs):
     assert nv_ingest_client_with_jobs._job_states[job_id].state == JobStateEnum.SUBMITTED
 
 
+def test_job_submission_offloads_large_content_to_blob_store(extended_mock_client_allocator, tmp_path):
+    store = FileBlobStore(str(tmp_path))
+    client = NvIngestClient(
+        message_client_allocator=extended_mock_client_allocator,
+        blob_store_threshold_bytes=100,
+        blob_store=store,
+    )
+    pdf = os.urandom(1000)
+    client._job_states = {
+        "job1": JobState(
+            JobSpec(payload=base64.b64encode(pdf).decode("utf-8"), source_id="a", document_type="pdf"),
+            state=JobStateEnum.PENDING,
+        )
+    }
+
+    client.submit_job("job1", "test_queue")
+
+    _, job_spec_str = client._message_client.submitted_messages[0]
+    assert store.get(json.loads(job_spec_str)["job_payload"]["content"][0]) == pdf
+
+
+def test_job_submission_offload_results_opt_in(extended_mock_client_allocator):
+    for offload_results in (False, True):
+        client = NvIngestClient(
+            message_client_allocator=extended_mock_client_allocator, offload_results=offload_results
+        )
+        client._job_states = {"job1": JobState(JobSpec(), state=JobStateEnum.PENDING)}
+
+        client.submit_job("job1", "test_queue")
+
+        _, job_spec_str = client._message_client.submitted_messages[-1]
+        assert json.loads(job_spec_str).get("offload_results", False) is offload_results
+
+
+def test_fetch_job_result_keeps_job_state_when_blobs_are_unreadable(extended_mock_client_allocator, tmp_path):
+    store = FileBlobStore(str(tmp_path))
+    client = NvIngestClient(message_client_allocator=extended_mock_client_allocator, blob_store=store)
+    image = os.urandom(1000)
+    reference = store.put(image)
+    os.remove(store._blob_path(reference))
+    job_spec = JobSpec()
+    job_spec.job_id = "job-channel"
+    client._job_states = {"job1": JobState(job_spec, state=JobStateEnum.SUBMITTED)}
+    result = {"data": [{"document_type": "image", "metadata": {"content": reference}}]}
+    client._message_client.messages["job-channel"] = ResponseSchema(response_code=0, response=json.dumps(result))
+
+    with pytest.raises(RuntimeError, match="fetch it again to retry"):
+        client._fetch_job_result("job1")
+    assert client._job_states["job1"].state == JobStateEnum.SUBMITTED
+
+    # The retry reads the result kept on the job state, not the broker.
+    del client._message_client.messages["job-channel"]
+    assert store.put(image) == reference
+    data, job_index, _ = client._fetch_job_result("job1")
+
+    assert job_index == "job1"
+    assert data[0]["metadata"]["content"] == base64.b64encode(image).decode("utf-8")
+    assert "job1" not in client._job_states
+
+
 def test_submit_job_nonexistent_id_raises(nv_ingest_client_with_jobs):
     with pytest.raises(ValueError):
         nv_ingest_client_with_jobs.submit_job("nonexistent_job", "test_queue")
@@ -22,7 +22,7 @@ def test_dedup_task_initialization():
 
 def test_dedup_task_str_representation():
     task = DedupTask(content_type="image", filter=True)
-    expected_str = "Dedup Task:\n" "  content_type: image\n" "  filter: True\n"
+    expected_str = "Dedup Task:\n" "  content_type: image\n" "  filter: True\n" "  method: exact\n"
     assert str(task) == expected_str
 
 
@@ -88,3 +88,13 @@ def test_dedup_task_default_params():
     }
 
     assert task.to_dict() == expected_dict
+
+
+def test_dedup_task_perceptual_method():
+    task = DedupTask(filter=True, method="perceptual")
+
+    assert "method: perceptual" in str(task)
+    assert task.to_dict() == {
+        "type": "dedup",
+        "task_properties": {"content_type": "image", "params": {"filter": True, "method": "perceptual"}},
+    }
@@ -48,6 +48,7 @@ def test_split_task_str_representation():
         ("word", 100, 10, 1000, 5),
         ("sentence", 50, 5, None, None),
         ("passage", None, None, 1500, 3),
+        ("token", 512, 64, None, None),
         (None, None, None, None, None),  # Test default parameters
     ],
 )
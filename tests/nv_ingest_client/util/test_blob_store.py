@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+import hashlib
+import io
+import os
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+from nv_ingest_client.util.blob_store import FileBlobStore
+from nv_ingest_client.util.blob_store import MinioBlobStore
+from nv_ingest_client.util.blob_store import is_blob_reference
+from nv_ingest_client.util.blob_store import offload_job_payload
+from nv_ingest_client.util.blob_store import offload_result_content
+from nv_ingest_client.util.blob_store import resolve_content
+from nv_ingest_client.util.blob_store import resolve_result_content
+
+MODULE_UNDER_TEST = "nv_ingest_client.util.blob_store"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FileBlobStore(str(tmp_path / "blobs"))
+
+
+def test_put_stream_is_content_addressed(store, tmp_path):
+    data = os.urandom(3 * 1024 + 7)
+    chunks = [data[i : i + 1024] for i in range(0, len(data), 1024)]
+
+    reference = store.put_stream(iter(chunks))
+
+    assert reference == "blob://" + hashlib.sha256(data).hexdigest()
+    assert is_blob_reference(reference)
+    assert store.get(reference) == data
+    with store.open(reference) as f:
+        assert f.read(10) == data[:10]
+
+
+def test_put_same_content_twice_keeps_one_copy(store, tmp_path):
+    assert store.put(b"abc") == store.put_stream([b"a", b"bc"])
+
+    files = [name for _, _, names in os.walk(tmp_path / "blobs") for name in names]
+    assert len(files) == 1
+
+
+def test_failed_put_leaves_no_partial_blob(store, tmp_path):
+    def _chunks():
+        yield b"partial"
+        raise IOError("upload interrupted")
+
+    with pytest.raises(IOError):
+        store.put_stream(_chunks())
+
+    assert [name for _, _, names in os.walk(tmp_path / "blobs") for name in names] == []
+
+
+@pytest.mark.parametrize("reference", ["abc", "blob://../../etc/passwd", "blob://" + "A" * 64])
+def test_malformed_references_are_rejected(store, reference):
+    with pytest.raises(ValueError):
+        store.get(reference)
+
+
+def test_missing_blob(store):
+    with pytest.raises(FileNotFoundError):
+        store.get("blob://" + "0" * 64)
+
+
+def test_sweep_deletes_expired_blobs(tmp_path):
+    store = FileBlobStore(str(tmp_path / "blobs"), ttl=60)
+    old = store.put(b"old upload")
+    new = store.put(b"new upload")
+    old_path = tmp_path / "blobs" / old[7:9] / old[7:]
+    os.utime(old_path, (time.time() - 61, time.time() - 61))
+
+    assert store.sweep() == 1
+    assert not old_path.exists()
+    assert store.get(new) == b"new upload"
+
+
+def test_put_sweeps_periodically(tmp_path):
+    store = FileBlobStore(str(tmp_path / "blobs"), ttl=60)
+    with patch.object(store, "sweep", return_value=0) as mock_sweep:
+        store.put(b"first")
+        store.put(b"second")
+
+    mock_sweep.assert_called_once()
+
+
+def test_sweep_disabled_without_ttl(store, tmp_path):
+    reference = store.put(b"kept")
+    path = tmp_path / "blobs" / reference[7:9] / reference[7:]
+    os.utime(path, (0, 0))
+
+    assert store.sweep() == 0
+    assert store.get(reference) == b"kept"
+
+
+def test_is_blob_reference():
+    assert not is_blob_reference(base64.b64encode(b"blob://").decode())
+    assert not is_blob_reference(b"blob://abc")
+    assert not is_blob_reference(None)
+
+
+def test_resolve_content(store):
+    reference = store.put(b"%PDF-1.7")
+
+    with patch(f"{MODULE_UNDER_TEST}.get_blob_store", return_value=store):
+        assert resolve_content(reference) == b"%PDF-1.7"
+        assert resolve_content(base64.b64encode(b"%PDF-1.7").decode()) == b"%PDF-1.7"
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("utf-8")
+
+
+def test_offload_job_payload(store):
+    pdf = os.urandom(1000)
+    job = {
+        "job_payload": {
+            "content": [_b64(pdf), _b64(b"small"), "x" * 2000, store.put(b"already stored")],
+            "document_type": ["pdf", "png", "text", "pdf"],
+        }
+    }
+
+    offloaded = offload_job_payload(job, threshold=100, store=store)
+
+    contents = job["job_payload"]["content"]
+    assert offloaded == len(_b64(pdf))
+    assert store.get(contents[0]) == pdf
+    assert contents[1] == _b64(b"small")
+    assert contents[2] == "x" * 2000  # Text documents stay inline.
+    assert store.get(contents[3]) == b"already stored"
+
+
+def test_offload_and_resolve_result_content(store):
+    image = os.urandom(1000)
+    data = [
+        {"document_type": "image", "metadata": {"content": _b64(image)}},
+        {"document_type": "structured", "metadata": {"content": _b64(b"tiny")}},
+        {"document_type": "text", "metadata": {"content": "t" * 2000}},
+    ]
+
+    assert offload_result_content(data, threshold=100, store=store) == len(_b64(image))
+    assert is_blob_reference(data[0]["metadata"]["content"])
+    assert data[1]["metadata"]["content"] == _b64(b"tiny")
+    assert data[2]["metadata"]["content"] == "t" * 2000
+
+    assert resolve_result_content(data, store=store) == 1
+    assert data[0]["metadata"]["content"] == _b64(image)
+
+
+def test_resolve_result_content_without_references_does_not_create_a_store():
+    with patch(f"{MODULE_UNDER_TEST}.get_blob_store") as mock_get_blob_store:
+        assert resolve_result_content([{"document_type": "text", "metadata": {"content": "abc"}}, {}]) == 0
+        assert resolve_result_content(None) == 0
+
+    mock_get_blob_store.assert_not_called()
+
+
+def test_minio_blob_store():
+    objects = {}
+    client = Mock()
+    client.bucket_exists.return_value = False
+    client.put_object.side_effect = lambda bucket, name, f, length: objects.__setitem__(name, f.read(length))
+    client.get_object.side_effect = lambda bucket, name: Mock(read=Mock(return_value=objects[name]))
+
+    store = MinioBlobStore(client, "blobs")
+    client.make_bucket.assert_called_once_with("blobs")
+
+    data = os.urandom(3000)
+    stream = io.BytesIO(data)
+    reference = store.put_stream(iter(lambda: stream.read(1024), b""))
+    assert reference == "blob://" + hashlib.sha256(data).hexdigest()
+    assert store.put(data) == reference
+    assert store.get(reference) == data
+    assert store.open(reference).read() == data
+
+
+def test_minio_blob_store_sweep():
+    now = datetime.now(timezone.utc)
+    client = Mock()
+    client.list_objects.return_value = [
+        Mock(object_name="old", last_modified=now - timedelta(seconds=61)),
+        Mock(object_name="new", last_modified=now),
+    ]
+
+    store = MinioBlobStore(client, "blobs", ttl=60)
+
+    assert store.sweep() == 1
+    client.remove_object.assert_called_once_with("blobs", "old")
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import numpy as np
+import pytest
+from nv_ingest_client.util.embeddings import decode_embedding
+from nv_ingest_client.util.embeddings import decode_embeddings
+from nv_ingest_client.util.embeddings import encode_embedding
+from nv_ingest_client.util.embeddings import encode_embeddings
+
+
+@pytest.mark.parametrize("dtype,expected_dtype", [("float32", "<f4"), ("float16", "<f2")])
+def test_encode_decode_round_trip(dtype, expected_dtype):
+    embedding = np.random.default_rng(0).standard_normal(1024).astype(np.float32).tolist()
+
+    encoded = encode_embedding(embedding, dtype)
+    decoded = decode_embedding(json.loads(json.dumps(encoded)))
+
+    assert encoded["encoding"] == "base64"
+    assert encoded["dtype"] == expected_dtype
+    assert encoded["shape"] == [1024]
+    assert isinstance(decoded, list)
+    assert np.allclose(decoded, embedding, atol=1e-2 if dtype == "float16" else 0)
+
+
+def test_encoded_bytes_are_little_endian():
+    encoded = encode_embedding([1.0], "float32")
+    assert encoded["data"] == "AACAPw=="  # 0x3f800000 little-endian
+
+
+def test_decode_embedding_as_numpy():
+    decoded = decode_embedding(encode_embedding([0.5, -0.25], "float16"), as_numpy=True)
+    assert decoded.dtype == np.dtype("<f2")
+    assert decoded.tolist() == [0.5, -0.25]
+
+
+@pytest.mark.parametrize("value", [None, [0.1, 0.2], {"data": "abc"}])
+def test_decode_embedding_passes_through_unencoded_values(value):
+    assert decode_embedding(value) == value
+
+
+def test_encode_embedding_rejects_unknown_dtype():
+    with pytest.raises(ValueError, match="Unsupported embedding dtype"):
+        encode_embedding([0.1], "float64")
+
+
+def test_encode_decode_records():
+    embedding = np.random.default_rng(0).standard_normal(1024).astype(np.float32).tolist()
+    records = [
+        {"document_type": "text", "metadata": {"content": "a", "embedding": list(embedding)}},
+        {"document_type": "text", "metadata": {"content": "b", "embedding": None}},
+        {"document_type": "text", "metadata": {"content": "c", "embedding": []}},
+        {"document_type": "image", "metadata": None},
+    ]
+    json_size = len(json.dumps(records))
+
+    encode_embeddings(records, "float32")
+    encoded_json = json.dumps(records)
+
+    assert records[0]["metadata"]["embedding"]["encoding"] == "base64"
+    assert records[1]["metadata"]["embedding"] is None
+    assert records[2]["metadata"]["embedding"] == []
+    assert len(encoded_json) * 3 < json_size
+
+    decoded = decode_embeddings(json.loads(encoded_json))
+    assert decoded[0]["metadata"]["embedding"] == embedding
+    assert decoded[1:] == records[1:]
+    assert decode_embeddings(None) is None